@@ -0,0 +1,9 @@
+-- The API process holding a session's pipeline job and when it last
+-- confirmed it. Admission control is per process, so a session still
+-- queued is admitted again only once its owner's heartbeat is older than
+-- ADMISSION_STALE_SEC
+ALTER TABLE public.sessions ADD COLUMN IF NOT EXISTS admission_owner TEXT;
+ALTER TABLE public.sessions ADD COLUMN IF NOT EXISTS admission_heartbeat_at TIMESTAMP WITH TIME ZONE;
+
+-- Reload Schema Cache
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,7 @@
+-- Row version for optimistic concurrency: a rollup update only applies if
+-- the version is unchanged since it was read, so API workers writing the
+-- same user's rollup retry instead of overwriting each other
+ALTER TABLE public.user_analytics_rollups ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0;
+
+-- Reload Schema Cache
+NOTIFY pgrst, 'reload schema';
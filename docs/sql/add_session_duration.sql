@@ -0,0 +1,4 @@
+-- Video length recorded at upload; admission control estimates the work of
+-- a processing request from it. Sessions uploaded before this column
+-- existed fall back to ADMISSION_DEFAULT_DURATION_SEC
+ALTER TABLE public.sessions ADD COLUMN IF NOT EXISTS duration_seconds REAL;
@@ -0,0 +1,24 @@
+-- Summary counts on the transcripts row, written by save_transcript, so the
+-- transcript summary never reads every segment. Rows left NULL are counted
+-- once on first read and written back
+ALTER TABLE public.transcripts ADD COLUMN IF NOT EXISTS segment_count INTEGER;
+ALTER TABLE public.transcripts ADD COLUMN IF NOT EXISTS word_count INTEGER;
+ALTER TABLE public.transcripts ADD COLUMN IF NOT EXISTS duration_seconds REAL;
+
+-- Backfill from transcript_segments
+UPDATE public.transcripts t
+SET segment_count = s.segment_count,
+    word_count = s.word_count,
+    duration_seconds = s.duration_seconds
+FROM (
+    SELECT session_id,
+           COUNT(*) AS segment_count,
+           COALESCE(SUM(word_count), 0) AS word_count,
+           (ARRAY_AGG(end_time ORDER BY seq DESC))[1] AS duration_seconds
+    FROM public.transcript_segments
+    GROUP BY session_id
+) s
+WHERE t.session_id = s.session_id AND t.segment_count IS NULL;
+
+-- Reload Schema Cache
+NOTIFY pgrst, 'reload schema';
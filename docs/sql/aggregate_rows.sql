@@ -0,0 +1,91 @@
+-- Row counts for StorageBackend.aggregate on Supabase: counts per distinct
+-- value of the group_by columns and, with p_bucket ('hour' or 'day'), per
+-- ISO bucket of p_bucket_column, largest first or in bucket order, as one
+-- JSON array of rows. Filters are [column, op, value] triples as sent by
+-- the API. Identifiers and values are quoted with format(), and only the
+-- listed tables are allowed.
+CREATE OR REPLACE FUNCTION public.aggregate_rows(
+    p_table TEXT,
+    p_group_by TEXT[] DEFAULT '{}',
+    p_bucket_column TEXT DEFAULT NULL,
+    p_bucket TEXT DEFAULT NULL,
+    p_filters JSONB DEFAULT '[]'::jsonb,
+    p_limit INTEGER DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql STABLE
+AS $$
+DECLARE
+    expressions TEXT[] := ARRAY[]::TEXT[];
+    conditions TEXT[] := ARRAY[]::TEXT[];
+    condition JSONB;
+    column_name TEXT;
+    operator TEXT;
+    query TEXT;
+    result JSONB;
+BEGIN
+    IF p_table NOT IN ('analytics_events', 'sessions') THEN
+        RAISE EXCEPTION 'aggregate_rows: table % is not allowed', p_table;
+    END IF;
+
+    FOREACH column_name IN ARRAY COALESCE(p_group_by, '{}') LOOP
+        expressions := expressions || format('%I', column_name);
+    END LOOP;
+
+    IF p_bucket IS NOT NULL THEN
+        IF p_bucket NOT IN ('hour', 'day') THEN
+            RAISE EXCEPTION 'aggregate_rows: unknown bucket %', p_bucket;
+        END IF;
+        expressions := expressions || format(
+            'to_char(%I AT TIME ZONE ''UTC'', %L) AS bucket',
+            p_bucket_column,
+            CASE p_bucket WHEN 'hour' THEN 'YYYY-MM-DD"T"HH24' ELSE 'YYYY-MM-DD' END
+        );
+    END IF;
+
+    FOR condition IN SELECT value FROM jsonb_array_elements(COALESCE(p_filters, '[]'::jsonb)) LOOP
+        column_name := condition->>0;
+        operator := condition->>1;
+        IF operator = 'in' THEN
+            conditions := conditions || format(
+                '%I::text IN (SELECT jsonb_array_elements_text(%L::jsonb))', column_name, condition->2
+            );
+        ELSIF operator IN ('eq', 'neq', 'lt', 'lte', 'gt', 'gte') THEN
+            conditions := conditions || format(
+                '%I %s %L',
+                column_name,
+                CASE operator WHEN 'eq' THEN '=' WHEN 'neq' THEN '<>' WHEN 'lt' THEN '<'
+                              WHEN 'lte' THEN '<=' WHEN 'gt' THEN '>' ELSE '>=' END,
+                condition->>2
+            );
+        ELSE
+            RAISE EXCEPTION 'aggregate_rows: unknown operator %', operator;
+        END IF;
+    END LOOP;
+
+    query := format(
+        'SELECT %s FROM public.%I',
+        array_to_string(expressions || ARRAY['COUNT(*) AS count'], ', '),
+        p_table
+    );
+    IF cardinality(conditions) > 0 THEN
+        query := query || ' WHERE ' || array_to_string(conditions, ' AND ');
+    END IF;
+    IF cardinality(expressions) > 0 THEN
+        query := query || ' GROUP BY ' || (SELECT string_agg(i::text, ', ') FROM generate_series(1, cardinality(expressions)) i);
+        query := query || CASE WHEN p_bucket IS NOT NULL THEN ' ORDER BY bucket ASC, count DESC' ELSE ' ORDER BY count DESC' END;
+    END IF;
+    IF p_limit IS NOT NULL THEN
+        query := query || format(' LIMIT %s', p_limit);
+    END IF;
+
+    EXECUTE format('SELECT COALESCE(jsonb_agg(to_jsonb(r)), ''[]''::jsonb) FROM (%s) r', query) INTO result;
+    RETURN result;
+END;
+$$;
+
+-- Only the service role aggregates; keep the function off the public API
+REVOKE EXECUTE ON FUNCTION public.aggregate_rows(TEXT, TEXT[], TEXT, TEXT, JSONB, INTEGER) FROM PUBLIC, anon, authenticated;
+
+-- Reload Schema Cache
+NOTIFY pgrst, 'reload schema';
@@ -8,17 +8,15 @@ CREATE TABLE IF NOT EXISTS public.analytics_events (
     timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
--- Create index on event_name for faster queries
-CREATE INDEX IF NOT EXISTS idx_analytics_events_event_name ON public.analytics_events(event_name);
-
--- Create index on timestamp for time-based queries
-CREATE INDEX IF NOT EXISTS idx_analytics_events_timestamp ON public.analytics_events(timestamp DESC);
-
--- Create index on session_id for session-based queries
-CREATE INDEX IF NOT EXISTS idx_analytics_events_session_id ON public.analytics_events(session_id);
-
--- Create index on user_id for user-based queries
-CREATE INDEX IF NOT EXISTS idx_analytics_events_user_id ON public.analytics_events(user_id);
+-- Indexes end in (timestamp, id) so filtered admin queries read one
+-- index range in keyset order
+CREATE INDEX IF NOT EXISTS idx_analytics_events_ts_id ON public.analytics_events(timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_name_ts ON public.analytics_events(event_name, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_session_ts ON public.analytics_events(session_id, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_user_ts ON public.analytics_events(user_id, timestamp DESC, id DESC);
+
+-- For tens of millions of events, convert the table to monthly partitions
+-- with partition_analytics_events.sql
 
 -- Enable Row Level Security (RLS)
 ALTER TABLE public.analytics_events ENABLE ROW LEVEL SECURITY;
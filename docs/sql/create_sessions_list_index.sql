@@ -0,0 +1,3 @@
+-- Session listing pages through a user's sessions by (created_at, id), newest
+-- first; this index serves both the ordering and the keyset range
+CREATE INDEX IF NOT EXISTS idx_sessions_user_created_id ON public.sessions(user_id, created_at DESC, id DESC);
@@ -0,0 +1,30 @@
+-- Transcript segments as rows, so time-range and paginated reads hit an index
+-- instead of loading the whole segments JSONB array
+CREATE TABLE IF NOT EXISTS public.transcript_segments (
+    id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
+    session_id UUID REFERENCES public.sessions(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL NOT NULL,
+    text TEXT,
+    word_count INTEGER DEFAULT 0
+);
+
+-- Keyset pagination walks (session_id, seq)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_transcript_segments_session_seq ON public.transcript_segments(session_id, seq);
+
+-- Time-range queries
+CREATE INDEX IF NOT EXISTS idx_transcript_segments_session_start ON public.transcript_segments(session_id, start_time);
+
+-- Enable Row Level Security (RLS)
+ALTER TABLE public.transcript_segments ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own transcript segments" ON public.transcript_segments
+    FOR SELECT USING (
+        auth.uid() IN (
+            SELECT user_id FROM public.sessions WHERE id = session_id
+        )
+    );
+
+-- Reload Schema Cache
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,21 @@
+-- Inverted index for transcript search on Postgres/Supabase: one row per
+-- distinct term per transcript segment (local SQLite mode uses FTS5 instead)
+CREATE TABLE IF NOT EXISTS public.transcript_terms (
+    id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
+    user_id UUID,
+    term TEXT NOT NULL,
+    session_id UUID REFERENCES public.sessions(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL
+);
+
+-- Term lookups are always scoped to one user
+CREATE INDEX IF NOT EXISTS idx_transcript_terms_user_term ON public.transcript_terms(user_id, term);
+
+-- Re-indexing and restarts delete by session
+CREATE INDEX IF NOT EXISTS idx_transcript_terms_session_id ON public.transcript_terms(session_id);
+
+-- Enable Row Level Security (RLS); only the service role reads the index
+ALTER TABLE public.transcript_terms ENABLE ROW LEVEL SECURITY;
+
+-- Reload Schema Cache
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,22 @@
+-- Per-user dashboard rollups, maintained incrementally when a session completes
+CREATE TABLE IF NOT EXISTS public.user_analytics_rollups (
+    id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
+    user_id UUID NOT NULL UNIQUE,
+    completed_sessions INTEGER DEFAULT 0,
+    metric_sums JSONB DEFAULT '{}'::jsonb,
+    metric_counts JSONB DEFAULT '{}'::jsonb,
+    score_distribution JSONB DEFAULT '{}'::jsonb,
+    score_history JSONB DEFAULT '[]'::jsonb,
+    first_score DOUBLE PRECISION,
+    latest_score DOUBLE PRECISION,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc'::text, now()) NOT NULL
+);
+
+-- Enable Row Level Security (RLS); rollups are read and written by the service role
+ALTER TABLE public.user_analytics_rollups ENABLE ROW LEVEL SECURITY;
+
+-- Existing users get their rollup rebuilt from their sessions on the first dashboard load
+
+-- Reload Schema Cache
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,82 @@
+-- Convert analytics_events into a table range-partitioned by month, so time
+-- filtered admin queries and aggregations only touch the partitions in range
+-- and old months can be detached or dropped instead of deleted row by row.
+-- Run once, in a maintenance window; the copy holds a lock on the old table.
+
+BEGIN;
+
+CREATE TABLE public.analytics_events_partitioned (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    event_name TEXT NOT NULL,
+    session_id UUID,
+    user_id UUID,
+    metadata JSONB DEFAULT '{}'::jsonb,
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (timestamp, id)
+) PARTITION BY RANGE (timestamp);
+
+-- Creates the partition holding the month of the given date
+CREATE OR REPLACE FUNCTION public.create_analytics_events_partition(month DATE)
+RETURNS VOID AS $$
+DECLARE
+    start_at DATE := date_trunc('month', month)::date;
+    end_at DATE := (date_trunc('month', month) + INTERVAL '1 month')::date;
+    partition_name TEXT := 'analytics_events_' || to_char(start_at, 'YYYY_MM');
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS public.%I PARTITION OF public.analytics_events_partitioned FOR VALUES FROM (%L) TO (%L)',
+        partition_name, start_at, end_at
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- Partitions for every month with data plus the next twelve
+SELECT public.create_analytics_events_partition(month::date)
+FROM generate_series(
+    date_trunc('month', COALESCE((SELECT MIN(timestamp) FROM public.analytics_events), NOW())),
+    date_trunc('month', NOW()) + INTERVAL '12 months',
+    INTERVAL '1 month'
+) AS month;
+
+-- Rows outside every monthly partition land here instead of failing
+CREATE TABLE IF NOT EXISTS public.analytics_events_default PARTITION OF public.analytics_events_partitioned DEFAULT;
+
+INSERT INTO public.analytics_events_partitioned (id, event_name, session_id, user_id, metadata, timestamp)
+SELECT id, event_name, session_id, user_id, metadata, COALESCE(timestamp, NOW())
+FROM public.analytics_events;
+
+ALTER TABLE public.analytics_events RENAME TO analytics_events_unpartitioned;
+ALTER TABLE public.analytics_events_partitioned RENAME TO analytics_events;
+
+-- Partitioned indexes, created on every partition
+CREATE INDEX IF NOT EXISTS idx_analytics_events_p_ts_id ON public.analytics_events(timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_p_name_ts ON public.analytics_events(event_name, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_p_session_ts ON public.analytics_events(session_id, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_p_user_ts ON public.analytics_events(user_id, timestamp DESC, id DESC);
+
+ALTER TABLE public.analytics_events ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Allow service role to insert analytics"
+ON public.analytics_events
+FOR INSERT
+TO service_role
+WITH CHECK (true);
+
+CREATE POLICY "Allow service role to select analytics"
+ON public.analytics_events
+FOR SELECT
+TO service_role
+USING (true);
+
+CREATE POLICY "Allow users to view their own analytics"
+ON public.analytics_events
+FOR SELECT
+TO authenticated
+USING (user_id::text = auth.uid()::text);
+
+COMMIT;
+
+-- Create next month's partition ahead of time, e.g. monthly from pg_cron:
+--   SELECT public.create_analytics_events_partition((NOW() + INTERVAL '1 month')::date);
+-- Once verified, drop the old table:
+--   DROP TABLE public.analytics_events_unpartitioned;
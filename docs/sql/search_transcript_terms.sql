@@ -0,0 +1,25 @@
+-- Transcript search on Postgres/Supabase: intersects the transcript_terms
+-- postings in the database and returns the segments holding every query
+-- term, at most p_limit of them. Phrases and ranking are checked by the API.
+CREATE OR REPLACE FUNCTION public.search_transcript_terms(p_user_id UUID, p_terms TEXT[], p_limit INTEGER)
+RETURNS TABLE (session_id UUID, seq INTEGER, start_time REAL, end_time REAL, text TEXT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT s.session_id, s.seq, s.start_time, s.end_time, s.text
+    FROM (
+        SELECT t.session_id, t.seq
+        FROM public.transcript_terms t
+        WHERE t.user_id = p_user_id AND t.term = ANY(p_terms)
+        GROUP BY t.session_id, t.seq
+        HAVING COUNT(DISTINCT t.term) = cardinality(p_terms)
+        ORDER BY t.session_id, t.seq
+        LIMIT p_limit
+    ) c
+    JOIN public.transcript_segments s ON s.session_id = c.session_id AND s.seq = c.seq;
+$$;
+
+-- Only the service role searches; keep the function off the public API
+REVOKE EXECUTE ON FUNCTION public.search_transcript_terms(UUID, TEXT[], INTEGER) FROM PUBLIC, anon, authenticated;
+
+-- Reload Schema Cache
+NOTIFY pgrst, 'reload schema';
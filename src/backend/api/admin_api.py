@@ -1,50 +1,107 @@
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Request, Depends, Query
 from typing import Optional, List
+from src.backend.services.analytics_service import EVENT_GROUP_COLUMNS, AnalyticsService
 from src.backend.services.user_service import UserService
-from src.backend.utils.supabase_client import supabase
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 router = APIRouter()
 
+def _parse_time(value: Optional[str], name: str) -> Optional[str]:
+    
+    if not value:
+        return None
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} timestamp, expected ISO 8601")
+    return value
+
 @router.get("/logs")
 def get_admin_logs(
     request: Request,
     event_type: Optional[str] = None,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
-    limit: int = 50,
-    offset: int = 0
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, max_length=512),
+    include_total: bool = False
 ):
     
     logger.info(f"[Admin] GET /logs requested")
     
-    current_user_id = UserService.get_user_id(request)
+    UserService.require_admin(request)
+    
+    filters = AnalyticsService.event_filters(
+        event_type, session_id, user_id,
+        _parse_time(since, "since"), _parse_time(until, "until")
+    )
     
     try:
-        query = supabase.table("analytics_events").select("*").order("timestamp", desc=True)
-        
-        if event_type:
-            query = query.eq("event_name", event_type)
-        
-        if session_id:
-            query = query.eq("session_id", session_id)
-            
-        if user_id:
-            query = query.eq("user_id", user_id)
-            
-        query = query.range(offset, offset + limit - 1)
-        
-        result = query.execute()
-        
-        return {
-            "data": result.data,
-            "count": len(result.data), # Approximate count of fetched items
-            "limit": limit,
-            "offset": offset
-        }
+        return AnalyticsService.query_events(filters, limit=limit, cursor=cursor, include_total=include_total)
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"[Admin] Error fetching logs: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch logs: {str(e)}")
+
+@router.get("/logs/aggregate")
+def get_admin_log_aggregates(
+    request: Request,
+    group_by: List[str] = Query(["event_name"]),
+    bucket: Optional[str] = Query(None, pattern="^(hour|day)$"),
+    event_type: Optional[str] = None,
+    session_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000)
+):
+    
+    logger.info(f"[Admin] GET /logs/aggregate requested")
+    
+    UserService.require_admin(request)
+    
+    # group_by=time is shorthand for a daily bucket
+    columns = [g for g in group_by if g != "time"]
+    if "time" in group_by and bucket is None:
+        bucket = "day"
+    invalid = [c for c in columns if c not in EVENT_GROUP_COLUMNS]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid group_by {invalid}. Must be one of: {EVENT_GROUP_COLUMNS + ['time']}")
+    
+    filters = AnalyticsService.event_filters(
+        event_type, session_id, user_id,
+        _parse_time(since, "since"), _parse_time(until, "until")
+    )
+    
+    try:
+        return AnalyticsService.aggregate_events(filters, columns, bucket=bucket, limit=limit)
+        
+    except Exception as e:
+        logger.error(f"[Admin] Error aggregating logs: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to aggregate logs: {str(e)}")
+
+@router.get("/analytics/ingestion")
+def get_ingestion_stats(request: Request):
+    
+    logger.info(f"[Admin] GET /analytics/ingestion requested")
+    
+    UserService.require_admin(request)
+    
+    return AnalyticsService.get_ingestion_stats()
+
+@router.get("/pipeline/admission")
+def get_admission_stats(request: Request):
+    
+    logger.info(f"[Admin] GET /pipeline/admission requested")
+    
+    UserService.require_admin(request)
+    
+    from src.backend.services.admission_control import get_admission_controller
+    return get_admission_controller().stats()
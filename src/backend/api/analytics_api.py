@@ -1,11 +1,10 @@
-from fastapi import APIRouter, HTTPException, Request, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from src.backend.services.analytics_service import AnalyticsService
 from src.backend.services.user_service import UserService
-from src.backend.utils.supabase_client import supabase
+from src.backend.storage import get_storage
 from src.backend.utils.logger import setup_logger
-from datetime import datetime, timedelta
 
 logger = setup_logger(__name__)
 
@@ -19,8 +18,7 @@ class FrontendEvent(BaseModel):
 @router.post("/analytics/frontend")
 def record_frontend_event(
     event: FrontendEvent,
-    request: Request,
-    background_tasks: BackgroundTasks
+    request: Request
 ):
     
     user_id = None
@@ -29,8 +27,8 @@ def record_frontend_event(
     except:
         pass
         
-    background_tasks.add_task(
-        AnalyticsService.record_event,
+    # Buffered, so recording inline costs no more than scheduling a task
+    AnalyticsService.record_event(
         event_name=event.event_name,
         session_id=event.session_id,
         user_id=user_id,
@@ -47,69 +45,38 @@ def get_dashboard_analytics(request: Request):
     logger.info(f"[API] GET /analytics/dashboard - Getting dashboard for user {user_id}")
     
     try:
-        response = supabase.table("sessions")\
-            .select("*")\
-            .eq("user_id", user_id)\
-            .order("created_at", desc=True)\
-            .execute()
+        from src.backend.services.analytics_rollup_service import AnalyticsRollupService
         
-        sessions = response.data or []
+        # Score aggregates come from the per-user rollup maintained on
+        # session completion; status counts are grouped by the database and
+        # only the five most recent sessions are read
+        rollup = AnalyticsRollupService.get_rollup(user_id)
+        dashboard = AnalyticsRollupService.dashboard_metrics(rollup)
+        avgs = dashboard["averages"]
         
-        total_sessions = len(sessions)
-        completed_sessions = [s for s in sessions if s.get("status") == "complete"]
-        processing_sessions = [s for s in sessions if s.get("status") == "processing"]
-        failed_sessions = [s for s in sessions if s.get("status") == "failed"]
-        
-        metrics = {
-            "mentor_score": [],
-            "engagement": [],
-            "communication_clarity": [],
-            "technical_correctness": [],
-            "pacing_structure": []
+        status_counts = {
+            row["status"]: row["count"]
+            for row in get_storage().aggregate("sessions", group_by=["status"], filters={"user_id": user_id})
         }
         
-        # Get all final_scores for completed sessions
-        session_ids = [s["id"] for s in completed_sessions]
+        latest = get_storage().select(
+            "sessions",
+            {"user_id": user_id},
+            columns=["id", "filename", "status", "created_at", "completion_metadata"],
+            order_by="created_at",
+            desc=True,
+            limit=5
+        )
+        
+        missing = [s["id"] for s in latest if not (s.get("completion_metadata") or {}).get("mentor_score")]
         final_scores_map = {}
-        if session_ids:
+        if missing:
             try:
-                fs_response = supabase.table("final_scores")\
-                    .select("*")\
-                    .in_("session_id", session_ids)\
-                    .execute()
-                for fs in (fs_response.data or []):
-                    final_scores_map[fs["session_id"]] = fs
+                fs_rows = get_storage().select("final_scores", {"session_id": ("in", missing)}, columns=["session_id", "mentor_score"])
+                final_scores_map = {fs["session_id"]: fs for fs in fs_rows}
             except Exception as e:
                 logger.warning(f"Failed to fetch final_scores: {e}")
         
-        for session in completed_sessions:
-            meta = session.get("completion_metadata") or {}
-            sid = session["id"]
-            fs = final_scores_map.get(sid, {})
-            
-            # Get mentor_score from metadata or final_scores
-            mentor = meta.get("mentor_score") or fs.get("mentor_score")
-            if mentor:
-                metrics["mentor_score"].append(float(mentor))
-            
-            # Get other scores from metadata first, then final_scores
-            for key in ["engagement", "communication_clarity", "technical_correctness", "pacing_structure"]:
-                val = meta.get(key) or fs.get(key)
-                if val:
-                    metrics[key].append(float(val))
-                    
-        avgs = {
-            k: round(sum(v) / len(v), 2) if v else 0 
-            for k, v in metrics.items()
-        }
-        
-        improvement = 0
-        scores = metrics["mentor_score"]
-        if len(scores) >= 2:
-            latest, oldest = scores[0], scores[-1]
-            if oldest > 0:
-                improvement = round(((latest - oldest) / oldest) * 100, 1)
-        
         recent_sessions = [
             {
                 "id": s["id"],
@@ -118,47 +85,25 @@ def get_dashboard_analytics(request: Request):
                 "created_at": s["created_at"],
                 "mentor_score": (s.get("completion_metadata") or {}).get("mentor_score") or final_scores_map.get(s["id"], {}).get("mentor_score")
             }
-            for s in sessions[:5]
+            for s in latest
         ]
         
-        score_distribution = {
-            "0-2": 0, "2-4": 0, "4-6": 0, "6-8": 0, "8-10": 0
-        }
-        for score in scores:
-            if score < 2: score_distribution["0-2"] += 1
-            elif score < 4: score_distribution["2-4"] += 1
-            elif score < 6: score_distribution["4-6"] += 1
-            elif score < 8: score_distribution["6-8"] += 1
-            else: score_distribution["8-10"] += 1
-        
-        score_history = []
-        for s in completed_sessions[:10][::-1]:
-            meta = s.get("completion_metadata") or {}
-            fs = final_scores_map.get(s["id"], {})
-            score = meta.get("mentor_score") or fs.get("mentor_score")
-            if score:
-                score_history.append({
-                    "date": s["created_at"][:10],
-                    "score": float(score)
-                })
-
-        
         return {
             "summary": {
-                "total_sessions": total_sessions,
-                "completed_sessions": len(completed_sessions),
-                "processing_sessions": len(processing_sessions),
-                "failed_sessions": len(failed_sessions),
+                "total_sessions": sum(status_counts.values()),
+                "completed_sessions": status_counts.get("complete", 0),
+                "processing_sessions": status_counts.get("processing", 0) + status_counts.get("queued", 0),
+                "failed_sessions": status_counts.get("failed", 0),
                 "avg_mentor_score": avgs["mentor_score"],
                 "avg_engagement": avgs["engagement"],
                 "avg_communication": avgs["communication_clarity"],
                 "avg_technical": avgs["technical_correctness"],
                 "avg_pacing": avgs["pacing_structure"],
-                "improvement_percent": improvement
+                "improvement_percent": dashboard["improvement_percent"]
             },
             "recent_sessions": recent_sessions,
-            "score_distribution": score_distribution,
-            "score_history": score_history
+            "score_distribution": dashboard["score_distribution"],
+            "score_history": dashboard["score_history"]
         }
         
     except Exception as e:
@@ -2,10 +2,6 @@ from fastapi import APIRouter, HTTPException, Request, Response
 from src.backend.services.session_service import SessionService
 from src.backend.services.user_service import UserService
 from src.backend.utils.logger import setup_logger
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from io import BytesIO
 
 logger = setup_logger(__name__)
@@ -37,6 +33,11 @@ def download_report_endpoint(session_id: str, request: Request):
         raise HTTPException(status_code=500, detail="Failed to fetch session data")
 
     try:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        
         buffer = BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=letter)
         styles = getSampleStyleSheet()
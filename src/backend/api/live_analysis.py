@@ -1,150 +1,248 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import json
+import threading
+import time
+import uuid
+from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-import numpy as np
-import cv2
-import base64
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from src.backend.pipelines.live import (
+    LiveTracker,
+    LiveFrameScheduler,
+    LiveSessionRecorder,
+    FrameDropped,
+    empty_live_result
+)
+from src.backend.services.live_session_service import LiveSessionService
+from src.backend.services.session_service import SessionService
+from src.backend.services.user_service import UserService
+from src.backend.utils.config import Config
 from src.backend.utils.logger import setup_logger
-import mediapipe as mp
 
 logger = setup_logger(__name__)
 
 router = APIRouter()
 
-# Initialize MediaPipe solutions for live analysis
-mp_face_mesh = mp.solutions.face_mesh
-mp_hands = mp.solutions.hands
-
-# Lazy-loaded detectors
-_face_mesh = None
-_hands = None
-
-def _get_face_mesh():
-    global _face_mesh
-    if _face_mesh is None:
-        _face_mesh = mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-    return _face_mesh
-
-def _get_hands():
-    global _hands
-    if _hands is None:
-        _hands = mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-    return _hands
+LIVE_FRAME_FORMATS = ("jpeg", "webp", "rgb")
+
+_scheduler: Optional[LiveFrameScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_live_scheduler() -> LiveFrameScheduler:
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = LiveFrameScheduler(
+                    LiveTracker,
+                    max_workers=Config.LIVE_INFERENCE_WORKERS,
+                    max_clients=Config.LIVE_MAX_CLIENTS,
+                    idle_timeout=Config.LIVE_IDLE_TIMEOUT_SEC,
+                    on_abandon=LiveSessionService.abandon_live_recording
+                )
+    return _scheduler
+
+def set_live_scheduler(scheduler: Optional[LiveFrameScheduler]):
+    global _scheduler
+    _scheduler = scheduler
+
+def shutdown_live_scheduler():
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.shutdown()
+            _scheduler = None
+
+def _client_key(user_id: str, client_id: Optional[str]) -> str:
+    # Trackers belong to a user; client ids only tell apart one user's tabs
+    # or devices, so nobody can reach another user's tracker by its id
+    return f"{user_id}:{client_id or 'default'}"
 
 class LiveFrameRequest(BaseModel):
     image: str  # Base64 encoded image
+    client_id: Optional[str] = None
 
 @router.post("/analyze")
-async def analyze_live_frame(request: LiveFrameRequest) -> Dict[str, Any]:
+async def analyze_live_frame(request: LiveFrameRequest, http_request: Request) -> Dict[str, Any]:
+    user_id = await run_in_threadpool(UserService.get_user_id, http_request)
+    client_id = _client_key(user_id, request.client_id)
+    image = request.image
+    
     try:
-        # Decode base64 image
-        if "," in request.image:
-            header, encoded = request.image.split(",", 1)
-        else:
-            encoded = request.image
-            
-        image_data = base64.b64decode(encoded)
-        nparr = np.frombuffer(image_data, np.uint8)
-        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        
-        if frame is None:
-            raise HTTPException(status_code=400, detail="Invalid image data")
-        
-        # Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w = frame.shape[:2]
+        result = await get_live_scheduler().submit(
+            client_id,
+            lambda tracker: tracker.analyze_base64(image)
+        )
+    except FrameDropped:
+        # A newer frame from the same client superseded this one
+        response = empty_live_result()
+        response["dropped"] = True
+        return response
+    except Exception as e:
+        logger.error(f"Error analyzing live frame: {str(e)}")
+        # Return safe defaults
+        return empty_live_result()
+    
+    if result is None:
+        logger.warning(f"Invalid image data from live client {client_id}")
+        return empty_live_result()
+    
+    return result
+
+class LiveRecordingRequest(BaseModel):
+    client_id: str
+
+@router.post("/sessions")
+async def start_live_session(body: LiveRecordingRequest, request: Request) -> Dict[str, Any]:
+    user_id = await run_in_threadpool(UserService.get_user_id, request)
+    
+    session = await run_in_threadpool(LiveSessionService.create_live_session, user_id)
+    if not session:
+        raise HTTPException(status_code=500, detail="Failed to create live session")
+    
+    get_live_scheduler().start_recording(_client_key(user_id, body.client_id), LiveSessionRecorder(session["id"]))
+    
+    return {"session_id": session["id"], "client_id": body.client_id, "status": session.get("status")}
+
+@router.post("/sessions/{session_id}/finish")
+async def finish_live_session(session_id: str, body: LiveRecordingRequest, request: Request) -> Dict[str, Any]:
+    user_id = await run_in_threadpool(UserService.get_user_id, request)
+    scheduler = get_live_scheduler()
+    client_key = _client_key(user_id, body.client_id)
+    
+    recorder = scheduler.get_recorder(client_key)
+    if recorder is None or recorder.session_id != session_id:
+        raise HTTPException(status_code=404, detail=f"No active live recording for session {session_id}")
+    
+    session = await run_in_threadpool(SessionService.get_session, session_id)
+    if not session or session.get("user_id") != user_id:
+        raise HTTPException(status_code=403, detail="You do not have permission to access this session")
+    
+    scheduler.stop_recording(client_key)
+    
+    visual_scores = await run_in_threadpool(LiveSessionService.save_live_evaluation, session_id, recorder)
+    
+    return {
+        "session_id": session_id,
+        "frames_recorded": recorder.total_frames,
+        "duration_sec": round(recorder.duration_minutes() * 60, 1),
+        "visual_scores": visual_scores,
+        "saved": visual_scores is not None
+    }
+
+@router.get("/stats")
+async def get_live_stats(request: Request) -> Dict[str, Any]:
+    await run_in_threadpool(UserService.require_admin, request)
+    clients = get_live_scheduler().stats()
+    return {
+        "active_clients": len(clients),
+        "clients": clients
+    }
+
+@router.get("/clients/{client_id}/stats")
+async def get_live_client_stats(client_id: str, request: Request) -> Dict[str, Any]:
+    user_id = await run_in_threadpool(UserService.get_user_id, request)
+    stats = get_live_scheduler().client_stats(_client_key(user_id, client_id))
+    if stats is None:
+        raise HTTPException(status_code=404, detail=f"No live session for client {client_id}")
+    return stats
+
+@router.delete("/clients/{client_id}")
+async def release_live_client(client_id: str, request: Request) -> Dict[str, Any]:
+    user_id = await run_in_threadpool(UserService.get_user_id, request)
+    released = get_live_scheduler().close_client(_client_key(user_id, client_id))
+    return {"client_id": client_id, "released": released}
+
+@router.websocket("/ws")
+async def live_stream(websocket: WebSocket):
+    # Binary frames in, compact JSON results out. Encoded frames (JPEG/WebP)
+    # are sent as-is; raw frames need format=rgb&width=W&height=H and must be
+    # exactly W*H*3 bytes. Each connection keeps its own tracker so
+    # MediaPipe's tracking mode sees one continuous stream.
+    params = websocket.query_params
+    frame_format = params.get("format", "jpeg").lower()
+    
+    await websocket.accept()
+    
+    try:
+        user_id = await run_in_threadpool(UserService.get_websocket_user_id, websocket)
+    except HTTPException as e:
+        await websocket.close(code=1008, reason=e.detail)
+        return
+    client_id = _client_key(user_id, params.get("client_id") or f"ws-{uuid.uuid4().hex}")
+    
+    if frame_format not in LIVE_FRAME_FORMATS:
+        await websocket.close(code=1003, reason=f"Unsupported format: {frame_format}")
+        return
+    
+    try:
+        width = int(params.get("width", 0))
+        height = int(params.get("height", 0))
+    except ValueError:
+        width = height = 0
+    
+    if frame_format == "rgb" and (width <= 0 or height <= 0):
+        await websocket.close(code=1003, reason="format=rgb requires width and height")
+        return
+    
+    def make_work(data: bytes):
+        if frame_format == "rgb":
+            return lambda tracker: tracker.analyze_rgb_bytes(data, width, height)
+        return lambda tracker: tracker.analyze_bytes(data)
+    
+    scheduler = get_live_scheduler()
+    send_lock = asyncio.Lock()
+    in_flight = set()
+    seq = 0
+    
+    logger.info(f"[Live] WebSocket stream opened for client {client_id} ({frame_format})")
+    
+    async def process_frame(frame_seq: int, data: bytes, received_at: float):
+        try:
+            result = await scheduler.submit(client_id, make_work(data))
+        except FrameDropped:
+            return
+        except Exception as e:
+            logger.error(f"Error analyzing live frame: {str(e)}")
+            result = empty_live_result()
         
-        response = {
-            "eye_contact": False,
-            "gestures": 0,
-            "face_detected": False,
-            "pose_score": 0.0
-        }
+        if result is None:
+            result = empty_live_result()
+            result["invalid"] = True
         
-        # === FACE MESH ANALYSIS FOR EYE CONTACT ===
-        face_mesh = _get_face_mesh()
-        face_results = face_mesh.process(frame_rgb)
+        result["seq"] = frame_seq
+        result["latency_ms"] = round((time.perf_counter() - received_at) * 1000, 1)
         
-        if face_results.multi_face_landmarks:
-            response["face_detected"] = True
-            landmarks = face_results.multi_face_landmarks[0].landmark
-            
-            # Get key eye landmarks for gaze detection
-            # Iris landmarks: Right iris center (468), Left iris center (473)
-            # Eye corners for reference
+        async with send_lock:
             try:
-                # Left eye: landmarks 33 (outer corner), 133 (inner corner)
-                # Right eye: landmarks 362 (outer corner), 263 (inner corner)
-                # Nose tip: 1
-                
-                left_eye_outer = landmarks[33]
-                left_eye_inner = landmarks[133]
-                right_eye_outer = landmarks[362]
-                right_eye_inner = landmarks[263]
-                nose_tip = landmarks[1]
-                
-                # Calculate eye center positions
-                left_eye_center_x = (left_eye_outer.x + left_eye_inner.x) / 2
-                right_eye_center_x = (right_eye_outer.x + right_eye_inner.x) / 2
-                
-                # Calculate face center (average of nose and eyes)
-                face_center_x = (left_eye_center_x + right_eye_center_x) / 2
-                
-                # Check if face is roughly centered (looking at camera)
-                # If face center is within 25% of frame center, consider it eye contact
-                horizontal_offset = abs(face_center_x - 0.5)
-                
-                # Check vertical - if they're looking down (nose tip too low)
-                vertical_offset = nose_tip.y
-                
-                # Eye contact if:
-                # 1. Face is horizontally centered (within 25% of center)
-                # 2. Face is not looking too far down (y < 0.7)
-                if horizontal_offset < 0.25 and vertical_offset < 0.7:
-                    response["eye_contact"] = True
-                else:
-                    response["eye_contact"] = False
-                    
-            except (IndexError, AttributeError):
-                # If landmark access fails, default based on face detection
-                response["eye_contact"] = False
-        
-        # === HANDS ANALYSIS FOR GESTURES ===
-        hands = _get_hands()
-        hands_results = hands.process(frame_rgb)
-        
-        if hands_results.multi_hand_landmarks:
-            gesture_count = 0
-            for hand_landmarks in hands_results.multi_hand_landmarks:
-                # Get wrist position (landmark 0)
-                wrist = hand_landmarks.landmark[0]
-                
-                # Count any hand that is visible in upper 80% of frame
-                # (y values go from 0=top to 1=bottom)
-                if wrist.y < 0.8:
-                    gesture_count += 1
-                    
-            response["gestures"] = gesture_count
-            logger.debug(f"Hands detected: {gesture_count}")
+                await websocket.send_text(json.dumps(result, separators=(",", ":")))
+            except Exception:
+                pass
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
             
-        return response
-        
-    except Exception as e:
-        logger.error(f"Error analyzing live frame: {str(e)}")
-        # Return safe defaults
-        return {
-            "eye_contact": False,
-            "gestures": 0,
-            "face_detected": False,
-            "pose_score": 0.0
-        }
+            data = message.get("bytes")
+            if data is None:
+                continue
+            
+            if len(data) > Config.LIVE_MAX_FRAME_BYTES:
+                await websocket.close(code=1009, reason="Frame too large")
+                break
+            
+            seq += 1
+            task = asyncio.create_task(process_frame(seq, data, time.perf_counter()))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+    
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in list(in_flight):
+            task.cancel()
+        scheduler.close_client(client_id)
+        logger.info(f"[Live] WebSocket stream closed for client {client_id} after {seq} frames")
@@ -1,18 +1,54 @@
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Depends
-from src.backend.services.pipeline_runner import run_full_pipeline_async
+import math
+from fastapi import APIRouter, HTTPException, Request, Depends
+from src.backend.services.admission_control import QueueFull, estimate_work, get_admission_controller
 from src.backend.services.session_service import SessionService
+from src.backend.services.visual_evaluation_service import VisualEvaluationService
 from src.backend.services.user_service import UserService
 from src.backend.services.analytics_service import AnalyticsService
+from src.backend.utils.config import Config
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 router = APIRouter()
 
+EVALUATION_TABLES = [
+    "transcripts",
+    "transcript_segments",
+    "text_evaluations",
+    "visual_evaluations",
+    "final_scores",
+    "reports"
+]
+
+def admit_session(session: dict) -> dict:
+    
+    # Live sessions arrive with their visual evaluation and skip that stage
+    visual = not VisualEvaluationService.get_visual_evaluation(session["id"])
+    cost = estimate_work(session.get("duration_seconds"), visual=visual)
+    
+    try:
+        return get_admission_controller().submit(session["id"], cost)
+    except QueueFull as e:
+        logger.warning(f"[API] Processing queue full, session {session['id']} not admitted")
+        raise HTTPException(
+            status_code=503,
+            detail="Processing queue is full. Try again later.",
+            headers={"Retry-After": str(math.ceil(e.retry_after))}
+        )
+
+def already_processing(session_id: str, admission: dict = None) -> dict:
+    
+    return {
+        "status": "already_processing",
+        "session_id": session_id,
+        "admission": admission,
+        "message": "Session is already being processed. Please wait for completion."
+    }
+
 @router.post("/{session_id}")
 def process_session_endpoint(
     session_id: str, 
-    background_tasks: BackgroundTasks,
     request: Request
 ):
     
@@ -48,14 +84,19 @@ def process_session_endpoint(
         )
     
     current_status = session.get("status", "uploaded")
-    
-    if current_status == "processing":
+    controller = get_admission_controller()
+    admission = controller.status(session_id)
+    
+    # Admission queues are per process. A session another process holds,
+    # going by its heartbeat, is left to it; one left "queued" by a process
+    # that has stopped is admitted again
+    if current_status == "processing" or admission is not None or \
+            SessionService.admission_held_elsewhere(session, controller.owner, Config.ADMISSION_STALE_SEC):
         logger.warning(f"[API] Session {session_id} is already being processed")
-        return {
-            "status": "already_processing",
-            "session_id": session_id,
-            "message": "Session is already being processed. Please wait for completion."
-        }
+        return already_processing(session_id, admission)
+    
+    if current_status == "queued":
+        logger.warning(f"[API] Session {session_id} is queued without a live pipeline job, admitting it again")
     
     if current_status == "complete":
         logger.warning(f"[API] Session {session_id} is already complete")
@@ -65,16 +106,21 @@ def process_session_endpoint(
             "message": "Session has already been processed. Results are available."
         }
     
+    # The pipeline sets "processing" itself once admission control starts it
     try:
-        success = SessionService.update_session_status(session_id, "processing")
+        if not SessionService.claim_admission(session, controller.owner):
+            logger.warning(f"[API] Session {session_id} was admitted by another process")
+            return already_processing(session_id)
+        
+        success = SessionService.update_session_status(session_id, "queued")
         if not success:
-            logger.error(f"[API] Failed to update session {session_id} status to 'processing'")
+            logger.error(f"[API] Failed to update session {session_id} status to 'queued'")
             raise HTTPException(
                 status_code=500,
                 detail="Failed to update session status"
             )
         
-        logger.info(f"[API] Session {session_id} status set to 'processing'")
+        logger.info(f"[API] Session {session_id} status set to 'queued'")
         
     except HTTPException:
         raise
@@ -88,22 +134,24 @@ def process_session_endpoint(
     logger.info(f"[API] Queueing pipeline job for session {session_id}")
     
     try:
-        background_tasks.add_task(run_full_pipeline_async, session_id)
-        logger.info(f"[API] Pipeline job queued successfully for session {session_id}")
+        ticket = admit_session(session)
+        logger.info(f"[API] Pipeline job for session {session_id} {ticket['state']}, ETA {ticket['eta_seconds']}s")
         
         AnalyticsService.record_event(
             event_name="pipeline_start",
             session_id=session_id,
             user_id=user_id,
-            metadata={"trigger": "manual_process"}
+            metadata={"trigger": "manual_process", "state": ticket["state"], "estimated_work": ticket["estimated_work"]}
         )
         
     except Exception as e:
         logger.error(f"[API] Failed to queue pipeline job: {str(e)}")
         try:
-            SessionService.update_session_status(session_id, "uploaded")
+            SessionService.update_session_status(session_id, current_status)
         except:
             pass
+        if isinstance(e, HTTPException):
+            raise
         raise HTTPException(
             status_code=500,
             detail=f"Failed to queue processing job: {str(e)}"
@@ -111,9 +159,18 @@ def process_session_endpoint(
     
     logger.info(f"[API] Returning success response for session {session_id}")
     
+    if ticket["state"] == "queued":
+        return {
+            "status": "queued",
+            "session_id": session_id,
+            "admission": ticket,
+            "message": f"Pipeline is at capacity. Session is number {ticket['position']} in the queue. Poll session status for completion."
+        }
+    
     return {
         "status": "processing_started",
         "session_id": session_id,
+        "admission": ticket,
         "message": "Pipeline processing started in background. Poll session status for completion."
     }
 
@@ -172,6 +229,8 @@ def get_session_status_endpoint(
     
     if current_status == "uploaded":
         progress = {"percentage": 0, "current_stage": "Uploaded - Ready for processing"}
+    elif current_status == "queued":
+        progress = {"percentage": 0, "current_stage": "Queued - Waiting for pipeline capacity"}
     elif current_status == "processing":
         completion_meta = status_info.get("metadata", {}).get("completion_metadata", {})
         pipeline_stages = completion_meta.get("pipeline_stages", {})
@@ -203,6 +262,9 @@ def get_session_status_endpoint(
         "metadata": response_metadata
     }
     
+    if current_status in ("queued", "processing"):
+        response["admission"] = get_admission_controller().status(session_id)
+    
     logger.info(f"[API] Returning status response for session {session_id}")
     
     if current_status in ["complete", "failed"]:
@@ -215,7 +277,6 @@ def get_session_status_endpoint(
 @router.post("/restart/{session_id}")
 def restart_session_endpoint(
     session_id: str, 
-    background_tasks: BackgroundTasks,
     request: Request
 ):
     
@@ -250,105 +311,106 @@ def restart_session_endpoint(
             detail=f"Session validation failed: {str(e)}"
         )
     
+    # Cleaning up under a running pipeline would wipe the rows it is
+    # writing, and admission would hand back the running job. A job held
+    # by another process may be running there
+    controller = get_admission_controller()
+    admission = controller.status(session_id)
+    if (admission and admission["state"] == "running") or \
+            SessionService.admission_held_elsewhere(session, controller.owner, Config.ADMISSION_STALE_SEC):
+        logger.warning(f"[API] Session {session_id} restart rejected, pipeline is running")
+        raise HTTPException(
+            status_code=409,
+            detail="Session is being processed. Restart it once processing has finished."
+        )
+    
+    if not SessionService.claim_admission(session, controller.owner):
+        logger.warning(f"[API] Session {session_id} restart rejected, admitted by another process")
+        raise HTTPException(
+            status_code=409,
+            detail="Session is being processed. Restart it once processing has finished."
+        )
+    
     logger.info(f"[API] Cleaning previous evaluation data for session {session_id}")
     
     from src.backend.utils.cache import clear_cache
-    clear_cache(f"results:{session_id}")
+    clear_cache(f"results:{session_id}:summary")
+    clear_cache(f"results:{session_id}:full")
     clear_cache(f"status:{session_id}")
     
     try:
-        from src.backend.utils.supabase_client import supabase
+        from src.backend.storage import get_storage
         
-        deleted_count = 0
-        
-        try:
-            result = supabase.table("transcripts").delete().eq("session_id", session_id).execute()
-            if result.data:
-                deleted_count += len(result.data)
-                logger.info(f"[API] Deleted {len(result.data)} transcript records")
-        except Exception as e:
-            logger.warning(f"[API] Error deleting transcripts: {str(e)}")
+        storage = get_storage()
         
-        try:
-            result = supabase.table("text_evaluations").delete().eq("session_id", session_id).execute()
-            if result.data:
-                deleted_count += len(result.data)
-                logger.info(f"[API] Deleted {len(result.data)} text evaluation records")
-        except Exception as e:
-            logger.warning(f"[API] Error deleting text evaluations: {str(e)}")
-        
-        try:
-            result = supabase.table("visual_evaluations").delete().eq("session_id", session_id).execute()
-            if result.data:
-                deleted_count += len(result.data)
-                logger.info(f"[API] Deleted {len(result.data)} visual evaluation records")
-        except Exception as e:
-            logger.warning(f"[API] Error deleting visual evaluations: {str(e)}")
-        
-        try:
-            result = supabase.table("final_scores").delete().eq("session_id", session_id).execute()
-            if result.data:
-                deleted_count += len(result.data)
-                logger.info(f"[API] Deleted {len(result.data)} final score records")
-        except Exception as e:
-            logger.warning(f"[API] Error deleting final scores: {str(e)}")
-        
-        try:
-            result = supabase.table("reports").delete().eq("session_id", session_id).execute()
-            if result.data:
-                deleted_count += len(result.data)
-                logger.info(f"[API] Deleted {len(result.data)} report records")
-        except Exception as e:
-            logger.warning(f"[API] Error deleting reports: {str(e)}")
+        with storage.transaction():
+            deleted_count = 0
+            
+            # Each cleanup step runs in its own savepoint, so a table that
+            # doesn't exist yet (migration not run) doesn't abort the reset
+            for table in EVALUATION_TABLES:
+                try:
+                    with storage.transaction():
+                        deleted = storage.delete(table, {"session_id": session_id})
+                    if deleted:
+                        deleted_count += len(deleted)
+                        logger.info(f"[API] Deleted {len(deleted)} {table} records")
+                except Exception as e:
+                    logger.warning(f"[API] Error deleting {table}: {str(e)}")
+            
+            try:
+                from src.backend.services.analytics_rollup_service import AnalyticsRollupService
+                with storage.transaction():
+                    AnalyticsRollupService.retract_session(session)
+            except Exception as e:
+                logger.warning(f"[API] Error retracting session from analytics rollup: {str(e)}")
+            
+            try:
+                from src.backend.services.transcript_search_service import TranscriptSearchService
+                with storage.transaction():
+                    TranscriptSearchService.remove_transcript(session_id)
+            except Exception as e:
+                logger.warning(f"[API] Error removing transcript from search index: {str(e)}")
+            
+            logger.info(f"[API] Cleaned {deleted_count} evaluation records total")
+            logger.info(f"[API] Resetting session metadata")
+            
+            storage.update("sessions", {
+                "status": "queued",
+                "has_transcript": False,
+                "stages_completed": [],
+                "last_successful_stage": None,
+                "completed_at": None,
+                "completion_metadata": None
+            }, {"id": session_id})
         
-        logger.info(f"[API] Cleaned {deleted_count} evaluation records total")
+        logger.info(f"[API] Session {session_id} reset to queued state")
         
     except Exception as e:
-        logger.error(f"[API] Error cleaning evaluation data: {str(e)}")
+        logger.error(f"[API] Error resetting session data: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to clean previous evaluation data: {str(e)}"
         )
     
-    logger.info(f"[API] Resetting session metadata")
-    
-    try:
-        from src.backend.utils.supabase_client import supabase
-        
-        supabase.table("sessions").update({
-            "status": "pending",
-            "has_transcript": False,
-            "stages_completed": [],
-            "last_successful_stage": None,
-            "completed_at": None,
-            "completion_metadata": None
-        }).eq("id", session_id).execute()
-        
-        logger.info(f"[API] Session {session_id} reset to pending state")
-        
-    except Exception as e:
-        logger.error(f"[API] Error resetting session metadata: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to reset session metadata: {str(e)}"
-        )
-    
     logger.info(f"[API] Queueing pipeline for reprocessing")
     
     try:
-        background_tasks.add_task(run_full_pipeline_async, session_id)
-        background_tasks.add_task(run_full_pipeline_async, session_id)
-        logger.info(f"[API] Pipeline queued successfully")
+        ticket = admit_session(session)
+        logger.info(f"[API] Pipeline {ticket['state']}, ETA {ticket['eta_seconds']}s")
         
         AnalyticsService.record_event(
             event_name="pipeline_restart",
             session_id=session_id,
             user_id=user_id,
-            metadata={"trigger": "manual_restart"}
+            metadata={"trigger": "manual_restart", "state": ticket["state"], "estimated_work": ticket["estimated_work"]}
         )
         
     except Exception as e:
         logger.error(f"[API] Failed to queue pipeline: {str(e)}")
+        SessionService.update_session_status(session_id, "pending")
+        if isinstance(e, HTTPException):
+            raise
         raise HTTPException(
             status_code=500,
             detail=f"Failed to queue processing: {str(e)}"
@@ -359,5 +421,6 @@ def restart_session_endpoint(
     return {
         "status": "restarted",
         "session_id": session_id,
+        "admission": ticket,
         "message": "Pipeline restarted successfully. All previous data has been cleaned and processing has started from the beginning."
     }
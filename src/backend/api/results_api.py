@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Request, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Depends, Query
 from src.backend.services.session_service import SessionService
 from src.backend.services.transcript_service import TranscriptService
 from src.backend.services.text_evaluation_service import TextEvaluationService
@@ -16,7 +17,8 @@ router = APIRouter()
 @router.get("/{session_id}")
 def get_session_results(
     session_id: str,
-    request: Request
+    request: Request,
+    include_transcript: bool = False
 ):
     
     logger.info(f"[API] GET /results/{session_id} - Results requested")
@@ -63,7 +65,7 @@ def get_session_results(
         }
     
     from src.backend.utils.cache import get_cache, set_cache
-    cache_key = f"results:{session_id}"
+    cache_key = f"results:{session_id}:{'full' if include_transcript else 'summary'}"
     cached_results = get_cache(cache_key)
     
     if cached_results:
@@ -108,13 +110,20 @@ def get_session_results(
         results["report"] = None
     
     try:
-        transcript = TranscriptService.get_transcript(session_id)
-        if transcript:
-            results["transcript"] = {
-                "text": transcript.get("full_text", ""),
+        # Only a summary by default; segments are paged through
+        # GET /results/{session_id}/transcript
+        if include_transcript:
+            transcript = TranscriptService.get_transcript(session_id)
+            transcript = {
+                "text": transcript.get("raw_text", ""),
                 "segments": transcript.get("segments", [])
-            }
-            logger.info(f"[API] Transcript retrieved ({len(transcript.get('full_text', ''))} chars)")
+            } if transcript else None
+        else:
+            transcript = TranscriptService.get_transcript_summary(session_id)
+
+        if transcript:
+            results["transcript"] = transcript
+            logger.info(f"[API] Transcript retrieved ({'full' if include_transcript else 'summary'})")
         else:
             results["transcript"] = None
             logger.warning(f"[API] No transcript found for session {session_id}")
@@ -197,7 +206,8 @@ def get_session_results(
                 "silence_ratio": silence_ratio,
                 "silence_score": silence_score,
                 "clarity_score": clarity_score,
-                "audio_overall": audio_overall
+                "audio_overall": audio_overall,
+                "pacing": (audio_eval.get("raw_features") or {}).get("pacing")
             }
             logger.info(f"[API] Audio evaluation retrieved: wpm={wpm}, audio_overall={audio_overall}")
         else:
@@ -224,3 +234,43 @@ def get_session_results(
     set_cache(cache_key, results, ttl_seconds=600)
     
     return results
+
+@router.get("/{session_id}/transcript")
+def get_session_transcript(
+    session_id: str,
+    request: Request,
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0),
+    cursor: Optional[int] = Query(None, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    include_text: bool = False
+):
+
+    logger.info(f"[API] GET /results/{session_id}/transcript - start={start}, end={end}, cursor={cursor}, limit={limit}")
+
+    user_id = UserService.get_user_id(request)
+
+    status_info = SessionService.get_session_status(session_id)
+    if not status_info:
+        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+    if status_info.get("user_id") != user_id:
+        logger.warning(f"[API] User {user_id} attempted to access transcript of session {session_id}")
+        raise HTTPException(status_code=403, detail="You do not have permission to access this session")
+
+    if start is not None and end is not None and end <= start:
+        raise HTTPException(status_code=400, detail="end must be greater than start")
+
+    try:
+        page = TranscriptService.get_segments(session_id, start=start, end=end, cursor=cursor, limit=limit)
+    except Exception as e:
+        logger.error(f"[API] Error fetching transcript segments: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch transcript: {str(e)}")
+
+    response = {"session_id": session_id, **page}
+
+    if include_text:
+        from src.backend.storage import get_storage
+        row = get_storage().select_one("transcripts", {"session_id": session_id}, columns=["raw_text"])
+        response["text"] = row.get("raw_text", "") if row else ""
+
+    return response
@@ -1,48 +1,64 @@
-from fastapi import APIRouter, HTTPException, Request, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Depends, Query
+from src.backend.services.session_service import (
+    MAX_SESSION_PAGE_SIZE,
+    SESSION_PAGE_SIZE,
+    SessionService
+)
 from src.backend.services.user_service import UserService
-from src.backend.utils.supabase_client import supabase
+from src.backend.storage import get_storage
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 router = APIRouter()
 
 @router.get("/list")
-def list_sessions(request: Request):
+def list_sessions(
+    request: Request,
+    cursor: Optional[str] = Query(None, max_length=512),
+    limit: int = Query(SESSION_PAGE_SIZE, ge=1, le=MAX_SESSION_PAGE_SIZE),
+    status: Optional[str] = Query(None, max_length=32),
+    order: str = Query("desc", pattern="^(asc|desc)$")
+):
     
     user_id = UserService.get_user_id(request)
     
     logger.info(f"[API] GET /sessions/list - Listing sessions for user {user_id}")
     
     try:
-        response = supabase.table("sessions")\
-            .select("*")\
-            .eq("user_id", user_id)\
-            .order("created_at", desc=True)\
-            .execute()
-            
-        sessions = response.data
-        
-        result = []
-        for session in sessions:
-            mentor_score = None
-            if session.get("completion_metadata"):
-                mentor_score = session.get("completion_metadata", {}).get("mentor_score")
-            
-            result.append({
-                "id": session["id"],
-                "filename": session["filename"],
-                "status": session["status"],
-                "created_at": session["created_at"],
-                "mentor_score": mentor_score,
-                "file_url": session["file_url"]
-            })
-            
-        return result
+        return SessionService.list_sessions(
+            user_id,
+            cursor=cursor,
+            limit=limit,
+            status=status,
+            newest_first=order == "desc"
+        )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"[API] Error listing sessions: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to list sessions: {str(e)}")
 
+@router.get("/search")
+def search_sessions(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100)
+):
+    
+    user_id = UserService.get_user_id(request)
+    
+    logger.info(f"[API] GET /sessions/search - Searching transcripts for user {user_id}")
+    
+    try:
+        from src.backend.services.transcript_search_service import TranscriptSearchService
+        return TranscriptSearchService.search(user_id, q, limit=limit)
+        
+    except Exception as e:
+        logger.error(f"[API] Error searching transcripts: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search transcripts: {str(e)}")
+
 @router.get("/{session_id}")
 def get_session_status(session_id: str, request: Request):
     
@@ -51,15 +67,10 @@ def get_session_status(session_id: str, request: Request):
     logger.info(f"[API] GET /sessions/{session_id} - Getting status for user {user_id}")
     
     try:
-        response = supabase.table("sessions")\
-            .select("*")\
-            .eq("id", session_id)\
-            .execute()
+        session = get_storage().select_one("sessions", {"id": session_id})
             
-        if not response.data or len(response.data) == 0:
+        if not session:
             raise HTTPException(status_code=404, detail="Session not found")
-            
-        session = response.data[0]
         
         import os
         DEV_MODE = os.getenv("DEV_MODE", "true").lower() == "true"
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Request, Depends
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request, Depends
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional
 from src.backend.services.session_service import SessionService
 from src.backend.services.user_service import UserService
 from src.backend.services.analytics_service import AnalyticsService
+from src.backend.services.live_session_service import LiveSessionService
 from src.backend.utils.logger import setup_logger
-from src.backend.utils.supabase_client import supabase
+from src.backend.storage import get_storage
 from src.backend.utils.file_manager import FileManager
 from src.backend.models.api_models import UploadResponse
 import os
@@ -14,11 +17,22 @@ logger = setup_logger(__name__)
 @router.post("/", response_model=UploadResponse)
 async def upload_video(
     request: Request,
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    session_id: Optional[str] = Form(None)
 ):
     try:
         user_id = UserService.get_user_id(request)
         
+        # Recording of a live practice session: reuse its session so the
+        # visual evaluation captured live is kept and the stage is skipped
+        if session_id:
+            try:
+                LiveSessionService.validate_pending_live_session(session_id, user_id)
+            except LookupError as e:
+                raise HTTPException(status_code=404, detail=str(e))
+            except PermissionError as e:
+                raise HTTPException(status_code=403, detail=str(e))
+        
         AnalyticsService.record_event(
             event_name="upload_start",
             user_id=user_id,
@@ -32,23 +46,32 @@ async def upload_video(
         content = await file.read()
         
         bucket_name = "videos"
-        res = supabase.storage.from_(bucket_name).upload(
-            path=filename,
-            file=content,
-            file_options={"content-type": file.content_type}
+        storage = get_storage()
+        storage.upload_file(
+            bucket_name,
+            filename,
+            content,
+            content_type=file.content_type
         )
         
-        public_url = supabase.storage.from_(bucket_name).get_public_url(filename)
+        public_url = storage.get_public_url(bucket_name, filename)
+        
+        # Admission control sizes processing requests by video length
+        duration = await run_in_threadpool(FileManager.probe_duration, content, filename)
         
         session_data = {
             "user_id": user_id,
             "file_url": public_url,
             "filename": filename,
-            "status": "uploaded"
+            "status": "uploaded",
+            "duration_seconds": duration
         }
         
-        response = supabase.table("sessions").insert(session_data).execute()
-        data = response.data
+        if session_id:
+            attached = LiveSessionService.attach_recording(session_id, filename, public_url, duration)
+            data = [attached] if attached else []
+        else:
+            data = storage.insert("sessions", session_data)
         
         if not data or len(data) == 0:
              raise HTTPException(status_code=500, detail="Failed to create session record")
@@ -61,7 +84,7 @@ async def upload_video(
             event_name="upload_success",
             session_id=session['id'],
             user_id=user_id,
-            metadata={"filename": filename, "size": len(content)}
+            metadata={"filename": filename, "size": len(content), "duration_sec": duration}
         )
         
         return UploadResponse(
@@ -24,16 +24,18 @@ origins = [
     os.getenv("FRONTEND_URL", "")
 ]
 
+# Added first so CORS wraps it and 429 responses carry CORS headers too
+app.add_middleware(RateLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[origin for origin in origins if origin],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy", "Retry-After"],
 )
 
-app.add_middleware(RateLimitMiddleware)
-
 app.include_router(upload.router, prefix="/api/upload", tags=["Upload"])
 app.include_router(process.router, prefix="/api/process", tags=["Process"])
 app.include_router(results_api.router, prefix="/api/results", tags=["Results"])
@@ -50,6 +52,17 @@ app.include_router(live_analysis.router, prefix="/api/live", tags=["Live"])
 async def health_check():
     return {"status": "healthy", "service": "MentorMetrics Backend"}
 
+@app.on_event("shutdown")
+def shutdown_inference_workers():
+    from src.backend.workers import shutdown_model_client
+    shutdown_model_client()
+    live_analysis.shutdown_live_scheduler()
+
+@app.on_event("shutdown")
+def flush_analytics_events():
+    from src.backend.services.analytics_service import shutdown_event_buffer
+    shutdown_event_buffer()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("src.backend.main:app", host="0.0.0.0", port=8000, reload=True)
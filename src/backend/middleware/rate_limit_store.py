@@ -0,0 +1,212 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# take() returns (allowed, tokens left after the request); take_all() the
+# fewest tokens left in any of its buckets
+TakeResult = Tuple[bool, float]
+
+def refill(tokens: float, updated_at: float, now: float, rate: float, capacity: float) -> float:
+
+    return min(capacity, tokens + max(0.0, now - updated_at) * rate)
+
+class RateLimitStore:
+
+    # Token buckets keyed by string. A bucket holds up to capacity tokens
+    # and gains rate tokens per second; take() removes cost tokens if they
+    # are there. take_all() does the same for several buckets at once,
+    # removing tokens only when every bucket has them. Missing or evicted
+    # buckets count as full.
+
+    name = "base"
+    blocking = False
+
+    def take(self, key: str, rate: float, capacity: float, cost: float = 1.0, now: Optional[float] = None) -> TakeResult:
+
+        return self.take_all([key], rate, capacity, cost, now)
+
+    def take_all(self, keys: List[str], rate: float, capacity: float, cost: float = 1.0, now: Optional[float] = None) -> TakeResult:
+        raise NotImplementedError("Subclasses must implement take_all")
+
+    def close(self) -> None:
+
+        pass
+
+class MemoryRateLimitStore(RateLimitStore):
+
+    # Per-process buckets, least recently used evicted beyond max_keys
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = 10000):
+
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take_all(self, keys: List[str], rate: float, capacity: float, cost: float = 1.0, now: Optional[float] = None) -> TakeResult:
+
+        now = time.time() if now is None else now
+        with self._lock:
+            levels = [refill(*self._buckets.pop(key, (capacity, now)), now, rate, capacity) for key in keys]
+            allowed = all(tokens >= cost for tokens in levels)
+            if allowed:
+                levels = [tokens - cost for tokens in levels]
+
+            for key, tokens in zip(keys, levels):
+                self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, min(levels)
+
+    def __len__(self) -> int:
+
+        return len(self._buckets)
+
+class SQLiteRateLimitStore(RateLimitStore):
+
+    # Buckets in a SQLite file shared by every worker on the host. Each
+    # take_all is one IMMEDIATE transaction, so concurrent workers
+    # serialise on the file lock. Rows of buckets that have refilled
+    # completely carry no state and are pruned every prune_every takes.
+
+    name = "sqlite"
+    blocking = True
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+        "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, full_at REAL NOT NULL)"
+    )
+
+    def __init__(self, db_path: str, prune_every: int = 1000):
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.db_path = db_path
+        self.prune_every = prune_every
+        self._takes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(self.SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_rate_limit_buckets_full_at ON rate_limit_buckets(full_at)")
+
+    def take_all(self, keys: List[str], rate: float, capacity: float, cost: float = 1.0, now: Optional[float] = None) -> TakeResult:
+
+        now = time.time() if now is None else now
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                levels = []
+                for key in keys:
+                    row = conn.execute("SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?", (key,)).fetchone()
+                    levels.append(refill(row[0], row[1], now, rate, capacity) if row else capacity)
+                allowed = all(tokens >= cost for tokens in levels)
+                if allowed:
+                    levels = [tokens - cost for tokens in levels]
+
+                conn.executemany(
+                    "INSERT INTO rate_limit_buckets (key, tokens, updated_at, full_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at, full_at = excluded.full_at",
+                    [(key, tokens, now, now + (capacity - tokens) / rate) for key, tokens in zip(keys, levels)]
+                )
+
+                self._takes += 1
+                if self._takes % self.prune_every == 0:
+                    conn.execute("DELETE FROM rate_limit_buckets WHERE full_at < ?", (now,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return allowed, min(levels)
+
+    def close(self) -> None:
+
+        self._conn.close()
+
+class RedisRateLimitStore(RateLimitStore):
+
+    # Buckets in Redis or any server speaking its protocol with Lua
+    # scripting (Valkey, KeyDB, Dragonfly). The refill-and-take over all of
+    # a request's buckets runs as one script, so it is atomic across
+    # workers and hosts; every bucket key expires once it would have
+    # refilled.
+
+    name = "redis"
+    blocking = True
+
+    SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+local levels = {}
+local allowed = 1
+for i, key in ipairs(KEYS) do
+    local state = redis.call('HMGET', key, 'tokens', 'updated_at')
+    local tokens = tonumber(state[1]) or capacity
+    local updated_at = tonumber(state[2]) or now
+    levels[i] = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+    if levels[i] < cost then
+        allowed = 0
+    end
+end
+local lowest = capacity
+for i, key in ipairs(KEYS) do
+    local tokens = levels[i] - cost * allowed
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'updated_at', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate * 1000) + 1000)
+    lowest = math.min(lowest, tokens)
+end
+return {allowed, tostring(lowest)}
+"""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:", client=None):
+
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url, socket_timeout=1.0)
+
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(self.SCRIPT)
+
+    def take_all(self, keys: List[str], rate: float, capacity: float, cost: float = 1.0, now: Optional[float] = None) -> TakeResult:
+
+        now = time.time() if now is None else now
+        allowed, tokens = self._script(keys=[self.prefix + key for key in keys], args=[rate, capacity, cost, now])
+        return bool(int(allowed)), float(tokens)
+
+def create_rate_limit_store(backend: str, sqlite_path: Optional[str] = None, redis_url: Optional[str] = None, max_keys: int = 10000) -> RateLimitStore:
+
+    backend = (backend or "memory").lower()
+
+    if backend == "sqlite":
+        return SQLiteRateLimitStore(sqlite_path)
+
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("RATE_LIMIT_REDIS_URL is not set")
+        return RedisRateLimitStore(redis_url)
+
+    if backend == "memory":
+        return MemoryRateLimitStore(max_keys=max_keys)
+
+    raise ValueError(f"Unknown RATE_LIMIT_STORE: {backend}")
+
+__all__ = [
+    'RateLimitStore',
+    'MemoryRateLimitStore',
+    'SQLiteRateLimitStore',
+    'RedisRateLimitStore',
+    'create_rate_limit_store'
+]
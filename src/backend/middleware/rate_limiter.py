@@ -1,65 +1,180 @@
-import time
+import hashlib
+import math
 import os
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+import threading
+from typing import List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
 from starlette.responses import JSONResponse
+from src.backend.middleware.rate_limit_store import RateLimitStore, create_rate_limit_store
+from src.backend.utils.config import Config
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
-UPLOAD_RATE_LIMIT = int(os.getenv("UPLOAD_RATE_LIMIT", "5"))
-PROCESS_RATE_LIMIT = int(os.getenv("PROCESS_RATE_LIMIT", "10"))
-
-_rate_limit_store = {}
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if not RATE_LIMIT_ENABLED:
-            return await call_next(request)
-
-        client_id = request.client.host if request.client else "unknown"
-        path = request.url.path
-
-        limit = None
-        window_seconds = 60
-        endpoint_key = None
-
-        if "/api/upload" in path and request.method == "POST":
-            limit = UPLOAD_RATE_LIMIT
-            endpoint_key = "upload"
-        elif "/api/process" in path and request.method == "POST":
-            limit = PROCESS_RATE_LIMIT
-            endpoint_key = "process"
-        
-        if limit is None:
-            return await call_next(request)
-
-        current_time = time.time()
-        
-        if client_id not in _rate_limit_store:
-            _rate_limit_store[client_id] = {}
-        
-        if endpoint_key not in _rate_limit_store[client_id]:
-            _rate_limit_store[client_id][endpoint_key] = {
-                "count": 0,
-                "reset_time": current_time + window_seconds
-            }
-        
-        bucket = _rate_limit_store[client_id][endpoint_key]
-        
-        if current_time > bucket["reset_time"]:
-            bucket["count"] = 0
-            bucket["reset_time"] = current_time + window_seconds
-            
-        if bucket["count"] >= limit:
-            logger.warning(f"[RateLimit] Limit exceeded for {client_id} on {endpoint_key}")
-            return JSONResponse(
+DEV_MODE = os.getenv("DEV_MODE", "true").lower() == "true"
+
+class RateLimitRule:
+
+    # limit requests per period seconds, as a token bucket: bursts of up to
+    # limit requests, refilled at limit/period per second
+
+    def __init__(self, name: str, method: str, path_prefix: str, limit: int, period: float = 60.0):
+
+        self.name = name
+        self.method = method
+        self.path_prefix = path_prefix
+        self.limit = limit
+        self.period = period
+        self.rate = limit / period
+
+    def matches(self, method: str, path: str) -> bool:
+
+        return method == self.method and path.startswith(self.path_prefix)
+
+def default_rules() -> List[RateLimitRule]:
+
+    return [
+        RateLimitRule("upload", "POST", "/api/upload", Config.UPLOAD_RATE_LIMIT),
+        RateLimitRule("process", "POST", "/api/process", Config.PROCESS_RATE_LIMIT)
+    ]
+
+def _header(scope, name: bytes) -> Optional[str]:
+
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+def client_keys(scope, trust_proxy: bool = False) -> List[str]:
+
+    # Every request is limited per client address and, when it carries
+    # credentials, per user as well. Rotating addresses does not get around
+    # a user's limit; clients behind one address (NAT, proxies) share its
+    # bucket.
+    ip = None
+    if trust_proxy:
+        forwarded = _header(scope, b"x-forwarded-for")
+        if forwarded:
+            ip = forwarded.split(",")[0].strip()
+    if not ip:
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+    keys = [f"ip:{ip}"]
+
+    user_id = _header(scope, b"x-user-id") if DEV_MODE else None
+    auth = _header(scope, b"authorization")
+    if user_id and user_id.strip():
+        keys.append(f"user:{user_id.strip()}")
+    elif auth:
+        # The token is verified later by the endpoint; hashing it keys the
+        # bucket to the credential without trusting its unverified claims
+        token = auth.split(" ", 1)[-1].strip()
+        keys.append("token:" + hashlib.blake2b(token.encode(), digest_size=12).hexdigest())
+    return keys
+
+def rate_limit_headers(rule: RateLimitRule, tokens: float) -> dict:
+
+    return {
+        "RateLimit-Limit": str(rule.limit),
+        "RateLimit-Remaining": str(max(0, math.floor(tokens))),
+        "RateLimit-Reset": str(max(0, math.ceil((rule.limit - tokens) / rule.rate))),
+        "RateLimit-Policy": f"{rule.limit};w={int(rule.period)}"
+    }
+
+_store: Optional[RateLimitStore] = None
+_store_lock = threading.Lock()
+
+def get_rate_limit_store() -> RateLimitStore:
+
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_rate_limit_store(
+                    Config.RATE_LIMIT_STORE,
+                    sqlite_path=Config.RATE_LIMIT_SQLITE_PATH,
+                    redis_url=Config.RATE_LIMIT_REDIS_URL,
+                    max_keys=Config.RATE_LIMIT_MAX_KEYS
+                )
+                logger.info(f"[RateLimit] Using {_store.name} store")
+    return _store
+
+def set_rate_limit_store(store: Optional[RateLimitStore]):
+
+    global _store
+    _store = store
+
+class RateLimitMiddleware:
+
+    # Pure ASGI middleware: requests that match no rule are passed through
+    # untouched, without the request/response wrapping of BaseHTTPMiddleware
+
+    def __init__(self, app, store: Optional[RateLimitStore] = None, rules: Optional[List[RateLimitRule]] = None, enabled: Optional[bool] = None):
+
+        self.app = app
+        self.store = store
+        self.rules = default_rules() if rules is None else rules
+        self.enabled = Config.RATE_LIMIT_ENABLED if enabled is None else enabled
+
+    def _take(self, store: RateLimitStore, rule: RateLimitRule, keys: List[str]) -> Tuple[bool, float]:
+
+        # All of the request's buckets in one step: a request denied by one
+        # bucket takes nothing from the others
+        return store.take_all([f"{rule.name}:{key}" for key in keys], rule.rate, rule.limit)
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        rule = next((r for r in self.rules if r.matches(scope["method"], scope["path"])), None)
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        keys = client_keys(scope, trust_proxy=Config.RATE_LIMIT_TRUST_PROXY)
+        store = self.store if self.store is not None else get_rate_limit_store()
+
+        try:
+            if store.blocking:
+                allowed, tokens = await run_in_threadpool(self._take, store, rule, keys)
+            else:
+                allowed, tokens = self._take(store, rule, keys)
+        except Exception as e:
+            # An unreachable shared store must not take the API down with it
+            logger.error(f"[RateLimit] Store error, request not limited: {str(e)}")
+            await self.app(scope, receive, send)
+            return
+
+        headers = rate_limit_headers(rule, tokens)
+
+        if not allowed:
+            logger.warning(f"[RateLimit] Limit exceeded for {', '.join(keys)} on {rule.name}")
+            headers["Retry-After"] = str(max(1, math.ceil((1 - tokens) / rule.rate)))
+            response = JSONResponse(
                 status_code=429,
-                content={"error": "Rate limit exceeded. Try again later."}
+                content={"error": "Rate limit exceeded. Try again later."},
+                headers=headers
             )
-            
-        bucket["count"] += 1
-        
-        response = await call_next(request)
-        return response
+            await response(scope, receive, send)
+            return
+
+        raw_headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+
+        async def send_with_headers(message):
+
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message.get("headers", [])) + raw_headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+__all__ = [
+    'RateLimitRule',
+    'RateLimitMiddleware',
+    'default_rules',
+    'client_keys',
+    'get_rate_limit_store',
+    'set_rate_limit_store'
+]
@@ -18,6 +18,9 @@ CREATE TABLE IF NOT EXISTS public.sessions (
     last_successful_stage TEXT,
     completed_at TIMESTAMP WITH TIME ZONE,
     completion_metadata JSONB,
+    duration_seconds REAL,
+    admission_owner TEXT,
+    admission_heartbeat_at TIMESTAMP WITH TIME ZONE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc'::text, now()) NOT NULL,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc'::text, now()) NOT NULL
 );
@@ -53,10 +56,31 @@ CREATE TABLE IF NOT EXISTS public.transcripts (
     raw_text TEXT,
     segments JSONB,
     word_timestamps JSONB,
+    segment_count INTEGER,
+    word_count INTEGER,
+    duration_seconds REAL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc'::text, now()) NOT NULL,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc'::text, now()) NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS public.transcript_segments (
+    id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
+    session_id UUID REFERENCES public.sessions(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL NOT NULL,
+    text TEXT,
+    word_count INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS public.transcript_terms (
+    id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
+    user_id UUID,
+    term TEXT NOT NULL,
+    session_id UUID REFERENCES public.sessions(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS public.audio_features (
     id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
     session_id UUID REFERENCES public.sessions(id) ON DELETE CASCADE,
@@ -117,6 +141,25 @@ CREATE TABLE IF NOT EXISTS public.reports (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc'::text, now()) NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS public.user_analytics_rollups (
+    id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
+    user_id UUID NOT NULL UNIQUE,
+    completed_sessions INTEGER DEFAULT 0,
+    metric_sums JSONB DEFAULT '{}'::jsonb,
+    metric_counts JSONB DEFAULT '{}'::jsonb,
+    score_distribution JSONB DEFAULT '{}'::jsonb,
+    score_history JSONB DEFAULT '[]'::jsonb,
+    first_score DOUBLE PRECISION,
+    latest_score DOUBLE PRECISION,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc'::text, now()) NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_sessions_user_created_id ON public.sessions(user_id, created_at DESC, id DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_transcript_segments_session_seq ON public.transcript_segments(session_id, seq);
+CREATE INDEX IF NOT EXISTS idx_transcript_segments_session_start ON public.transcript_segments(session_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_transcript_terms_user_term ON public.transcript_terms(user_id, term);
+CREATE INDEX IF NOT EXISTS idx_transcript_terms_session_id ON public.transcript_terms(session_id);
 CREATE INDEX IF NOT EXISTS idx_audio_features_session_id ON public.audio_features(session_id);
 CREATE INDEX IF NOT EXISTS idx_text_evaluations_session_id ON public.text_evaluations(session_id);
 CREATE INDEX IF NOT EXISTS idx_visual_evaluations_session_id ON public.visual_evaluations(session_id);
@@ -129,6 +172,9 @@ ALTER TABLE public.evaluations ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.scores ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.reports ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.transcripts ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.transcript_segments ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.transcript_terms ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.user_analytics_rollups ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.audio_features ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.text_evaluations ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.visual_evaluations ENABLE ROW LEVEL SECURITY;
@@ -154,6 +200,13 @@ CREATE POLICY "Users can insert own transcripts" ON public.transcripts
         )
     );
 
+CREATE POLICY "Users can view own transcript segments" ON public.transcript_segments
+    FOR SELECT USING (
+        auth.uid() IN (
+            SELECT user_id FROM public.sessions WHERE id = session_id
+        )
+    );
+
 CREATE POLICY "Users can view own audio features" ON public.audio_features
     FOR SELECT USING (
         auth.uid() IN (
@@ -223,3 +276,112 @@ CREATE POLICY "Users can insert own reports" ON public.reports
             SELECT user_id FROM public.sessions WHERE id = session_id
         )
     );
+
+-- Transcript search intersects term postings in the database
+CREATE OR REPLACE FUNCTION public.search_transcript_terms(p_user_id UUID, p_terms TEXT[], p_limit INTEGER)
+RETURNS TABLE (session_id UUID, seq INTEGER, start_time REAL, end_time REAL, text TEXT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT s.session_id, s.seq, s.start_time, s.end_time, s.text
+    FROM (
+        SELECT t.session_id, t.seq
+        FROM public.transcript_terms t
+        WHERE t.user_id = p_user_id AND t.term = ANY(p_terms)
+        GROUP BY t.session_id, t.seq
+        HAVING COUNT(DISTINCT t.term) = cardinality(p_terms)
+        ORDER BY t.session_id, t.seq
+        LIMIT p_limit
+    ) c
+    JOIN public.transcript_segments s ON s.session_id = c.session_id AND s.seq = c.seq;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.search_transcript_terms(UUID, TEXT[], INTEGER) FROM PUBLIC, anon, authenticated;
+
+-- Row counts for StorageBackend.aggregate on Supabase: counts per distinct
+-- value of the group_by columns and, with p_bucket ('hour' or 'day'), per
+-- ISO bucket of p_bucket_column, largest first or in bucket order, as one
+-- JSON array of rows. Filters are [column, op, value] triples as sent by
+-- the API. Identifiers and values are quoted with format(), and only the
+-- listed tables are allowed.
+CREATE OR REPLACE FUNCTION public.aggregate_rows(
+    p_table TEXT,
+    p_group_by TEXT[] DEFAULT '{}',
+    p_bucket_column TEXT DEFAULT NULL,
+    p_bucket TEXT DEFAULT NULL,
+    p_filters JSONB DEFAULT '[]'::jsonb,
+    p_limit INTEGER DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql STABLE
+AS $$
+DECLARE
+    expressions TEXT[] := ARRAY[]::TEXT[];
+    conditions TEXT[] := ARRAY[]::TEXT[];
+    condition JSONB;
+    column_name TEXT;
+    operator TEXT;
+    query TEXT;
+    result JSONB;
+BEGIN
+    IF p_table NOT IN ('analytics_events', 'sessions') THEN
+        RAISE EXCEPTION 'aggregate_rows: table % is not allowed', p_table;
+    END IF;
+
+    FOREACH column_name IN ARRAY COALESCE(p_group_by, '{}') LOOP
+        expressions := expressions || format('%I', column_name);
+    END LOOP;
+
+    IF p_bucket IS NOT NULL THEN
+        IF p_bucket NOT IN ('hour', 'day') THEN
+            RAISE EXCEPTION 'aggregate_rows: unknown bucket %', p_bucket;
+        END IF;
+        expressions := expressions || format(
+            'to_char(%I AT TIME ZONE ''UTC'', %L) AS bucket',
+            p_bucket_column,
+            CASE p_bucket WHEN 'hour' THEN 'YYYY-MM-DD"T"HH24' ELSE 'YYYY-MM-DD' END
+        );
+    END IF;
+
+    FOR condition IN SELECT value FROM jsonb_array_elements(COALESCE(p_filters, '[]'::jsonb)) LOOP
+        column_name := condition->>0;
+        operator := condition->>1;
+        IF operator = 'in' THEN
+            conditions := conditions || format(
+                '%I::text IN (SELECT jsonb_array_elements_text(%L::jsonb))', column_name, condition->2
+            );
+        ELSIF operator IN ('eq', 'neq', 'lt', 'lte', 'gt', 'gte') THEN
+            conditions := conditions || format(
+                '%I %s %L',
+                column_name,
+                CASE operator WHEN 'eq' THEN '=' WHEN 'neq' THEN '<>' WHEN 'lt' THEN '<'
+                              WHEN 'lte' THEN '<=' WHEN 'gt' THEN '>' ELSE '>=' END,
+                condition->>2
+            );
+        ELSE
+            RAISE EXCEPTION 'aggregate_rows: unknown operator %', operator;
+        END IF;
+    END LOOP;
+
+    query := format(
+        'SELECT %s FROM public.%I',
+        array_to_string(expressions || ARRAY['COUNT(*) AS count'], ', '),
+        p_table
+    );
+    IF cardinality(conditions) > 0 THEN
+        query := query || ' WHERE ' || array_to_string(conditions, ' AND ');
+    END IF;
+    IF cardinality(expressions) > 0 THEN
+        query := query || ' GROUP BY ' || (SELECT string_agg(i::text, ', ') FROM generate_series(1, cardinality(expressions)) i);
+        query := query || CASE WHEN p_bucket IS NOT NULL THEN ' ORDER BY bucket ASC, count DESC' ELSE ' ORDER BY count DESC' END;
+    END IF;
+    IF p_limit IS NOT NULL THEN
+        query := query || format(' LIMIT %s', p_limit);
+    END IF;
+
+    EXECUTE format('SELECT COALESCE(jsonb_agg(to_jsonb(r)), ''[]''::jsonb) FROM (%s) r', query) INTO result;
+    RETURN result;
+END;
+$$;
+
+-- Only the service role aggregates; keep the function off the public API
+REVOKE EXECUTE ON FUNCTION public.aggregate_rows(TEXT, TEXT[], TEXT, TEXT, JSONB, INTEGER) FROM PUBLIC, anon, authenticated;
@@ -2,7 +2,7 @@ from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-def compute_audio_scores(wpm_value: float, silence_dict: dict, clarity_dict: dict) -> dict:
+def compute_audio_scores(wpm_value: float, silence_dict: dict, clarity_dict: dict, pacing_dict: dict = None) -> dict:
     try:
         wpm_score = 0.0
         if wpm_value is None:
@@ -50,7 +50,8 @@ def compute_audio_scores(wpm_value: float, silence_dict: dict, clarity_dict: dic
             "raw_features": {
                 "wpm": wpm_value,
                 "silence": silence_dict,
-                "clarity": clarity_dict
+                "clarity": clarity_dict,
+                "pacing": pacing_dict
             }
         }
 
@@ -1,5 +1,3 @@
-import librosa
-import numpy as np
 import os
 from src.backend.utils.logger import setup_logger
 
@@ -13,38 +11,13 @@ def analyze_audio_clarity(audio_path: str) -> dict:
     try:
         logger.info(f"Starting audio clarity analysis for {audio_path}")
         
-        y, sr = librosa.load(audio_path, sr=16000, mono=True)
+        from src.backend.pipelines.audio.feature_engine import extract_audio_features, clarity_from_features
         
-        rms = librosa.feature.rms(y=y)[0]
-        avg_volume = float(np.mean(rms))
-        volume_variation = float(np.std(rms))
+        result = clarity_from_features(extract_audio_features(audio_path))
         
-        spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-        avg_centroid = float(np.mean(spectral_centroid))
+        logger.info(f"Clarity analysis completed. Score: {result['clarity_score']}")
         
-        vol_score = min(avg_volume * 100, 1.0) 
-        
-        var_score = min(volume_variation * 100, 1.0)
-        
-        centroid_score = 1.0
-        if avg_centroid < 500 or avg_centroid > 4000:
-            centroid_score = 0.5
-            
-        raw_score = (vol_score * 0.4) + (var_score * 0.4) + (centroid_score * 0.2)
-        clarity_score = round(raw_score * 10, 2) # Scale to 0-10
-        
-        logger.info(f"Clarity analysis completed. Score: {clarity_score}")
-        
-        return {
-            "avg_volume": round(avg_volume, 4),
-            "volume_variation": round(volume_variation, 4),
-            "clarity_score": clarity_score,
-            "raw": {
-                "avg_centroid": round(avg_centroid, 2),
-                "vol_score": round(vol_score, 2),
-                "var_score": round(var_score, 2)
-            }
-        }
+        return result
 
     except Exception as e:
         logger.error(f"Clarity analysis failed: {str(e)}")
@@ -0,0 +1,197 @@
+import math
+from typing import Any, Dict, List, Optional
+import numpy as np
+from src.backend.pipelines.audio.silence_detector import FrameEnergy, silence_from_energy, FRAME_MS
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Analysis frames are ~64 ms long with a 10 ms hop, so the hop grid lines up
+# with the silence detector's energy frames
+WINDOW_SECONDS = 0.064
+PITCH_MIN_HZ = 70.0
+PITCH_MAX_HZ = 400.0
+VOICING_THRESHOLD = 0.4
+SILENCE_THRESH_DB = -40
+MIN_SILENCE_LEN_MS = 800
+
+class AudioFeatureEngine:
+
+    # Streaming single-pass audio features. Every chunk is cut into
+    # overlapping windows once; each window gets one zero-padded FFT whose
+    # magnitudes yield the spectral centroid and whose power spectrum,
+    # through its inverse, the autocorrelation used for pitch. Window energies give RMS and the
+    # non-overlapping hop frames feed silence detection and SNR, so no
+    # sample is decoded or transformed twice.
+
+    def __init__(self, sample_rate: int):
+
+        self.sample_rate = sample_rate
+        self.energy = FrameEnergy(sample_rate, FRAME_MS)
+        self.hop = self.energy.frame_length
+        self.window_length = 2 ** int(math.ceil(math.log2(WINDOW_SECONDS * sample_rate)))
+        self.fft_size = 2 * self.window_length
+        self.window = np.hanning(self.window_length).astype(np.float32)
+        self.frequencies = np.fft.rfftfreq(self.fft_size, 1.0 / sample_rate)
+        self.min_lag = max(1, int(sample_rate / PITCH_MAX_HZ))
+        self.max_lag = min(self.window_length - 1, int(sample_rate / PITCH_MIN_HZ))
+
+        self._carry = np.empty(0, dtype=np.float32)
+        self._rms: List[np.ndarray] = []
+        self._centroid: List[np.ndarray] = []
+        self._pitch: List[np.ndarray] = []
+
+    def add(self, samples: np.ndarray) -> None:
+
+        samples = np.asarray(samples, dtype=np.float32)
+        self.energy.add(samples)
+
+        buffer = np.concatenate((self._carry, samples)) if self._carry.size else samples
+        count = (len(buffer) - self.window_length) // self.hop + 1
+        if count <= 0:
+            self._carry = buffer.copy()
+            return
+
+        frames = np.lib.stride_tricks.sliding_window_view(buffer, self.window_length)[::self.hop][:count]
+        self._analyse(frames)
+        self._carry = buffer[count * self.hop:].copy()
+
+    def _analyse(self, frames: np.ndarray) -> None:
+
+        energy = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / self.window_length
+        self._rms.append(np.sqrt(energy).astype(np.float32))
+
+        # The centroid is weighted by magnitude, as librosa's spectral_centroid
+        # that the clarity band (500-4000 Hz) was tuned against
+        magnitude = np.abs(np.fft.rfft(frames * self.window, n=self.fft_size, axis=1))
+        power = magnitude ** 2
+        total = magnitude.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centroid = (magnitude @ self.frequencies) / total
+        self._centroid.append(np.where(total > 1e-6, centroid, np.nan).astype(np.float32))
+
+        # Wiener-Khinchin: the inverse FFT of the zero-padded power spectrum
+        # is the linear autocorrelation of each window
+        autocorr = np.fft.irfft(power, n=self.fft_size, axis=1)[:, :self.max_lag + 2]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normalised = autocorr / autocorr[:, :1]
+        search = normalised[:, self.min_lag:self.max_lag + 1]
+        best = np.argmax(search, axis=1)
+        strength = search[np.arange(len(best)), best]
+
+        # Parabolic interpolation around the peak for sub-sample lags
+        lag = best + self.min_lag
+        left = normalised[np.arange(len(lag)), lag - 1]
+        right = normalised[np.arange(len(lag)), lag + 1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            offset = 0.5 * (left - right) / (left - 2 * strength + right)
+        offset = np.where(np.isfinite(offset) & (np.abs(offset) <= 1), offset, 0.0)
+
+        voiced = (strength > VOICING_THRESHOLD) & (energy > 10 ** (SILENCE_THRESH_DB / 10))
+        self._pitch.append(np.where(voiced, self.sample_rate / (lag + offset), np.nan).astype(np.float32))
+
+    @property
+    def duration(self) -> float:
+
+        return self.energy.duration
+
+    def result(self, min_silence_len: int = MIN_SILENCE_LEN_MS, silence_thresh: float = SILENCE_THRESH_DB) -> Dict[str, Any]:
+
+        rms = _concat(self._rms)
+        centroid = _concat(self._centroid)
+        pitch = _concat(self._pitch)
+        block_energy = self.energy.energies
+
+        silence = silence_from_energy(
+            block_energy, FRAME_MS, self.duration,
+            min_silence_len=min_silence_len, silence_thresh=silence_thresh
+        )
+
+        loud = block_energy >= 10 ** (silence_thresh / 10)
+        speech_power = float(block_energy[loud].mean()) if loud.any() else 0.0
+        # Noise floor: silent frames when there are any, else the quietest tenth
+        noise_power = float(block_energy[~loud].mean()) if (~loud).any() else \
+            float(np.percentile(block_energy, 10)) if block_energy.size else 0.0
+        snr_db = 10 * math.log10(speech_power / max(noise_power, 1e-10)) if speech_power > 0 else 0.0
+
+        voiced_pitch = pitch[~np.isnan(pitch)]
+        rms_db = 20 * np.log10(rms[rms > 10 ** (silence_thresh / 20)])
+        valid_centroid = centroid[~np.isnan(centroid)]
+
+        return {
+            "duration": round(self.duration, 2),
+            "avg_volume": float(rms.mean()) if rms.size else 0.0,
+            "volume_variation": float(rms.std()) if rms.size else 0.0,
+            "avg_centroid": float(valid_centroid.mean()) if valid_centroid.size else 0.0,
+            "pitch_mean_hz": float(voiced_pitch.mean()) if voiced_pitch.size else 0.0,
+            # Semitone spread is independent of the speaker's base pitch
+            "pitch_variation": float(np.std(12 * np.log2(voiced_pitch / np.median(voiced_pitch)))) if voiced_pitch.size > 1 else 0.0,
+            "voiced_ratio": float(voiced_pitch.size / pitch.size) if pitch.size else 0.0,
+            "energy_variation_db": float(rms_db.std()) if rms_db.size > 1 else 0.0,
+            "snr_db": round(min(max(snr_db, 0.0), 60.0), 2),
+            "silence": silence
+        }
+
+def _concat(parts: List[np.ndarray]) -> np.ndarray:
+
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.float32)
+
+def clarity_from_features(features: Dict[str, Any]) -> Dict[str, Any]:
+
+    avg_volume = features["avg_volume"]
+    volume_variation = features["volume_variation"]
+    avg_centroid = features["avg_centroid"]
+
+    vol_score = min(avg_volume * 100, 1.0)
+
+    var_score = min(volume_variation * 100, 1.0)
+
+    centroid_score = 1.0
+    if avg_centroid < 500 or avg_centroid > 4000:
+        centroid_score = 0.5
+
+    raw_score = (vol_score * 0.4) + (var_score * 0.4) + (centroid_score * 0.2)
+    clarity_score = round(raw_score * 10, 2) # Scale to 0-10
+
+    return {
+        "avg_volume": round(avg_volume, 4),
+        "volume_variation": round(volume_variation, 4),
+        "clarity_score": clarity_score,
+        "raw": {
+            "avg_centroid": round(avg_centroid, 2),
+            "vol_score": round(vol_score, 2),
+            "var_score": round(var_score, 2),
+            "pitch_mean_hz": round(features["pitch_mean_hz"], 1),
+            "pitch_variation": round(features["pitch_variation"], 2),
+            "energy_variation_db": round(features["energy_variation_db"], 2),
+            "voiced_ratio": round(features["voiced_ratio"], 3),
+            "snr_db": features["snr_db"]
+        }
+    }
+
+def extract_audio_features(audio_path: str, chunk_seconds: Optional[float] = None) -> Dict[str, Any]:
+
+    from src.backend.pipelines.audio.pcm_stream import open_pcm_stream, CHUNK_SECONDS
+
+    stream = open_pcm_stream(audio_path, chunk_seconds=chunk_seconds or CHUNK_SECONDS)
+    engine = AudioFeatureEngine(stream.sample_rate)
+    for chunk in stream:
+        engine.add(chunk)
+    return engine.result()
+
+def analyze_audio_features(audio_path: str) -> Dict[str, Any]:
+
+    # Silence and clarity results for the audio stage from a single pass
+    features = extract_audio_features(audio_path)
+
+    silence = features.pop("silence")
+    if features["duration"] < 2:
+        logger.warning(f"Audio too short for silence detection: {features['duration']}s")
+        silence = {"silence_ratio": 0.0, "total_silence_seconds": 0.0, "silence_segments": []}
+
+    clarity = clarity_from_features(features)
+    logger.info(
+        f"Audio features: silence {silence['silence_ratio']:.2f}, clarity {clarity['clarity_score']}, "
+        f"pitch variation {features['pitch_variation']:.2f} st, SNR {features['snr_db']:.1f} dB"
+    )
+    return {"silence": silence, "clarity": clarity, "features": features}
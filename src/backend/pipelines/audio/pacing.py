@@ -0,0 +1,167 @@
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Gaps shorter than this are articulation (breaths, plosives), not pauses
+PAUSE_MIN_SEC = 0.25
+PAUSE_BIN_EDGES_SEC = (0.25, 0.5, 1.0, 2.0, 4.0)
+ROLLING_WINDOW_SEC = 30.0
+TIMELINE_STEP_SEC = 5.0
+# Windows with less speech than this have no meaningful articulation rate
+MIN_SPEECH_SEC = 1.0
+MIN_DURATION_SEC = 5.0
+
+def compact_words(words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+    # Whisper word entries trimmed to what pacing and highlighting need,
+    # with timestamps at 10 ms resolution
+    compact = []
+    for word in words or []:
+        start, end = word.get("start"), word.get("end")
+        if not isinstance(start, (int, float)) or not isinstance(end, (int, float)):
+            continue
+        compact.append({
+            "word": str(word.get("word", "")).strip(),
+            "start": round(float(start), 2),
+            "end": round(float(end), 2)
+        })
+    return compact
+
+def word_times(word_timestamps: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+
+    if not word_timestamps:
+        return np.empty(0), np.empty(0)
+
+    starts = np.array([w["start"] for w in word_timestamps], dtype=np.float64)
+    ends = np.array([w["end"] for w in word_timestamps], dtype=np.float64)
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    return starts, np.maximum(ends, starts)
+
+def segment_word_times(segments: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+
+    # Transcripts saved before word timestamps were captured: spread each
+    # segment's words evenly over the segment, so only pauses between
+    # segments are visible
+    counts, seg_starts, seg_ends = [], [], []
+    for segment in segments or []:
+        start, end, text = segment.get("start"), segment.get("end"), segment.get("text", "")
+        if not isinstance(start, (int, float)) or not isinstance(end, (int, float)) or not isinstance(text, str):
+            continue
+        counts.append(len(text.split()))
+        seg_starts.append(float(start))
+        seg_ends.append(max(float(end), float(start)))
+
+    counts = np.asarray(counts, dtype=np.int64)
+    if not counts.sum():
+        return np.empty(0), np.empty(0)
+
+    word_length = np.repeat((np.asarray(seg_ends) - np.asarray(seg_starts)) / np.maximum(counts, 1), counts)
+    position = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    starts = np.repeat(seg_starts, counts) + position * word_length
+    return starts, starts + word_length
+
+def _speech_runs(starts: np.ndarray, ends: np.ndarray, pause_min: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+    # Merge words into runs of continuous speech; gaps below pause_min
+    # count as speaking time. Returns run starts, run ends and the gaps
+    # between consecutive words.
+    running_end = np.maximum.accumulate(ends)
+    gaps = starts[1:] - running_end[:-1]
+    breaks = np.flatnonzero(gaps >= pause_min)
+
+    run_starts = np.concatenate(([starts[0]], starts[breaks + 1]))
+    run_ends = np.concatenate((running_end[breaks], [running_end[-1]]))
+    return run_starts, run_ends, gaps
+
+def _speaking_time_before(times: np.ndarray, run_starts: np.ndarray, run_ends: np.ndarray) -> np.ndarray:
+
+    # Cumulative speaking time S(t) at each query time
+    lengths = run_ends - run_starts
+    before = np.concatenate(([0.0], np.cumsum(lengths)))
+    run = np.searchsorted(run_starts, times, side="right") - 1
+    inside = np.clip(times - run_starts[np.maximum(run, 0)], 0.0, lengths[np.maximum(run, 0)])
+    return np.where(run >= 0, before[np.maximum(run, 0)] + inside, 0.0)
+
+def _rounded(values: np.ndarray, decimals: int = 1) -> List[Optional[float]]:
+
+    rounded = np.round(values, decimals)
+    return [None if np.isnan(v) else float(v) for v in rounded]
+
+def compute_pacing(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    window_sec: float = ROLLING_WINDOW_SEC,
+    step_sec: float = TIMELINE_STEP_SEC,
+    pause_min: float = PAUSE_MIN_SEC
+) -> Optional[Dict[str, Any]]:
+
+    # Speaking rate (words over the whole talk), articulation rate (words
+    # over speaking time only), a pause histogram and rolling series of both
+    # rates, all computed from the word time arrays in one vectorised pass
+    if len(starts) < 2:
+        return None
+
+    session_start, session_end = float(starts[0]), float(np.max(ends))
+    duration = session_end - session_start
+    if duration < MIN_DURATION_SEC:
+        logger.warning(f"Pacing: duration too short ({duration:.2f}s)")
+        return None
+
+    run_starts, run_ends, gaps = _speech_runs(starts, ends, pause_min)
+    speaking_time = float((run_ends - run_starts).sum())
+    pauses = gaps[gaps >= pause_min]
+
+    edges = np.asarray(PAUSE_BIN_EDGES_SEC + (np.inf,))
+    histogram, _ = np.histogram(pauses, bins=edges)
+
+    # Rolling windows ending at each timeline point
+    times = np.arange(session_start + step_sec, session_end + step_sec, step_sec)
+    times[-1] = min(times[-1], session_end)
+    window_starts = np.maximum(times - window_sec, session_start)
+    words = np.searchsorted(starts, times, side="right") - np.searchsorted(starts, window_starts, side="left")
+    spoken = _speaking_time_before(times, run_starts, run_ends) - _speaking_time_before(window_starts, run_starts, run_ends)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rolling_wpm = words / (times - window_starts) * 60.0
+        rolling_articulation = np.where(spoken >= MIN_SPEECH_SEC, words / spoken * 60.0, np.nan)
+
+    word_count = len(starts)
+    result = {
+        "word_count": word_count,
+        "duration_seconds": round(duration, 2),
+        "speaking_seconds": round(speaking_time, 2),
+        "wpm": round(word_count / duration * 60.0, 2),
+        "articulation_rate": round(word_count / speaking_time * 60.0, 2) if speaking_time > 0 else None,
+        "pauses": {
+            "count": int(len(pauses)),
+            "total_seconds": round(float(pauses.sum()), 2),
+            "longest_seconds": round(float(pauses.max()), 2) if len(pauses) else 0.0,
+            "per_minute": round(len(pauses) / duration * 60.0, 2),
+            "bin_edges": list(PAUSE_BIN_EDGES_SEC),
+            "histogram": histogram.tolist()
+        },
+        "timeline": {
+            "window_seconds": window_sec,
+            "t": _rounded(times - session_start),
+            "wpm": _rounded(rolling_wpm),
+            "articulation_rate": _rounded(rolling_articulation)
+        }
+    }
+
+    logger.info(
+        f"Pacing: {word_count} words, {result['wpm']} WPM, articulation {result['articulation_rate']} WPM, "
+        f"{len(pauses)} pauses"
+    )
+    return result
+
+def pacing_from_transcript(transcript: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+
+    words = transcript.get("word_timestamps") or []
+    starts, ends = word_times(words) if words else segment_word_times(transcript.get("segments") or [])
+    pacing = compute_pacing(starts, ends)
+    if pacing is not None:
+        pacing["source"] = "words" if words else "segments"
+    return pacing
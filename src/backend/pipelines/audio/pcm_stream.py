@@ -0,0 +1,128 @@
+import shutil
+import subprocess
+import wave
+from typing import Iterator, Optional
+import numpy as np
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Chunks are bounded so memory stays flat regardless of recording length
+CHUNK_SECONDS = 30.0
+DEFAULT_SAMPLE_RATE = 16000
+
+_WAV_DTYPES = {1: np.uint8, 2: np.int16, 4: np.int32}
+
+class PCMStream:
+
+    # Iterates a recording as mono float32 chunks in [-1, 1]. PCM WAV files
+    # (what audio extraction produces) are read directly; anything else is
+    # decoded by ffmpeg to 16-bit mono PCM on a pipe, with pydub as a
+    # last resort when ffmpeg is missing.
+
+    def __init__(self, path: str, chunk_seconds: float = CHUNK_SECONDS, sample_rate: Optional[int] = None):
+
+        self.path = path
+        self.chunk_seconds = chunk_seconds
+        self.sample_rate = sample_rate or DEFAULT_SAMPLE_RATE
+        self.total_samples = 0
+        self._wav = self._wav_params() if sample_rate is None else None
+        if self._wav is not None:
+            self.sample_rate = self._wav["rate"]
+
+    def _wav_params(self) -> Optional[dict]:
+
+        try:
+            with wave.open(self.path, "rb") as wav:
+                if wav.getcomptype() != "NONE" or wav.getsampwidth() not in _WAV_DTYPES:
+                    return None
+                return {"rate": wav.getframerate(), "channels": wav.getnchannels(), "width": wav.getsampwidth()}
+        except (wave.Error, EOFError):
+            return None
+
+    @property
+    def duration(self) -> float:
+
+        # Seconds read so far; the full duration once iteration has finished
+        return self.total_samples / self.sample_rate if self.sample_rate else 0.0
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+
+        self.total_samples = 0
+        if self._wav is not None:
+            chunks = self._iter_wav()
+        elif shutil.which("ffmpeg"):
+            chunks = self._iter_ffmpeg()
+        else:
+            chunks = self._iter_pydub()
+
+        for chunk in chunks:
+            self.total_samples += len(chunk)
+            yield chunk
+
+    def _chunk_frames(self) -> int:
+
+        return max(1, int(self.chunk_seconds * self.sample_rate))
+
+    def _iter_wav(self) -> Iterator[np.ndarray]:
+
+        channels, width = self._wav["channels"], self._wav["width"]
+        dtype = _WAV_DTYPES[width]
+
+        with wave.open(self.path, "rb") as wav:
+            while True:
+                data = wav.readframes(self._chunk_frames())
+                if not data:
+                    break
+                samples = np.frombuffer(data, dtype=dtype)
+                yield _to_mono_float(samples, channels, width)
+
+    def _iter_ffmpeg(self) -> Iterator[np.ndarray]:
+
+        command = [
+            "ffmpeg", "-v", "error", "-nostdin", "-i", self.path,
+            "-vn", "-ac", "1", "-ar", str(self.sample_rate), "-f", "s16le", "pipe:1"
+        ]
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        chunk_bytes = self._chunk_frames() * 2
+        try:
+            while True:
+                data = process.stdout.read(chunk_bytes)
+                if not data:
+                    break
+                yield _to_mono_float(np.frombuffer(data[:len(data) // 2 * 2], dtype=np.int16), 1, 2)
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+            stderr = process.stderr.read().decode(errors="replace").strip()
+            process.stderr.close()
+            if process.wait() not in (0, -9) and self.total_samples == 0:
+                raise RuntimeError(f"ffmpeg could not decode {self.path}: {stderr}")
+
+    def _iter_pydub(self) -> Iterator[np.ndarray]:
+
+        from pydub import AudioSegment
+
+        logger.warning("ffmpeg not found; decoding through pydub without bounded memory")
+        audio = AudioSegment.from_file(self.path).set_channels(1).set_frame_rate(self.sample_rate)
+        samples = np.array(audio.get_array_of_samples())
+        step = self._chunk_frames()
+        for start in range(0, len(samples), step):
+            yield _to_mono_float(samples[start:start + step], 1, audio.sample_width)
+
+def _to_mono_float(samples: np.ndarray, channels: int, width: int) -> np.ndarray:
+
+    if width == 1:
+        # 8-bit WAV is unsigned
+        samples = samples.astype(np.float32) - 128.0
+    scale = float(2 ** (8 * width - 1))
+
+    samples = samples[:len(samples) // channels * channels].astype(np.float32)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples / scale
+
+def open_pcm_stream(path: str, chunk_seconds: float = CHUNK_SECONDS) -> PCMStream:
+
+    return PCMStream(path, chunk_seconds=chunk_seconds)
@@ -1,9 +1,99 @@
-from pydub import AudioSegment, silence
+from typing import List
+import numpy as np
 from src.backend.utils.logger import setup_logger
 import os
 
 logger = setup_logger(__name__)
 
+# Energy resolution of the detector; pydub stepped in 1 ms windows, 10 ms
+# frames keep boundaries well inside the 800 ms minimum silence length
+FRAME_MS = 10
+
+class FrameEnergy:
+
+    # Streaming mean-square energy per fixed-length frame. Chunks can have
+    # any length; leftover samples carry over to the next chunk, so only the
+    # per-frame energies (one float per 10 ms) are kept in memory.
+
+    def __init__(self, sample_rate: int, frame_ms: int = FRAME_MS):
+
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame_length = max(1, int(sample_rate * frame_ms / 1000))
+        self.total_samples = 0
+        self._carry = np.empty(0, dtype=np.float32)
+        self._energies: List[np.ndarray] = []
+
+    def add(self, samples: np.ndarray) -> None:
+
+        self.total_samples += len(samples)
+        if self._carry.size:
+            samples = np.concatenate((self._carry, samples))
+
+        usable = len(samples) // self.frame_length * self.frame_length
+        frames = samples[:usable].reshape(-1, self.frame_length)
+        self._energies.append(np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / self.frame_length)
+        self._carry = samples[usable:].copy()
+
+    @property
+    def energies(self) -> np.ndarray:
+
+        if len(self._energies) > 1:
+            self._energies = [np.concatenate(self._energies)]
+        return self._energies[0] if self._energies else np.empty(0)
+
+    @property
+    def duration(self) -> float:
+
+        return self.total_samples / self.sample_rate if self.sample_rate else 0.0
+
+def silence_from_energy(
+    energies: np.ndarray,
+    frame_ms: int,
+    duration_seconds: float,
+    min_silence_len: int = 800,
+    silence_thresh: float = -40
+) -> dict:
+
+    # Same semantics as pydub.silence.detect_silence: every window of
+    # min_silence_len whose RMS is below silence_thresh dBFS is silent, and
+    # overlapping silent windows merge into one segment
+    window = max(1, int(round(min_silence_len / frame_ms)))
+    total_silence_seconds = 0.0
+    silence_intervals = []
+
+    if len(energies) >= window:
+        cumulative = np.concatenate(([0.0], np.cumsum(energies)))
+        window_power = (cumulative[window:] - cumulative[:-window]) / window
+        silent_start = window_power < 10 ** (silence_thresh / 10)
+
+        # A frame is silent when any silent window covers it, i.e. a silent
+        # window starts within the preceding `window` frames
+        silent_count = np.concatenate(([0], np.cumsum(silent_start)))
+        frame_index = np.arange(len(energies))
+        first = np.maximum(frame_index - window + 1, 0)
+        last = np.minimum(frame_index + 1, len(silent_start))
+        covered = silent_count[last] - silent_count[first] > 0
+
+        edges = np.diff(np.concatenate(([0], covered.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+
+        seconds = frame_ms / 1000.0
+        silence_intervals = [
+            {"start": round(float(start * seconds), 3), "end": round(float(end * seconds), 3)}
+            for start, end in zip(run_starts, run_ends)
+        ]
+        total_silence_seconds = float((run_ends - run_starts).sum() * seconds)
+
+    silence_ratio = total_silence_seconds / duration_seconds if duration_seconds > 0 else 0
+
+    return {
+        "silence_ratio": round(min(silence_ratio, 1.0), 2),
+        "total_silence_seconds": round(total_silence_seconds, 2),
+        "silence_segments": silence_intervals
+    }
+
 def detect_silence_intervals(audio_path: str, min_silence_len=800, silence_thresh=-40) -> dict:
     if not os.path.exists(audio_path):
         logger.error(f"Audio file not found: {audio_path}")
@@ -11,14 +101,16 @@ def detect_silence_intervals(audio_path: str, min_silence_len=800, silence_thres
 
     try:
         logger.info(f"Starting silence detection for {audio_path}")
-        
-        audio = AudioSegment.from_file(audio_path)
-        
-        if audio.channels > 1:
-            audio = audio.set_channels(1)
-            
-        duration_seconds = len(audio) / 1000.0
-        
+
+        from src.backend.pipelines.audio.pcm_stream import open_pcm_stream
+
+        stream = open_pcm_stream(audio_path)
+        energy = FrameEnergy(stream.sample_rate)
+        for chunk in stream:
+            energy.add(chunk)
+
+        duration_seconds = energy.duration
+
         if duration_seconds < 2:
             logger.warning(f"Audio too short for silence detection: {duration_seconds}s")
             return {
@@ -27,32 +119,17 @@ def detect_silence_intervals(audio_path: str, min_silence_len=800, silence_thres
                 "silence_segments": []
             }
 
-        silence_segments = silence.detect_silence(
-            audio, 
-            min_silence_len=min_silence_len, 
+        result = silence_from_energy(
+            energy.energies,
+            energy.frame_ms,
+            duration_seconds,
+            min_silence_len=min_silence_len,
             silence_thresh=silence_thresh
         )
-        
-        silence_intervals = []
-        total_silence_ms = 0
-        
-        for start, end in silence_segments:
-            silence_intervals.append({
-                "start": start / 1000.0,
-                "end": end / 1000.0
-            })
-            total_silence_ms += (end - start)
-            
-        total_silence_seconds = total_silence_ms / 1000.0
-        silence_ratio = total_silence_seconds / duration_seconds if duration_seconds > 0 else 0
-        
-        logger.info(f"Silence detection completed. Ratio: {silence_ratio:.2f}, Segments: {len(silence_intervals)}")
-        
-        return {
-            "silence_ratio": round(silence_ratio, 2),
-            "total_silence_seconds": round(total_silence_seconds, 2),
-            "silence_segments": silence_intervals
-        }
+
+        logger.info(f"Silence detection completed. Ratio: {result['silence_ratio']:.2f}, Segments: {len(result['silence_segments'])}")
+
+        return result
 
     except Exception as e:
         logger.error(f"Silence detection failed: {str(e)}")
@@ -0,0 +1,23 @@
+from src.backend.pipelines.live.tracker import (
+    LiveTracker,
+    decode_base64_frame,
+    decode_image_bytes,
+    rgb_frame_from_bytes,
+    empty_live_result
+)
+from src.backend.pipelines.live.recorder import LiveSessionRecorder
+from src.backend.pipelines.live.scheduler import (
+    FrameDropped,
+    LiveFrameScheduler
+)
+
+__all__ = [
+    'LiveTracker',
+    'decode_base64_frame',
+    'decode_image_bytes',
+    'rgb_frame_from_bytes',
+    'empty_live_result',
+    'LiveSessionRecorder',
+    'FrameDropped',
+    'LiveFrameScheduler'
+]
@@ -0,0 +1,93 @@
+import time
+from typing import Any, Callable, Dict, Optional
+from src.backend.pipelines.visual.engagement_analyzer import REFERENCE_SAMPLE_INTERVAL_SEC, engagement_metrics_from_counts
+
+class LiveSessionRecorder:
+
+    # Folds live frame results into the same counters the offline visual
+    # stage derives from sampled frames, so a practice session can be scored
+    # with compute_visual_scores without keeping any per-frame data.
+
+    def __init__(self, session_id: str, clock: Callable[[], float] = time.time):
+
+        self.session_id = session_id
+        self.clock = clock
+        self.total_frames = 0
+        self.face_detected_count = 0
+        self.gaze_forward_count = 0
+        self.hands_detected_count = 0
+        self.gesture_frames_count = 0
+        self.body_movement_total = 0.0
+        self.body_movement_samples = 0
+        self.first_timestamp: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+        # Time between frames with each gap capped as offline, for rates
+        self.sampled_seconds = 0.0
+
+    def add(self, result: Dict[str, Any], timestamp: Optional[float] = None) -> None:
+
+        if not isinstance(result, dict):
+            return
+
+        timestamp = self.clock() if timestamp is None else timestamp
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        else:
+            self.sampled_seconds += min(max(0.0, timestamp - self.last_timestamp), REFERENCE_SAMPLE_INTERVAL_SEC)
+        self.last_timestamp = timestamp
+
+        self.total_frames += 1
+
+        if result.get("face_detected"):
+            self.face_detected_count += 1
+        # The live tracker's eye-contact check plays the role of "forward" gaze
+        if result.get("eye_contact") or result.get("gaze_direction") == "forward":
+            self.gaze_forward_count += 1
+        if result.get("hand_count", 0) > 0:
+            self.hands_detected_count += 1
+            self.gesture_frames_count += 1
+
+        body_movement = result.get("body_movement")
+        if isinstance(body_movement, (int, float)):
+            self.body_movement_total += body_movement
+            self.body_movement_samples += 1
+
+    def duration_minutes(self) -> float:
+
+        if self.total_frames < 2 or self.first_timestamp is None:
+            return self.total_frames / 120.0
+        return self.sampled_seconds / 60.0
+
+    def counters(self) -> Dict[str, Any]:
+
+        return {
+            "total_frames": self.total_frames,
+            "face_detected_count": self.face_detected_count,
+            "gaze_forward_count": self.gaze_forward_count,
+            "hands_detected_count": self.hands_detected_count,
+            "gesture_frames_count": self.gesture_frames_count,
+            "body_movement_total": round(self.body_movement_total, 3),
+            "body_movement_samples": self.body_movement_samples,
+            "duration_sec": round((self.last_timestamp or 0.0) - (self.first_timestamp or 0.0), 1)
+        }
+
+    def engagement_metrics(self) -> Dict[str, Any]:
+
+        metrics = engagement_metrics_from_counts(
+            total_frames=self.total_frames,
+            face_detected_count=self.face_detected_count,
+            gaze_forward_count=self.gaze_forward_count,
+            hands_detected_count=self.hands_detected_count,
+            gesture_frames_count=self.gesture_frames_count,
+            body_movement_total=self.body_movement_total,
+            body_movement_samples=self.body_movement_samples,
+            duration_minutes=self.duration_minutes()
+        )
+
+        # Live mode runs no pose model; leave body movement unset so scoring
+        # falls back to its neutral default instead of treating it as zero.
+        if not self.body_movement_samples:
+            metrics.pop("body_movement_activity")
+
+        metrics["raw"] = self.counters()
+        return metrics
@@ -0,0 +1,251 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class FrameDropped(Exception):
+    pass
+
+STATS_WINDOW = 100
+
+class LiveClientState:
+
+    def __init__(self, client_id: str, tracker, now: float):
+
+        self.client_id = client_id
+        self.tracker = tracker
+        self.pending: Optional[Tuple[Callable[[Any], Any], asyncio.Future, float]] = None
+        self.running = False
+        self.created_at = now
+        self.last_seen = now
+        self.frames_processed = 0
+        self.frames_dropped = 0
+        self.completed_at = deque(maxlen=STATS_WINDOW)
+        self.latencies_ms = deque(maxlen=STATS_WINDOW)
+        self.inference_ms = deque(maxlen=STATS_WINDOW)
+
+    def record(self, submitted_at: float, started_at: float, finished_at: float) -> None:
+
+        self.frames_processed += 1
+        self.completed_at.append(finished_at)
+        self.latencies_ms.append((finished_at - submitted_at) * 1000)
+        self.inference_ms.append((finished_at - started_at) * 1000)
+
+    def stats(self, now: float) -> Dict[str, Any]:
+
+        fps = 0.0
+        if len(self.completed_at) > 1:
+            span = self.completed_at[-1] - self.completed_at[0]
+            if span > 0:
+                fps = (len(self.completed_at) - 1) / span
+
+        latencies = np.asarray(self.latencies_ms, dtype=np.float64)
+        inference = np.asarray(self.inference_ms, dtype=np.float64)
+
+        return {
+            "client_id": self.client_id,
+            "frames_processed": self.frames_processed,
+            "frames_dropped": self.frames_dropped,
+            "fps": round(fps, 2),
+            "latency_ms": {
+                "avg": round(float(latencies.mean()), 1) if latencies.size else None,
+                "p95": round(float(np.percentile(latencies, 95)), 1) if latencies.size else None
+            },
+            "inference_ms": {
+                "avg": round(float(inference.mean()), 1) if inference.size else None
+            },
+            "age_sec": round(now - self.created_at, 1),
+            "idle_sec": round(now - self.last_seen, 1)
+        }
+
+class LiveFrameScheduler:
+
+    # Runs live inference on a bounded thread pool instead of the event loop.
+    # Each client owns one tracker and has at most one frame in flight; a
+    # frame that arrives while another is waiting replaces it, and the
+    # superseded request fails fast with FrameDropped. Queue depth is thus
+    # bounded by the number of clients, and results are never stale by more
+    # than one frame.
+    #
+    # Clients are kept in least-recently-seen order, so idle eviction only
+    # has to look at the front of the map.
+
+    def __init__(
+        self,
+        tracker_factory: Callable[[], Any],
+        max_workers: int = 2,
+        max_clients: int = 64,
+        idle_timeout: Optional[float] = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        on_abandon: Optional[Callable[[Any], Any]] = None
+    ):
+
+        self.tracker_factory = tracker_factory
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.on_abandon = on_abandon
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="live-inference")
+        self._clients: "OrderedDict[str, LiveClientState]" = OrderedDict()
+        # Recordings in progress; dropping a client abandons its recording,
+        # which is handed to on_abandon
+        self._recorders: Dict[str, Any] = {}
+
+    def _get_client(self, client_id: str) -> LiveClientState:
+
+        now = self.clock()
+        self.evict_idle(now)
+        state = self._clients.get(client_id)
+
+        if state is None:
+            while len(self._clients) >= self.max_clients:
+                evicted_id, evicted = self._clients.popitem(last=False)
+                logger.info(f"[Live] Evicting tracker for client {evicted_id} (max {self.max_clients} clients)")
+                self._close_tracker(evicted)
+                self._abandon_recording(evicted_id)
+            state = LiveClientState(client_id, self.tracker_factory(), now)
+            self._clients[client_id] = state
+        else:
+            self._clients.move_to_end(client_id)
+
+        state.last_seen = now
+        return state
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+
+        if not self.idle_timeout:
+            return 0
+
+        now = self.clock() if now is None else now
+        evicted = 0
+
+        while self._clients:
+            client_id, state = next(iter(self._clients.items()))
+            if now - state.last_seen <= self.idle_timeout or state.running:
+                break
+            self._clients.popitem(last=False)
+            logger.info(f"[Live] Evicting idle tracker for client {client_id}")
+            self._close_tracker(state)
+            self._abandon_recording(client_id)
+            evicted += 1
+
+        return evicted
+
+    def _close_tracker(self, state: LiveClientState) -> None:
+
+        if state.pending is not None and not state.pending[1].done():
+            state.pending[1].set_exception(FrameDropped())
+        state.pending = None
+
+        close = getattr(state.tracker, "close", None)
+        if close is not None:
+            # Close on the executor so an in-flight frame finishes first
+            self._executor.submit(close)
+
+    def _abandon_recording(self, client_id: str) -> None:
+
+        recorder = self._recorders.pop(client_id, None)
+        if recorder is None:
+            return
+        logger.info(f"[Live] Abandoning recording of client {client_id}")
+        if self.on_abandon is not None:
+            # Off the event loop, like tracker shutdown
+            self._executor.submit(self.on_abandon, recorder)
+
+    async def submit(self, client_id: str, work: Callable[[Any], Any]) -> Any:
+
+        loop = asyncio.get_running_loop()
+        state = self._get_client(client_id)
+        future = loop.create_future()
+
+        if state.pending is not None and not state.pending[1].done():
+            state.pending[1].set_exception(FrameDropped())
+            state.frames_dropped += 1
+
+        state.pending = (work, future, self.clock())
+
+        if not state.running:
+            state.running = True
+            loop.create_task(self._drain(state))
+
+        return await future
+
+    async def _drain(self, state: LiveClientState) -> None:
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            while state.pending is not None:
+                work, future, submitted_at = state.pending
+                state.pending = None
+
+                if future.done():
+                    continue
+
+                started_at = self.clock()
+                try:
+                    result = await loop.run_in_executor(self._executor, work, state.tracker)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                    continue
+
+                state.record(submitted_at, started_at, self.clock())
+
+                recorder = self._recorders.get(state.client_id)
+                if recorder is not None and result is not None:
+                    recorder.add(result)
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            state.running = False
+
+    def close_client(self, client_id: str) -> bool:
+
+        state = self._clients.pop(client_id, None)
+        self._abandon_recording(client_id)
+        if state is None:
+            return False
+        self._close_tracker(state)
+        return True
+
+    def start_recording(self, client_id: str, recorder: Any) -> None:
+
+        self._recorders[client_id] = recorder
+
+    def stop_recording(self, client_id: str) -> Optional[Any]:
+
+        return self._recorders.pop(client_id, None)
+
+    def get_recorder(self, client_id: str) -> Optional[Any]:
+
+        return self._recorders.get(client_id)
+
+    def client_stats(self, client_id: str) -> Optional[Dict[str, Any]]:
+
+        state = self._clients.get(client_id)
+        return state.stats(self.clock()) if state is not None else None
+
+    def stats(self) -> List[Dict[str, Any]]:
+
+        self.evict_idle()
+        now = self.clock()
+        return [state.stats(now) for state in self._clients.values()]
+
+    @property
+    def client_count(self) -> int:
+
+        return len(self._clients)
+
+    def shutdown(self) -> None:
+
+        for client_id in list(self._clients):
+            self.close_client(client_id)
+        for client_id in list(self._recorders):
+            self._abandon_recording(client_id)
+        self._executor.shutdown(wait=False)
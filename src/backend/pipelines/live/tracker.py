@@ -0,0 +1,154 @@
+import base64
+import threading
+import numpy as np
+from typing import Any, Dict, Optional
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# FaceMesh landmark indices used for the eye-contact heuristic
+LEFT_EYE_OUTER = 33
+LEFT_EYE_INNER = 133
+RIGHT_EYE_OUTER = 362
+RIGHT_EYE_INNER = 263
+NOSE_TIP = 1
+
+def empty_live_result() -> Dict[str, Any]:
+
+    return {
+        "eye_contact": False,
+        "gestures": 0,
+        "hand_count": 0,
+        "face_detected": False,
+        "pose_score": 0.0
+    }
+
+def decode_image_bytes(data: bytes) -> Optional[np.ndarray]:
+
+    import cv2
+
+    # imdecode sniffs the container, so JPEG, WebP and PNG all work
+    frame = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+
+    if frame is None:
+        return None
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+def decode_base64_frame(image: str) -> Optional[np.ndarray]:
+
+    # Accept both raw base64 and data URLs ("data:image/jpeg;base64,...")
+    encoded = image.split(",", 1)[1] if "," in image else image
+    return decode_image_bytes(base64.b64decode(encoded))
+
+def rgb_frame_from_bytes(data: bytes, width: int, height: int) -> Optional[np.ndarray]:
+
+    if width <= 0 or height <= 0 or len(data) != width * height * 3:
+        return None
+    return np.frombuffer(data, np.uint8).reshape(height, width, 3)
+
+class LiveTracker:
+
+    # Holds one client's MediaPipe graphs. FaceMesh and Hands run in
+    # tracking mode, which is only valid for consecutive frames of a single
+    # stream, so trackers must never be shared between clients.
+
+    def __init__(self):
+
+        self._face_mesh = None
+        self._hands = None
+        self._lock = threading.Lock()
+
+    def _get_face_mesh(self):
+
+        if self._face_mesh is None:
+            import mediapipe as mp
+            self._face_mesh = mp.solutions.face_mesh.FaceMesh(
+                static_image_mode=False,
+                max_num_faces=1,
+                refine_landmarks=True,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+        return self._face_mesh
+
+    def _get_hands(self):
+
+        if self._hands is None:
+            import mediapipe as mp
+            self._hands = mp.solutions.hands.Hands(
+                static_image_mode=False,
+                max_num_hands=2,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+        return self._hands
+
+    def analyze(self, frame_rgb: np.ndarray) -> Dict[str, Any]:
+
+        with self._lock:
+            response = empty_live_result()
+
+            face_results = self._get_face_mesh().process(frame_rgb)
+
+            if face_results.multi_face_landmarks:
+                response["face_detected"] = True
+                landmarks = face_results.multi_face_landmarks[0].landmark
+
+                try:
+                    left_eye_center_x = (landmarks[LEFT_EYE_OUTER].x + landmarks[LEFT_EYE_INNER].x) / 2
+                    right_eye_center_x = (landmarks[RIGHT_EYE_OUTER].x + landmarks[RIGHT_EYE_INNER].x) / 2
+                    face_center_x = (left_eye_center_x + right_eye_center_x) / 2
+
+                    # Eye contact if the face is horizontally centered (within
+                    # 25% of frame center) and not looking too far down
+                    horizontal_offset = abs(face_center_x - 0.5)
+                    vertical_offset = landmarks[NOSE_TIP].y
+
+                    response["eye_contact"] = horizontal_offset < 0.25 and vertical_offset < 0.7
+
+                except (IndexError, AttributeError):
+                    response["eye_contact"] = False
+
+            hands_results = self._get_hands().process(frame_rgb)
+
+            if hands_results.multi_hand_landmarks:
+                # Count any hand whose wrist (landmark 0) is in the upper 80% of the frame
+                response["hand_count"] = len(hands_results.multi_hand_landmarks)
+                response["gestures"] = sum(
+                    1 for hand_landmarks in hands_results.multi_hand_landmarks
+                    if hand_landmarks.landmark[0].y < 0.8
+                )
+                logger.debug(f"Hands detected: {response['gestures']}")
+
+            return response
+
+    def analyze_base64(self, image: str) -> Optional[Dict[str, Any]]:
+
+        frame_rgb = decode_base64_frame(image)
+        if frame_rgb is None:
+            return None
+        return self.analyze(frame_rgb)
+
+    def analyze_bytes(self, data: bytes) -> Optional[Dict[str, Any]]:
+
+        frame_rgb = decode_image_bytes(data)
+        if frame_rgb is None:
+            return None
+        return self.analyze(frame_rgb)
+
+    def analyze_rgb_bytes(self, data: bytes, width: int, height: int) -> Optional[Dict[str, Any]]:
+
+        frame_rgb = rgb_frame_from_bytes(data, width, height)
+        if frame_rgb is None:
+            return None
+        return self.analyze(frame_rgb)
+
+    def close(self) -> None:
+
+        with self._lock:
+            if self._face_mesh is not None:
+                self._face_mesh.close()
+                self._face_mesh = None
+            if self._hands is not None:
+                self._hands.close()
+                self._hands = None
@@ -16,13 +16,12 @@ from src.backend.pipelines.report.report_generator import generate_report
 import os
 from src.backend.services.audio_feature_service import AudioFeatureService
 from src.backend.pipelines.audio.wpm_calculator import calculate_wpm
-from src.backend.pipelines.audio.silence_detector import detect_silence_intervals
-from src.backend.pipelines.audio.clarity_analyzer import analyze_audio_clarity
+from src.backend.pipelines.audio.pacing import pacing_from_transcript
+from src.backend.pipelines.audio.feature_engine import analyze_audio_features
 from src.backend.pipelines.audio.audio_scoring import compute_audio_scores
 from src.backend.utils.audio_extractor import extract_audio_from_video
 
-from src.backend.pipelines.visual.frame_extractor import extract_frames
-from src.backend.pipelines.visual.mediapipe_detector import batch_analyze_frames, cleanup_detectors
+from src.backend.workers import get_model_client
 from src.backend.pipelines.visual.engagement_analyzer import compute_engagement_metrics
 from src.backend.pipelines.visual.visual_scoring import compute_visual_scores
 
@@ -31,7 +30,7 @@ logger = setup_logger(__name__)
 def mark_stage_complete(session_id: str, stage_name: str):
     
     try:
-        from src.backend.utils.supabase_client import supabase
+        from src.backend.storage import get_storage
         
         session = SessionService.get_session(session_id)
         stages = session.get("stages_completed", []) if session else []
@@ -39,10 +38,10 @@ def mark_stage_complete(session_id: str, stage_name: str):
         if stage_name not in stages:
             stages.append(stage_name)
             
-            supabase.table("sessions").update({
+            get_storage().update("sessions", {
                 "stages_completed": stages,
                 "last_successful_stage": stage_name
-            }).eq("id", session_id).execute()
+            }, {"id": session_id})
             
             logger.info(f"[TRACKING] Marked stage '{stage_name}' as complete")
     except Exception as e:
@@ -103,12 +102,12 @@ def process_session(session_id: str) -> Dict[str, Any]:
                 video_path = os.path.join(Config.UPLOAD_DIR, session.get("filename"))
                 
                 if not os.path.exists(video_path):
-                    logger.info(f"Video not found locally, downloading from Supabase: {session.get('filename')}")
+                    logger.info(f"Video not found locally, downloading from storage: {session.get('filename')}")
                     try:
-                        from src.backend.utils.supabase_client import supabase
+                        from src.backend.storage import get_storage
                         os.makedirs(Config.UPLOAD_DIR, exist_ok=True)
                         
-                        data = supabase.storage.from_("videos").download(session.get("filename"))
+                        data = get_storage().download_file("videos", session.get("filename"))
                         
                         with open(video_path, "wb") as f:
                             f.write(data)
@@ -125,16 +124,23 @@ def process_session(session_id: str) -> Dict[str, Any]:
                 logger.info(f"Audio extracted to {audio_path}")
                 
                 transcript_data = TranscriptService.get_transcript(session_id)
-                wpm = calculate_wpm(transcript_data.get('segments', [])) if transcript_data else None
+                # Pacing series are computed once here and stored with the
+                # audio features, so charts never re-split the transcript
+                pacing = pacing_from_transcript(transcript_data) if transcript_data else None
+                if pacing is not None:
+                    wpm = pacing["wpm"]
+                else:
+                    wpm = calculate_wpm(transcript_data.get('segments', [])) if transcript_data else None
                 logger.info(f"WPM calculated: {wpm}")
                 
-                silence_data = detect_silence_intervals(audio_path)
+                # One streaming pass yields both silence and clarity features
+                audio_features = analyze_audio_features(audio_path)
+                silence_data = audio_features["silence"]
+                clarity_data = audio_features["clarity"]
                 logger.info(f"Silence detected: {silence_data.get('silence_ratio', 0):.2%}")
-                
-                clarity_data = analyze_audio_clarity(audio_path)
                 logger.info(f"Clarity analyzed: {clarity_data.get('clarity_score', 0)}")
                 
-                audio_scores = compute_audio_scores(wpm, silence_data, clarity_data)
+                audio_scores = compute_audio_scores(wpm, silence_data, clarity_data, pacing)
                 
                 AudioFeatureService.save_audio_features(session_id, audio_scores)
                 
@@ -162,24 +168,35 @@ def process_session(session_id: str) -> Dict[str, Any]:
             try:
                 video_path = os.path.join(Config.UPLOAD_DIR, session.get("filename"))
                 
-                frames = extract_frames(video_path, fps=1, max_frames=60)
-                logger.info(f"Extracted {len(frames)} frames for analysis")
+                model_client = get_model_client()
                 
-                frame_results = batch_analyze_frames(frames)
+                # In-process runs release the MediaPipe graphs afterwards;
+                # worker processes keep them loaded for the next session.
+                frame_results = model_client.call(
+                    "analyze_video_frames",
+                    video_path,
+                    fps=1,
+                    max_frames=60,
+                    release_detectors=model_client.in_process,
+                    adaptive=Config.ADAPTIVE_FRAME_SAMPLING
+                )
                 
                 engagement_metrics = compute_engagement_metrics(frame_results)
                 
                 visual_scores = compute_visual_scores(engagement_metrics)
                 
-                VisualEvaluationService.save_visual_evaluation(session_id, visual_scores)
+                raw_visual_data = {"frames": engagement_metrics.get("raw")}
+                if Config.KEEP_RAW_LANDMARKS:
+                    artifact_path = VisualEvaluationService.save_frame_results_artifact(session_id, frame_results)
+                    if artifact_path:
+                        raw_visual_data["frame_results_artifact"] = artifact_path
                 
-                cleanup_detectors()
+                VisualEvaluationService.save_visual_evaluation(session_id, visual_scores, raw_visual_data)
                 
                 mark_stage_complete(session_id, "visual")
                 
             except Exception as e:
                 logger.error(f"Visual analysis failed: {str(e)}")
-                cleanup_detectors()
                 raise e
         
         stage_times["visual"] = time.time() - stage_start
@@ -1,11 +1,11 @@
 import json
 import time
-import google.generativeai as genai
 from typing import Dict, Any, Optional
 from src.backend.utils.logger import setup_logger
 from src.backend.utils.config import Config
 from src.backend.services.final_score_service import FinalScoreService
 from src.backend.services.report_service import ReportService
+from src.backend.workers import get_model_client
 from src.backend.pipelines.report.report_prompt_template import (
     build_report_prompt,
     validate_report_response
@@ -56,7 +56,7 @@ def generate_report(session_id: str, retry_count: int = 1) -> Dict[str, Any]:
         report_json = None
         for attempt in range(retry_count + 1):
             try:
-                report_json = _call_llm_api(prompt, attempt + 1)
+                report_json = get_model_client().call("generate_report_json", prompt, attempt + 1)
                 if report_json:
                     break
             except Exception as e:
@@ -104,6 +104,7 @@ def _call_llm_api(prompt: str, attempt: int) -> Optional[Dict[str, Any]]:
         return None
     
     try:
+        import google.generativeai as genai
         genai.configure(api_key=api_key)
         model_name = Config.LLM_MODEL  # e.g., "gemini-1.5-flash"
         model = genai.GenerativeModel(model_name)
@@ -183,7 +184,7 @@ def generate_report_with_scores(
     
     prompt = build_report_prompt(scores)
     
-    report_json = _call_llm_api(prompt, 1)
+    report_json = get_model_client().call("generate_report_json", prompt, 1)
     
     if report_json and validate_report_response(report_json):
         return {
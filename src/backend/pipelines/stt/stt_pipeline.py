@@ -3,10 +3,9 @@ import json
 from src.backend.services.session_service import SessionService
 from src.backend.services.transcript_service import TranscriptService
 from src.backend.utils.audio_extractor import extract_audio_from_video
-from src.backend.pipelines.stt.whisper_engine import run_whisper
-from src.backend.pipelines.text.text_evaluator import run_text_evaluation
 from src.backend.pipelines.text.text_parser import parse_text_evaluation_output
 from src.backend.services.text_evaluation_service import TextEvaluationService
+from src.backend.workers import get_model_client
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -24,6 +23,7 @@ def store_transcript_result(session_id: str, transcript_result: dict) -> bool:
     try:
         full_text = transcript_result.get("text", "")
         segments = transcript_result.get("segments", [])
+        words = transcript_result.get("words", [])
         
         if not full_text or not full_text.strip():
             logger.warning(f"store_transcript_result: Empty transcript text for session {session_id}")
@@ -33,12 +33,17 @@ def store_transcript_result(session_id: str, transcript_result: dict) -> bool:
             logger.warning(f"store_transcript_result: Invalid segments format for session {session_id}")
             segments = []
         
-        logger.info(f"Storing transcript for session {session_id}: {len(full_text)} chars, {len(segments)} segments")
+        if not isinstance(words, list):
+            logger.warning(f"store_transcript_result: Invalid word timestamps for session {session_id}")
+            words = []
+        
+        logger.info(f"Storing transcript for session {session_id}: {len(full_text)} chars, {len(segments)} segments, {len(words)} words")
         
         transcript_id = TranscriptService.save_transcript(
             session_id,
             full_text,
-            segments
+            segments,
+            words
         )
         
         if not transcript_id:
@@ -46,8 +51,14 @@ def store_transcript_result(session_id: str, transcript_result: dict) -> bool:
             return False
         
         try:
-            from src.backend.utils.supabase_client import supabase
-            supabase.table("sessions").update({"has_transcript": True}).eq("id", session_id).execute()
+            from src.backend.services.transcript_search_service import TranscriptSearchService
+            TranscriptSearchService.index_transcript(session_id, segments)
+        except Exception as e:
+            logger.warning(f"Failed to index transcript for search for session {session_id}: {str(e)}")
+        
+        try:
+            from src.backend.storage import get_storage
+            get_storage().update("sessions", {"has_transcript": True}, {"id": session_id})
             logger.info(f"Updated has_transcript flag for session {session_id}")
         except Exception as e:
             logger.warning(f"Failed to update has_transcript flag for session {session_id}: {str(e)}")
@@ -78,7 +89,7 @@ def stt_pipeline(session_id: str) -> dict:
         audio_path = video_path.rsplit('.', 1)[0] + ".wav"
         extract_audio_from_video(video_path, audio_path)
         
-        transcript_result = run_whisper(audio_path)
+        transcript_result = get_model_client().call("transcribe", audio_path)
         
         if not store_transcript_result(session_id, transcript_result):
             logger.warning(f"Transcript storage failed for session {session_id}, continuing anyway")
@@ -89,7 +100,7 @@ def stt_pipeline(session_id: str) -> dict:
             SessionService.update_status(session_id, "processing_text_eval")
             logger.info(f"Starting text evaluation for session {session_id}")
             
-            raw_llm_result = run_text_evaluation(transcript_result["text"])
+            raw_llm_result = get_model_client().call("evaluate_text", transcript_result["text"])
             parsed_scores = parse_text_evaluation_output(json.dumps(raw_llm_result)) # run_text_evaluation returns dict, parser expects str or dict? Parser expects str.
             
             raw_json_str = raw_llm_result.get("raw_llm_response", "{}")
@@ -1,11 +1,33 @@
-import whisper
 import time
 import os
+import threading
 from src.backend.utils.logger import setup_logger
 from src.backend.utils.config import Config
 
 logger = setup_logger(__name__)
 
+_models = {}
+_models_lock = threading.Lock()
+
+# One model instance is shared by every pipeline thread, and transcribe()
+# installs kv-cache and alignment hooks on it, so transcriptions on the
+# same model must not overlap
+_transcribe_locks = {}
+
+def load_whisper_model(model_name: str = None):
+    
+    model_name = model_name or Config.WHISPER_MODEL
+    
+    with _models_lock:
+        if model_name not in _models:
+            logger.info(f"Loading Whisper model: {model_name}")
+            start_time = time.time()
+            import whisper
+            _models[model_name] = whisper.load_model(model_name)
+            _transcribe_locks[model_name] = threading.Lock()
+            logger.info(f"Model loaded in {time.time() - start_time:.2f}s")
+        return _models[model_name]
+
 def run_whisper(audio_path: str) -> dict:
     if not os.path.exists(audio_path):
         logger.error(f"Audio file not found: {audio_path}")
@@ -13,17 +35,13 @@ def run_whisper(audio_path: str) -> dict:
 
     try:
         model_name = Config.WHISPER_MODEL
-        logger.info(f"Loading Whisper model: {model_name}")
-        
-        start_time = time.time()
-        model = whisper.load_model(model_name)
-        load_time = time.time() - start_time
-        logger.info(f"Model loaded in {load_time:.2f}s")
+        model = load_whisper_model(model_name)
 
         logger.info(f"Starting transcription for {audio_path}")
         transcription_start = time.time()
         
-        result = model.transcribe(audio_path)
+        with _transcribe_locks[model_name]:
+            result = model.transcribe(audio_path, word_timestamps=True)
         
         transcription_time = time.time() - transcription_start
         logger.info(f"Transcription completed in {transcription_time:.2f}s")
@@ -37,6 +55,15 @@ def run_whisper(audio_path: str) -> dict:
                     "text": segment["text"]
                 }
                 for segment in result["segments"]
+            ],
+            "words": [
+                {
+                    "word": word["word"],
+                    "start": word["start"],
+                    "end": word["end"]
+                }
+                for segment in result["segments"]
+                for word in segment.get("words", [])
             ]
         }
 
@@ -1,6 +1,5 @@
 import json
 import time
-import google.generativeai as genai
 from src.backend.utils.logger import setup_logger
 from src.backend.utils.config import Config
 from src.backend.pipelines.text.text_prompt_template import build_text_evaluation_prompt
@@ -18,6 +17,7 @@ def run_text_evaluation(transcript: str) -> dict:
         return _get_fallback_response("Missing API Key")
 
     try:
+        import google.generativeai as genai
         genai.configure(api_key=api_key)
         model_name = Config.LLM_MODEL # e.g., "gemini-1.5-flash"
         model = genai.GenerativeModel(model_name)
@@ -12,14 +12,21 @@ from .frame_extractor import (
     get_video_metadata,
     FrameExtractionError
 )
+from .frame_store import (
+    FrameResultStore,
+    GAZE_CODES,
+    as_frame_store
+)
 from .mediapipe_detector import (
     analyze_frame,
     batch_analyze_frames,
     cleanup_detectors
 )
+from .motion_features import compute_motion_features
 from .engagement_analyzer import (
     compute_engagement_metrics,
     compute_detailed_metrics,
+    engagement_metrics_from_counts,
     normalize_metrics_for_scoring
 )
 from .visual_scoring import (
@@ -40,11 +47,16 @@ __all__ = [
     'extract_frames',
     'get_video_metadata',
     'FrameExtractionError',
+    'FrameResultStore',
+    'GAZE_CODES',
     'analyze_frame',
     'batch_analyze_frames',
     'cleanup_detectors',
+    'as_frame_store',
+    'compute_motion_features',
     'compute_engagement_metrics',
     'compute_detailed_metrics',
+    'engagement_metrics_from_counts',
     'normalize_metrics_for_scoring',
     'compute_visual_scores',
     'get_visual_score_breakdown',
@@ -0,0 +1,69 @@
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional
+from src.backend.pipelines.visual.video_decoder import DECODERS, DecoderUnavailable, available_decoders
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Compares decode backends on one video for the two access patterns the
+# visual stage uses: the uniform fps pass at full size and the scene probe
+# pass at thumbnail size.
+#
+#   python -m src.backend.pipelines.visual.decode_benchmark lecture.mp4 --threads 4
+
+def _time_pass(decoder, **kwargs) -> Dict[str, Any]:
+
+    start = time.perf_counter()
+    frames = sum(1 for _, frame in decoder.iter_frames(**kwargs) if frame is not None)
+    elapsed = time.perf_counter() - start
+    return {
+        "frames": frames,
+        "seconds": round(elapsed, 3),
+        "frames_per_sec": round(frames / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+def benchmark_decoders(
+    path: str,
+    backends: Optional[List[str]] = None,
+    fps: float = 1.0,
+    threads: int = 0,
+    hwaccel: bool = False
+) -> List[Dict[str, Any]]:
+
+    from src.backend.pipelines.visual.scene_detector import THUMBNAIL_SIZE, probe_interval
+
+    results = []
+    for name in backends or available_decoders():
+        try:
+            decoder = DECODERS[name](path, threads=threads, hwaccel=hwaccel)
+        except DecoderUnavailable as e:
+            results.append({"decoder": name, "error": str(e)})
+            continue
+
+        step = max(1, int(decoder.fps / fps))
+        results.append({
+            "decoder": name,
+            "video_frames": decoder.frame_count,
+            "uniform": _time_pass(decoder, step=step),
+            "probe": _time_pass(decoder, step=probe_interval(decoder.fps), size=THUMBNAIL_SIZE)
+        })
+        logger.info(f"[Decode] {name}: {results[-1]['uniform']} / probe {results[-1]['probe']}")
+    return results
+
+def main(argv: Optional[List[str]] = None) -> None:
+
+    parser = argparse.ArgumentParser(description="Benchmark video decode backends")
+    parser.add_argument("video")
+    parser.add_argument("--decoders", nargs="*", choices=sorted(DECODERS), default=None)
+    parser.add_argument("--fps", type=float, default=1.0)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--hwaccel", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = benchmark_decoders(args.video, args.decoders, args.fps, args.threads, args.hwaccel)
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
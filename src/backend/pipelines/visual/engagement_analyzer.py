@@ -1,44 +1,72 @@
 from typing import List, Dict, Any, Optional
+import numpy as np
+from src.backend.pipelines.visual.frame_store import FrameResultStore, GAZE_CODES, GAZE_UNKNOWN, as_frame_store
+from src.backend.pipelines.visual.motion_features import compute_motion_features
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-def compute_engagement_metrics(frames_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+# Hand movement frequency is calibrated on the pipeline's 1 fps sampling.
+# Longer gaps between samples, as adaptive sampling leaves on static
+# shots, count as one interval, so the rate depends on what the sampled
+# frames show rather than on how far apart they are
+REFERENCE_SAMPLE_INTERVAL_SEC = 1.0
+
+def _raw_payload(frames_results, store: FrameResultStore, keep_raw: bool):
+    
+    # Per-frame results (and their landmarks) are only carried along on request;
+    # by default the payload is a small summary of the store
+    return frames_results if keep_raw else store.summary()
+
+def compute_engagement_metrics(frames_results, keep_raw: bool = False) -> Dict[str, Any]:
     
-    if not frames_results or len(frames_results) == 0:
+    if frames_results is None or len(frames_results) == 0:
         logger.warning("No frames provided for engagement analysis")
         return _get_empty_metrics(frames_results)
     
     logger.info(f"Computing engagement metrics for {len(frames_results)} frames")
     
-    total_frames = len(frames_results)
-    face_detected_count = 0
-    gaze_forward_count = 0
-    hands_detected_count = 0
-    gesture_frames_count = 0
-    body_movements = []
-    
-    for frame_result in frames_results:
-        if frame_result is None or not isinstance(frame_result, dict):
-            continue
-        
-        if frame_result.get("face_detected", False):
-            face_detected_count += 1
-        
-        gaze = frame_result.get("gaze_direction")
-        if gaze == "forward":
-            gaze_forward_count += 1
-        
-        if frame_result.get("hands_detected", False):
-            hands_detected_count += 1
-        
-        hand_count = frame_result.get("hand_count", 0)
-        if hand_count > 0:
-            gesture_frames_count += 1
-        
-        body_movement = frame_result.get("body_movement")
-        if body_movement is not None and isinstance(body_movement, (int, float)):
-            body_movements.append(body_movement)
+    store = as_frame_store(frames_results)
+    valid = store.column("valid")
+    body_movement = store.column("body_movement")
+    body_movement = body_movement[valid & ~np.isnan(body_movement)]
+    duration_minutes = _estimate_duration_minutes(store)
+    
+    metrics = engagement_metrics_from_counts(
+        total_frames=len(store),
+        face_detected_count=int(np.count_nonzero(store.column("face_detected") & valid)),
+        gaze_forward_count=int(np.count_nonzero(store.column("gaze") == GAZE_CODES["forward"])),
+        hands_detected_count=int(np.count_nonzero(store.column("hands_detected") & valid)),
+        gesture_frames_count=int(np.count_nonzero(store.column("hand_count") > 0)),
+        body_movement_total=float(body_movement.sum(dtype=np.float64)),
+        body_movement_samples=int(body_movement.size),
+        duration_minutes=duration_minutes
+    )
+    
+    if store.keep_landmarks:
+        metrics["motion"] = compute_motion_features(store, duration_minutes)
+    
+    metrics["raw"] = _raw_payload(frames_results, store, keep_raw)
+    
+    logger.info(f"Engagement metrics computed:")
+    logger.info(f"  - Face visibility: {metrics['face_visibility_ratio']:.1%}")
+    logger.info(f"  - Gaze forward: {metrics['gaze_forward_ratio']:.1%}")
+    logger.info(f"  - Hand movement frequency: {metrics['hand_movement_frequency']:.1f}/min")
+    logger.info(f"  - Body movement activity: {metrics['body_movement_activity']:.1f}/10")
+    logger.info(f"  - Gesture activity: {metrics['gesture_activity_ratio']:.1%}")
+    
+    return metrics
+
+def engagement_metrics_from_counts(
+    total_frames: int,
+    face_detected_count: int,
+    gaze_forward_count: int,
+    hands_detected_count: int,
+    gesture_frames_count: int,
+    body_movement_total: float,
+    body_movement_samples: int,
+    duration_minutes: float
+) -> Dict[str, Any]:
     
     metrics = {}
     
@@ -52,14 +80,13 @@ def compute_engagement_metrics(frames_results: List[Dict[str, Any]]) -> Dict[str
         3
     )
     
-    duration_minutes = _estimate_duration_minutes(frames_results)
     metrics["hand_movement_frequency"] = round(
         hands_detected_count / duration_minutes if duration_minutes > 0 else hands_detected_count,
         2
     )
     
     metrics["body_movement_activity"] = round(
-        sum(body_movements) / len(body_movements) if body_movements else 0.0,
+        body_movement_total / body_movement_samples if body_movement_samples else 0.0,
         2
     )
     
@@ -68,35 +95,19 @@ def compute_engagement_metrics(frames_results: List[Dict[str, Any]]) -> Dict[str
         3
     )
     
-    metrics["raw"] = frames_results
-    
-    logger.info(f"Engagement metrics computed:")
-    logger.info(f"  - Face visibility: {metrics['face_visibility_ratio']:.1%}")
-    logger.info(f"  - Gaze forward: {metrics['gaze_forward_ratio']:.1%}")
-    logger.info(f"  - Hand movement frequency: {metrics['hand_movement_frequency']:.1f}/min")
-    logger.info(f"  - Body movement activity: {metrics['body_movement_activity']:.1f}/10")
-    logger.info(f"  - Gesture activity: {metrics['gesture_activity_ratio']:.1%}")
-    
     return metrics
 
-def _estimate_duration_minutes(frames_results: List[Dict[str, Any]]) -> float:
-    
-    try:
-        timestamps = []
-        for frame in frames_results:
-            if frame and isinstance(frame, dict):
-                ts = frame.get("timestamp")
-                if ts is not None and isinstance(ts, (int, float)):
-                    timestamps.append(ts)
-        
-        if len(timestamps) < 2:
-            return len(frames_results) / 120.0
-        
-        duration_seconds = max(timestamps) - min(timestamps)
-        return duration_seconds / 60.0
-    
-    except Exception:
-        return len(frames_results) / 120.0
+def _estimate_duration_minutes(frames_results) -> float:
+    
+    store = as_frame_store(frames_results)
+    timestamps = store.column("timestamp")
+    timestamps = timestamps[~np.isnan(timestamps)]
+    
+    if timestamps.size < 2:
+        return len(store) / 120.0
+    
+    intervals = np.minimum(np.diff(np.sort(timestamps)), REFERENCE_SAMPLE_INTERVAL_SEC)
+    return float(intervals.sum(dtype=np.float64)) / 60.0
 
 def _get_empty_metrics(frames_results: Optional[List] = None) -> Dict[str, Any]:
     
@@ -109,47 +120,40 @@ def _get_empty_metrics(frames_results: Optional[List] = None) -> Dict[str, Any]:
         "raw": frames_results or []
     }
 
-def compute_detailed_metrics(frames_results: List[Dict[str, Any]]) -> Dict[str, Any]:
-    
-    base_metrics = compute_engagement_metrics(frames_results)
-    
-    if not frames_results:
-        return base_metrics
-    
-    gaze_distribution = {"forward": 0, "away": 0, "down": 0, "unknown": 0}
-    hand_statistics = {"left_only": 0, "right_only": 0, "both": 0}
-    confidence_scores = {"face": [], "hand": []}
-    
-    for frame_result in frames_results:
-        if not frame_result or not isinstance(frame_result, dict):
-            continue
-        
-        gaze = frame_result.get("gaze_direction")
-        if gaze in gaze_distribution:
-            gaze_distribution[gaze] += 1
-        else:
-            gaze_distribution["unknown"] += 1
-        
-        face_conf = frame_result.get("face_confidence")
-        if face_conf is not None:
-            confidence_scores["face"].append(face_conf)
-        
-        hand_count = frame_result.get("hand_count", 0)
-        if hand_count == 2:
-            hand_statistics["both"] += 1
-        elif hand_count == 1:
-            hand_statistics["left_only"] += 1  # Placeholder
+def compute_detailed_metrics(frames_results, keep_raw: bool = False) -> Dict[str, Any]:
+    
+    if frames_results is None or len(frames_results) == 0:
+        return compute_engagement_metrics(frames_results)
+    
+    store = as_frame_store(frames_results)
+    base_metrics = compute_engagement_metrics(store)
+    base_metrics["raw"] = _raw_payload(frames_results, store, keep_raw)
+    
+    valid = store.column("valid")
+    gaze = store.column("gaze")[valid]
+    hand_count = store.column("hand_count")[valid]
+    face_confidence = store.column("face_confidence")[valid]
+    face_confidence = face_confidence[~np.isnan(face_confidence)]
+    
+    gaze_counts = np.bincount(gaze, minlength=len(GAZE_CODES) + 1)
+    gaze_distribution = {label: int(gaze_counts[code]) for label, code in GAZE_CODES.items()}
+    gaze_distribution["unknown"] = int(gaze_counts[GAZE_UNKNOWN])
+    
+    hand_statistics = {
+        "left_only": int(np.count_nonzero(hand_count == 1)),  # Placeholder
+        "right_only": 0,
+        "both": int(np.count_nonzero(hand_count == 2))
+    }
     
     base_metrics["detailed"] = {
         "gaze_distribution": gaze_distribution,
         "hand_statistics": hand_statistics,
         "average_face_confidence": round(
-            sum(confidence_scores["face"]) / len(confidence_scores["face"])
-            if confidence_scores["face"] else 0.0,
+            float(face_confidence.mean(dtype=np.float64)) if face_confidence.size else 0.0,
             3
         ),
-        "total_analyzed_frames": len(frames_results),
-        "valid_frames": sum(1 for f in frames_results if f is not None)
+        "total_analyzed_frames": len(store),
+        "valid_frames": int(np.count_nonzero(valid))
     }
     
     return base_metrics
@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+import numpy as np
+from src.backend.pipelines.visual.frame_store import FrameResultStore
+from src.backend.utils.config import Config
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+HASH_CHUNK_BYTES = 4 * 1024 * 1024
+HASH_MEMO_SIZE = 256
+
+_hash_memo: "OrderedDict[Tuple[str, int, float], str]" = OrderedDict()
+_hash_lock = threading.Lock()
+
+def media_hash(path: str) -> str:
+
+    # Content hash, memoised per (path, size, mtime) so repeated runs on the
+    # same upload read the file once per process
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime)
+    with _hash_lock:
+        if memo_key in _hash_memo:
+            _hash_memo.move_to_end(memo_key)
+            return _hash_memo[memo_key]
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+
+    with _hash_lock:
+        _hash_memo[memo_key] = digest.hexdigest()
+        while len(_hash_memo) > HASH_MEMO_SIZE:
+            _hash_memo.popitem(last=False)
+    return digest.hexdigest()
+
+def detector_key(min_face_confidence: float, min_hand_confidence: float) -> str:
+
+    from src.backend.pipelines.visual.mediapipe_detector import DETECTOR_VERSION
+
+    try:
+        from importlib.metadata import version
+        mediapipe_version = version("mediapipe")
+    except Exception:
+        mediapipe_version = "unknown"
+
+    return f"v{DETECTOR_VERSION}-mp{mediapipe_version}-face{min_face_confidence:g}-hand{min_hand_confidence:g}-static"
+
+class FrameResultCache:
+
+    # Per-frame detector output on local disk, one compressed FrameResultStore
+    # per (media hash, detector key) holding every frame analysed so far, plus
+    # the frame plans of earlier sampling runs. Files are replaced atomically,
+    # so concurrent writers at worst lose each other's newest frames. Past
+    # max_bytes, whole videos are dropped, least recently used first.
+
+    def __init__(self, root: str, max_bytes: Optional[int] = None):
+
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, media: str, *parts: str) -> str:
+
+        return os.path.join(self.root, media[:2], media, *parts)
+
+    def _write(self, path: str, data: bytes) -> None:
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def load(self, media: str, detector: str) -> Optional[FrameResultStore]:
+
+        path = self._path(media, f"{detector}.npz")
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                store = FrameResultStore.from_bytes(f.read())
+            # mtime marks the last use for eviction
+            os.utime(path)
+            return store
+        except Exception as e:
+            logger.warning(f"[FrameCache] Ignoring unreadable entry {path}: {str(e)}")
+            return None
+
+    def save(self, media: str, detector: str, store: FrameResultStore) -> None:
+
+        with self._lock:
+            self._write(self._path(media, f"{detector}.npz"), store.to_bytes())
+            self._prune(keep=media)
+
+    def _prune(self, keep: str) -> int:
+
+        if not self.max_bytes or not os.path.isdir(self.root):
+            return 0
+
+        entries = []
+        total = 0
+        for prefix in os.listdir(self.root):
+            prefix_dir = os.path.join(self.root, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for media in os.listdir(prefix_dir):
+                size, last_used = 0, 0.0
+                for dirpath, _, filenames in os.walk(os.path.join(prefix_dir, media)):
+                    for name in filenames:
+                        stat = os.stat(os.path.join(dirpath, name))
+                        size += stat.st_size
+                        last_used = max(last_used, stat.st_mtime)
+                total += size
+                if media != keep:
+                    entries.append((last_used, size, media))
+
+        removed = 0
+        for _, size, media in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self._path(media), ignore_errors=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"[FrameCache] Evicted {removed} videos, {total / 1e6:.0f} MB in use")
+        return removed
+
+    def load_plan(self, media: str, plan_key: str) -> Optional[List[int]]:
+
+        path = self._path(media, "plans", f"{plan_key}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def save_plan(self, media: str, plan_key: str, frame_numbers: List[int]) -> None:
+
+        self._write(self._path(media, "plans", f"{plan_key}.json"), json.dumps(frame_numbers).encode())
+
+def _plan_frames(cache: FrameResultCache, media: str, video_path: str, fps: int, max_frames: int, adaptive: bool) -> List[int]:
+
+    from src.backend.pipelines.visual.video_decoder import open_video
+    from src.backend.pipelines.visual.frame_extractor import plan_adaptive_frames
+
+    plan_key = f"fps{fps}-max{max_frames}-{'adaptive' if adaptive else 'uniform'}"
+    cached = cache.load_plan(media, plan_key)
+    if cached is not None:
+        return cached
+
+    video = open_video(video_path)
+    if adaptive:
+        planned, _ = plan_adaptive_frames(video, fps, max_frames)
+        frame_numbers = sorted(planned)
+    else:
+        step = max(1, int(video.fps / fps))
+        frame_numbers = list(range(0, video.frame_count, step))[:max_frames]
+
+    cache.save_plan(media, plan_key, frame_numbers)
+    return frame_numbers
+
+def analyze_video_cached(
+    video_path: str,
+    cache: FrameResultCache,
+    fps: int = 1,
+    max_frames: int = 60,
+    adaptive: bool = False,
+    min_face_confidence: float = 0.7,
+    min_hand_confidence: float = 0.6
+) -> FrameResultStore:
+
+    from src.backend.pipelines.visual.frame_extractor import extract_frames
+    from src.backend.pipelines.visual.mediapipe_detector import batch_analyze_frames
+
+    media = media_hash(video_path)
+    detector = detector_key(min_face_confidence, min_hand_confidence)
+    frame_numbers = _plan_frames(cache, media, video_path, fps, max_frames, adaptive)
+
+    cached = cache.load(media, detector)
+    cached_numbers = cached.column("frame_number") if cached is not None else np.empty(0, dtype=np.int64)
+    missing = np.setdiff1d(frame_numbers, cached_numbers).tolist()
+
+    logger.info(
+        f"[FrameCache] {len(frame_numbers) - len(missing)}/{len(frame_numbers)} frames cached, "
+        f"analysing {len(missing)}"
+    )
+
+    parts = [cached] if cached is not None else []
+    if missing:
+        frames = extract_frames(video_path, fps=fps, max_frames=len(missing), frame_numbers=missing)
+        # Cached frames are merged across runs with different samplings, so
+        # each must be analysed on its own, not tracked from the frame before
+        parts.append(batch_analyze_frames(
+            frames,
+            min_face_confidence=min_face_confidence,
+            min_hand_confidence=min_hand_confidence,
+            as_store=True,
+            static_image_mode=True
+        ))
+
+    merged = FrameResultStore.concat(parts)
+    if missing:
+        cache.save(media, detector, merged)
+
+    # Rows for the planned frames, in frame order; frames that failed to
+    # decode are simply absent, as with uncached extraction
+    numbers = merged.column("frame_number")
+    rows = np.flatnonzero(np.isin(numbers, frame_numbers))
+    return merged.take(rows[np.argsort(numbers[rows], kind="stable")])
+
+_cache: Optional[FrameResultCache] = None
+_cache_lock = threading.Lock()
+
+def get_frame_cache() -> Optional[FrameResultCache]:
+
+    global _cache
+
+    if not Config.FRAME_CACHE_ENABLED:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = FrameResultCache(Config.FRAME_CACHE_DIR, max_bytes=Config.FRAME_CACHE_MAX_MB * 1024 * 1024)
+                logger.info(f"[FrameCache] Using {Config.FRAME_CACHE_DIR}")
+    return _cache
+
+def set_frame_cache(cache: Optional[FrameResultCache]) -> None:
+
+    global _cache
+    _cache = cache
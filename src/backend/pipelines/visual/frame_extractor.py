@@ -1,8 +1,7 @@
-import cv2
 import numpy as np
 import os
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,10 +10,49 @@ class FrameExtractionError(Exception):
     
     pass
 
+def _probe_scenes(decoder):
+    
+    from src.backend.pipelines.visual.scene_detector import frame_signature, probe_interval, THUMBNAIL_SIZE
+    
+    probe_times, thumbnails, histograms = [], [], []
+    frames_seen = 0
+    
+    # Probes are requested as thumbnails so decoders that scale natively
+    # never materialise full-size frames for this pass
+    for frame_number, frame in decoder.iter_frames(step=probe_interval(decoder.fps), size=THUMBNAIL_SIZE):
+        frames_seen = frame_number + 1
+        if frame is not None and frame.size > 0:
+            thumbnail, histogram = frame_signature(frame)
+            probe_times.append(frame_number / decoder.fps)
+            thumbnails.append(thumbnail)
+            histograms.append(histogram)
+    
+    if not probe_times:
+        raise FrameExtractionError("No frames could be decoded for scene detection")
+    
+    return np.array(probe_times), np.stack(thumbnails), np.stack(histograms), max(frames_seen, decoder.frame_count)
+
+def plan_adaptive_frames(decoder, fps: int, max_frames: int):
+    
+    from src.backend.pipelines.visual.scene_detector import plan_adaptive_sampling, scene_index
+    
+    probe_times, thumbnails, histograms, frames_seen = _probe_scenes(decoder)
+    times, segments = plan_adaptive_sampling(
+        probe_times, thumbnails, histograms, frames_seen / decoder.fps, fps, max_frames
+    )
+    
+    frame_numbers = np.clip(np.round(times * decoder.fps - 0.5), 0, frames_seen - 1).astype(np.int64)
+    frame_numbers, first = np.unique(frame_numbers, return_index=True)
+    scenes = scene_index(times[first], segments)
+    return dict(zip(frame_numbers.tolist(), scenes.tolist())), segments
+
 def extract_frames(
     video_path: str, 
     fps: int = 2,
-    max_frames: int = 1000
+    max_frames: int = 1000,
+    adaptive: bool = False,
+    decoder: Optional[str] = None,
+    frame_numbers: Optional[Sequence[int]] = None
 ) -> List[Dict[str, Any]]:
     
     if not os.path.exists(video_path):
@@ -26,71 +64,78 @@ def extract_frames(
     if max_frames <= 0:
         raise ValueError(f"max_frames must be positive, got: {max_frames}")
     
+    # An explicit frame list (e.g. the cache misses of a planned sampling)
+    # is decoded as-is; an empty list means there is nothing to decode
+    if frame_numbers is not None and len(frame_numbers) == 0:
+        return []
+    
+    import cv2
+    from src.backend.pipelines.visual.video_decoder import open_video, DecoderUnavailable
+    
     frames = []
-    cap = None
     
     try:
         start_time = time.time()
         logger.info(f"Starting frame extraction from {video_path} at {fps} FPS")
         
-        cap = cv2.VideoCapture(video_path)
-        
-        if not cap.isOpened():
+        try:
+            video = open_video(video_path, decoder)
+        except DecoderUnavailable:
             raise FrameExtractionError(f"Failed to open video: {video_path}")
         
-        original_fps = cap.get(cv2.CAP_PROP_FPS)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration = total_frames / original_fps if original_fps > 0 else 0
+        original_fps = video.fps
+        total_frames = video.frame_count
+        duration = video.duration
         
         if original_fps == 0:
             raise FrameExtractionError("Video has invalid FPS (0)")
         
-        logger.info(f"Video properties: {original_fps:.2f} FPS, {total_frames} total frames, {duration:.2f}s duration")
+        logger.info(f"Video properties: {original_fps:.2f} FPS, {total_frames} total frames, {duration:.2f}s duration ({video.name} decoder)")
         
         frame_interval = int(original_fps / fps)
         if frame_interval == 0:
             frame_interval = 1
             logger.warning(f"Requested FPS ({fps}) higher than video FPS ({original_fps}), extracting every frame")
         
-        frame_count = 0
+        # Adaptive mode first scans the video for scene changes and spends
+        # the frame budget densely on camera shots and sparsely on static
+        # slides; the second pass then decodes only the planned frames
+        planned = None
+        if frame_numbers is not None:
+            selection = video.iter_frames(frame_numbers=sorted(frame_numbers))
+        elif adaptive:
+            planned, segments = plan_adaptive_frames(video, fps, max_frames)
+            selection = video.iter_frames(frame_numbers=sorted(planned))
+        else:
+            selection = video.iter_frames(step=frame_interval)
+        
         extracted_count = 0
         failed_count = 0
         
-        while True:
-            ret, frame = cap.read()
-            
-            if not ret:
-                break
-            
-            if frame_count % frame_interval == 0:
-                try:
-                    if frame is None or frame.size == 0:
-                        logger.warning(f"Corrupted frame at frame_count={frame_count}, skipping")
-                        failed_count += 1
-                        frame_count += 1
-                        continue
-                    
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    timestamp = frame_count / original_fps
-                    
-                    frames.append({
-                        "frame": frame_rgb,
-                        "timestamp": timestamp,
-                        "frame_number": frame_count
-                    })
-                    
-                    extracted_count += 1
-                    
-                    if extracted_count >= max_frames:
-                        logger.info(f"Reached max_frames limit ({max_frames}), stopping extraction")
-                        break
-                
-                except Exception as e:
-                    logger.warning(f"Error processing frame {frame_count}: {str(e)}")
+        try:
+            for frame_count, frame_rgb in selection:
+                if frame_rgb is None or frame_rgb.size == 0:
+                    logger.warning(f"Corrupted frame at frame_count={frame_count}, skipping")
                     failed_count += 1
-            
-            frame_count += 1
+                    continue
+                
+                extracted = {
+                    "frame": frame_rgb,
+                    "timestamp": frame_count / original_fps,
+                    "frame_number": frame_count
+                }
+                if planned is not None:
+                    extracted["scene"] = planned.get(frame_count, 0)
+                frames.append(extracted)
+                
+                extracted_count += 1
+                
+                if extracted_count >= max_frames:
+                    logger.info(f"Reached max_frames limit ({max_frames}), stopping extraction")
+                    break
+        finally:
+            selection.close()
+            logger.info("Video decoder released")
         
         extraction_duration = time.time() - start_time
         
@@ -106,10 +151,12 @@ def extract_frames(
         
         logger.info(f"Frame extraction completed:")
         logger.info(f"  - Extracted {extracted_count} frames")
+        if planned is not None:
+            logger.info(f"  - Adaptive sampling over {len(segments)} scene segments")
         logger.info(f"  - Failed frames: {failed_count}")
         logger.info(f"  - Average interval: {avg_interval:.3f}s")
         logger.info(f"  - Extraction duration: {extraction_duration:.2f}s")
-        logger.info(f"  - Effective FPS: {extracted_count/duration:.2f}")
+        logger.info(f"  - Effective FPS: {extracted_count/duration:.2f}" if duration > 0 else "  - Effective FPS: n/a")
         
         return frames
     
@@ -120,11 +167,6 @@ def extract_frames(
         if isinstance(e, (FrameExtractionError, FileNotFoundError, ValueError)):
             raise
         raise FrameExtractionError(f"Unexpected error during frame extraction: {str(e)}")
-    
-    finally:
-        if cap is not None:
-            cap.release()
-            logger.info("Video capture released")
 
 def get_video_metadata(video_path: str) -> Optional[Dict[str, Any]]:
     
@@ -132,6 +174,8 @@ def get_video_metadata(video_path: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Video file not found: {video_path}")
         return None
     
+    import cv2
+    
     cap = None
     try:
         cap = cv2.VideoCapture(video_path)
@@ -0,0 +1,275 @@
+import io
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+
+GAZE_CODES = {"forward": 1, "away": 2, "down": 3}
+GAZE_LABELS = {code: label for label, code in GAZE_CODES.items()}
+GAZE_UNKNOWN = 0
+
+POSE_LANDMARKS = 33
+HAND_LANDMARKS = 21
+MAX_HANDS = 2
+
+# Normalised MediaPipe coordinates need ~3 significant digits, so half
+# precision keeps landmarks at a quarter of the float64 footprint
+LANDMARK_DTYPE = np.float16
+
+SCALAR_COLUMNS = {
+    "timestamp": np.float64,
+    "frame_number": np.int64,
+    "valid": np.bool_,
+    "face_detected": np.bool_,
+    "face_confidence": np.float32,
+    "gaze": np.int8,
+    "hands_detected": np.bool_,
+    "hand_count": np.int8,
+    "body_movement": np.float32
+}
+
+# Fill values for frames where a field is missing
+COLUMN_DEFAULTS = {
+    "timestamp": np.nan,
+    "frame_number": -1,
+    "valid": False,
+    "face_detected": False,
+    "face_confidence": np.nan,
+    "gaze": GAZE_UNKNOWN,
+    "hands_detected": False,
+    "hand_count": 0,
+    "body_movement": np.nan
+}
+
+def _number(value: Any, default: float) -> float:
+
+    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+        return value
+    return default
+
+class FrameResultStore:
+
+    # Column-wise container for per-frame detector output. Scalars live in
+    # one NumPy array per field and landmarks in (frames, landmarks, 3)
+    # tensors with NaN for missing detections, so session-level metrics are
+    # plain array reductions instead of loops over per-frame dicts.
+
+    def __init__(self, capacity: int = 64, keep_landmarks: bool = True, landmark_dtype=LANDMARK_DTYPE):
+
+        self.keep_landmarks = keep_landmarks
+        self.landmark_dtype = np.dtype(landmark_dtype)
+        self._size = 0
+        self._capacity = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        self._pose: Optional[np.ndarray] = None
+        self._hands: Optional[np.ndarray] = None
+        self._grow(max(1, capacity))
+
+    @classmethod
+    def from_results(cls, results: Iterable[Optional[Dict[str, Any]]], keep_landmarks: bool = True) -> "FrameResultStore":
+
+        results = list(results)
+        store = cls(capacity=len(results), keep_landmarks=keep_landmarks)
+        for result in results:
+            store.append(result)
+        return store
+
+    def _grow(self, capacity: int) -> None:
+
+        for name, dtype in SCALAR_COLUMNS.items():
+            column = np.full(capacity, COLUMN_DEFAULTS[name], dtype=dtype)
+            if name in self._columns:
+                column[:self._size] = self._columns[name][:self._size]
+            self._columns[name] = column
+
+        if self.keep_landmarks:
+            pose = np.full((capacity, POSE_LANDMARKS, 3), np.nan, dtype=self.landmark_dtype)
+            hands = np.full((capacity, MAX_HANDS, HAND_LANDMARKS, 3), np.nan, dtype=self.landmark_dtype)
+            if self._pose is not None:
+                pose[:self._size] = self._pose[:self._size]
+                hands[:self._size] = self._hands[:self._size]
+            self._pose, self._hands = pose, hands
+
+        self._capacity = capacity
+
+    def append(self, result: Optional[Dict[str, Any]]) -> None:
+
+        if self._size == self._capacity:
+            self._grow(max(1, self._capacity * 2))
+
+        i = self._size
+        self._size += 1
+
+        if not isinstance(result, dict):
+            return
+
+        columns = self._columns
+        columns["valid"][i] = True
+        columns["timestamp"][i] = _number(result.get("timestamp"), np.nan)
+        columns["frame_number"][i] = _number(result.get("frame_number"), -1)
+        columns["face_detected"][i] = bool(result.get("face_detected", False))
+        columns["face_confidence"][i] = _number(result.get("face_confidence"), np.nan)
+        columns["gaze"][i] = GAZE_CODES.get(result.get("gaze_direction"), GAZE_UNKNOWN)
+        columns["hands_detected"][i] = bool(result.get("hands_detected", False))
+        columns["hand_count"][i] = result.get("hand_count", 0) or 0
+        columns["body_movement"][i] = _number(result.get("body_movement"), np.nan)
+
+        if self.keep_landmarks:
+            self._store_landmarks(i, result.get("raw") or {})
+
+    def _store_landmarks(self, i: int, raw: Dict[str, Any]) -> None:
+
+        # Landmarks may arrive as float arrays (detector) or tuple lists
+        pose = raw.get("pose") or {}
+        if pose.get("landmarks") is not None:
+            landmarks = np.asarray(pose["landmarks"], dtype=np.float32)
+            if landmarks.shape == (POSE_LANDMARKS, 3):
+                self._pose[i] = landmarks
+
+        for slot, hand in enumerate((raw.get("hands") or [])[:MAX_HANDS]):
+            if hand.get("landmarks") is None:
+                continue
+            landmarks = np.asarray(hand["landmarks"], dtype=np.float32)
+            if landmarks.shape == (HAND_LANDMARKS, 3):
+                self._hands[i, slot] = landmarks
+
+    def __len__(self) -> int:
+
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+
+        return self._columns[name][:self._size]
+
+    @property
+    def pose_landmarks(self) -> Optional[np.ndarray]:
+
+        return self._pose[:self._size] if self._pose is not None else None
+
+    @property
+    def hand_landmarks(self) -> Optional[np.ndarray]:
+
+        return self._hands[:self._size] if self._hands is not None else None
+
+    @property
+    def nbytes(self) -> int:
+
+        total = sum(self.column(name).nbytes for name in SCALAR_COLUMNS)
+        if self._pose is not None:
+            total += self.pose_landmarks.nbytes + self.hand_landmarks.nbytes
+        return total
+
+    def to_results(self) -> List[Optional[Dict[str, Any]]]:
+
+        # Landmark-free dict view for callers that still expect the list format
+        results = []
+        for i in range(self._size):
+            if not self._columns["valid"][i]:
+                results.append(None)
+                continue
+            confidence = self._columns["face_confidence"][i]
+            movement = self._columns["body_movement"][i]
+            timestamp = self._columns["timestamp"][i]
+            frame_number = self._columns["frame_number"][i]
+            results.append({
+                "timestamp": None if np.isnan(timestamp) else float(timestamp),
+                "frame_number": None if frame_number < 0 else int(frame_number),
+                "face_detected": bool(self._columns["face_detected"][i]),
+                "face_confidence": None if np.isnan(confidence) else float(confidence),
+                "gaze_direction": GAZE_LABELS.get(int(self._columns["gaze"][i])),
+                "hands_detected": bool(self._columns["hands_detected"][i]),
+                "hand_count": int(self._columns["hand_count"][i]),
+                "body_movement": None if np.isnan(movement) else float(movement)
+            })
+        return results
+
+    def __getstate__(self) -> Dict[str, Any]:
+
+        # Drop unused capacity when crossing process boundaries
+        return {
+            "keep_landmarks": self.keep_landmarks,
+            "landmark_dtype": self.landmark_dtype.str,
+            "columns": {name: self.column(name).copy() for name in SCALAR_COLUMNS},
+            "pose": None if self._pose is None else self.pose_landmarks.copy(),
+            "hands": None if self._hands is None else self.hand_landmarks.copy()
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+
+        self.keep_landmarks = state["keep_landmarks"]
+        self.landmark_dtype = np.dtype(state.get("landmark_dtype", LANDMARK_DTYPE))
+        self._columns = state["columns"]
+        self._pose = state["pose"]
+        self._hands = state["hands"]
+        self._size = self._capacity = len(self._columns["valid"])
+
+    def take(self, indices) -> "FrameResultStore":
+
+        indices = np.asarray(indices, dtype=np.int64)
+        store = FrameResultStore.__new__(FrameResultStore)
+        store.__setstate__({
+            "keep_landmarks": self.keep_landmarks,
+            "landmark_dtype": self.landmark_dtype.str,
+            "columns": {name: self.column(name)[indices] for name in SCALAR_COLUMNS},
+            "pose": None if self._pose is None else self.pose_landmarks[indices],
+            "hands": None if self._hands is None else self.hand_landmarks[indices]
+        })
+        return store
+
+    @classmethod
+    def concat(cls, stores: List["FrameResultStore"]) -> "FrameResultStore":
+
+        # Landmarks survive only if every part carries them
+        keep_landmarks = all(store.keep_landmarks for store in stores)
+        store = cls.__new__(cls)
+        store.__setstate__({
+            "keep_landmarks": keep_landmarks,
+            "landmark_dtype": stores[0].landmark_dtype.str if stores else LANDMARK_DTYPE,
+            "columns": {
+                name: np.concatenate([s.column(name) for s in stores]) if stores else np.empty(0, dtype=dtype)
+                for name, dtype in SCALAR_COLUMNS.items()
+            },
+            "pose": np.concatenate([s.pose_landmarks for s in stores]) if keep_landmarks and stores else None,
+            "hands": np.concatenate([s.hand_landmarks for s in stores]) if keep_landmarks and stores else None
+        })
+        return store
+
+    def to_bytes(self) -> bytes:
+
+        # Compressed .npz blob: one entry per column plus the landmark tensors
+        arrays = {name: self.column(name) for name in SCALAR_COLUMNS}
+        if self._pose is not None:
+            arrays["pose_landmarks"] = self.pose_landmarks
+            arrays["hand_landmarks"] = self.hand_landmarks
+
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FrameResultStore":
+
+        with np.load(io.BytesIO(data), allow_pickle=False) as blob:
+            pose = blob["pose_landmarks"] if "pose_landmarks" in blob.files else None
+            store = cls.__new__(cls)
+            store.__setstate__({
+                "keep_landmarks": pose is not None,
+                "landmark_dtype": pose.dtype.str if pose is not None else LANDMARK_DTYPE,
+                "columns": {name: blob[name] for name in SCALAR_COLUMNS},
+                "pose": pose,
+                "hands": blob["hand_landmarks"] if pose is not None else None
+            })
+        return store
+
+    def summary(self) -> Dict[str, Any]:
+
+        return {
+            "frames": len(self),
+            "valid_frames": int(np.count_nonzero(self.column("valid"))),
+            "landmarks": self.keep_landmarks,
+            "nbytes": self.nbytes
+        }
+
+def as_frame_store(frames_results) -> FrameResultStore:
+
+    if isinstance(frames_results, FrameResultStore):
+        return frames_results
+    return FrameResultStore.from_results(frames_results or [], keep_landmarks=False)
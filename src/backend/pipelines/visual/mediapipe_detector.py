@@ -1,24 +1,44 @@
-import mediapipe as mp
 import numpy as np
+from src.backend.pipelines.visual.frame_store import FrameResultStore
 from typing import Dict, Any, Optional, Tuple
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-mp_face_detection = mp.solutions.face_detection
-mp_hands = mp.solutions.hands
-mp_pose = mp.solutions.pose
+# MediaPipe PoseLandmark indices, kept here so the module imports without mediapipe
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+LEFT_HIP = 23
+RIGHT_HIP = 24
+
+# Bump when detector configuration or result fields change; cached frame
+# results from other versions are ignored
+DETECTOR_VERSION = 2
 
 _face_detector = None
 _hands_detector = None
 _pose_detector = None
+_static_image_mode = False
 
 def _initialize_detectors(
     min_face_confidence: float = 0.7,
-    min_hand_confidence: float = 0.6
+    min_hand_confidence: float = 0.6,
+    static_image_mode: bool = False
 ):
     
-    global _face_detector, _hands_detector, _pose_detector
+    global _face_detector, _hands_detector, _pose_detector, _static_image_mode
+    
+    if _face_detector is not None and _hands_detector is not None and _pose_detector is not None:
+        if static_image_mode == _static_image_mode:
+            return
+        cleanup_detectors()
+    
+    _static_image_mode = static_image_mode
+    
+    import mediapipe as mp
+    mp_face_detection = mp.solutions.face_detection
+    mp_hands = mp.solutions.hands
+    mp_pose = mp.solutions.pose
     
     if _face_detector is None:
         _face_detector = mp_face_detection.FaceDetection(
@@ -28,7 +48,7 @@ def _initialize_detectors(
     
     if _hands_detector is None:
         _hands_detector = mp_hands.Hands(
-            static_image_mode=False,
+            static_image_mode=static_image_mode,
             max_num_hands=2,
             min_detection_confidence=min_hand_confidence,
             min_tracking_confidence=0.5
@@ -37,19 +57,27 @@ def _initialize_detectors(
     
     if _pose_detector is None:
         _pose_detector = mp_pose.Pose(
-            static_image_mode=False,
+            static_image_mode=static_image_mode,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5
         )
         logger.info("Pose detector initialized")
 
+def _landmarks_array(landmarks) -> np.ndarray:
+    
+    # One float32 (n, 3) buffer instead of n Python (x, y, z) tuples
+    return np.array([(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float32)
+
 def analyze_frame(
     frame_rgb: np.ndarray,
     min_face_confidence: float = 0.7,
-    min_hand_confidence: float = 0.6
+    min_hand_confidence: float = 0.6,
+    static_image_mode: bool = False
 ) -> Dict[str, Any]:
     
-    _initialize_detectors(min_face_confidence, min_hand_confidence)
+    # static_image_mode analyses each frame on its own; tracking mode lets
+    # hands and pose follow on from the previous frame
+    _initialize_detectors(min_face_confidence, min_hand_confidence, static_image_mode)
     
     result = {
         "face_detected": False,
@@ -94,7 +122,7 @@ def analyze_frame(
                 handedness = hands_results.multi_handedness[idx].classification[0].label
                 hand_data.append({
                     "handedness": handedness,
-                    "landmarks": [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+                    "landmarks": _landmarks_array(hand_landmarks.landmark)
                 })
             result["raw"]["hands"] = hand_data
     
@@ -108,7 +136,7 @@ def analyze_frame(
             result["body_movement"] = movement
             
             result["raw"]["pose"] = {
-                "landmarks": [(lm.x, lm.y, lm.z) for lm in pose_results.pose_landmarks.landmark]
+                "landmarks": _landmarks_array(pose_results.pose_landmarks.landmark)
             }
     
     except Exception as e:
@@ -167,10 +195,10 @@ def _get_face_bbox(
 def _calculate_body_movement(pose_landmarks) -> float:
     
     try:
-        left_shoulder = pose_landmarks.landmark[mp_pose.PoseLandmark.LEFT_SHOULDER]
-        right_shoulder = pose_landmarks.landmark[mp_pose.PoseLandmark.RIGHT_SHOULDER]
-        left_hip = pose_landmarks.landmark[mp_pose.PoseLandmark.LEFT_HIP]
-        right_hip = pose_landmarks.landmark[mp_pose.PoseLandmark.RIGHT_HIP]
+        left_shoulder = pose_landmarks.landmark[LEFT_SHOULDER]
+        right_shoulder = pose_landmarks.landmark[RIGHT_SHOULDER]
+        left_hip = pose_landmarks.landmark[LEFT_HIP]
+        right_hip = pose_landmarks.landmark[RIGHT_HIP]
         
         shoulder_width = abs(right_shoulder.x - left_shoulder.x)
         hip_width = abs(right_hip.x - left_hip.x)
@@ -210,10 +238,13 @@ def batch_analyze_frames(
     frames: list,
     min_face_confidence: float = 0.7,
     min_hand_confidence: float = 0.6,
-    log_progress: bool = True
-) -> list:
+    log_progress: bool = True,
+    as_store: bool = False,
+    static_image_mode: bool = False
+):
     
-    results = []
+    # as_store collects results column-wise instead of as a list of dicts
+    results = FrameResultStore(capacity=len(frames)) if as_store else []
     total = len(frames)
     
     if log_progress:
@@ -228,7 +259,8 @@ def batch_analyze_frames(
         analysis = analyze_frame(
             frame_rgb,
             min_face_confidence=min_face_confidence,
-            min_hand_confidence=min_hand_confidence
+            min_hand_confidence=min_hand_confidence,
+            static_image_mode=static_image_mode
         )
         
         analysis["timestamp"] = frame_data.get("timestamp")
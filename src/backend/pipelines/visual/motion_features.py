@@ -0,0 +1,145 @@
+from typing import Any, Dict, Optional
+import numpy as np
+from src.backend.pipelines.visual.frame_store import FrameResultStore
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Upper-body pose landmarks: nose, shoulders, elbows, wrists
+UPPER_BODY_LANDMARKS = [0, 11, 12, 13, 14, 15, 16]
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+
+# Speeds are measured in shoulder widths per second, which keeps them
+# independent of camera distance and resolution
+GESTURE_SPEED_THRESHOLD = 0.5
+STILLNESS_SPEED_THRESHOLD = 0.05
+MIN_STILLNESS_SEC = 5.0
+MOTION_FULL_SCALE = 1.0
+
+# Consecutive samples further apart than this are not treated as motion
+MAX_SAMPLE_GAP_SEC = 2.5
+MIN_MOTION_SAMPLES = 3
+
+def _nanmean(values: np.ndarray, axis: int) -> np.ndarray:
+
+    # np.nanmean without the all-NaN RuntimeWarning
+    mask = ~np.isnan(values)
+    counts = mask.sum(axis=axis)
+    totals = np.where(mask, values, 0.0).sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+
+def _sample_intervals(store: FrameResultStore) -> np.ndarray:
+
+    timestamps = store.column("timestamp")
+    dt = np.diff(timestamps)
+    dt[~(dt > 0) | (dt > MAX_SAMPLE_GAP_SEC)] = np.nan
+    return dt
+
+def _body_scale(pose: np.ndarray) -> float:
+
+    widths = np.linalg.norm(pose[:, LEFT_SHOULDER, :2] - pose[:, RIGHT_SHOULDER, :2], axis=-1)
+    widths = widths[~np.isnan(widths) & (widths > 1e-3)]
+    return float(np.median(widths)) if widths.size else np.nan
+
+def _pose_speed(pose: np.ndarray, dt: np.ndarray, scale: float) -> np.ndarray:
+
+    points = pose[:, UPPER_BODY_LANDMARKS, :2]
+    displacement = np.linalg.norm(np.diff(points, axis=0), axis=-1)
+    return _nanmean(displacement, axis=1) / scale / dt
+
+def _hand_speed(hands: np.ndarray, dt: np.ndarray, scale: float) -> np.ndarray:
+
+    # Hand slots carry no identity across frames, so each step takes the
+    # cheaper of the straight and swapped slot pairings
+    centroids = _nanmean(hands[..., :2], axis=2)
+    previous, current = centroids[:-1], centroids[1:]
+    straight = np.linalg.norm(current - previous, axis=-1)
+    swapped = np.linalg.norm(current[:, ::-1] - previous, axis=-1)
+    straight_mean = _nanmean(straight, axis=1)
+    swapped_mean = _nanmean(swapped, axis=1)
+    use_swapped = np.isnan(straight_mean) | (swapped_mean < straight_mean)
+    return np.where(use_swapped, swapped_mean, straight_mean) / scale / dt
+
+def _runs(mask: np.ndarray):
+
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+def _empty_motion_features() -> Dict[str, Any]:
+
+    return {
+        "samples": 0,
+        "mean_velocity": 0.0,
+        "p90_velocity": 0.0,
+        "hand_velocity": 0.0,
+        "gesture_onsets": 0,
+        "gesture_onsets_per_minute": 0.0,
+        "stillness_windows": 0,
+        "longest_stillness_sec": 0.0,
+        "stillness_ratio": 0.0,
+        "motion_activity": 0.0
+    }
+
+def compute_motion_features(store: FrameResultStore, duration_minutes: Optional[float] = None) -> Dict[str, Any]:
+
+    features = _empty_motion_features()
+
+    if store.pose_landmarks is None or len(store) < 2:
+        return features
+
+    pose = store.pose_landmarks.astype(np.float32)
+    hands = store.hand_landmarks.astype(np.float32)
+    scale = _body_scale(pose)
+    if np.isnan(scale):
+        return features
+
+    dt = _sample_intervals(store)
+    pose_speed = _pose_speed(pose, dt, scale)
+    hand_speed = _hand_speed(hands, dt, scale)
+
+    measured = ~np.isnan(pose_speed)
+    samples = int(np.count_nonzero(measured))
+    if samples < MIN_MOTION_SAMPLES:
+        features["samples"] = samples
+        return features
+
+    # Gestures prefer hand landmarks and fall back to pose wrists/elbows
+    gesture_speed = np.where(np.isnan(hand_speed), pose_speed, hand_speed)
+    active = np.nan_to_num(gesture_speed, nan=0.0) > GESTURE_SPEED_THRESHOLD
+    onsets = int(np.count_nonzero(active[1:] & ~active[:-1]) + active[0])
+
+    still = measured & (np.nan_to_num(pose_speed, nan=np.inf) < STILLNESS_SPEED_THRESHOLD)
+    still_time = np.concatenate(([0.0], np.cumsum(np.where(still, dt, 0.0))))
+    starts, ends = _runs(still)
+    durations = still_time[ends] - still_time[starts]
+    measured_time = float(np.nansum(dt[measured]))
+
+    if duration_minutes is None or duration_minutes <= 0:
+        duration_minutes = measured_time / 60.0
+
+    valid_speed = pose_speed[measured]
+    hand_measured = hand_speed[~np.isnan(hand_speed)]
+    mean_velocity = float(valid_speed.mean(dtype=np.float64))
+
+    features.update({
+        "samples": samples,
+        "mean_velocity": round(mean_velocity, 3),
+        "p90_velocity": round(float(np.percentile(valid_speed, 90)), 3),
+        "hand_velocity": round(float(hand_measured.mean(dtype=np.float64)) if hand_measured.size else 0.0, 3),
+        "gesture_onsets": onsets,
+        "gesture_onsets_per_minute": round(onsets / duration_minutes if duration_minutes > 0 else 0.0, 2),
+        "stillness_windows": int(np.count_nonzero(durations >= MIN_STILLNESS_SEC)),
+        "longest_stillness_sec": round(float(durations.max()) if durations.size else 0.0, 2),
+        "stillness_ratio": round(float(durations.sum()) / measured_time if measured_time > 0 else 0.0, 3),
+        "motion_activity": round(min(10.0, mean_velocity / MOTION_FULL_SCALE * 10.0), 2)
+    })
+
+    logger.info(
+        f"Motion features: {samples} samples, velocity {features['mean_velocity']:.2f}/s, "
+        f"{onsets} gesture onsets, {features['stillness_windows']} stillness windows"
+    )
+
+    return features
+
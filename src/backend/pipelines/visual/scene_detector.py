@@ -0,0 +1,134 @@
+import math
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Probe frames are reduced to a small grayscale thumbnail; the histogram
+# distance marks cuts and the pixel difference measures on-screen motion
+THUMBNAIL_SIZE = (64, 36)
+HISTOGRAM_BINS = 32
+PROBE_FPS = 2.0
+
+SCENE_CUT_THRESHOLD = 0.35
+STATIC_ACTIVITY_THRESHOLD = 0.01
+
+# Static content (slides, screen share) gets one sample per this many seconds
+STATIC_SAMPLE_INTERVAL_SEC = 10.0
+
+def frame_signature(frame_rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+
+    import cv2
+
+    # Decoders can already deliver thumbnails, in which case resize is skipped
+    small = frame_rgb
+    if small.shape[1::-1] != THUMBNAIL_SIZE:
+        small = cv2.resize(small, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY) if small.ndim == 3 else small
+    hist = np.bincount((gray >> 3).ravel(), minlength=HISTOGRAM_BINS).astype(np.float32)
+    return gray.astype(np.float32) / 255.0, hist / max(1.0, hist.sum())
+
+def segment_scenes(
+    probe_times: np.ndarray,
+    thumbnails: np.ndarray,
+    histograms: np.ndarray,
+    duration: float
+) -> List[Dict[str, Any]]:
+
+    probe_times = np.asarray(probe_times, dtype=np.float64)
+    if probe_times.size == 0:
+        return []
+
+    if probe_times.size == 1:
+        return [{"start": 0.0, "end": duration, "static": True, "activity": 0.0}]
+
+    # Distances between consecutive probes, both in [0, 1]
+    cut_distance = 0.5 * np.abs(np.diff(histograms, axis=0)).sum(axis=1)
+    pixel_change = np.abs(np.diff(thumbnails, axis=0)).mean(axis=(1, 2))
+
+    cuts = np.flatnonzero(cut_distance > SCENE_CUT_THRESHOLD) + 1
+    bounds = np.concatenate(([0], cuts, [probe_times.size]))
+
+    segments = []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        # Changes inside the segment only; the cut step itself is excluded
+        inside = pixel_change[first:last - 1]
+        activity = float(inside.mean()) if inside.size else 0.0
+        segments.append({
+            "start": 0.0 if first == 0 else float(probe_times[first]),
+            "end": duration if last == probe_times.size else float(probe_times[last]),
+            "static": activity < STATIC_ACTIVITY_THRESHOLD,
+            "activity": round(activity, 4)
+        })
+    return segments
+
+def allocate_frame_budget(segments: List[Dict[str, Any]], fps: float, max_frames: int) -> List[int]:
+
+    if not segments:
+        return []
+
+    lengths = np.array([max(0.0, s["end"] - s["start"]) for s in segments])
+    static = np.array([s["static"] for s in segments])
+    wanted = np.where(static, np.ceil(lengths / STATIC_SAMPLE_INTERVAL_SEC), np.ceil(lengths * fps))
+    wanted = np.maximum(wanted, 1).astype(np.int64)
+
+    if wanted.sum() <= max_frames:
+        return wanted.tolist()
+
+    # Every segment keeps one frame so short camera shots are not lost;
+    # when even that does not fit, camera segments and longer ones win
+    counts = np.zeros(len(segments), dtype=np.int64)
+    priority = np.lexsort((-lengths, static))
+    counts[priority[:max_frames]] = 1
+
+    remaining = max_frames - int(counts.sum())
+    extra = np.where(counts > 0, wanted - counts, 0).astype(np.float64)
+    if remaining > 0 and extra.sum() > 0:
+        share = extra / extra.sum() * remaining
+        floors = np.floor(share).astype(np.int64)
+        leftover = remaining - int(floors.sum())
+        floors[np.argsort(floors - share)[:leftover]] += 1
+        counts += floors
+
+    return counts.tolist()
+
+def plan_sample_times(segments: List[Dict[str, Any]], counts: List[int]) -> np.ndarray:
+
+    times = []
+    for segment, count in zip(segments, counts):
+        if count <= 0:
+            continue
+        step = (segment["end"] - segment["start"]) / count
+        times.append(segment["start"] + step * (np.arange(count) + 0.5))
+    return np.concatenate(times) if times else np.empty(0)
+
+def plan_adaptive_sampling(
+    probe_times: np.ndarray,
+    thumbnails: np.ndarray,
+    histograms: np.ndarray,
+    duration: float,
+    fps: float,
+    max_frames: int
+) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+
+    segments = segment_scenes(probe_times, thumbnails, histograms, duration)
+    counts = allocate_frame_budget(segments, fps, max_frames)
+    for segment, count in zip(segments, counts):
+        segment["samples"] = count
+
+    static_count = sum(1 for s in segments if s["static"])
+    logger.info(
+        f"Scene detection: {len(segments)} segments ({static_count} static), "
+        f"{sum(counts)} frames planned within budget {max_frames}"
+    )
+    return plan_sample_times(segments, counts), segments
+
+def scene_index(times: np.ndarray, segments: List[Dict[str, Any]]) -> np.ndarray:
+
+    starts = np.array([s["start"] for s in segments[1:]])
+    return np.searchsorted(starts, times, side="right")
+
+def probe_interval(original_fps: float) -> int:
+
+    return max(1, int(math.floor(original_fps / PROBE_FPS)))
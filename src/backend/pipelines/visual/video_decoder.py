@@ -0,0 +1,276 @@
+import json
+import shutil
+import subprocess
+from typing import Iterator, Optional, Sequence, Tuple
+import numpy as np
+from src.backend.utils.config import Config
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# A frame is (frame_number, RGB array); size is (width, height)
+Frame = Tuple[int, np.ndarray]
+Size = Optional[Tuple[int, int]]
+
+class DecoderUnavailable(Exception):
+    pass
+
+class VideoDecoder:
+
+    # Decodes one video file. Metadata is read on open; every iter_frames()
+    # call starts a fresh sequential pass and yields RGB frames, optionally
+    # scaled, for either every `step`-th frame or an explicit sorted list
+    # of frame numbers.
+
+    name = "base"
+
+    def __init__(self, path: str, threads: int = 0, hwaccel: bool = False):
+
+        self.path = path
+        self.threads = threads
+        self.hwaccel = hwaccel
+        self.fps = 0.0
+        self.frame_count = 0
+        self.width = 0
+        self.height = 0
+
+    @property
+    def duration(self) -> float:
+
+        return self.frame_count / self.fps if self.fps > 0 else 0.0
+
+    def iter_frames(self, step: int = 1, frame_numbers: Optional[Sequence[int]] = None, size: Size = None) -> Iterator[Frame]:
+        raise NotImplementedError
+
+class OpenCVDecoder(VideoDecoder):
+
+    name = "opencv"
+
+    def __init__(self, path: str, threads: int = 0, hwaccel: bool = False):
+
+        super().__init__(path, threads, hwaccel)
+        import cv2
+
+        cap = self._open()
+        try:
+            self.fps = cap.get(cv2.CAP_PROP_FPS)
+            self.frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self.width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            self.height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        finally:
+            cap.release()
+
+    def _open(self):
+
+        import cv2
+
+        params = []
+        if self.threads and hasattr(cv2, "CAP_PROP_N_THREADS"):
+            params += [cv2.CAP_PROP_N_THREADS, self.threads]
+        if self.hwaccel and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+            params += [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+
+        cap = cv2.VideoCapture(self.path, cv2.CAP_ANY, params) if params else cv2.VideoCapture(self.path)
+        if not cap.isOpened():
+            raise DecoderUnavailable(f"OpenCV could not open {self.path}")
+        return cap
+
+    def iter_frames(self, step: int = 1, frame_numbers: Optional[Sequence[int]] = None, size: Size = None) -> Iterator[Frame]:
+
+        import cv2
+
+        wanted = set(frame_numbers) if frame_numbers is not None else None
+        last = max(wanted) if wanted else None
+        cap = self._open()
+        try:
+            frame_number = 0
+            # grab() advances without converting frames that are skipped
+            while (last is None or frame_number <= last) and cap.grab():
+                if (frame_number in wanted) if wanted is not None else frame_number % step == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret or frame is None or frame.size == 0:
+                        yield frame_number, None
+                    else:
+                        if size:
+                            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                        yield frame_number, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                frame_number += 1
+        finally:
+            cap.release()
+
+class FFmpegDecoder(VideoDecoder):
+
+    # Runs the ffmpeg CLI with threaded (optionally hardware) decode and lets
+    # its filter graph drop unselected frames, scale and convert to RGB, so
+    # Python only receives the frames it keeps.
+
+    name = "ffmpeg"
+
+    def __init__(self, path: str, threads: int = 0, hwaccel: bool = False):
+
+        super().__init__(path, threads, hwaccel)
+        self.ffmpeg = shutil.which("ffmpeg")
+        ffprobe = shutil.which("ffprobe")
+        if not self.ffmpeg or not ffprobe:
+            raise DecoderUnavailable("ffmpeg/ffprobe not found on PATH")
+
+        probe = subprocess.run(
+            [
+                ffprobe, "-v", "error", "-select_streams", "v:0",
+                "-show_entries", "stream=width,height,avg_frame_rate,r_frame_rate,nb_frames,duration",
+                "-of", "json", path
+            ],
+            capture_output=True, text=True, check=False
+        )
+        streams = json.loads(probe.stdout or "{}").get("streams") or []
+        if probe.returncode != 0 or not streams:
+            raise DecoderUnavailable(f"ffprobe could not read {path}: {probe.stderr.strip()}")
+
+        stream = streams[0]
+        self.width = int(stream.get("width") or 0)
+        self.height = int(stream.get("height") or 0)
+        self.fps = _parse_rate(stream.get("avg_frame_rate")) or _parse_rate(stream.get("r_frame_rate"))
+        nb_frames = stream.get("nb_frames")
+        if nb_frames and str(nb_frames).isdigit():
+            self.frame_count = int(nb_frames)
+        else:
+            self.frame_count = int(float(stream.get("duration") or 0) * self.fps)
+
+    def _command(self, select: Optional[str], size: Size, max_output: Optional[int] = None) -> list:
+
+        command = [self.ffmpeg, "-v", "error", "-nostdin"]
+        if self.hwaccel:
+            command += ["-hwaccel", "auto"]
+        command += ["-threads", str(self.threads or 0), "-i", self.path]
+
+        filters = []
+        if select:
+            # Arguments bypass the shell, so commas are escaped for the
+            # filtergraph parser rather than quoted
+            filters.append(f"select={select}")
+        if size:
+            filters.append(f"scale={size[0]}:{size[1]}:flags=area")
+        if filters:
+            command += ["-vf", ",".join(filters)]
+        if max_output:
+            command += ["-frames:v", str(max_output)]
+
+        return command + ["-vsync", "0", "-an", "-f", "rawvideo", "-pix_fmt", "rgb24", "pipe:1"]
+
+    def iter_frames(self, step: int = 1, frame_numbers: Optional[Sequence[int]] = None, size: Size = None) -> Iterator[Frame]:
+
+        if frame_numbers is not None:
+            numbers = sorted(set(frame_numbers))
+            select = "+".join(f"eq(n\\,{n})" for n in numbers)
+        else:
+            numbers = None
+            select = f"not(mod(n\\,{step}))" if step > 1 else None
+
+        width, height = size or (self.width, self.height)
+        frame_bytes = width * height * 3
+        command = self._command(select, size, len(numbers) if numbers is not None else None)
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            index = 0
+            while True:
+                frame = np.empty((height, width, 3), dtype=np.uint8)
+                if process.stdout.readinto(memoryview(frame).cast("B")) < frame_bytes:
+                    break
+                if numbers is not None:
+                    if index >= len(numbers):
+                        break
+                    frame_number = numbers[index]
+                else:
+                    frame_number = index * step
+                index += 1
+                yield frame_number, frame
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+class PyAVDecoder(VideoDecoder):
+
+    name = "pyav"
+
+    def __init__(self, path: str, threads: int = 0, hwaccel: bool = False):
+
+        super().__init__(path, threads, hwaccel)
+        try:
+            import av
+        except ImportError as e:
+            raise DecoderUnavailable("PyAV is not installed") from e
+
+        with av.open(path) as container:
+            if not container.streams.video:
+                raise DecoderUnavailable(f"No video stream in {path}")
+            stream = container.streams.video[0]
+            self.fps = float(stream.average_rate or stream.guessed_rate or 0)
+            self.width = stream.codec_context.width
+            self.height = stream.codec_context.height
+            self.frame_count = stream.frames or int(float(stream.duration * stream.time_base) * self.fps if stream.duration else 0)
+
+    def iter_frames(self, step: int = 1, frame_numbers: Optional[Sequence[int]] = None, size: Size = None) -> Iterator[Frame]:
+
+        import av
+
+        wanted = set(frame_numbers) if frame_numbers is not None else None
+        last = max(wanted) if wanted else None
+        width, height = size or (None, None)
+
+        with av.open(self.path) as container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            if self.threads:
+                stream.codec_context.thread_count = self.threads
+
+            for frame_number, frame in enumerate(container.decode(stream)):
+                if last is not None and frame_number > last:
+                    break
+                if (frame_number in wanted) if wanted is not None else frame_number % step == 0:
+                    yield frame_number, frame.to_ndarray(format="rgb24", width=width, height=height)
+
+def _parse_rate(rate: Optional[str]) -> float:
+
+    try:
+        numerator, _, denominator = (rate or "0/1").partition("/")
+        denominator = float(denominator or 1)
+        return float(numerator) / denominator if denominator else 0.0
+    except ValueError:
+        return 0.0
+
+DECODERS = {
+    "opencv": OpenCVDecoder,
+    "ffmpeg": FFmpegDecoder,
+    "pyav": PyAVDecoder
+}
+
+def open_video(path: str, backend: Optional[str] = None, threads: Optional[int] = None, hwaccel: Optional[bool] = None) -> VideoDecoder:
+
+    backend = (backend or Config.VIDEO_DECODER or "opencv").lower()
+    threads = Config.VIDEO_DECODE_THREADS if threads is None else threads
+    hwaccel = Config.VIDEO_HWACCEL if hwaccel is None else hwaccel
+
+    if backend not in DECODERS:
+        raise ValueError(f"Unknown VIDEO_DECODER: {backend}")
+
+    try:
+        return DECODERS[backend](path, threads=threads, hwaccel=hwaccel)
+    except DecoderUnavailable as e:
+        if backend == "opencv":
+            raise
+        logger.warning(f"[Decode] {backend} decoder unavailable ({e}), falling back to opencv")
+        return OpenCVDecoder(path, threads=threads, hwaccel=hwaccel)
+
+def available_decoders() -> list:
+
+    names = ["opencv"]
+    if shutil.which("ffmpeg") and shutil.which("ffprobe"):
+        names.append("ffmpeg")
+    try:
+        import av  # noqa: F401
+        names.append("pyav")
+    except ImportError:
+        pass
+    return names
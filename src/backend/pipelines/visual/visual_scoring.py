@@ -1,4 +1,5 @@
 from typing import Dict, Any
+from src.backend.pipelines.visual.motion_features import MIN_MOTION_SAMPLES
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -43,6 +44,17 @@ def compute_visual_scores(engagement_metrics: Dict[str, Any]) -> Dict[str, float
     )
     hand_frequency = engagement_metrics.get("hand_movement_frequency", 0.0)
     
+    # Cross-frame landmark motion replaces the single-frame pose heuristic
+    # and hand-presence frequency whenever enough landmark samples exist
+    motion = engagement_metrics.get("motion") or {}
+    if motion.get("samples", 0) >= MIN_MOTION_SAMPLES:
+        body_movement = motion["motion_activity"]
+        hand_frequency = motion["gesture_onsets_per_minute"]
+        logger.info(
+            f"Using landmark motion: activity {body_movement:.2f}/10, "
+            f"{hand_frequency:.1f} gesture onsets/min"
+        )
+    
     face_visibility_score = _clamp_score(face_visibility * 10)
     
     gaze_forward_score = _clamp_score(gaze_forward * 10)
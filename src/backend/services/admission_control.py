@@ -0,0 +1,284 @@
+import heapq
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.backend.utils.config import Config
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Work is counted in units: one second of video through one stage of
+# weight 1. Transcription scales with the Whisper model, the visual stage
+# is a fixed cost per second (halved when frames are sampled adaptively),
+# and the LLM evaluation and report are network-bound, so roughly the same
+# for every video.
+WHISPER_WEIGHTS = {
+    "tiny": 0.5,
+    "base": 1.0,
+    "small": 2.0,
+    "medium": 4.0,
+    "turbo": 3.0,
+    "large": 8.0
+}
+VISUAL_WEIGHT = 1.0
+LLM_UNITS = 60.0
+
+# Share of each finished job's measured seconds per unit folded into the
+# running estimate used for ETAs
+THROUGHPUT_SMOOTHING = 0.2
+
+def whisper_weight(model: Optional[str] = None) -> float:
+
+    # Matches sizes inside names like "large-v3", "medium.en", "distil-small.en"
+    model = (model or Config.WHISPER_MODEL or "base").lower()
+    for size, weight in WHISPER_WEIGHTS.items():
+        if size in model:
+            return weight
+    return WHISPER_WEIGHTS["base"]
+
+def estimate_work(duration_seconds: Optional[float], whisper_model: Optional[str] = None, visual: bool = True) -> float:
+
+    duration = duration_seconds or Config.ADMISSION_DEFAULT_DURATION_SEC
+    per_second = whisper_weight(whisper_model)
+    if visual:
+        per_second += VISUAL_WEIGHT * (0.5 if Config.ADAPTIVE_FRAME_SAMPLING else 1.0)
+    return round(duration * per_second + LLM_UNITS, 1)
+
+class QueueFull(Exception):
+
+    def __init__(self, retry_after: float):
+
+        super().__init__("Processing queue is full")
+        self.retry_after = retry_after
+
+class AdmissionJob:
+
+    def __init__(self, session_id: str, cost: float):
+
+        self.session_id = session_id
+        self.cost = cost
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+
+class AdmissionController:
+
+    # Starts pipeline jobs while the estimated work of everything running
+    # fits within capacity; later jobs wait in a FIFO queue and start as
+    # running ones finish. A job larger than capacity still runs, alone.
+    # ETAs replay the queue against the seconds per unit measured on
+    # finished jobs. State is per process: each API worker admits against
+    # its own capacity. While it holds jobs, heartbeat(owner, session_ids)
+    # is called every heartbeat_interval seconds so other processes can
+    # tell its sessions from ones left behind by a process that is gone.
+
+    def __init__(
+        self,
+        capacity: float,
+        runner: Callable[[str], Any],
+        seconds_per_unit: float = 0.25,
+        max_queue: int = 100,
+        owner: Optional[str] = None,
+        heartbeat: Optional[Callable[[str, List[str]], Any]] = None,
+        heartbeat_interval: float = 30.0
+    ):
+
+        self.capacity = capacity
+        self.runner = runner
+        self.seconds_per_unit = seconds_per_unit
+        self.max_queue = max_queue
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.heartbeat = heartbeat
+        self.heartbeat_interval = heartbeat_interval
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+        self._running: Dict[str, AdmissionJob] = {}
+        self._queue: "OrderedDict[str, AdmissionJob]" = OrderedDict()
+        self._used = 0.0
+        self._lock = threading.Lock()
+
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, session_id: str, cost: float) -> Dict[str, Any]:
+
+        # Submitting a session that is already running or queued returns
+        # its current ticket instead of a second job
+        with self._lock:
+            if session_id not in self._running and session_id not in self._queue:
+                if len(self._queue) >= self.max_queue:
+                    self.rejected += 1
+                    raise QueueFull(self._next_finish())
+                self._queue[session_id] = AdmissionJob(session_id, cost)
+            started = self._drain()
+            ticket = self._ticket(session_id)
+            if self.heartbeat and self._heartbeat_thread is None:
+                self._heartbeat_thread = threading.Thread(target=self._beat, name="admission-heartbeat", daemon=True)
+                self._heartbeat_thread.start()
+
+        for job in started:
+            self._launch(job)
+        return ticket
+
+    def status(self, session_id: str) -> Optional[Dict[str, Any]]:
+
+        with self._lock:
+            if session_id not in self._running and session_id not in self._queue:
+                return None
+            return self._ticket(session_id)
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "used": round(self._used, 1),
+                "running": len(self._running),
+                "queued": len(self._queue),
+                "queued_work": round(sum(job.cost for job in self._queue.values()), 1),
+                "seconds_per_unit": round(self.seconds_per_unit, 4),
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+    def _beat(self) -> None:
+
+        # Runs while the controller holds jobs; a later submit starts it again
+        while True:
+            time.sleep(self.heartbeat_interval)
+            with self._lock:
+                held = list(self._running) + list(self._queue)
+                if not held:
+                    self._heartbeat_thread = None
+                    return
+            try:
+                self.heartbeat(self.owner, held)
+            except Exception as e:
+                logger.warning(f"[Admission] Heartbeat for {len(held)} sessions failed: {str(e)}")
+
+    def _drain(self) -> list:
+
+        started = []
+        now = time.time()
+        while self._queue:
+            job = next(iter(self._queue.values()))
+            if self._running and self._used + job.cost > self.capacity:
+                break
+            del self._queue[job.session_id]
+            job.started_at = now
+            self._running[job.session_id] = job
+            self._used += job.cost
+            started.append(job)
+        return started
+
+    def _launch(self, job: AdmissionJob) -> None:
+
+        logger.info(f"[Admission] Starting session {job.session_id} ({job.cost} units, {self._used:.0f}/{self.capacity:.0f} in use)")
+        thread = threading.Thread(target=self._run, args=(job,), name=f"pipeline-{job.session_id[:8]}", daemon=True)
+        thread.start()
+
+    def _run(self, job: AdmissionJob) -> None:
+
+        try:
+            self.runner(job.session_id)
+        except Exception as e:
+            logger.error(f"[Admission] Pipeline job for session {job.session_id} raised: {str(e)}")
+        finally:
+            self._finish(job)
+
+    def _finish(self, job: AdmissionJob) -> None:
+
+        with self._lock:
+            self._running.pop(job.session_id, None)
+            self._used = max(0.0, self._used - job.cost)
+            self.completed += 1
+            if job.cost > 0:
+                observed = (time.time() - job.started_at) / job.cost
+                self.seconds_per_unit += THROUGHPUT_SMOOTHING * (observed - self.seconds_per_unit)
+            started = self._drain()
+
+        for next_job in started:
+            self._launch(next_job)
+
+    def _next_finish(self) -> float:
+
+        # Seconds until the first running job should end and free capacity
+        now = time.time()
+        ends = [job.started_at + job.cost * self.seconds_per_unit for job in self._running.values()]
+        return max(1.0, min(ends) - now) if ends else 1.0
+
+    def _schedule(self, now: float) -> Dict[str, Tuple[float, float]]:
+
+        # (start, finish) per session: running jobs end at their estimate
+        # (or now, if overdue); each queued job starts once enough of the
+        # jobs ahead of it have ended to fit its work
+        ends = []
+        schedule = {}
+        for job in self._running.values():
+            finish = max(now, job.started_at + job.cost * self.seconds_per_unit)
+            schedule[job.session_id] = (job.started_at, finish)
+            heapq.heappush(ends, (finish, job.cost))
+
+        used, clock = self._used, now
+        for job in self._queue.values():
+            while ends and used + job.cost > self.capacity:
+                finish, cost = heapq.heappop(ends)
+                clock = max(clock, finish)
+                used -= cost
+            finish = clock + job.cost * self.seconds_per_unit
+            schedule[job.session_id] = (clock, finish)
+            heapq.heappush(ends, (finish, job.cost))
+            used += job.cost
+        return schedule
+
+    def _ticket(self, session_id: str) -> Dict[str, Any]:
+
+        now = time.time()
+        start, finish = self._schedule(now)[session_id]
+        queued = session_id in self._queue
+        job = self._queue[session_id] if queued else self._running[session_id]
+        return {
+            "state": "queued" if queued else "running",
+            "position": list(self._queue).index(session_id) + 1 if queued else 0,
+            "estimated_work": job.cost,
+            "start_in_seconds": round(max(0.0, start - now)),
+            "eta_seconds": round(max(0.0, finish - now))
+        }
+
+_controller: Optional[AdmissionController] = None
+_controller_lock = threading.Lock()
+
+def get_admission_controller() -> AdmissionController:
+
+    global _controller
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                from src.backend.services.pipeline_runner import run_full_pipeline_async
+                from src.backend.services.session_service import SessionService
+                _controller = AdmissionController(
+                    capacity=Config.PIPELINE_CAPACITY,
+                    runner=run_full_pipeline_async,
+                    seconds_per_unit=Config.ADMISSION_SECONDS_PER_UNIT,
+                    max_queue=Config.ADMISSION_MAX_QUEUE,
+                    heartbeat=SessionService.touch_admissions,
+                    heartbeat_interval=Config.ADMISSION_HEARTBEAT_SEC
+                )
+    return _controller
+
+def set_admission_controller(controller: Optional[AdmissionController]):
+
+    global _controller
+    _controller = controller
+
+__all__ = [
+    'AdmissionController',
+    'QueueFull',
+    'estimate_work',
+    'whisper_weight',
+    'get_admission_controller',
+    'set_admission_controller'
+]
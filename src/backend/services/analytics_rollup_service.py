@@ -0,0 +1,221 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from src.backend.storage import get_storage
+from src.backend.storage.pagination import keyset_page
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ROLLUP_METRICS = ["mentor_score", "engagement", "communication_clarity", "technical_correctness", "pacing_structure"]
+SCORE_BUCKETS = ["0-2", "2-4", "4-6", "6-8", "8-10"]
+HISTORY_SIZE = 10
+
+# Attempts at a versioned rollup write before giving up on an update that
+# keeps losing to other workers
+ROLLUP_WRITE_ATTEMPTS = 5
+REBUILD_PAGE_SIZE = 500
+
+def empty_rollup(user_id: str) -> Dict[str, Any]:
+
+    return {
+        "user_id": user_id,
+        "completed_sessions": 0,
+        "metric_sums": {k: 0.0 for k in ROLLUP_METRICS},
+        "metric_counts": {k: 0 for k in ROLLUP_METRICS},
+        "score_distribution": {b: 0 for b in SCORE_BUCKETS},
+        "score_history": [],
+        "first_score": None,
+        "latest_score": None
+    }
+
+def score_bucket(score: float) -> str:
+
+    return SCORE_BUCKETS[min(int(score // 2), len(SCORE_BUCKETS) - 1)] if score >= 0 else SCORE_BUCKETS[0]
+
+def session_scores(metadata: Optional[Dict[str, Any]], final_scores: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+
+    # Completion metadata first, final_scores for older sessions; zero and
+    # missing scores are left out of the averages
+    metadata, final_scores = metadata or {}, final_scores or {}
+    scores = {}
+    for key in ROLLUP_METRICS:
+        value = metadata.get(key) or final_scores.get(key)
+        if value:
+            scores[key] = float(value)
+    return scores
+
+def apply_session(rollup: Dict[str, Any], session_id: str, created_at: str, scores: Dict[str, float], sign: int = 1) -> Dict[str, Any]:
+
+    # Adds (sign=1) or retracts (sign=-1) one completed session. Retracting
+    # can't restore first_score or refill the history window, so callers
+    # rebuild instead (see AnalyticsRollupService.retract_session)
+    rollup["completed_sessions"] = max(0, rollup["completed_sessions"] + sign)
+    for key, value in scores.items():
+        rollup["metric_sums"][key] = rollup["metric_sums"].get(key, 0.0) + sign * value
+        rollup["metric_counts"][key] = max(0, rollup["metric_counts"].get(key, 0) + sign)
+
+    mentor = scores.get("mentor_score")
+    history = [h for h in rollup["score_history"] if h["session_id"] != session_id]
+
+    if mentor is not None:
+        bucket = score_bucket(mentor)
+        rollup["score_distribution"][bucket] = max(0, rollup["score_distribution"].get(bucket, 0) + sign)
+        if sign > 0:
+            if rollup["first_score"] is None:
+                rollup["first_score"] = mentor
+            history.append({"session_id": session_id, "date": (created_at or "")[:10], "score": mentor, "created_at": created_at or ""})
+            history = sorted(history, key=lambda h: h["created_at"])[-HISTORY_SIZE:]
+
+    # Improvement compares the oldest score with the newest session's
+    if history:
+        rollup["latest_score"] = history[-1]["score"]
+    rollup["score_history"] = history
+    return rollup
+
+class AnalyticsRollupService:
+    @staticmethod
+    def _load(user_id: str) -> Optional[Dict[str, Any]]:
+
+        return get_storage().select_one("user_analytics_rollups", {"user_id": user_id})
+
+    @staticmethod
+    def _write(user_id: str, compute: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+
+        # Optimistic concurrency: compute() turns the stored row (or None)
+        # into the new rollup, which is written only if the row's version
+        # is still the one read; otherwise it is read and computed again.
+        # API workers share the row and Supabase has no transactions to
+        # lock it, so this is what keeps their updates from being lost.
+        storage = get_storage()
+        for _ in range(ROLLUP_WRITE_ATTEMPTS):
+            row = AnalyticsRollupService._load(user_id)
+            rollup = compute(row)
+            if rollup is None:
+                return None
+
+            values = {k: v for k, v in rollup.items() if k not in ("id", "created_at", "version")}
+            values["updated_at"] = datetime.utcnow().isoformat()
+
+            if row is None:
+                values["version"] = 1
+                try:
+                    storage.insert("user_analytics_rollups", values)
+                    return rollup
+                except Exception as e:
+                    # Another worker created the row first (user_id is unique)
+                    logger.info(f"[Analytics] Rollup insert for user {user_id} lost a race: {str(e)}")
+                    continue
+
+            version = row.get("version") or 0
+            values["version"] = version + 1
+            if storage.update("user_analytics_rollups", values, {"user_id": user_id, "version": version}):
+                return rollup
+
+        logger.warning(f"[Analytics] Rollup for user {user_id} not written after {ROLLUP_WRITE_ATTEMPTS} conflicting attempts")
+        return None
+
+    @staticmethod
+    def _compute(user_id: str, exclude: Optional[str] = None) -> Dict[str, Any]:
+
+        # Full recomputation from sessions and final_scores, read in
+        # keyset pages oldest first
+        storage = get_storage()
+        rollup = empty_rollup(user_id)
+        cursor = None
+        while True:
+            sessions, cursor = keyset_page(
+                storage, "sessions", {"user_id": user_id, "status": "complete"},
+                columns=["id", "created_at", "completion_metadata"],
+                sort_column="created_at", limit=REBUILD_PAGE_SIZE, cursor=cursor, desc=False
+            )
+            sessions = [s for s in sessions if s["id"] != exclude]
+
+            final_scores_map = {}
+            missing = [s["id"] for s in sessions if not (s.get("completion_metadata") or {}).get("mentor_score")]
+            if missing:
+                try:
+                    final_scores_map = {fs["session_id"]: fs for fs in storage.select("final_scores", {"session_id": ("in", missing)})}
+                except Exception as e:
+                    logger.warning(f"Failed to fetch final_scores: {e}")
+
+            for session in sessions:
+                scores = session_scores(session.get("completion_metadata"), final_scores_map.get(session["id"]))
+                if scores:
+                    apply_session(rollup, session["id"], session.get("created_at"), scores)
+
+            if cursor is None:
+                return rollup
+
+    @staticmethod
+    def record_completion(session: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+
+        # Called when a session completes. A first rollup, or a re-run whose
+        # earlier scores are already counted, is rebuilt from the sessions,
+        # which already reflect this completion; otherwise the session is
+        # added incrementally
+        user_id = session.get("user_id")
+        if not user_id:
+            return
+
+        scores = session_scores(metadata)
+        previous = session_scores(session.get("completion_metadata"))
+        if not scores and not previous:
+            return
+
+        def compute(row):
+            if row is None or previous:
+                return AnalyticsRollupService._compute(user_id)
+            return apply_session(row, session["id"], session.get("created_at"), scores)
+
+        AnalyticsRollupService._write(user_id, compute)
+        logger.info(f"[Analytics] Rollup updated for user {user_id} (session {session['id']})")
+
+    @staticmethod
+    def retract_session(session: Dict[str, Any]) -> None:
+
+        # The session is being re-run and still reads as complete; rebuild
+        # without it so first_score and the history window come out right
+        user_id = session.get("user_id")
+        previous = session_scores(session.get("completion_metadata"))
+        if not user_id or not previous:
+            return
+
+        AnalyticsRollupService._write(
+            user_id,
+            lambda row: AnalyticsRollupService._compute(user_id, exclude=session["id"]) if row is not None else None
+        )
+
+    @staticmethod
+    def rebuild(user_id: str) -> Dict[str, Any]:
+
+        # Seeds the rollup of a user who has none
+        rollup = AnalyticsRollupService._write(user_id, lambda row: AnalyticsRollupService._compute(user_id))
+        if rollup is None:
+            rollup = AnalyticsRollupService._compute(user_id)
+        logger.info(f"[Analytics] Rollup rebuilt for user {user_id} ({rollup['completed_sessions']} completed sessions)")
+        return rollup
+
+    @staticmethod
+    def get_rollup(user_id: str) -> Dict[str, Any]:
+
+        row = AnalyticsRollupService._load(user_id)
+        return row if row is not None else AnalyticsRollupService.rebuild(user_id)
+
+    @staticmethod
+    def dashboard_metrics(rollup: Dict[str, Any]) -> Dict[str, Any]:
+
+        sums, counts = rollup["metric_sums"], rollup["metric_counts"]
+        avgs = {k: round(sums.get(k, 0.0) / counts[k], 2) if counts.get(k) else 0 for k in ROLLUP_METRICS}
+
+        improvement = 0
+        first, latest = rollup.get("first_score"), rollup.get("latest_score")
+        if counts.get("mentor_score", 0) >= 2 and first and latest is not None:
+            improvement = round(((latest - first) / first) * 100, 1)
+
+        history: List[Dict[str, Any]] = [{"date": h["date"], "score": h["score"]} for h in rollup["score_history"]]
+        return {
+            "averages": avgs,
+            "improvement_percent": improvement,
+            "score_distribution": {b: rollup["score_distribution"].get(b, 0) for b in SCORE_BUCKETS},
+            "score_history": history
+        }
@@ -1,15 +1,159 @@
-import json
+import atexit
+import threading
 from datetime import datetime
-from src.backend.utils.supabase_client import supabase
+from typing import Any, Dict, List, Optional, Sequence
+from src.backend.storage import get_storage
+from src.backend.storage.pagination import keyset_page
+from src.backend.utils.config import Config
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+EVENT_LOG_COLUMNS = ["id", "event_name", "session_id", "user_id", "metadata", "timestamp"]
+EVENT_GROUP_COLUMNS = ["event_name", "user_id", "session_id"]
+
+class AnalyticsEventBuffer:
+
+    # In-process queue of analytics rows, written by a background thread in
+    # one bulk insert per batch_size events or per flush_interval seconds,
+    # whichever comes first. The queue is capped at max_events; events that
+    # do not fit are counted as overflowed, batches whose insert fails are
+    # counted as dropped. Request handlers only pay for an append.
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 1.0, max_events: int = 10000):
+
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_events = max(self.batch_size, max_events)
+
+        self._events: List[Dict[str, Any]] = []
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        self.recorded = 0
+        self.written = 0
+        self.batches = 0
+        self.overflowed = 0
+        self.dropped = 0
+
+    def add(self, row: Dict[str, Any]) -> bool:
+
+        with self._cond:
+            if self._stopped or len(self._events) >= self.max_events:
+                self.overflowed += 1
+                return False
+
+            self._events.append(row)
+            self.recorded += 1
+            if self._thread is None:
+                self._start()
+            if len(self._events) >= self.batch_size:
+                self._cond.notify()
+        return True
+
+    def _start(self) -> None:
+
+        self._thread = threading.Thread(target=self._run, name="analytics-flusher", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+
+        while True:
+            with self._cond:
+                if not self._stopped and len(self._events) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                if self._stopped:
+                    return
+            self.flush()
+
+    def flush(self) -> int:
+
+        # Serialised so the final flush on shutdown cannot interleave with
+        # the flusher thread's last batch
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._cond:
+                    batch = self._events[:self.batch_size]
+                    del self._events[:self.batch_size]
+                if not batch:
+                    return written
+
+                try:
+                    get_storage().insert("analytics_events", batch)
+                    written += len(batch)
+                    with self._cond:
+                        self.written += len(batch)
+                        self.batches += 1
+                except Exception as e:
+                    with self._cond:
+                        self.dropped += len(batch)
+                    logger.error(f"[Analytics] Failed to write {len(batch)} events: {str(e)}")
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        written = self.flush()
+        if written:
+            logger.info(f"[Analytics] Event buffer stopped, {written} events flushed on shutdown")
+
+    def stats(self) -> Dict[str, int]:
+
+        with self._cond:
+            return {
+                "queued": len(self._events),
+                "recorded": self.recorded,
+                "written": self.written,
+                "batches": self.batches,
+                "overflowed": self.overflowed,
+                "dropped": self.dropped
+            }
+
+_buffer: Optional[AnalyticsEventBuffer] = None
+_buffer_lock = threading.Lock()
+
+def get_event_buffer() -> AnalyticsEventBuffer:
+
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = AnalyticsEventBuffer(
+                    batch_size=Config.ANALYTICS_BATCH_SIZE,
+                    flush_interval=Config.ANALYTICS_FLUSH_INTERVAL_MS / 1000.0,
+                    max_events=Config.ANALYTICS_BUFFER_SIZE
+                )
+    return _buffer
+
+def set_event_buffer(buffer: Optional[AnalyticsEventBuffer]):
+
+    global _buffer
+    _buffer = buffer
+
+def shutdown_event_buffer():
+
+    global _buffer
+    with _buffer_lock:
+        if _buffer is not None:
+            _buffer.shutdown()
+            _buffer = None
+
+# Scripts and workers that never reach the FastAPI shutdown hook still get
+# their last events written
+atexit.register(shutdown_event_buffer)
+
 class AnalyticsService:
-    
+
     @staticmethod
     def record_event(event_name: str, session_id: str = None, user_id: str = None, metadata: dict = None):
-        
+
         try:
             data = {
                 "event_name": event_name,
@@ -18,12 +162,93 @@ class AnalyticsService:
                 "metadata": metadata or {},
                 "timestamp": datetime.utcnow().isoformat()
             }
-            
-            response = supabase.table("analytics_events").insert(data).execute()
-            
-            logger.info(f"[Analytics] Recorded event: {event_name} (User: {user_id}, Session: {session_id})")
+
+            if Config.ANALYTICS_ASYNC:
+                if not get_event_buffer().add(data):
+                    logger.warning(f"[Analytics] Event buffer full, dropped event: {event_name}")
+                    return False
+            else:
+                get_storage().insert("analytics_events", data)
+
+            logger.debug(f"[Analytics] Recorded event: {event_name} (User: {user_id}, Session: {session_id})")
             return True
-            
+
         except Exception as e:
             logger.error(f"[Analytics] Failed to record event {event_name}: {str(e)}")
             return False
+
+    @staticmethod
+    def flush() -> int:
+
+        return get_event_buffer().flush() if _buffer is not None else 0
+
+    @staticmethod
+    def get_ingestion_stats() -> Dict[str, Any]:
+
+        stats = get_event_buffer().stats()
+        stats["mode"] = "async" if Config.ANALYTICS_ASYNC else "inline"
+        return stats
+
+    @staticmethod
+    def event_filters(
+        event_name: Optional[str] = None,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> Dict[str, Any]:
+
+        # since is inclusive, until exclusive
+        filters: Dict[str, Any] = {}
+        if event_name:
+            filters["event_name"] = event_name
+        if session_id:
+            filters["session_id"] = session_id
+        if user_id:
+            filters["user_id"] = user_id
+
+        bounds = []
+        if since:
+            bounds.append(("gte", since))
+        if until:
+            bounds.append(("lt", until))
+        if bounds:
+            filters["timestamp"] = bounds
+        return filters
+
+    @staticmethod
+    def query_events(filters: Dict[str, Any], limit: int = 50, cursor: Optional[str] = None, include_total: bool = False) -> Dict[str, Any]:
+
+        # Newest first, keyset-paginated on (timestamp, id) so deep pages
+        # cost the same as the first one
+        storage = get_storage()
+        events, next_cursor = keyset_page(
+            storage, "analytics_events", filters, EVENT_LOG_COLUMNS, "timestamp", limit, cursor=cursor
+        )
+
+        result = {"data": events, "count": len(events), "limit": limit, "next_cursor": next_cursor}
+        if include_total:
+            result["total"] = storage.aggregate("analytics_events", filters=filters)[0]["count"]
+        return result
+
+    @staticmethod
+    def aggregate_events(
+        filters: Dict[str, Any],
+        group_by: Sequence[str],
+        bucket: Optional[str] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+
+        # group_by names columns of EVENT_GROUP_COLUMNS; bucket ("hour" or
+        # "day") adds a time bucket on the event timestamp
+        storage = get_storage()
+        groups = storage.aggregate(
+            "analytics_events",
+            group_by=list(group_by),
+            filters=filters,
+            time_bucket=("timestamp", bucket) if bucket else None,
+            limit=limit
+        )
+        total = storage.aggregate("analytics_events", filters=filters)[0]["count"]
+
+        return {"group_by": list(group_by), "bucket": bucket, "total": total, "groups": groups}
@@ -1,4 +1,4 @@
-from src.backend.utils.supabase_client import supabase
+from src.backend.storage import get_storage
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -23,11 +23,11 @@ class AudioFeatureService:
                 "raw_features": features_dict.get("raw_features", {})
             }
             
-            response = supabase.table("audio_features").insert(data).execute()
+            rows = get_storage().insert("audio_features", data)
             
-            if response.data:
+            if rows:
                 logger.info(f"Audio features saved successfully for session {session_id}")
-                return response.data[0]['id']
+                return rows[0]['id']
             else:
                 logger.warning(f"No rows inserted for audio features session {session_id}")
                 return None
@@ -42,10 +42,10 @@ class AudioFeatureService:
             return None
             
         try:
-            response = supabase.table("audio_features").select("*").eq("session_id", session_id).execute()
+            rows = get_storage().select("audio_features", {"session_id": session_id}, limit=1)
             
-            if response.data:
-                return response.data[0]
+            if rows:
+                return rows[0]
             else:
                 logger.info(f"Audio features not found for session {session_id}")
                 return None
@@ -1,4 +1,4 @@
-from src.backend.utils.supabase_client import supabase
+from src.backend.storage import get_storage
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -40,12 +40,12 @@ class FinalScoreService:
                 if not (0 <= score <= 10):
                     logger.warning(f"Score {key} out of range (0-10): {score}")
             
-            response = supabase.table("final_scores").insert(data).execute()
+            rows = get_storage().insert("final_scores", data)
             
-            if response.data:
+            if rows:
                 logger.info(f"Final scores saved successfully for session {session_id}")
                 logger.info(f"  Mentor Score: {mentor_score:.2f}/10")
-                return response.data[0]['id']
+                return rows[0]['id']
             else:
                 logger.warning(f"No rows inserted for final scores session {session_id}")
                 return None
@@ -64,10 +64,10 @@ class FinalScoreService:
             return None
             
         try:
-            response = supabase.table("final_scores").select("*").eq("session_id", session_id).execute()
+            rows = get_storage().select("final_scores", {"session_id": session_id}, limit=1)
             
-            if response.data:
-                return response.data[0]
+            if rows:
+                return rows[0]
             else:
                 logger.info(f"Final scores not found for session {session_id}")
                 return None
@@ -83,8 +83,8 @@ class FinalScoreService:
             return False
         
         try:
-            response = supabase.table("sessions").select("id").eq("id", session_id).execute()
-            return response.data and len(response.data) > 0
+            row = get_storage().select_one("sessions", {"id": session_id}, columns="id")
+            return row is not None
         except Exception as e:
             logger.error(f"Error validating session {session_id}: {str(e)}")
             return False
@@ -0,0 +1,113 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from src.backend.storage import get_storage
+from src.backend.services.session_service import SessionService
+from src.backend.services.visual_evaluation_service import VisualEvaluationService
+from src.backend.pipelines.visual.visual_scoring import compute_visual_scores
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+LIVE_STATUS = "live"
+
+class LiveSessionService:
+    @staticmethod
+    def create_live_session(user_id: str) -> Optional[Dict[str, Any]]:
+        
+        try:
+            started_at = datetime.utcnow()
+            # No video exists yet; file fields are filled in when the
+            # recording is uploaded against this session
+            rows = get_storage().insert("sessions", {
+                "user_id": user_id,
+                "file_url": "",
+                "filename": f"live-{started_at.strftime('%Y%m%d-%H%M%S')}",
+                "status": LIVE_STATUS
+            })
+            
+            if rows:
+                logger.info(f"Live session {rows[0]['id']} created for user {user_id}")
+                return rows[0]
+            return None
+        except Exception as e:
+            logger.error(f"Error creating live session for user {user_id}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def save_live_evaluation(session_id: str, recorder) -> Optional[Dict[str, Any]]:
+        
+        if not session_id or recorder is None:
+            logger.error("save_live_evaluation: session_id and recorder are required")
+            return None
+        
+        if recorder.total_frames == 0:
+            logger.warning(f"Live session {session_id} recorded no frames, nothing to save")
+            return None
+        
+        engagement_metrics = recorder.engagement_metrics()
+        visual_scores = compute_visual_scores(engagement_metrics)
+        
+        raw_data = {
+            "source": "live",
+            "engagement_metrics": {k: v for k, v in engagement_metrics.items() if k != "raw"},
+            "counters": engagement_metrics["raw"]
+        }
+        
+        evaluation_id = VisualEvaluationService.save_visual_evaluation(session_id, visual_scores, raw_data)
+        if not evaluation_id:
+            return None
+        
+        from src.backend.pipelines.process_pipeline import mark_stage_complete
+        mark_stage_complete(session_id, "visual")
+        
+        logger.info(f"Live visual evaluation saved for session {session_id} ({recorder.total_frames} frames)")
+        
+        return {k: v for k, v in visual_scores.items() if k != "raw"}
+    
+    @staticmethod
+    def abandon_live_recording(recorder) -> bool:
+        
+        # The client went away before finishing; a session still in live
+        # status will never get its evaluation, so mark it failed
+        session_id = recorder.session_id
+        try:
+            rows = get_storage().update(
+                "sessions",
+                {"status": "failed", "updated_at": datetime.utcnow().isoformat()},
+                {"id": session_id, "status": LIVE_STATUS}
+            )
+            if rows:
+                logger.warning(f"Live session {session_id} abandoned after {recorder.total_frames} frames, marked failed")
+            return bool(rows)
+        except Exception as e:
+            logger.error(f"Error abandoning live session {session_id}: {str(e)}")
+            return False
+    
+    @staticmethod
+    def validate_pending_live_session(session_id: str, user_id: str) -> Dict[str, Any]:
+        
+        session = SessionService.get_session(session_id)
+        
+        if not session:
+            raise LookupError(f"Session {session_id} not found")
+        if session.get("user_id") != user_id:
+            raise PermissionError("You do not have permission to access this session")
+        if session.get("status") != LIVE_STATUS:
+            raise ValueError(f"Session {session_id} is not a live session awaiting a recording")
+        
+        return session
+    
+    @staticmethod
+    def attach_recording(session_id: str, filename: str, file_url: str, duration_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        
+        rows = get_storage().update("sessions", {
+            "filename": filename,
+            "file_url": file_url,
+            "status": "uploaded",
+            "duration_seconds": duration_seconds,
+            "updated_at": datetime.utcnow().isoformat()
+        }, {"id": session_id})
+        
+        if rows:
+            logger.info(f"Recording {filename} attached to live session {session_id}")
+        return rows[0] if rows else None
@@ -1,4 +1,4 @@
-from src.backend.utils.supabase_client import supabase
+from src.backend.storage import get_storage
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -34,15 +34,15 @@ class ReportService:
                 "raw_llm_response": raw_llm_response or {}
             }
             
-            response = supabase.table("reports").insert(data).execute()
+            rows = get_storage().insert("reports", data)
             
-            if response.data:
+            if rows:
                 logger.info(f"Report saved successfully for session {session_id}")
                 logger.info(f"  Summary length: {len(summary)} chars")
                 logger.info(f"  Strengths: {len(strengths)} items")
                 logger.info(f"  Improvements: {len(improvements)} items")
                 logger.info(f"  Tips: {len(actionable_tips)} items")
-                return response.data[0]['id']
+                return rows[0]['id']
             else:
                 logger.warning(f"No rows inserted for report session {session_id}")
                 return None
@@ -59,11 +59,11 @@ class ReportService:
             
         try:
             logger.info(f"Fetching report for session {session_id}")
-            response = supabase.table("reports").select("*").eq("session_id", session_id).execute()
+            rows = get_storage().select("reports", {"session_id": session_id}, limit=1)
             
-            if response.data:
+            if rows:
                 logger.info(f"Report retrieved for session {session_id}")
-                return response.data[0]
+                return rows[0]
             else:
                 logger.info(f"Report not found for session {session_id}")
                 return None
@@ -79,8 +79,8 @@ class ReportService:
             return False
         
         try:
-            response = supabase.table("sessions").select("id").eq("id", session_id).execute()
-            return response.data and len(response.data) > 0
+            row = get_storage().select_one("sessions", {"id": session_id}, columns="id")
+            return row is not None
         except Exception as e:
             logger.error(f"Error validating session {session_id}: {str(e)}")
             return False
@@ -1,30 +1,122 @@
 import os
 import tempfile
-from datetime import datetime
-from src.backend.utils.supabase_client import supabase
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+from src.backend.storage import get_storage
+from src.backend.storage.pagination import keyset_page
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-VALID_STATUSES = ["pending", "processing", "complete", "failed"]
+VALID_STATUSES = ["pending", "uploaded", "queued", "processing", "complete", "failed"]
+
+SESSION_LIST_COLUMNS = ["id", "filename", "status", "created_at"]
+SESSION_PAGE_SIZE = 20
+MAX_SESSION_PAGE_SIZE = 100
+
+# Statuses in which a session's pipeline job is held by an API process
+ADMITTED_STATUSES = ("queued", "processing")
+
+def _utc(value) -> Optional[datetime]:
+
+    # Naive UTC datetime from an ISO string or a (possibly aware) datetime
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
 
 class SessionService:
     @staticmethod
     def get_session(session_id: str):
         try:
-            response = supabase.table("sessions").select("*").eq("id", session_id).execute()
-            if not response.data:
-                return None
-            return response.data[0]
+            return get_storage().select_one("sessions", {"id": session_id})
         except Exception as e:
             logger.error(f"Error fetching session {session_id}: {str(e)}")
             raise
 
+    @staticmethod
+    def list_sessions(
+        user_id: str,
+        cursor: Optional[str] = None,
+        limit: int = SESSION_PAGE_SIZE,
+        status: Optional[str] = None,
+        newest_first: bool = True
+    ):
+
+        # Newest (or oldest) first, keyset-paginated on (created_at, id)
+        storage = get_storage()
+        limit = max(1, min(int(limit), MAX_SESSION_PAGE_SIZE))
+
+        filters = {"user_id": user_id}
+        if status:
+            filters["status"] = status
+
+        page, next_cursor = keyset_page(
+            storage, "sessions", filters, SESSION_LIST_COLUMNS, "created_at",
+            limit, cursor=cursor, desc=newest_first
+        )
+
+        # Mentor scores come from final_scores for this page only, instead of
+        # loading completion_metadata for every row
+        scores = {}
+        completed = [s["id"] for s in page if s["status"] == "complete"]
+        if completed:
+            for row in storage.select(
+                "final_scores",
+                {"session_id": ("in", completed)},
+                columns=["session_id", "mentor_score"],
+                order_by="created_at"
+            ):
+                scores[row["session_id"]] = row["mentor_score"]
+
+        for session in page:
+            session["mentor_score"] = scores.get(session["id"])
+
+        return {"sessions": page, "next_cursor": next_cursor}
+
+    @staticmethod
+    def admission_held_elsewhere(session: dict, owner: str, stale_after: float) -> bool:
+
+        # Another API process holds the session's pipeline job while the
+        # session is queued or processing and that process's heartbeat is
+        # younger than stale_after seconds
+        holder = session.get("admission_owner")
+        if not holder or holder == owner or session.get("status") not in ADMITTED_STATUSES:
+            return False
+        heartbeat = _utc(session.get("admission_heartbeat_at"))
+        return heartbeat is not None and (datetime.utcnow() - heartbeat).total_seconds() < stale_after
+
+    @staticmethod
+    def claim_admission(session: dict, owner: str) -> bool:
+
+        # Conditional on the holder read with the session, so when several
+        # processes admit the same session at once only one of them wins
+        rows = get_storage().update(
+            "sessions",
+            {"admission_owner": owner, "admission_heartbeat_at": datetime.utcnow().isoformat()},
+            {"id": session["id"], "admission_owner": session.get("admission_owner")}
+        )
+        return bool(rows)
+
+    @staticmethod
+    def touch_admissions(owner: str, session_ids: Iterable[str]) -> None:
+
+        session_ids = list(session_ids)
+        if session_ids:
+            get_storage().update(
+                "sessions",
+                {"admission_heartbeat_at": datetime.utcnow().isoformat()},
+                {"id": ("in", session_ids), "admission_owner": owner}
+            )
+
     @staticmethod
     def update_status(session_id: str, status: str):
         
         try:
-            supabase.table("sessions").update({"status": status}).eq("id", session_id).execute()
+            get_storage().update("sessions", {"status": status}, {"id": session_id})
         except Exception as e:
             logger.error(f"Error updating session status {session_id}: {str(e)}")
             raise
@@ -48,9 +140,9 @@ class SessionService:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            response = supabase.table("sessions").update(update_data).eq("id", session_id).execute()
+            rows = get_storage().update("sessions", update_data, {"id": session_id})
             
-            if response.data:
+            if rows:
                 logger.info(f"Session {session_id} status updated successfully")
                 return True
             else:
@@ -83,12 +175,23 @@ class SessionService:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            response = supabase.table("sessions").update(update_data).eq("id", session_id).execute()
+            previous = get_storage().select_one(
+                "sessions", {"id": session_id},
+                columns=["id", "user_id", "created_at", "completion_metadata"]
+            )
+            
+            rows = get_storage().update("sessions", update_data, {"id": session_id})
             
-            if response.data:
+            if rows:
                 logger.info(f"Session {session_id} marked as completed successfully")
                 if "mentor_score" in metadata:
                     logger.info(f"  Mentor Score: {metadata['mentor_score']}/10")
+                
+                try:
+                    from src.backend.services.analytics_rollup_service import AnalyticsRollupService
+                    AnalyticsRollupService.record_completion(previous or rows[0], metadata)
+                except Exception as e:
+                    logger.warning(f"Failed to update analytics rollup for session {session_id}: {str(e)}")
                 return True
             else:
                 logger.warning(f"No session updated for {session_id}")
@@ -104,7 +207,7 @@ class SessionService:
             bucket_name = "videos"
             logger.info(f"Downloading video {filename} for session {session_id}")
             
-            data = supabase.storage.from_(bucket_name).download(filename)
+            data = get_storage().download_file(bucket_name, filename)
             
             temp_dir = tempfile.gettempdir()
             file_path = os.path.join(temp_dir, f"{session_id}_{filename}")
@@ -1,4 +1,4 @@
-from src.backend.utils.supabase_client import supabase
+from src.backend.storage import get_storage
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -27,11 +27,11 @@ class TextEvaluationService:
                 if not isinstance(value, (int, float)):
                     logger.warning(f"Invalid score type for {key}: {value}")
             
-            response = supabase.table("text_evaluations").insert(data).execute()
+            rows = get_storage().insert("text_evaluations", data)
             
-            if response.data:
+            if rows:
                 logger.info(f"Text evaluation saved successfully for session {session_id}")
-                return response.data[0]['id']
+                return rows[0]['id']
             else:
                 logger.warning(f"No rows inserted for text evaluation session {session_id}")
                 return None
@@ -46,10 +46,10 @@ class TextEvaluationService:
             return None
             
         try:
-            response = supabase.table("text_evaluations").select("*").eq("session_id", session_id).execute()
+            rows = get_storage().select("text_evaluations", {"session_id": session_id}, limit=1)
             
-            if response.data:
-                return response.data[0]
+            if rows:
+                return rows[0]
             else:
                 logger.info(f"Text evaluation not found for session {session_id}")
                 return None
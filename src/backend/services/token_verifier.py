@@ -0,0 +1,253 @@
+import hashlib
+import json
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from src.backend.utils.config import Config
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Asymmetric algorithms Supabase signs access tokens with; HS256 tokens are
+# only accepted with the project's JWT secret
+ASYMMETRIC_ALGORITHMS = ["RS256", "ES256", "EdDSA"]
+
+# Longest a token with an unknown kid waits on another thread's JWKS fetch
+JWKS_FETCH_WAIT_SEC = 10.0
+
+class TokenVerifier:
+
+    # Resolves an access token to its user id. Tokens are verified locally:
+    # HS256 against the project JWT secret, RS256/ES256/EdDSA against the
+    # project's JWKS, fetched on first use and refreshed every jwks_ttl
+    # seconds or when a token names an unknown key (at most once per
+    # jwks_min_refresh). One thread fetches while the others keep using
+    # the keys they have. Once a JWKS has loaded, a kid it lacks is
+    # rejected here. Only when no key material is available is the token
+    # sent to Supabase Auth. Verified tokens are cached by hash for
+    # cache_ttl seconds, never past their expiry; tokens Supabase Auth
+    # rejects are remembered for reject_ttl seconds.
+
+    def __init__(
+        self,
+        secret: Optional[str] = None,
+        jwks_url: Optional[str] = None,
+        issuer: Optional[str] = None,
+        audience: Optional[str] = "authenticated",
+        cache_ttl: float = 60.0,
+        cache_size: int = 10000,
+        jwks_ttl: float = 600.0,
+        jwks_min_refresh: float = 30.0,
+        reject_ttl: float = 10.0,
+        fetch_jwks: Optional[Callable[[str], Dict[str, Any]]] = None,
+        remote_verify: Optional[Callable[[str], Optional[str]]] = None
+    ):
+
+        self.secret = secret
+        self.jwks_url = jwks_url
+        self.issuer = issuer
+        self.audience = audience
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.jwks_ttl = jwks_ttl
+        self.jwks_min_refresh = jwks_min_refresh
+        self.reject_ttl = reject_ttl
+        self.fetch_jwks = fetch_jwks or _fetch_jwks
+        self.remote_verify = remote_verify or _remote_verify
+
+        # user id, or None for a rejected token, and when the entry expires
+        self._tokens: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._keys: Dict[str, Any] = {}
+        self._keys_loaded = False
+        self._keys_fetched_at: Optional[float] = None
+        self._jwks_fetch: Optional[threading.Event] = None
+        self._lock = threading.Lock()
+        self._jwks_lock = threading.Lock()
+
+        self.hits = 0
+        self.local = 0
+        self.remote = 0
+
+    def verify(self, token: str) -> str:
+
+        # Returns the user id; raises ValueError for invalid or expired tokens
+        digest = hashlib.sha256(token.encode()).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            cached = self._tokens.get(digest)
+            if cached and cached[1] > now:
+                self._tokens.move_to_end(digest)
+                self.hits += 1
+                if cached[0] is None:
+                    raise ValueError("Invalid user token")
+                return cached[0]
+
+        user_id, expires_at = self._verify_local(token, now)
+        if user_id is None:
+            try:
+                user_id = self.remote_verify(token)
+            finally:
+                # Failed checks, errors included, are not retried per request
+                if not user_id:
+                    self._remember(digest, None, now + self.reject_ttl)
+            if not user_id:
+                raise ValueError("Invalid user token")
+            expires_at = now + self.cache_ttl
+            self.remote += 1
+        else:
+            self.local += 1
+
+        self._remember(digest, user_id, min(expires_at, now + self.cache_ttl))
+        return user_id
+
+    def _remember(self, digest: str, user_id: Optional[str], expires_at: float) -> None:
+
+        with self._lock:
+            self._tokens[digest] = (user_id, expires_at)
+            self._tokens.move_to_end(digest)
+            while len(self._tokens) > self.cache_size:
+                self._tokens.popitem(last=False)
+
+    def _verify_local(self, token: str, now: float) -> Tuple[Optional[str], float]:
+
+        # (None, 0) when the token can't be checked here and must go remote
+        try:
+            import jwt
+        except ImportError:
+            return None, 0.0
+
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.InvalidTokenError as e:
+            raise ValueError(f"Malformed token: {str(e)}")
+
+        alg = header.get("alg")
+        if alg == "HS256":
+            key = self.secret
+        elif alg in ASYMMETRIC_ALGORITHMS:
+            key = self._signing_key(header.get("kid"), now)
+        else:
+            raise ValueError(f"Unsupported token algorithm: {alg}")
+
+        if key is None:
+            return None, 0.0
+
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=[alg],
+                audience=self.audience,
+                issuer=self.issuer,
+                options={"require": ["exp", "sub"], "verify_aud": self.audience is not None}
+            )
+        except jwt.InvalidTokenError as e:
+            raise ValueError(f"Invalid user token: {str(e)}")
+        return claims["sub"], float(claims["exp"])
+
+    def _signing_key(self, kid: Optional[str], now: float):
+
+        if not self.jwks_url:
+            return None
+
+        # Only one thread fetches; the lock is never held across the fetch
+        with self._jwks_lock:
+            fetched_at = self._keys_fetched_at
+            stale = fetched_at is None or now - fetched_at > self.jwks_ttl
+            unknown = kid not in self._keys and (fetched_at is None or now - fetched_at > self.jwks_min_refresh)
+            fetch = self._jwks_fetch
+            owner = (stale or unknown) and fetch is None
+            if owner:
+                fetch = self._jwks_fetch = threading.Event()
+            key = self._keys.get(kid)
+
+        if owner:
+            try:
+                self._load_jwks(now)
+            finally:
+                with self._jwks_lock:
+                    self._jwks_fetch = None
+                fetch.set()
+        elif key is None and fetch is not None:
+            fetch.wait(JWKS_FETCH_WAIT_SEC)
+
+        with self._jwks_lock:
+            key = self._keys.get(kid)
+            if key is None and self._keys_loaded:
+                raise ValueError(f"Unknown signing key: {kid}")
+        return key
+
+    def _load_jwks(self, now: float) -> None:
+
+        import jwt
+
+        keys = None
+        try:
+            jwk_set = jwt.PyJWKSet.from_dict(self.fetch_jwks(self.jwks_url))
+            keys = {key.key_id: key for key in jwk_set.keys}
+            logger.info(f"[Auth] Loaded {len(keys)} signing keys from JWKS")
+        except Exception as e:
+            # Keep the previous keys; until a JWKS has loaded, tokens go remote
+            logger.warning(f"[Auth] Could not load JWKS from {self.jwks_url}: {str(e)}")
+
+        with self._jwks_lock:
+            if keys is not None:
+                self._keys = keys
+                self._keys_loaded = True
+            self._keys_fetched_at = now
+
+    def stats(self) -> Dict[str, int]:
+
+        with self._lock:
+            return {
+                "cached_tokens": len(self._tokens),
+                "hits": self.hits,
+                "local": self.local,
+                "remote": self.remote
+            }
+
+def _fetch_jwks(url: str) -> Dict[str, Any]:
+
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return json.loads(response.read())
+
+def _remote_verify(token: str) -> Optional[str]:
+
+    from src.backend.utils.supabase_client import get_supabase_client
+
+    user_response = get_supabase_client().auth.get_user(token)
+    if not user_response or not user_response.user:
+        return None
+    return user_response.user.id
+
+_verifier: Optional[TokenVerifier] = None
+_verifier_lock = threading.Lock()
+
+def get_token_verifier() -> TokenVerifier:
+
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                auth_url = f"{Config.SUPABASE_URL.rstrip('/')}/auth/v1" if Config.SUPABASE_URL else None
+                local = Config.AUTH_LOCAL_VERIFY
+                _verifier = TokenVerifier(
+                    secret=Config.SUPABASE_JWT_SECRET if local else None,
+                    jwks_url=f"{auth_url}/.well-known/jwks.json" if auth_url and local else None,
+                    issuer=auth_url,
+                    cache_ttl=Config.AUTH_TOKEN_CACHE_TTL_SEC,
+                    cache_size=Config.AUTH_TOKEN_CACHE_SIZE,
+                    jwks_ttl=Config.AUTH_JWKS_TTL_SEC,
+                    reject_ttl=Config.AUTH_REJECT_CACHE_TTL_SEC
+                )
+    return _verifier
+
+def set_token_verifier(verifier: Optional[TokenVerifier]):
+
+    global _verifier
+    _verifier = verifier
+
+__all__ = ['TokenVerifier', 'get_token_verifier', 'set_token_verifier']
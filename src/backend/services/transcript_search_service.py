@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional
+from src.backend.storage import get_storage
+from src.backend.storage.search_index import get_search_index, parse_query
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SEARCH_RESULT_LIMIT = 20
+MATCHES_PER_SESSION = 5
+
+class TranscriptSearchService:
+    @staticmethod
+    def index_transcript(session_id: str, segments: list, user_id: Optional[str] = None) -> int:
+
+        if user_id is None:
+            session = get_storage().select_one("sessions", {"id": session_id}, columns=["user_id"])
+            user_id = session.get("user_id") if session else None
+        if not user_id:
+            logger.warning(f"[Search] No owner for session {session_id}, transcript not indexed")
+            return 0
+
+        rows = [
+            {
+                "session_id": session_id,
+                "seq": seq,
+                "start_time": float(segment.get("start", 0.0) or 0.0),
+                "end_time": float(segment.get("end", 0.0) or 0.0),
+                "text": segment.get("text", "") or ""
+            }
+            for seq, segment in enumerate(segments or [])
+        ]
+
+        # Re-indexing a session replaces its previous entries
+        index = get_search_index()
+        index.remove(session_id)
+        index.add(user_id, rows)
+        logger.info(f"[Search] Indexed {len(rows)} segments for session {session_id}")
+        return len(rows)
+
+    @staticmethod
+    def remove_transcript(session_id: str) -> None:
+
+        get_search_index().remove(session_id)
+
+    @staticmethod
+    def search(user_id: str, query: str, limit: int = SEARCH_RESULT_LIMIT) -> Dict[str, Any]:
+
+        phrases = parse_query(query)
+        if not phrases:
+            return {"query": query, "results": []}
+
+        matches = get_search_index().search(user_id, phrases)
+
+        # Matches arrive best first, so the first hit fixes a session's rank
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for match in matches:
+            entry = grouped.get(match["session_id"])
+            if entry is None:
+                if len(grouped) >= limit:
+                    continue
+                entry = grouped[match["session_id"]] = {"session_id": match["session_id"], "match_count": 0, "matches": []}
+            entry["match_count"] += 1
+            if len(entry["matches"]) < MATCHES_PER_SESSION:
+                entry["matches"].append({
+                    "seq": match["seq"],
+                    "start": match["start_time"],
+                    "end": match["end_time"],
+                    "text": match["text"]
+                })
+
+        results: List[Dict[str, Any]] = list(grouped.values())
+        if results:
+            sessions = get_storage().select(
+                "sessions",
+                {"id": ("in", list(grouped)), "user_id": user_id},
+                columns=["id", "filename", "created_at"]
+            )
+            details = {s["id"]: s for s in sessions}
+            # Entries of deleted sessions can outlive them in the index
+            results = [r for r in results if r["session_id"] in details]
+            for result in results:
+                result["filename"] = details[result["session_id"]]["filename"]
+                result["created_at"] = details[result["session_id"]]["created_at"]
+                result["matches"].sort(key=lambda m: m["start"])
+
+        logger.info(f"[Search] '{query}' for user {user_id}: {len(matches)} segments in {len(results)} sessions")
+        return {"query": query, "results": results}
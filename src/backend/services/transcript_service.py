@@ -1,34 +1,107 @@
-from src.backend.utils.supabase_client import supabase
+from typing import Any, Dict, Iterator, List, Optional
+from src.backend.storage import get_storage
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+SEGMENT_PAGE_SIZE = 100
+MAX_SEGMENT_PAGE_SIZE = 500
+
+SEGMENT_COLUMNS = ["seq", "start_time", "end_time", "text"]
+
+def _segment_rows(session_id: str, segments: list) -> List[Dict[str, Any]]:
+
+    rows = []
+    for seq, segment in enumerate(segments or []):
+        text = segment.get("text", "") or ""
+        rows.append({
+            "session_id": session_id,
+            "seq": seq,
+            "start_time": float(segment.get("start", 0.0) or 0.0),
+            "end_time": float(segment.get("end", 0.0) or 0.0),
+            "text": text,
+            "word_count": len(text.split())
+        })
+    return rows
+
+def _legacy_segment_rows(session_id: str, start: Optional[float], end: Optional[float], cursor: Optional[int]) -> List[Dict[str, Any]]:
+
+    # Transcripts saved before segment rows existed keep a JSON array
+    rows = get_storage().select("transcripts", {"session_id": session_id}, columns=["segments"], limit=1)
+    segments = (rows[0].get("segments") or []) if rows else []
+    return [
+        {"seq": seq, "start_time": s.get("start", 0.0), "end_time": s.get("end", 0.0), "text": s.get("text", "")}
+        for seq, s in enumerate(segments)
+        if (cursor is None or seq > cursor)
+        and (start is None or s.get("end", 0.0) > start)
+        and (end is None or s.get("start", 0.0) < end)
+    ]
+
+def _summary(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+
+    return {
+        "segment_count": len(rows),
+        "word_count": sum(r.get("word_count") or 0 for r in rows),
+        "duration_seconds": round(float(rows[-1]["end_time"]), 2) if rows else 0.0
+    }
+
+def _iter_segment_rows(session_id: str, columns: List[str]) -> Iterator[Dict[str, Any]]:
+
+    # Keyset pages by seq, each well under PostgREST's row cap
+    cursor = None
+    while True:
+        filters: Dict[str, Any] = {"session_id": session_id}
+        if cursor is not None:
+            filters["seq"] = ("gt", cursor)
+        rows = get_storage().select(
+            "transcript_segments", filters, columns=["seq"] + columns,
+            order_by="seq", limit=MAX_SEGMENT_PAGE_SIZE
+        )
+        yield from rows
+        if len(rows) < MAX_SEGMENT_PAGE_SIZE:
+            return
+        cursor = rows[-1]["seq"]
+
+def _as_segment(row: Dict[str, Any]) -> Dict[str, Any]:
+
+    return {"seq": row["seq"], "start": row["start_time"], "end": row["end_time"], "text": row["text"]}
+
 class TranscriptService:
     @staticmethod
-    def save_transcript(session_id: str, full_text: str, segments: list):
+    def save_transcript(session_id: str, full_text: str, segments: list, word_timestamps: list = None):
         if not session_id or not full_text:
             logger.error("Invalid input for save_transcript")
             return None
 
         try:
+            from src.backend.pipelines.audio.pacing import compact_words
+
             logger.info(f"Transcript save started for session {session_id}")
-            
+
+            # Segments live in transcript_segments, one indexed row each;
+            # the transcripts row keeps the text, word timestamps and the
+            # summary counts, so summaries never read the segments
+            segment_rows = _segment_rows(session_id, segments)
             data = {
                 "session_id": session_id,
                 "raw_text": full_text,
-                "segments": segments,
-                "word_timestamps": [] 
+                "segments": None,
+                "word_timestamps": compact_words(word_timestamps),
+                **_summary(segment_rows)
             }
-            
-            response = supabase.table("transcripts").insert(data).execute()
-            
-            if response.data:
-                logger.info(f"Transcript saved successfully. Rows inserted: {len(response.data)}")
-                return response.data[0]['id']
+
+            storage = get_storage()
+            with storage.transaction():
+                rows = storage.insert("transcripts", data)
+                storage.insert("transcript_segments", segment_rows)
+
+            if rows:
+                logger.info(f"Transcript saved successfully with {len(segments or [])} segments")
+                return rows[0]['id']
             else:
                 logger.warning(f"No rows inserted for transcript session {session_id}")
                 return None
-                
+
         except Exception as e:
             logger.error(f"DB failure saving transcript for session {session_id}: {str(e)}")
             return None
@@ -37,16 +110,92 @@ class TranscriptService:
     def get_transcript(session_id: str):
         if not session_id:
             return None
-            
+
         try:
-            response = supabase.table("transcripts").select("*").eq("session_id", session_id).execute()
-            
-            if response.data:
-                return response.data[0]
+            rows = get_storage().select("transcripts", {"session_id": session_id}, limit=1)
+
+            if rows:
+                transcript = rows[0]
+                if transcript.get("segments") is None:
+                    transcript["segments"] = [
+                        {"start": r["start_time"], "end": r["end_time"], "text": r["text"]}
+                        for r in _iter_segment_rows(session_id, ["start_time", "end_time", "text"])
+                    ]
+                return transcript
             else:
                 logger.info(f"Transcript not found for session {session_id}")
                 return None
-                
+
         except Exception as e:
             logger.error(f"Error fetching transcript for session {session_id}: {str(e)}")
             return None
+
+    @staticmethod
+    def get_segments(
+        session_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        cursor: Optional[int] = None,
+        limit: int = SEGMENT_PAGE_SIZE
+    ) -> Dict[str, Any]:
+
+        # Keyset page of segments overlapping [start, end], in order; the
+        # cursor is the last seq of the previous page
+        limit = max(1, min(int(limit), MAX_SEGMENT_PAGE_SIZE))
+        filters: Dict[str, Any] = {"session_id": session_id}
+        if cursor is not None:
+            filters["seq"] = ("gt", cursor)
+        if start is not None:
+            filters["end_time"] = ("gt", start)
+        if end is not None:
+            filters["start_time"] = ("lt", end)
+
+        rows = get_storage().select(
+            "transcript_segments", filters, columns=SEGMENT_COLUMNS,
+            order_by="seq", limit=limit + 1
+        )
+
+        if not rows:
+            rows = _legacy_segment_rows(session_id, start, end, cursor)[:limit + 1]
+
+        page = rows[:limit]
+        return {
+            "segments": [_as_segment(r) for r in page],
+            "next_cursor": page[-1]["seq"] if len(rows) > limit else None
+        }
+
+    @staticmethod
+    def get_transcript_summary(session_id: str) -> Optional[Dict[str, Any]]:
+
+        try:
+            storage = get_storage()
+            transcript = storage.select_one(
+                "transcripts", {"session_id": session_id},
+                columns=["id", "segments", "segment_count", "word_count", "duration_seconds"]
+            )
+            if not transcript:
+                return None
+
+            if transcript.get("segment_count") is not None:
+                return {
+                    "segment_count": transcript["segment_count"],
+                    "duration_seconds": round(float(transcript["duration_seconds"] or 0.0), 2),
+                    "word_count": transcript["word_count"] or 0
+                }
+
+            if transcript.get("segments") is not None:
+                segments = transcript["segments"] or []
+                return {
+                    "segment_count": len(segments),
+                    "duration_seconds": round(float(segments[-1].get("end", 0.0)), 2) if segments else 0.0,
+                    "word_count": sum(len((s.get("text") or "").split()) for s in segments)
+                }
+
+            # Saved before the counts were stored: count once and keep them
+            summary = _summary(list(_iter_segment_rows(session_id, ["end_time", "word_count"])))
+            storage.update("transcripts", summary, {"id": transcript["id"]})
+            return summary
+
+        except Exception as e:
+            logger.error(f"Error summarising transcript for session {session_id}: {str(e)}")
+            return None
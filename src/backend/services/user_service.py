@@ -1,5 +1,7 @@
 from fastapi import Request, HTTPException, status
-from src.backend.utils.supabase_client import supabase
+from starlette.requests import HTTPConnection
+from src.backend.services.token_verifier import get_token_verifier
+from src.backend.utils.config import Config
 from src.backend.utils.logger import setup_logger
 import os
 
@@ -11,10 +13,38 @@ class UserService:
     @staticmethod
     def get_user_id(request: Request) -> str:
         
-        auth_header = request.headers.get("Authorization")
+        return UserService.resolve_user_id(request.headers.get("Authorization"), request.headers.get("X-User-ID"))
+    
+    @staticmethod
+    def get_websocket_user_id(connection: HTTPConnection) -> str:
+        
+        # Browsers can't set headers on a WebSocket handshake, so the token
+        # (and the dev-mode user id) may also come as query parameters
+        params = connection.query_params
+        token = params.get("access_token")
+        return UserService.resolve_user_id(
+            connection.headers.get("Authorization") or (f"Bearer {token}" if token else None),
+            connection.headers.get("X-User-ID") or params.get("user_id")
+        )
+    
+    @staticmethod
+    def require_admin(request: Request) -> str:
+        
+        # Admins are listed in ADMIN_USER_IDS; with none configured, dev
+        # mode lets everyone through and production lets no one
+        user_id = UserService.get_user_id(request)
+        if user_id in Config.ADMIN_USER_IDS or (DEV_MODE and not Config.ADMIN_USER_IDS):
+            return user_id
+        logger.warning(f"User {user_id} denied access to an admin endpoint")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    @staticmethod
+    def resolve_user_id(auth_header, user_id_header) -> str:
         
         if DEV_MODE:
-            user_id_header = request.headers.get("X-User-ID")
             if user_id_header and user_id_header.strip():
                 logger.info(f"Using X-User-ID header in dev mode: {user_id_header}")
                 return user_id_header
@@ -36,15 +66,7 @@ class UserService:
             else:
                 token = auth_header
                 
-            user_response = supabase.auth.get_user(token)
-            
-            if not user_response or not user_response.user:
-                if DEV_MODE:
-                    logger.warning("Invalid token - using dev mode mock user")
-                    return "00000000-0000-0000-0000-000000000001"
-                raise ValueError("Invalid user token")
-                
-            return user_response.user.id
+            return get_token_verifier().verify(token)
             
         except Exception as e:
             if DEV_MODE:
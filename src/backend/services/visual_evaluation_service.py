@@ -1,4 +1,7 @@
-from src.backend.utils.supabase_client import supabase
+from typing import Optional
+from src.backend.storage import get_storage
+from src.backend.pipelines.visual.frame_store import FrameResultStore, as_frame_store
+from src.backend.utils.config import Config
 from src.backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -33,11 +36,11 @@ class VisualEvaluationService:
                 if not (0 <= score <= 10):
                     logger.warning(f"Score {key} out of range (0-10): {score}")
             
-            response = supabase.table("visual_evaluations").insert(data).execute()
+            rows = get_storage().insert("visual_evaluations", data)
             
-            if response.data:
+            if rows:
                 logger.info(f"Visual evaluation saved successfully for session {session_id}")
-                return response.data[0]['id']
+                return rows[0]['id']
             else:
                 logger.warning(f"No rows inserted for visual evaluation session {session_id}")
                 return None
@@ -49,6 +52,30 @@ class VisualEvaluationService:
             logger.error(f"DB failure saving visual evaluation for session {session_id}: {str(e)}")
             return None
 
+    @staticmethod
+    def save_frame_results_artifact(session_id: str, frame_results) -> Optional[str]:
+        
+        try:
+            store = as_frame_store(frame_results)
+            blob = store.to_bytes()
+            path = f"{session_id}/frame_results.npz"
+            
+            get_storage().upload_file(Config.ARTIFACTS_BUCKET, path, blob, content_type="application/octet-stream")
+            logger.info(f"Saved frame results artifact for session {session_id}: {len(store)} frames, {len(blob)} bytes")
+            return path
+        except Exception as e:
+            logger.warning(f"Failed to save frame results artifact for session {session_id}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def load_frame_results_artifact(path: str) -> Optional[FrameResultStore]:
+        
+        try:
+            return FrameResultStore.from_bytes(get_storage().download_file(Config.ARTIFACTS_BUCKET, path))
+        except Exception as e:
+            logger.error(f"Failed to load frame results artifact {path}: {str(e)}")
+            return None
+    
     @staticmethod
     def get_visual_evaluation(session_id: str):
         
@@ -56,10 +83,10 @@ class VisualEvaluationService:
             return None
             
         try:
-            response = supabase.table("visual_evaluations").select("*").eq("session_id", session_id).execute()
+            rows = get_storage().select("visual_evaluations", {"session_id": session_id}, limit=1)
             
-            if response.data:
-                return response.data[0]
+            if rows:
+                return rows[0]
             else:
                 logger.info(f"Visual evaluation not found for session {session_id}")
                 return None
@@ -75,8 +102,8 @@ class VisualEvaluationService:
             return False
         
         try:
-            response = supabase.table("sessions").select("id").eq("id", session_id).execute()
-            return response.data and len(response.data) > 0
+            row = get_storage().select_one("sessions", {"id": session_id}, columns="id")
+            return row is not None
         except Exception as e:
             logger.error(f"Error validating session {session_id}: {str(e)}")
             return False
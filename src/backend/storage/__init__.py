@@ -0,0 +1,59 @@
+import threading
+from typing import Optional
+from src.backend.storage.base import (
+    StorageBackend,
+    StorageError,
+    FILTER_OPERATORS
+)
+from src.backend.utils.config import Config
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_storage: Optional[StorageBackend] = None
+_storage_lock = threading.Lock()
+
+def create_storage(backend: Optional[str] = None) -> StorageBackend:
+
+    backend = (backend or Config.STORAGE_BACKEND or "supabase").lower()
+
+    if backend == "sqlite":
+        from src.backend.storage.sql_backend import SQLiteBackend
+        return SQLiteBackend(Config.SQLITE_PATH, files_dir=Config.LOCAL_STORAGE_DIR)
+
+    if backend in ("postgres", "postgresql"):
+        from src.backend.storage.sql_backend import PostgresBackend
+        if not Config.DATABASE_URL:
+            raise ValueError("DATABASE_URL is not set")
+        return PostgresBackend(Config.DATABASE_URL, files_dir=Config.LOCAL_STORAGE_DIR)
+
+    if backend == "supabase":
+        from src.backend.storage.supabase_backend import SupabaseBackend
+        return SupabaseBackend()
+
+    raise ValueError(f"Unknown STORAGE_BACKEND: {backend}")
+
+def get_storage() -> StorageBackend:
+
+    global _storage
+
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = create_storage()
+                logger.info(f"[Storage] Using {_storage.name} backend")
+    return _storage
+
+def set_storage(storage: Optional[StorageBackend]) -> None:
+
+    global _storage
+    _storage = storage
+
+__all__ = [
+    'StorageBackend',
+    'StorageError',
+    'FILTER_OPERATORS',
+    'create_storage',
+    'get_storage',
+    'set_storage'
+]
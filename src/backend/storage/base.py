@@ -0,0 +1,152 @@
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+Row = Dict[str, Any]
+Filters = Optional[Dict[str, Any]]
+
+FILTER_OPERATORS = ("eq", "neq", "lt", "lte", "gt", "gte", "in")
+
+# Length of the ISO timestamp prefix that identifies each bucket
+TIME_BUCKETS = {"hour": 13, "day": 10}
+
+AGGREGATE_PAGE_SIZE = 1000
+
+class StorageError(Exception):
+
+    pass
+
+def normalize_filter(value: Any):
+
+    if isinstance(value, tuple) and len(value) == 2 and value[0] in FILTER_OPERATORS:
+        return value
+    if isinstance(value, (list, set)):
+        return ("in", list(value))
+    return ("eq", value)
+
+def filter_conditions(value: Any) -> List[Tuple[str, Any]]:
+
+    # A list of operator tuples puts several conditions on one column,
+    # e.g. [("gte", since), ("lt", until)]; any other list means "in"
+    if isinstance(value, list) and value and all(
+        isinstance(v, tuple) and len(v) == 2 and v[0] in FILTER_OPERATORS for v in value
+    ):
+        return list(value)
+    return [normalize_filter(value)]
+
+def bucket_key(value: Any, unit: str) -> Optional[str]:
+
+    if value is None:
+        return None
+    text = value.isoformat() if hasattr(value, "isoformat") else str(value)
+    return text[:TIME_BUCKETS[unit]].replace(" ", "T")
+
+class StorageBackend:
+
+    name = "base"
+
+    def select(
+        self,
+        table: str,
+        filters: Filters = None,
+        columns: Union[str, Sequence[str]] = "*",
+        order_by: Optional[Union[str, Sequence[str]]] = None,
+        desc: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Row]:
+        raise NotImplementedError("Subclasses must implement select")
+
+    def select_one(self, table: str, filters: Filters = None, columns: Union[str, Sequence[str]] = "*") -> Optional[Row]:
+
+        rows = self.select(table, filters=filters, columns=columns, limit=1)
+        return rows[0] if rows else None
+
+    def aggregate(
+        self,
+        table: str,
+        group_by: Sequence[str] = (),
+        filters: Filters = None,
+        time_bucket: Optional[Tuple[str, str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Row]:
+
+        # Row counts per distinct value of the group_by columns and, with
+        # time_bucket=(column, "hour" | "day"), per ISO "bucket" of that
+        # column. Rows come back largest count first, or in bucket order
+        # when bucketing. This generic version pages through the projected
+        # columns; the SQL backends and Supabase push the counting to the
+        # database.
+        group_by = list(group_by)
+        columns = group_by + ([time_bucket[0]] if time_bucket else [])
+
+        counts: Counter = Counter()
+        offset = 0
+        while True:
+            rows = self.select(
+                table, filters, columns=columns or "id", order_by="id",
+                limit=AGGREGATE_PAGE_SIZE, offset=offset
+            )
+            for row in rows:
+                key = tuple(row.get(c) for c in group_by)
+                if time_bucket:
+                    key += (bucket_key(row.get(time_bucket[0]), time_bucket[1]),)
+                counts[key] += 1
+            if len(rows) < AGGREGATE_PAGE_SIZE:
+                break
+            offset += AGGREGATE_PAGE_SIZE
+
+        names = group_by + (["bucket"] if time_bucket else [])
+        if not names:
+            return [{"count": counts[()]}]
+        result = [dict(zip(names, key), count=count) for key, count in counts.items()]
+        if time_bucket:
+            result.sort(key=lambda r: (r["bucket"] or "", -r["count"]))
+        else:
+            result.sort(key=lambda r: -r["count"])
+        return result[:limit] if limit is not None else result
+
+    def insert(self, table: str, rows: Union[Row, List[Row]]) -> List[Row]:
+        raise NotImplementedError("Subclasses must implement insert")
+
+    def update(self, table: str, values: Row, filters: Filters) -> List[Row]:
+        raise NotImplementedError("Subclasses must implement update")
+
+    def delete(self, table: str, filters: Filters) -> List[Row]:
+        raise NotImplementedError("Subclasses must implement delete")
+
+    def rpc(self, function: str, params: Row) -> List[Row]:
+
+        # Calls a SQL function from docs/sql with named arguments. Backends
+        # without them raise NotImplementedError and callers fall back to
+        # plain selects.
+        raise NotImplementedError(f"{self.name} storage does not support functions")
+
+    @contextmanager
+    def transaction(self) -> Iterator["StorageBackend"]:
+
+        # No atomicity: backends without transactions (Supabase over
+        # PostgREST) run each statement on its own, so callers must not
+        # rely on a failed block being undone
+        yield self
+
+    def upload_file(self, bucket: str, path: str, content: bytes, content_type: Optional[str] = None) -> None:
+        raise NotImplementedError("Subclasses must implement upload_file")
+
+    def download_file(self, bucket: str, path: str) -> bytes:
+        raise NotImplementedError("Subclasses must implement download_file")
+
+    def get_public_url(self, bucket: str, path: str) -> str:
+        raise NotImplementedError("Subclasses must implement get_public_url")
+
+__all__ = [
+    'Row',
+    'Filters',
+    'FILTER_OPERATORS',
+    'TIME_BUCKETS',
+    'filter_conditions',
+    'bucket_key',
+    'StorageError',
+    'StorageBackend',
+    'normalize_filter'
+]
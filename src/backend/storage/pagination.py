@@ -0,0 +1,71 @@
+import base64
+import json
+from typing import Any, List, Optional, Sequence, Tuple, Union
+from src.backend.storage.base import StorageBackend, Row, Filters, filter_conditions
+
+def encode_cursor(*values: Any) -> str:
+
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int = 2) -> List[Any]:
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size or not all(isinstance(v, str) for v in values):
+        raise ValueError("Invalid cursor")
+    return values
+
+def keyset_page(
+    storage: StorageBackend,
+    table: str,
+    filters: Filters,
+    columns: Union[str, Sequence[str]],
+    sort_column: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    desc: bool = True,
+    tie_column: str = "id"
+) -> Tuple[List[Row], Optional[str]]:
+
+    # Keyset pagination on (sort_column, tie_column); the cursor is the last
+    # row of the previous page. The storage API only ANDs its filters, so
+    # (sort = c AND tie past t) OR (sort past c) is two range scans: rows
+    # sharing the cursor's sort value first, then strictly later ones.
+    # Either way a page costs the same no matter how deep it is.
+    filters = dict(filters or {})
+    past = "lt" if desc else "gt"
+
+    rows: List[Row] = []
+    if cursor:
+        sort_value, tie_value = decode_cursor(cursor)
+        rows = storage.select(
+            table,
+            {**filters, sort_column: sort_value, tie_column: (past, tie_value)},
+            columns=columns,
+            order_by=tie_column,
+            desc=desc,
+            limit=limit + 1
+        )
+        existing = filter_conditions(filters[sort_column]) if sort_column in filters else []
+        filters[sort_column] = existing + [(past, sort_value)]
+
+    if len(rows) <= limit:
+        rows += storage.select(
+            table,
+            filters,
+            columns=columns,
+            order_by=[sort_column, tie_column],
+            desc=desc,
+            limit=limit + 1 - len(rows)
+        )
+
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(page[-1][sort_column], page[-1][tie_column])
+    return page, next_cursor
+
+__all__ = ['encode_cursor', 'decode_cursor', 'keyset_page']
@@ -0,0 +1,185 @@
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    user_id TEXT,
+    file_url TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    status TEXT DEFAULT 'uploaded',
+    has_transcript INTEGER DEFAULT 0,
+    stages_completed TEXT DEFAULT '[]',
+    last_successful_stage TEXT,
+    completed_at TEXT,
+    completion_metadata TEXT,
+    duration_seconds REAL,
+    admission_owner TEXT,
+    admission_heartbeat_at TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now')),
+    updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS transcripts (
+    id TEXT PRIMARY KEY,
+    session_id TEXT REFERENCES sessions(id) ON DELETE CASCADE,
+    raw_text TEXT,
+    segments TEXT,
+    word_timestamps TEXT,
+    segment_count INTEGER,
+    word_count INTEGER,
+    duration_seconds REAL,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now')),
+    updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS transcript_segments (
+    id TEXT PRIMARY KEY,
+    session_id TEXT REFERENCES sessions(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL NOT NULL,
+    text TEXT,
+    word_count INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS transcript_terms (
+    id TEXT PRIMARY KEY,
+    user_id TEXT,
+    term TEXT NOT NULL,
+    session_id TEXT REFERENCES sessions(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS audio_features (
+    id TEXT PRIMARY KEY,
+    session_id TEXT REFERENCES sessions(id) ON DELETE CASCADE,
+    words_per_minute REAL,
+    silence_ratio REAL,
+    avg_volume REAL,
+    volume_variation REAL,
+    clarity_score REAL,
+    raw_features TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS text_evaluations (
+    id TEXT PRIMARY KEY,
+    session_id TEXT REFERENCES sessions(id) ON DELETE CASCADE,
+    clarity_score REAL,
+    structure_score REAL,
+    technical_correctness_score REAL,
+    explanation_quality_score REAL,
+    raw_llm_response TEXT,
+    summary_feedback TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS visual_evaluations (
+    id TEXT PRIMARY KEY,
+    session_id TEXT REFERENCES sessions(id) ON DELETE CASCADE,
+    face_visibility_score REAL,
+    gaze_forward_score REAL,
+    gesture_score REAL,
+    movement_score REAL,
+    visual_overall REAL,
+    raw_visual_data TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS final_scores (
+    id TEXT PRIMARY KEY,
+    session_id TEXT REFERENCES sessions(id) ON DELETE CASCADE,
+    engagement REAL,
+    communication_clarity REAL,
+    technical_correctness REAL,
+    pacing_structure REAL,
+    interactive_quality REAL,
+    mentor_score REAL,
+    raw_fusion_data TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS reports (
+    id TEXT PRIMARY KEY,
+    session_id TEXT REFERENCES sessions(id) ON DELETE CASCADE,
+    summary TEXT,
+    strengths TEXT,
+    improvements TEXT,
+    actionable_tips TEXT,
+    raw_llm_response TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS analytics_events (
+    id TEXT PRIMARY KEY,
+    event_name TEXT NOT NULL,
+    session_id TEXT,
+    user_id TEXT,
+    metadata TEXT DEFAULT '{}',
+    timestamp TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS user_analytics_rollups (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL UNIQUE,
+    completed_sessions INTEGER DEFAULT 0,
+    metric_sums TEXT DEFAULT '{}',
+    metric_counts TEXT DEFAULT '{}',
+    score_distribution TEXT DEFAULT '{}',
+    score_history TEXT DEFAULT '[]',
+    first_score REAL,
+    latest_score REAL,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+DROP INDEX IF EXISTS idx_sessions_user_created;
+CREATE INDEX IF NOT EXISTS idx_sessions_user_created_id ON sessions(user_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_transcripts_session_id ON transcripts(session_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_transcript_segments_session_seq ON transcript_segments(session_id, seq);
+CREATE INDEX IF NOT EXISTS idx_transcript_segments_session_start ON transcript_segments(session_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_transcript_terms_user_term ON transcript_terms(user_id, term);
+CREATE INDEX IF NOT EXISTS idx_transcript_terms_session_id ON transcript_terms(session_id);
+CREATE INDEX IF NOT EXISTS idx_audio_features_session_id ON audio_features(session_id);
+CREATE INDEX IF NOT EXISTS idx_text_evaluations_session_id ON text_evaluations(session_id);
+CREATE INDEX IF NOT EXISTS idx_visual_evaluations_session_id ON visual_evaluations(session_id);
+CREATE INDEX IF NOT EXISTS idx_final_scores_session_id ON final_scores(session_id);
+CREATE INDEX IF NOT EXISTS idx_reports_session_id ON reports(session_id);
+DROP INDEX IF EXISTS idx_analytics_events_event_name;
+DROP INDEX IF EXISTS idx_analytics_events_timestamp;
+DROP INDEX IF EXISTS idx_analytics_events_session_id;
+DROP INDEX IF EXISTS idx_analytics_events_user_id;
+CREATE INDEX IF NOT EXISTS idx_analytics_events_ts_id ON analytics_events(timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_name_ts ON analytics_events(event_name, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_session_ts ON analytics_events(session_id, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_analytics_events_user_ts ON analytics_events(user_id, timestamp DESC, id DESC);
+"""
+
+# Columns stored as JSONB in Postgres and as JSON text in SQLite
+JSON_COLUMNS = {
+    "sessions": {"stages_completed", "completion_metadata"},
+    "transcripts": {"segments", "word_timestamps"},
+    "audio_features": {"raw_features"},
+    "text_evaluations": {"raw_llm_response"},
+    "visual_evaluations": {"raw_visual_data"},
+    "final_scores": {"raw_fusion_data"},
+    "reports": {"strengths", "improvements", "actionable_tips", "raw_llm_response"},
+    "analytics_events": {"metadata"},
+    "user_analytics_rollups": {"metric_sums", "metric_counts", "score_distribution", "score_history"}
+}
+
+BOOL_COLUMNS = {
+    "sessions": {"has_transcript"}
+}
+
+# Columns added after their table was first created. CREATE TABLE IF NOT
+# EXISTS leaves existing SQLite files alone, so these are added on connect
+SQLITE_ADDED_COLUMNS = [
+    ("sessions", "duration_seconds", "REAL"),
+    ("sessions", "admission_owner", "TEXT"),
+    ("sessions", "admission_heartbeat_at", "TEXT"),
+    ("transcripts", "segment_count", "INTEGER"),
+    ("transcripts", "word_count", "INTEGER"),
+    ("transcripts", "duration_seconds", "REAL"),
+    ("user_analytics_rollups", "version", "INTEGER NOT NULL DEFAULT 0")
+]
+
+__all__ = ['SQLITE_SCHEMA', 'JSON_COLUMNS', 'BOOL_COLUMNS', 'SQLITE_ADDED_COLUMNS']
@@ -0,0 +1,258 @@
+import hashlib
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from src.backend.storage.base import StorageBackend, Row
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Letters and digits plus the Indic blocks (Devanagari to Sinhala), whose
+# vowel signs and viramas are combining marks that \w does not match.
+# U+0964/U+0965 are the danda punctuation marks.
+_TOKEN = re.compile(r"(?:[^\W_]|[\u0900-\u0963\u0966-\u0DFF])+")
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\ufeff"))
+_PHRASE = re.compile(r'"([^"]*)"')
+
+MAX_CANDIDATE_SEGMENTS = 500
+
+# Page sizes for the term index fallback, below PostgREST's 1000-row cap
+POSTINGS_PAGE_SIZE = 1000
+SEGMENT_LOOKUP_SIZE = 200
+
+def tokenize(text: str) -> List[str]:
+
+    # NFC keeps Devanagari conjuncts in one form; zero-width joiners vary
+    # between keyboards and carry no meaning for search
+    text = unicodedata.normalize("NFC", text or "").translate(_INVISIBLE).casefold()
+    return _TOKEN.findall(text)
+
+def parse_query(query: str) -> List[List[str]]:
+
+    # Quoted parts are phrases, every other word must appear on its own;
+    # returns one token list per phrase
+    phrases = [tokenize(p) for p in _PHRASE.findall(query or "")]
+    phrases += [[token] for token in tokenize(_PHRASE.sub(" ", query or ""))]
+    return [p for p in phrases if p]
+
+def owner_token(user_id: str) -> str:
+
+    return "u" + hashlib.blake2b(str(user_id).encode(), digest_size=8).hexdigest()
+
+def _contains(tokens: List[str], phrase: List[str]) -> bool:
+
+    n = len(phrase)
+    return any(tokens[i:i + n] == phrase for i in range(len(tokens) - n + 1))
+
+class SearchIndex:
+
+    # Segment-level transcript index. Rows carry session_id, seq,
+    # start_time, end_time and text; search returns matching rows of one
+    # user's transcripts, best first.
+
+    name = "base"
+
+    def add(self, user_id: str, rows: Sequence[Row]) -> None:
+        raise NotImplementedError("Subclasses must implement add")
+
+    def remove(self, session_id: str) -> None:
+        raise NotImplementedError("Subclasses must implement remove")
+
+    def search(self, user_id: str, phrases: List[List[str]], limit: int = MAX_CANDIDATE_SEGMENTS) -> List[Row]:
+        raise NotImplementedError("Subclasses must implement search")
+
+class FTS5SearchIndex(SearchIndex):
+
+    # SQLite FTS5 over pre-tokenised text. The ascii tokenizer splits only
+    # on ASCII separators and keeps every other code point, so the tokens
+    # produced by tokenize() (including Devanagari) survive unchanged. The
+    # owner column holds a per-user token so the user filter is part of the
+    # full-text match instead of a post-filter.
+
+    name = "fts5"
+
+    TABLE_SQL = (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS transcript_search USING fts5("
+        "body, owner, session_id UNINDEXED, seq UNINDEXED, start_time UNINDEXED, "
+        "end_time UNINDEXED, text UNINDEXED, tokenize = 'ascii')"
+    )
+
+    def __init__(self, backend):
+
+        self.backend = backend
+        self.backend._execute(self.TABLE_SQL)
+
+    def add(self, user_id: str, rows: Sequence[Row]) -> None:
+
+        owner = owner_token(user_id)
+        params = [
+            (" ".join(tokenize(r["text"])), owner, r["session_id"], r["seq"], r["start_time"], r["end_time"], r["text"])
+            for r in rows
+        ]
+        if not params:
+            return
+
+        with self.backend.transaction():
+            cursor = self.backend.connection.cursor()
+            try:
+                cursor.executemany(
+                    "INSERT INTO transcript_search (body, owner, session_id, seq, start_time, end_time, text) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    params
+                )
+            finally:
+                cursor.close()
+
+    def remove(self, session_id: str) -> None:
+
+        self.backend._execute("DELETE FROM transcript_search WHERE session_id = ?", (session_id,))
+
+    def search(self, user_id: str, phrases: List[List[str]], limit: int = MAX_CANDIDATE_SEGMENTS) -> List[Row]:
+
+        match = " AND ".join([f"owner : {owner_token(user_id)}"] + [f'body : "{" ".join(p)}"' for p in phrases])
+        return self.backend._execute(
+            "SELECT session_id, seq, start_time, end_time, text, bm25(transcript_search) AS rank "
+            "FROM transcript_search WHERE transcript_search MATCH ? ORDER BY rank LIMIT ?",
+            (match, int(limit))
+        )
+
+class TermSearchIndex(SearchIndex):
+
+    # Inverted index through the storage API, for backends without FTS5:
+    # one (user_id, term, session_id, seq) posting per distinct term per
+    # segment. Segments holding every query term are candidates; phrases
+    # are then confirmed against the segment text. The intersection runs in
+    # the database through search_transcript_terms
+    # (docs/sql/search_transcript_terms.sql); where that function is
+    # missing, postings are paged by id and intersected here.
+
+    name = "terms"
+
+    def __init__(self, storage: StorageBackend):
+
+        self.storage = storage
+
+    def add(self, user_id: str, rows: Sequence[Row]) -> None:
+
+        postings = [
+            {"user_id": user_id, "term": term, "session_id": r["session_id"], "seq": r["seq"]}
+            for r in rows
+            for term in sorted(set(tokenize(r["text"])))
+        ]
+        if postings:
+            self.storage.insert("transcript_terms", postings)
+
+    def remove(self, session_id: str) -> None:
+
+        self.storage.delete("transcript_terms", {"session_id": session_id})
+
+    def search(self, user_id: str, phrases: List[List[str]], limit: int = MAX_CANDIDATE_SEGMENTS) -> List[Row]:
+
+        terms = sorted({t for p in phrases for t in p})
+        segments = None
+        try:
+            segments = self.storage.rpc("search_transcript_terms", {
+                "p_user_id": user_id,
+                "p_terms": terms,
+                "p_limit": MAX_CANDIDATE_SEGMENTS
+            })
+        except NotImplementedError:
+            pass
+        except Exception as e:
+            logger.warning(f"[Search] search_transcript_terms failed ({str(e)}), intersecting postings locally")
+        if segments is None:
+            segments = self._candidate_segments(user_id, terms)
+
+        matches = []
+        for segment in segments:
+            tokens = tokenize(segment["text"])
+            if all(_contains(tokens, p) for p in phrases):
+                # Rank by how often the query terms occur, densest first
+                segment["rank"] = -sum(tokens.count(t) for t in terms) / max(len(tokens), 1)
+                matches.append(segment)
+
+        matches.sort(key=lambda m: m["rank"])
+        return matches[:limit]
+
+    def _candidate_segments(self, user_id: str, terms: List[str]) -> List[Row]:
+
+        found: Dict[Tuple[str, int], set] = {}
+        last_id = None
+        while True:
+            filters: Dict[str, Any] = {"user_id": user_id, "term": ("in", terms)}
+            if last_id is not None:
+                filters["id"] = ("gt", last_id)
+            postings = self.storage.select(
+                "transcript_terms", filters,
+                columns=["id", "term", "session_id", "seq"], order_by="id", limit=POSTINGS_PAGE_SIZE
+            )
+            for p in postings:
+                found.setdefault((p["session_id"], p["seq"]), set()).add(p["term"])
+            if len(postings) < POSTINGS_PAGE_SIZE:
+                break
+            last_id = postings[-1]["id"]
+
+        by_session: Dict[str, List[int]] = {}
+        for (session_id, seq), hits in sorted(found.items()):
+            if len(hits) == len(terms):
+                by_session.setdefault(session_id, []).append(seq)
+
+        # One session per lookup, so the IN list names exactly the wanted segments
+        segments = []
+        for session_id, seqs in by_session.items():
+            for i in range(0, len(seqs), SEGMENT_LOOKUP_SIZE):
+                segments.extend(self.storage.select(
+                    "transcript_segments",
+                    {"session_id": session_id, "seq": ("in", seqs[i:i + SEGMENT_LOOKUP_SIZE])},
+                    columns=["session_id", "seq", "start_time", "end_time", "text"]
+                ))
+        return segments
+
+def create_search_index(storage: StorageBackend) -> SearchIndex:
+
+    if getattr(storage, "name", None) == "sqlite":
+        try:
+            return FTS5SearchIndex(storage)
+        except Exception as e:
+            logger.warning(f"[Search] FTS5 unavailable ({str(e)}), using the term index")
+    return TermSearchIndex(storage)
+
+_index: Optional[SearchIndex] = None
+_index_storage: Optional[StorageBackend] = None
+_index_lock = threading.Lock()
+
+def get_search_index() -> SearchIndex:
+
+    global _index, _index_storage
+
+    from src.backend.storage import get_storage
+
+    storage = get_storage()
+    if _index is None or _index_storage is not storage:
+        with _index_lock:
+            if _index is None or _index_storage is not storage:
+                _index = create_search_index(storage)
+                _index_storage = storage
+                logger.info(f"[Search] Using {_index.name} transcript index")
+    return _index
+
+def set_search_index(index: Optional[SearchIndex]) -> None:
+
+    global _index, _index_storage
+
+    from src.backend.storage import get_storage
+
+    _index = index
+    _index_storage = get_storage() if index is not None else None
+
+__all__ = [
+    'SearchIndex',
+    'FTS5SearchIndex',
+    'TermSearchIndex',
+    'tokenize',
+    'parse_query',
+    'create_search_index',
+    'get_search_index',
+    'set_search_index'
+]
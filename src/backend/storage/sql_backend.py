@@ -0,0 +1,368 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from src.backend.storage.base import StorageBackend, StorageError, Row, Filters, TIME_BUCKETS, filter_conditions
+from src.backend.storage.schema import SQLITE_SCHEMA, JSON_COLUMNS, BOOL_COLUMNS, SQLITE_ADDED_COLUMNS
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_OPERATORS = {
+    "eq": "=",
+    "neq": "!=",
+    "lt": "<",
+    "lte": "<=",
+    "gt": ">",
+    "gte": ">="
+}
+
+INSERT_BATCH_SIZE = 500
+
+def _ident(name: str) -> str:
+
+    if not _IDENTIFIER.match(name):
+        raise StorageError(f"Invalid identifier: {name!r}")
+    return f'"{name}"'
+
+class SQLBackend(StorageBackend):
+
+    placeholder = "?"
+    generate_ids = True
+
+    def __init__(self, files_dir: Optional[str] = None):
+        self._local = threading.local()
+        self.files_dir = Path(files_dir) if files_dir else Path(os.getcwd()) / "storage"
+
+    def _connect(self):
+        raise NotImplementedError("Subclasses must implement _connect")
+
+    def _fetch(self, cursor) -> List[Row]:
+        raise NotImplementedError("Subclasses must implement _fetch")
+
+    @property
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    def _in_transaction(self) -> bool:
+        return getattr(self._local, "depth", 0) > 0
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[Row]:
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, tuple(params))
+            rows = self._fetch(cursor) if cursor.description else []
+            return rows
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLBackend"]:
+
+        # Nested blocks run in a savepoint: an error inside one rolls back
+        # only that block, and the outer transaction stays usable if the
+        # caller handles it (Postgres otherwise aborts the whole transaction)
+        conn = self.connection
+        outermost = not self._in_transaction()
+        savepoint = f"sp_{self._local.depth}"
+
+        self._execute("BEGIN" if outermost else f"SAVEPOINT {savepoint}")
+        self._local.depth += 1
+
+        try:
+            yield self
+        except Exception:
+            self._local.depth -= 1
+            if outermost:
+                self._execute("ROLLBACK")
+            else:
+                self._execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                self._execute(f"RELEASE SAVEPOINT {savepoint}")
+            raise
+        else:
+            self._local.depth -= 1
+            self._execute("COMMIT" if outermost else f"RELEASE SAVEPOINT {savepoint}")
+
+    def _encode(self, table: str, column: str, value: Any) -> Any:
+
+        if value is None:
+            return None
+        if column in JSON_COLUMNS.get(table, ()):
+            return json.dumps(value, default=str)
+        if isinstance(value, bool):
+            return int(value)
+        return value
+
+    def _decode(self, table: str, row: Row) -> Row:
+
+        json_columns = JSON_COLUMNS.get(table, ())
+        bool_columns = BOOL_COLUMNS.get(table, ())
+
+        for column, value in row.items():
+            if value is None:
+                continue
+            if column in json_columns and isinstance(value, (str, bytes)):
+                try:
+                    row[column] = json.loads(value)
+                except (TypeError, ValueError):
+                    pass
+            elif column in bool_columns:
+                row[column] = bool(value)
+            elif isinstance(value, (datetime, date)):
+                row[column] = value.isoformat()
+            elif isinstance(value, uuid.UUID):
+                row[column] = str(value)
+
+        return row
+
+    def _where(self, table: str, filters: Filters) -> Tuple[str, List[Any]]:
+
+        clauses = []
+        params: List[Any] = []
+
+        for column, value in (filters or {}).items():
+            for op, operand in filter_conditions(value):
+                if op == "in":
+                    values = list(operand)
+                    if not values:
+                        clauses.append("1 = 0")
+                        continue
+                    marks = ", ".join([self.placeholder] * len(values))
+                    clauses.append(f"{_ident(column)} IN ({marks})")
+                    params.extend(self._encode(table, column, v) for v in values)
+                elif operand is None and op in ("eq", "neq"):
+                    clauses.append(f"{_ident(column)} IS {'NOT ' if op == 'neq' else ''}NULL")
+                else:
+                    clauses.append(f"{_ident(column)} {_OPERATORS[op]} {self.placeholder}")
+                    params.append(self._encode(table, column, operand))
+
+        if not clauses:
+            return "", params
+        return " WHERE " + " AND ".join(clauses), params
+
+    def _columns(self, columns: Union[str, Sequence[str]]) -> str:
+
+        if isinstance(columns, str):
+            if columns.strip() == "*":
+                return "*"
+            columns = [c.strip() for c in columns.split(",")]
+        return ", ".join(_ident(c) for c in columns)
+
+    def select(
+        self,
+        table: str,
+        filters: Filters = None,
+        columns: Union[str, Sequence[str]] = "*",
+        order_by: Optional[Union[str, Sequence[str]]] = None,
+        desc: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Row]:
+
+        where, params = self._where(table, filters)
+        sql = f"SELECT {self._columns(columns)} FROM {_ident(table)}{where}"
+
+        if order_by:
+            direction = "DESC" if desc else "ASC"
+            order = [order_by] if isinstance(order_by, str) else list(order_by)
+            sql += " ORDER BY " + ", ".join(f"{_ident(c)} {direction}" for c in order)
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        if offset:
+            sql += f" OFFSET {int(offset)}"
+
+        return [self._decode(table, row) for row in self._execute(sql, params)]
+
+    def _bucket(self, column: str, unit: str) -> str:
+
+        # ISO text timestamps: keep the hour or day prefix
+        return f"substr(replace({_ident(column)}, ' ', 'T'), 1, {TIME_BUCKETS[unit]})"
+
+    def aggregate(
+        self,
+        table: str,
+        group_by: Sequence[str] = (),
+        filters: Filters = None,
+        time_bucket: Optional[Tuple[str, str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Row]:
+
+        expressions = [_ident(c) for c in group_by]
+        if time_bucket:
+            expressions.append(f"{self._bucket(*time_bucket)} AS bucket")
+
+        where, params = self._where(table, filters)
+        sql = f"SELECT {', '.join(expressions + ['COUNT(*) AS count'])} FROM {_ident(table)}{where}"
+
+        if expressions:
+            sql += " GROUP BY " + ", ".join(str(i + 1) for i in range(len(expressions)))
+            sql += " ORDER BY bucket ASC, count DESC" if time_bucket else " ORDER BY count DESC"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        return [self._decode(table, row) for row in self._execute(sql, params)]
+
+    def insert(self, table: str, rows: Union[Row, List[Row]]) -> List[Row]:
+
+        if isinstance(rows, dict):
+            rows = [rows]
+        if not rows:
+            return []
+
+        groups: Dict[Tuple[str, ...], List[Row]] = {}
+        for row in rows:
+            row = dict(row)
+            if self.generate_ids and not row.get("id"):
+                row["id"] = str(uuid.uuid4())
+            groups.setdefault(tuple(row.keys()), []).append(row)
+
+        inserted: List[Row] = []
+        with self.transaction():
+            for columns, group in groups.items():
+                column_sql = ", ".join(_ident(c) for c in columns)
+                row_marks = "(" + ", ".join([self.placeholder] * len(columns)) + ")"
+
+                for start in range(0, len(group), INSERT_BATCH_SIZE):
+                    batch = group[start:start + INSERT_BATCH_SIZE]
+                    params: List[Any] = []
+                    for row in batch:
+                        params.extend(self._encode(table, c, row[c]) for c in columns)
+
+                    sql = (
+                        f"INSERT INTO {_ident(table)} ({column_sql}) "
+                        f"VALUES {', '.join([row_marks] * len(batch))} RETURNING *"
+                    )
+                    inserted.extend(self._decode(table, r) for r in self._execute(sql, params))
+
+        return inserted
+
+    def update(self, table: str, values: Row, filters: Filters) -> List[Row]:
+
+        if not values:
+            return []
+
+        assignments = ", ".join(f"{_ident(c)} = {self.placeholder}" for c in values)
+        params = [self._encode(table, c, v) for c, v in values.items()]
+        where, where_params = self._where(table, filters)
+
+        sql = f"UPDATE {_ident(table)} SET {assignments}{where} RETURNING *"
+        return [self._decode(table, row) for row in self._execute(sql, params + where_params)]
+
+    def delete(self, table: str, filters: Filters) -> List[Row]:
+
+        where, params = self._where(table, filters)
+        sql = f"DELETE FROM {_ident(table)}{where} RETURNING *"
+        return [self._decode(table, row) for row in self._execute(sql, params)]
+
+    def _file_path(self, bucket: str, path: str) -> Path:
+
+        root = (self.files_dir / bucket).resolve()
+        target = (root / path).resolve()
+        if root not in target.parents:
+            raise StorageError(f"Invalid storage path: {path}")
+        return target
+
+    def upload_file(self, bucket: str, path: str, content: bytes, content_type: Optional[str] = None) -> None:
+
+        target = self._file_path(bucket, path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+
+    def download_file(self, bucket: str, path: str) -> bytes:
+
+        target = self._file_path(bucket, path)
+        if not target.exists():
+            raise FileNotFoundError(f"File not found in local storage: {bucket}/{path}")
+        return target.read_bytes()
+
+    def get_public_url(self, bucket: str, path: str) -> str:
+
+        return self._file_path(bucket, path).as_uri()
+
+class SQLiteBackend(SQLBackend):
+
+    name = "sqlite"
+    placeholder = "?"
+    generate_ids = True
+
+    def __init__(self, db_path: str, files_dir: Optional[str] = None):
+        super().__init__(files_dir)
+        self.db_path = db_path
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self):
+
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+
+        with self._schema_lock:
+            if not self._schema_ready or self.db_path == ":memory:":
+                conn.executescript(SQLITE_SCHEMA)
+                for table, column, decl in SQLITE_ADDED_COLUMNS:
+                    existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+                    if column not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+                self._schema_ready = True
+                logger.info(f"[Storage] SQLite schema ready at {self.db_path}")
+
+        return conn
+
+    def _fetch(self, cursor) -> List[Row]:
+
+        return [dict(row) for row in cursor.fetchall()]
+
+class PostgresBackend(SQLBackend):
+
+    name = "postgres"
+    placeholder = "%s"
+    generate_ids = False
+
+    def __init__(self, database_url: str, files_dir: Optional[str] = None):
+        super().__init__(files_dir)
+        self.database_url = database_url
+
+    def _connect(self):
+
+        import psycopg2
+
+        conn = psycopg2.connect(self.database_url)
+        conn.autocommit = True
+        return conn
+
+    def _bucket(self, column: str, unit: str) -> str:
+
+        formats = {"hour": 'YYYY-MM-DD"T"HH24', "day": "YYYY-MM-DD"}
+        return f"to_char({_ident(column)} AT TIME ZONE 'UTC', '{formats[unit]}')"
+
+    def rpc(self, function: str, params: Row) -> List[Row]:
+
+        args = ", ".join(f"{_ident(name)} => {self.placeholder}" for name in params)
+        return self._execute(f"SELECT * FROM {_ident(function)}({args})", list(params.values()))
+
+    def _fetch(self, cursor) -> List[Row]:
+
+        names = [col[0] for col in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+__all__ = ['SQLBackend', 'SQLiteBackend', 'PostgresBackend']
@@ -0,0 +1,126 @@
+from typing import Any, List, Optional, Sequence, Tuple, Union
+from src.backend.storage.base import StorageBackend, Row, Filters, filter_conditions
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class SupabaseBackend(StorageBackend):
+
+    name = "supabase"
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            from src.backend.utils.supabase_client import get_supabase_client
+            self._client = get_supabase_client()
+        return self._client
+
+    def _apply_filters(self, query, filters: Filters):
+        for column, value in (filters or {}).items():
+            for op, operand in filter_conditions(value):
+                if op == "in":
+                    query = query.in_(column, list(operand))
+                elif operand is None and op in ("eq", "neq"):
+                    # NULL never compares equal; PostgREST spells it is.null
+                    query = query.is_(column, "null") if op == "eq" else query.not_.is_(column, "null")
+                else:
+                    query = getattr(query, op)(column, operand)
+        return query
+
+    def select(
+        self,
+        table: str,
+        filters: Filters = None,
+        columns: Union[str, Sequence[str]] = "*",
+        order_by: Optional[Union[str, Sequence[str]]] = None,
+        desc: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Row]:
+
+        if not isinstance(columns, str):
+            columns = ",".join(columns)
+
+        query = self._apply_filters(self.client.table(table).select(columns), filters)
+
+        if order_by:
+            for column in ([order_by] if isinstance(order_by, str) else order_by):
+                query = query.order(column, desc=desc)
+
+        if offset is not None and limit is not None:
+            query = query.range(offset, offset + limit - 1)
+        elif limit is not None:
+            query = query.limit(limit)
+
+        return query.execute().data or []
+
+    def aggregate(
+        self,
+        table: str,
+        group_by: Sequence[str] = (),
+        filters: Filters = None,
+        time_bucket: Optional[Tuple[str, str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Row]:
+
+        # Totals are a HEAD request with an exact count. Groups and time
+        # buckets run in Postgres through aggregate_rows
+        # (docs/sql/aggregate_rows.sql); without it, the generic version
+        # pages through the rows.
+        if not group_by and not time_bucket:
+            query = self._apply_filters(self.client.table(table).select("id", count="exact", head=True), filters)
+            return [{"count": query.execute().count or 0}]
+
+        conditions = [
+            [column, op, operand]
+            for column, value in (filters or {}).items()
+            for op, operand in filter_conditions(value)
+        ]
+        try:
+            return self.rpc("aggregate_rows", {
+                "p_table": table,
+                "p_group_by": list(group_by),
+                "p_bucket_column": time_bucket[0] if time_bucket else None,
+                "p_bucket": time_bucket[1] if time_bucket else None,
+                "p_filters": conditions,
+                "p_limit": limit
+            })
+        except Exception as e:
+            logger.warning(f"[Storage] aggregate_rows failed on {table} ({str(e)}), paging rows instead")
+            return super().aggregate(table, group_by, filters, time_bucket, limit)
+
+    def insert(self, table: str, rows: Union[Row, List[Row]]) -> List[Row]:
+
+        if isinstance(rows, list) and not rows:
+            return []
+        return self.client.table(table).insert(rows).execute().data or []
+
+    def update(self, table: str, values: Row, filters: Filters) -> List[Row]:
+
+        query = self._apply_filters(self.client.table(table).update(values), filters)
+        return query.execute().data or []
+
+    def delete(self, table: str, filters: Filters) -> List[Row]:
+
+        query = self._apply_filters(self.client.table(table).delete(), filters)
+        return query.execute().data or []
+
+    def rpc(self, function: str, params: Row) -> List[Row]:
+
+        return self.client.rpc(function, params).execute().data or []
+
+    def upload_file(self, bucket: str, path: str, content: bytes, content_type: Optional[str] = None) -> None:
+
+        file_options = {"content-type": content_type} if content_type else None
+        self.client.storage.from_(bucket).upload(path=path, file=content, file_options=file_options)
+
+    def download_file(self, bucket: str, path: str) -> bytes:
+
+        return self.client.storage.from_(bucket).download(path)
+
+    def get_public_url(self, bucket: str, path: str) -> str:
+
+        return self.client.storage.from_(bucket).get_public_url(path)
@@ -0,0 +1,55 @@
+import pytest
+from src.backend.storage import set_storage
+from src.backend.storage.sql_backend import SQLiteBackend
+
+# Shared API fixtures. A test module sets `api_router` to the router under
+# test and, if needed, `api_user`; rows a test needs are added by
+# overriding `storage` in the module:
+#
+#     @pytest.fixture
+#     def storage(storage):
+#         storage.insert("sessions", [...])
+#         return storage
+
+@pytest.fixture
+def storage(tmp_path):
+
+    backend = SQLiteBackend(str(tmp_path / "test.db"), files_dir=str(tmp_path / "files"))
+    set_storage(backend)
+    yield backend
+    set_storage(None)
+
+@pytest.fixture
+def api_user():
+
+    # A user id, or a function of the request
+    return "user-1"
+
+@pytest.fixture
+def api_router():
+
+    # (router, prefix) mounted by the client fixture
+    pytest.fail("Test module must define an api_router fixture")
+
+@pytest.fixture
+def client(storage, api_router, api_user, monkeypatch):
+
+    pytest.importorskip("fastapi")
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from src.backend.services.user_service import UserService
+    from src.backend.utils.cache import clear_all_cache
+    from src.backend.utils.config import Config
+
+    get_user_id = api_user if callable(api_user) else (lambda request: api_user)
+    monkeypatch.setattr(UserService, "get_user_id", staticmethod(get_user_id))
+    # Endpoints that record events write them to this test's database
+    monkeypatch.setattr(Config, "ANALYTICS_ASYNC", False)
+
+    router, prefix = api_router
+    app = FastAPI()
+    app.include_router(router, prefix=prefix)
+    yield TestClient(app)
+
+    clear_all_cache()
@@ -0,0 +1,129 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from src.backend.api import admin_api
+from src.backend.utils.config import Config
+
+EVENTS = ["upload_success", "results_viewed", "results_viewed", "process_started"]
+
+@pytest.fixture
+def api_router():
+
+    return admin_api.router, "/api/admin"
+
+@pytest.fixture
+def api_user():
+
+    return "admin"
+
+@pytest.fixture(autouse=True)
+def admins(monkeypatch):
+
+    monkeypatch.setattr(Config, "ADMIN_USER_IDS", {"admin"})
+
+@pytest.fixture
+def storage(storage):
+
+    # 120 events over two days, in groups of three sharing a timestamp
+    storage.insert("analytics_events", [
+        {
+            "event_name": EVENTS[n % 4],
+            "user_id": f"user-{n % 3}",
+            "session_id": f"s{n % 5}",
+            "metadata": {"n": n},
+            "timestamp": f"2025-03-0{n // 60 + 1}T{(n // 3) % 20:02d}:15:00"
+        }
+        for n in range(120)
+    ])
+    return storage
+
+def walk(client, **params):
+
+    events, cursor = [], None
+    while True:
+        data = client.get("/api/admin/logs", params={**params, **({"cursor": cursor} if cursor else {})}).json()
+        events += data["data"]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return events
+
+class TestAdminLogs:
+
+    def test_keyset_pages_are_complete_and_ordered(self, client, storage):
+
+        events = walk(client, limit=7)
+        keys = [(e["timestamp"], e["id"]) for e in events]
+
+        assert len(events) == 120
+        assert keys == sorted(keys, reverse=True)
+        assert len(set(keys)) == 120
+
+    def test_filters_time_range_and_total(self, client):
+
+        first = client.get("/api/admin/logs", params={
+            "event_type": "results_viewed", "since": "2025-03-01T10:00:00", "until": "2025-03-02", "limit": 4, "include_total": True
+        }).json()
+        events = walk(client, event_type="results_viewed", since="2025-03-01T10:00:00", until="2025-03-02", limit=4)
+
+        assert first["total"] == len(events) == 15
+        assert first["count"] == 4
+        assert all(e["event_name"] == "results_viewed" and "2025-03-01T10" <= e["timestamp"] < "2025-03-02" for e in events)
+
+    def test_bad_cursor_and_timestamp(self, client):
+
+        assert client.get("/api/admin/logs", params={"cursor": "garbage"}).status_code == 400
+        assert client.get("/api/admin/logs", params={"since": "yesterday"}).status_code == 400
+        assert client.get("/api/admin/logs", params={"limit": 5000}).status_code == 422
+
+class TestAdminLogAggregates:
+
+    def test_counts_by_event_name(self, client):
+
+        data = client.get("/api/admin/logs/aggregate", params={"group_by": "event_name"}).json()
+
+        assert data["total"] == 120
+        assert data["groups"][0] == {"event_name": "results_viewed", "count": 60}
+        assert sum(g["count"] for g in data["groups"]) == 120
+
+    def test_counts_by_user_per_day(self, client):
+
+        data = client.get("/api/admin/logs/aggregate", params=[("group_by", "user_id"), ("group_by", "time")]).json()
+
+        assert data["bucket"] == "day"
+        assert {(g["bucket"], g["user_id"]): g["count"] for g in data["groups"]}[("2025-03-02", "user-1")] == 20
+        assert len(data["groups"]) == 6
+
+    def test_hourly_buckets_with_filter(self, client):
+
+        data = client.get("/api/admin/logs/aggregate", params={
+            "group_by": "time", "bucket": "hour", "user_id": "user-0", "since": "2025-03-02"
+        }).json()
+
+        assert data["total"] == 20
+        assert data["groups"][0]["bucket"] == "2025-03-02T00"
+        assert sum(g["count"] for g in data["groups"]) == 20
+
+    def test_invalid_group_by(self, client):
+
+        assert client.get("/api/admin/logs/aggregate", params={"group_by": "metadata"}).status_code == 400
+
+class TestAdminAccess:
+
+    @pytest.fixture
+    def api_user(self):
+
+        return "teacher"
+
+    @pytest.mark.parametrize("path", [
+        "/api/admin/logs",
+        "/api/admin/logs/aggregate?group_by=user_id",
+        "/api/admin/analytics/ingestion",
+        "/api/admin/pipeline/admission"
+    ])
+    def test_non_admins_are_refused(self, client, path):
+
+        assert client.get(path).status_code == 403
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,269 @@
+import threading
+import time
+import pytest
+
+pytest.importorskip("fastapi")
+
+from src.backend.api import process
+from src.backend.services.admission_control import (
+    AdmissionController, QueueFull, estimate_work, whisper_weight, get_admission_controller, set_admission_controller
+)
+from src.backend.services.session_service import SessionService
+from src.backend.utils.config import Config
+
+class BlockingRunner:
+
+    # Pipeline stand-in: each job runs until release(session_id)
+
+    def __init__(self):
+
+        self.started = []
+        self._gates = {}
+        self._lock = threading.Lock()
+
+    def _gate(self, session_id):
+
+        with self._lock:
+            return self._gates.setdefault(session_id, threading.Event())
+
+    def __call__(self, session_id):
+
+        self.started.append(session_id)
+        self._gate(session_id).wait(5)
+
+    def release(self, controller, session_id):
+
+        self._gate(session_id).set()
+        deadline = time.time() + 5
+        while controller.status(session_id) is not None and time.time() < deadline:
+            time.sleep(0.01)
+        assert controller.status(session_id) is None
+
+@pytest.fixture
+def runner():
+
+    runner = BlockingRunner()
+    yield runner
+    for gate in runner._gates.values():
+        gate.set()
+
+class TestWorkEstimate:
+
+    def test_whisper_weights(self):
+
+        assert whisper_weight("tiny") == 0.5
+        assert whisper_weight("medium.en") == 4.0
+        assert whisper_weight("large-v3") == 8.0
+        assert whisper_weight("unknown-model") == 1.0
+
+    def test_work_scales_with_duration_and_models(self, monkeypatch):
+
+        monkeypatch.setattr(Config, "ADAPTIVE_FRAME_SAMPLING", False)
+        monkeypatch.setattr(Config, "ADMISSION_DEFAULT_DURATION_SEC", 600.0)
+
+        short = estimate_work(60, "base")
+        long = estimate_work(3600, "base")
+
+        assert short == 60 * 2 + 60
+        assert long == 3600 * 2 + 60
+        assert estimate_work(60, "large") > estimate_work(60, "base") > estimate_work(60, "base", visual=False)
+        assert estimate_work(None, "base") == 600 * 2 + 60
+
+class TestAdmissionController:
+
+    def test_queues_beyond_capacity_in_order(self, runner):
+
+        controller = AdmissionController(capacity=100, runner=runner, seconds_per_unit=1.0)
+
+        first = controller.submit("a", 60)
+        second = controller.submit("b", 60)
+        third = controller.submit("c", 10)
+
+        assert first["state"] == "running"
+        # "c" would fit but does not overtake "b"
+        assert (second["state"], second["position"]) == ("queued", 1)
+        assert (third["state"], third["position"]) == ("queued", 2)
+        assert 55 <= second["start_in_seconds"] <= 60
+        assert second["eta_seconds"] == pytest.approx(second["start_in_seconds"] + 60, abs=1)
+        assert controller.stats()["used"] == 60
+
+        runner.release(controller, "a")
+
+        assert controller.status("b")["state"] == "running"
+        assert controller.status("c")["state"] == "running"
+        assert runner.started == ["a", "b", "c"]
+
+    def test_resubmit_returns_existing_ticket(self, runner):
+
+        controller = AdmissionController(capacity=100, runner=runner)
+        controller.submit("a", 80)
+        controller.submit("b", 80)
+
+        assert controller.submit("b", 80)["position"] == 1
+        assert controller.stats()["queued"] == 1
+
+    def test_oversized_job_runs_alone(self, runner):
+
+        controller = AdmissionController(capacity=100, runner=runner)
+
+        assert controller.submit("huge", 500)["state"] == "running"
+        assert controller.submit("small", 1)["state"] == "queued"
+
+    def test_full_queue_is_rejected(self, runner):
+
+        controller = AdmissionController(capacity=10, runner=runner, seconds_per_unit=1.0, max_queue=1)
+        controller.submit("a", 10)
+        controller.submit("b", 10)
+
+        with pytest.raises(QueueFull) as error:
+            controller.submit("c", 10)
+        assert 1 <= error.value.retry_after <= 10
+        assert controller.stats()["rejected"] == 1
+
+    def test_heartbeat_while_holding_jobs(self, runner):
+
+        beats = []
+        controller = AdmissionController(
+            capacity=100, runner=runner, owner="worker-a",
+            heartbeat=lambda owner, held: beats.append((owner, held)), heartbeat_interval=0.01
+        )
+        controller.submit("a", 60)
+        controller.submit("b", 60)
+
+        deadline = time.time() + 5
+        while not beats and time.time() < deadline:
+            time.sleep(0.01)
+        assert beats[0] == ("worker-a", ["a", "b"])
+
+        runner.release(controller, "a")
+        runner.release(controller, "b")
+        deadline = time.time() + 5
+        while controller._heartbeat_thread is not None and time.time() < deadline:
+            time.sleep(0.01)
+        assert controller._heartbeat_thread is None
+
+    def test_throughput_is_measured(self, runner):
+
+        controller = AdmissionController(capacity=100, runner=runner, seconds_per_unit=10.0)
+        controller.submit("a", 50)
+        runner.release(controller, "a")
+
+        # The job took far less than the 500 s estimated
+        assert controller.seconds_per_unit < 8.5
+        assert controller.stats()["completed"] == 1
+
+@pytest.fixture
+def api_router():
+
+    return process.router, "/api/process"
+
+@pytest.fixture
+def api_user():
+
+    return "teacher"
+
+@pytest.fixture
+def storage(storage):
+
+    storage.insert("sessions", [
+        {"id": f"s{n}", "user_id": "teacher", "file_url": "", "filename": f"s{n}.mp4", "status": "uploaded", "duration_seconds": 1800.0}
+        for n in range(3)
+    ])
+    return storage
+
+@pytest.fixture
+def client(client, runner):
+
+    set_admission_controller(AdmissionController(capacity=estimate_work(1800.0), runner=runner, max_queue=1))
+    yield client
+    set_admission_controller(None)
+
+class TestProcessEndpoint:
+
+    def test_second_long_video_is_queued_with_eta(self, client):
+
+        first = client.post("/api/process/s0").json()
+        second = client.post("/api/process/s1").json()
+
+        assert first["status"] == "processing_started"
+        assert second["status"] == "queued"
+        assert second["admission"]["position"] == 1
+        assert second["admission"]["eta_seconds"] > second["admission"]["start_in_seconds"] > 0
+
+        status = client.get("/api/process/status/s1").json()
+        assert status["status"] == "queued"
+        assert status["admission"]["state"] == "queued"
+
+        again = client.post("/api/process/s1").json()
+        assert again["status"] == "already_processing"
+
+    def test_full_queue_returns_503_and_keeps_status(self, client):
+
+        client.post("/api/process/s0")
+        client.post("/api/process/s1")
+        response = client.post("/api/process/s2")
+
+        assert response.status_code == 503
+        assert int(response.headers["Retry-After"]) >= 1
+        assert client.get("/api/process/status/s2").json()["status"] == "uploaded"
+
+    def test_queued_session_without_a_job_is_admitted_again(self, client, storage):
+
+        # Left "queued" by an API process that has since restarted
+        storage.update("sessions", {"status": "queued"}, {"id": "s0"})
+
+        response = client.post("/api/process/s0").json()
+
+        assert response["status"] == "processing_started"
+        assert get_admission_controller().status("s0")["state"] == "running"
+
+    def test_second_worker_leaves_a_held_session_alone(self, client, storage, runner, monkeypatch):
+
+        monkeypatch.setattr(Config, "ADMISSION_STALE_SEC", 60.0)
+        worker_a = get_admission_controller()
+        assert client.post("/api/process/s0").json()["status"] == "processing_started"
+
+        # The next request lands on another worker with its own queue
+        worker_b = AdmissionController(capacity=estimate_work(1800.0), runner=runner, max_queue=1)
+        set_admission_controller(worker_b)
+
+        assert client.post("/api/process/s0").json()["status"] == "already_processing"
+        assert client.post("/api/process/restart/s0").status_code == 409
+        assert runner.started == ["s0"]
+        assert worker_b.status("s0") is None
+
+        # Worker A stops sending heartbeats: its claim goes stale
+        storage.update("sessions", {"admission_heartbeat_at": "2000-01-01T00:00:00"}, {"id": "s0"})
+
+        assert client.post("/api/process/s0").json()["status"] == "processing_started"
+        assert runner.started == ["s0", "s0"]
+        assert storage.select_one("sessions", filters={"id": "s0"})["admission_owner"] == worker_b.owner
+
+        # A's heartbeats no longer refresh a session B has taken over
+        SessionService.touch_admissions(worker_a.owner, ["s0"])
+        assert storage.select_one("sessions", filters={"id": "s0"})["admission_owner"] == worker_b.owner
+
+    def test_concurrent_claims_admit_once(self, client, storage):
+
+        session = storage.select_one("sessions", filters={"id": "s0"})
+
+        assert SessionService.claim_admission(session, "worker-a") is True
+        assert SessionService.claim_admission(session, "worker-b") is False
+
+    def test_restart_is_rejected_while_running(self, client, storage, runner):
+
+        client.post("/api/process/s0")
+        storage.insert("reports", {"id": "r0", "session_id": "s0", "summary": "from this run"})
+
+        response = client.post("/api/process/restart/s0")
+
+        assert response.status_code == 409
+        assert storage.select_one("reports", filters={"id": "r0"}) is not None
+
+        runner.release(get_admission_controller(), "s0")
+
+        assert client.post("/api/process/restart/s0").json()["status"] == "restarted"
+        assert storage.select_one("reports", filters={"id": "r0"}) is None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,126 @@
+import threading
+import time
+import pytest
+from src.backend.services.analytics_service import AnalyticsEventBuffer, AnalyticsService, set_event_buffer
+from src.backend.utils.config import Config
+
+@pytest.fixture
+def storage(storage):
+
+    yield storage
+    set_event_buffer(None)
+
+def event(n):
+
+    return {"event_name": "results_viewed", "user_id": "user-1", "metadata": {"n": n}, "timestamp": f"2025-01-01T00:00:{n:02d}"}
+
+def wait_for(condition, timeout=2.0):
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+class TestAnalyticsEventBuffer:
+
+    def test_full_batch_is_written_in_one_insert(self, storage):
+
+        buffer = AnalyticsEventBuffer(batch_size=5, flush_interval=60)
+        for n in range(5):
+            buffer.add(event(n))
+
+        assert wait_for(lambda: buffer.stats()["written"] == 5)
+        assert buffer.stats()["batches"] == 1
+        assert len(storage.select("analytics_events")) == 5
+        buffer.shutdown()
+
+    def test_partial_batch_is_written_after_interval(self, storage):
+
+        buffer = AnalyticsEventBuffer(batch_size=100, flush_interval=0.05)
+        buffer.add(event(1))
+
+        assert wait_for(lambda: buffer.stats()["written"] == 1)
+        assert storage.select_one("analytics_events")["metadata"] == {"n": 1}
+        buffer.shutdown()
+
+    def test_overflow_is_bounded_and_counted(self, storage, monkeypatch):
+
+        release = threading.Event()
+        insert = storage.insert
+
+        def slow_insert(table, rows):
+
+            release.wait(2)
+            return insert(table, rows)
+
+        monkeypatch.setattr(storage, "insert", slow_insert)
+
+        buffer = AnalyticsEventBuffer(batch_size=4, flush_interval=60, max_events=8)
+        for n in range(4):
+            buffer.add(event(n))
+        # The flusher now holds the first batch inside the blocked insert
+        assert wait_for(lambda: buffer.stats()["queued"] == 0)
+
+        results = [buffer.add(event(n)) for n in range(4, 16)]
+        release.set()
+        buffer.shutdown()
+
+        assert results.count(False) == 4
+        assert buffer.stats() == {"queued": 0, "recorded": 12, "written": 12, "batches": 3, "overflowed": 4, "dropped": 0}
+
+    def test_failed_insert_is_dropped(self, storage, monkeypatch):
+
+        def failing_insert(table, rows):
+
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(storage, "insert", failing_insert)
+
+        buffer = AnalyticsEventBuffer(batch_size=3, flush_interval=60)
+        for n in range(3):
+            buffer.add(event(n))
+
+        assert wait_for(lambda: buffer.stats()["dropped"] == 3)
+        buffer.shutdown()
+
+    def test_shutdown_flushes_remaining_events(self, storage):
+
+        buffer = AnalyticsEventBuffer(batch_size=100, flush_interval=60)
+        for n in range(7):
+            buffer.add(event(n))
+        buffer.shutdown()
+
+        assert len(storage.select("analytics_events")) == 7
+        assert buffer.add(event(8)) is False
+
+class TestRecordEvent:
+
+    def test_record_event_is_buffered(self, storage, monkeypatch):
+
+        monkeypatch.setattr(Config, "ANALYTICS_ASYNC", True)
+        buffer = AnalyticsEventBuffer(batch_size=1000, flush_interval=60, max_events=5000)
+        set_event_buffer(buffer)
+
+        start = time.perf_counter()
+        for n in range(1000):
+            assert AnalyticsService.record_event("results_viewed", session_id="s1", user_id="user-1", metadata={"n": n})
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+
+        buffer.shutdown()
+        rows = storage.select("analytics_events", order_by="timestamp")
+        assert len(rows) == 1000
+        assert AnalyticsService.get_ingestion_stats()["written"] == 1000
+
+    def test_inline_mode_writes_immediately(self, storage, monkeypatch):
+
+        monkeypatch.setattr(Config, "ANALYTICS_ASYNC", False)
+
+        assert AnalyticsService.record_event("upload_started", user_id="user-1")
+        assert storage.select_one("analytics_events", {"event_name": "upload_started"})["user_id"] == "user-1"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
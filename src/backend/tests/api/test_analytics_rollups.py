@@ -0,0 +1,156 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from src.backend.api import analytics_api
+from src.backend.services.analytics_rollup_service import AnalyticsRollupService
+from src.backend.services.session_service import SessionService
+
+USER = "user-1"
+
+def add_session(storage, session_id, created_at, user_id=USER, status="processing"):
+
+    storage.insert("sessions", {
+        "id": session_id, "user_id": user_id, "file_url": "x", "filename": f"{session_id}.mp4",
+        "status": status, "created_at": created_at
+    })
+
+def scores(mentor, engagement=5.0):
+
+    return {
+        "mentor_score": mentor,
+        "engagement": engagement,
+        "communication_clarity": 6.0,
+        "technical_correctness": 7.0,
+        "pacing_structure": 8.0
+    }
+
+@pytest.fixture
+def api_router():
+
+    return analytics_api.router, "/api"
+
+def complete(storage, count):
+
+    for n in range(count):
+        add_session(storage, f"s{n}", f"2025-01-{n + 1:02d}T10:00:00")
+        SessionService.mark_session_completed(f"s{n}", scores(float(n + 1)))
+
+def comparable(rollup):
+
+    keys = ("completed_sessions", "metric_sums", "metric_counts", "score_distribution", "score_history", "first_score", "latest_score")
+    return {k: rollup[k] for k in keys}
+
+class TestAnalyticsRollups:
+
+    def test_incremental_rollup_matches_rebuild(self, storage):
+
+        complete(storage, 12)
+
+        incremental = AnalyticsRollupService.get_rollup(USER)
+        rebuilt = AnalyticsRollupService.rebuild(USER)
+
+        assert comparable(incremental) == comparable(rebuilt)
+        assert incremental["completed_sessions"] == 12
+        assert incremental["metric_sums"]["mentor_score"] == sum(range(1, 13))
+        assert len(incremental["score_history"]) == 10
+        assert incremental["score_history"][-1]["date"] == "2025-01-12"
+
+    def test_rerun_replaces_previous_scores(self, storage):
+
+        complete(storage, 3)
+        SessionService.mark_session_completed("s1", scores(9.5))
+
+        rollup = AnalyticsRollupService.get_rollup(USER)
+
+        assert rollup["completed_sessions"] == 3
+        assert rollup["metric_sums"]["mentor_score"] == pytest.approx(1 + 9.5 + 3)
+        assert rollup["score_distribution"] == {"0-2": 1, "2-4": 1, "4-6": 0, "6-8": 0, "8-10": 1}
+        assert [h["score"] for h in rollup["score_history"]] == [1.0, 9.5, 3.0]
+
+    def test_failed_rerun_and_restart_retract_scores(self, storage):
+
+        complete(storage, 3)
+        SessionService.mark_session_completed("s2", {"error": "boom"})
+        AnalyticsRollupService.retract_session(SessionService.get_session("s0"))
+
+        rollup = AnalyticsRollupService.get_rollup(USER)
+
+        assert rollup["completed_sessions"] == 1
+        assert rollup["metric_sums"]["mentor_score"] == pytest.approx(2.0)
+        assert [h["session_id"] for h in rollup["score_history"]] == ["s1"]
+
+    def test_retract_keeps_first_score_and_history_window(self, storage):
+
+        complete(storage, 12)
+        for session_id in ("s0", "s11"):
+            # As a restart does: retract, then reset the session
+            AnalyticsRollupService.retract_session(SessionService.get_session(session_id))
+            storage.update("sessions", {"status": "queued", "completion_metadata": None}, {"id": session_id})
+
+        rollup = AnalyticsRollupService.get_rollup(USER)
+
+        assert rollup["first_score"] == 2.0
+        assert [h["session_id"] for h in rollup["score_history"]] == [f"s{n}" for n in range(1, 11)]
+
+    def test_concurrent_update_is_not_lost(self, storage):
+
+        complete(storage, 2)
+        add_session(storage, "s2", "2025-01-03T10:00:00")
+        add_session(storage, "s3", "2025-01-04T10:00:00")
+        original_load = AnalyticsRollupService._load
+        raced = []
+
+        def load(user_id):
+            row = original_load(user_id)
+            if not raced:
+                # Another worker completes s3 between this read and the write
+                raced.append(True)
+                SessionService.mark_session_completed("s3", scores(4.0))
+            return row
+
+        AnalyticsRollupService._load = staticmethod(load)
+        try:
+            SessionService.mark_session_completed("s2", scores(3.0))
+        finally:
+            AnalyticsRollupService._load = staticmethod(original_load)
+
+        rollup = AnalyticsRollupService.get_rollup(USER)
+        assert rollup["completed_sessions"] == 4
+        assert rollup["metric_sums"]["mentor_score"] == pytest.approx(1 + 2 + 3 + 4)
+
+    def test_existing_users_are_seeded_from_final_scores(self, storage):
+
+        add_session(storage, "old", "2024-05-01T10:00:00", status="complete")
+        storage.insert("final_scores", {"session_id": "old", **scores(7.0)})
+
+        rollup = AnalyticsRollupService.get_rollup(USER)
+
+        assert rollup["metric_counts"]["mentor_score"] == 1
+        assert storage.select_one("user_analytics_rollups", {"user_id": USER}) is not None
+
+class TestDashboardEndpoint:
+
+    def test_dashboard_from_rollup(self, client, storage):
+
+        complete(storage, 4)
+        add_session(storage, "running", "2025-02-01T10:00:00")
+        add_session(storage, "other-user", "2025-02-01T10:00:00", user_id="someone-else")
+
+        data = client.get("/api/analytics/dashboard").json()
+
+        assert data["summary"]["total_sessions"] == 5
+        assert data["summary"]["completed_sessions"] == 4
+        assert data["summary"]["processing_sessions"] == 1
+        assert data["summary"]["avg_mentor_score"] == 2.5
+        assert data["summary"]["avg_pacing"] == 8.0
+        assert data["summary"]["improvement_percent"] == 300.0
+        assert data["score_distribution"] == {"0-2": 1, "2-4": 2, "4-6": 1, "6-8": 0, "8-10": 0}
+        assert data["score_history"] == [
+            {"date": f"2025-01-0{n}", "score": float(n)} for n in range(1, 5)
+        ]
+        assert [s["id"] for s in data["recent_sessions"]] == ["running", "s3", "s2", "s1", "s0"]
+        assert data["recent_sessions"][1]["mentor_score"] == 4.0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
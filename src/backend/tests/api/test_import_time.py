@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+pytest.importorskip("fastapi")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+HEAVY_MODULES = [
+    "mediapipe",
+    "cv2",
+    "whisper",
+    "torch",
+    "librosa",
+    "reportlab",
+    "google.generativeai",
+    "pydub",
+    "supabase"
+]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import src.backend.main
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+@pytest.fixture(scope="module")
+def import_profile(tmp_path_factory):
+
+    data_dir = tmp_path_factory.mktemp("data")
+    env = {k: v for k, v in os.environ.items() if not k.startswith("SUPABASE_")}
+    env.update({
+        "STORAGE_BACKEND": "sqlite",
+        "SQLITE_PATH": str(data_dir / "test.db"),
+        "LOCAL_STORAGE_DIR": str(data_dir / "storage")
+    })
+
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+class TestImportTime:
+
+    def test_heavy_modules_not_loaded(self, import_profile):
+
+        loaded = set(import_profile["modules"])
+        assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+    def test_import_within_budget(self, import_profile):
+
+        budget = float(os.getenv("IMPORT_TIME_BUDGET", "1.5"))
+        assert import_profile["elapsed"] < budget
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
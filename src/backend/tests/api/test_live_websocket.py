@@ -0,0 +1,127 @@
+import json
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("websockets")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from src.backend.api import live_analysis
+from src.backend.pipelines.live import LiveFrameScheduler, rgb_frame_from_bytes
+from src.backend.services import user_service
+from src.backend.utils.config import Config
+
+class FakeTracker:
+
+    def analyze_bytes(self, data):
+
+        if data == b"bad":
+            return None
+        return {"eye_contact": True, "gestures": len(data), "face_detected": True, "pose_score": 0.0}
+
+    def analyze_rgb_bytes(self, data, width, height):
+
+        frame = rgb_frame_from_bytes(data, width, height)
+        if frame is None:
+            return None
+        return {"eye_contact": False, "gestures": 0, "face_detected": True, "pose_score": float(frame.shape[1])}
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def client():
+
+    scheduler = LiveFrameScheduler(FakeTracker, max_workers=1, max_clients=4)
+    live_analysis.set_live_scheduler(scheduler)
+
+    app = FastAPI()
+    app.include_router(live_analysis.router, prefix="/api/live")
+
+    yield TestClient(app)
+
+    scheduler.shutdown()
+    live_analysis.set_live_scheduler(None)
+
+class TestLiveWebSocket:
+
+    def test_binary_frame_round_trip(self, client):
+
+        with client.websocket_connect("/api/live/ws?client_id=abc") as ws:
+            ws.send_bytes(b"\xff\xd8jpeg")
+            result = json.loads(ws.receive_text())
+
+        assert result["seq"] == 1
+        assert result["gestures"] == 6
+        assert "latency_ms" in result
+
+    def test_raw_rgb_frames(self, client):
+
+        with client.websocket_connect("/api/live/ws?format=rgb&width=4&height=2") as ws:
+            ws.send_bytes(bytes(4 * 2 * 3))
+            result = json.loads(ws.receive_text())
+
+        assert result["pose_score"] == 4.0
+
+    def test_invalid_frame_reports_defaults(self, client):
+
+        with client.websocket_connect("/api/live/ws") as ws:
+            ws.send_bytes(b"bad")
+            result = json.loads(ws.receive_text())
+
+        assert result["invalid"] is True
+        assert result["face_detected"] is False
+
+    def test_rgb_requires_dimensions(self, client):
+
+        with client.websocket_connect("/api/live/ws?format=rgb") as ws:
+            with pytest.raises(WebSocketDisconnect) as exc:
+                ws.receive_text()
+
+        assert exc.value.code == 1003
+
+    def test_tracker_released_on_disconnect(self, client):
+
+        with client.websocket_connect("/api/live/ws?client_id=abc") as ws:
+            ws.send_bytes(b"frame")
+            ws.receive_text()
+
+        assert live_analysis.get_live_scheduler().client_count == 0
+
+    def test_unauthenticated_stream_refused(self, client, monkeypatch):
+
+        monkeypatch.setattr(user_service, "DEV_MODE", False)
+
+        with client.websocket_connect("/api/live/ws?client_id=abc") as ws:
+            with pytest.raises(WebSocketDisconnect) as exc:
+                ws.receive_text()
+
+        assert exc.value.code == 1008
+        assert live_analysis.get_live_scheduler().client_count == 0
+
+class TestLiveClientEndpoints:
+
+    def test_clients_are_keyed_by_user(self, client):
+
+        scheduler = live_analysis.get_live_scheduler()
+        with client.websocket_connect("/api/live/ws?client_id=abc&user_id=alice") as ws:
+            ws.send_bytes(b"frame")
+            ws.receive_text()
+
+            assert client.get("/api/live/clients/abc/stats", headers={"X-User-ID": "alice"}).status_code == 200
+            assert client.get("/api/live/clients/abc/stats", headers={"X-User-ID": "bob"}).status_code == 404
+
+            released = client.delete("/api/live/clients/abc", headers={"X-User-ID": "bob"}).json()
+            assert released["released"] is False
+            assert scheduler.client_count == 1
+
+    def test_stats_require_admin(self, client, monkeypatch):
+
+        monkeypatch.setattr(Config, "ADMIN_USER_IDS", {"admin"})
+
+        assert client.get("/api/live/stats", headers={"X-User-ID": "alice"}).status_code == 403
+        assert client.get("/api/live/stats", headers={"X-User-ID": "admin"}).json()["active_clients"] == 0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
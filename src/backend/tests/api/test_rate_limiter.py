@@ -0,0 +1,161 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.backend.middleware.rate_limit_store import MemoryRateLimitStore, SQLiteRateLimitStore
+from src.backend.middleware.rate_limiter import RateLimitMiddleware, RateLimitRule
+from src.backend.utils.config import Config
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+
+    if request.param == "memory":
+        yield MemoryRateLimitStore()
+    else:
+        store = SQLiteRateLimitStore(str(tmp_path / "rate_limits.db"))
+        yield store
+        store.close()
+
+def make_client(store, limit=3):
+
+    app = FastAPI()
+
+    @app.post("/api/upload/")
+    def upload():
+        return {"ok": True}
+
+    @app.get("/api/sessions/list")
+    def sessions():
+        return []
+
+    app.add_middleware(RateLimitMiddleware, store=store, rules=[RateLimitRule("upload", "POST", "/api/upload", limit)], enabled=True)
+    return TestClient(app)
+
+class TestTokenBucket:
+
+    def test_burst_then_refill(self, store):
+
+        results = [store.take("k", rate=1.0, capacity=3, now=100.0)[0] for _ in range(4)]
+        assert results == [True, True, True, False]
+
+        assert store.take("k", rate=1.0, capacity=3, now=101.5) == (True, pytest.approx(0.5))
+        assert store.take("k", rate=1.0, capacity=3, now=101.6)[0] is False
+        assert store.take("k", rate=1.0, capacity=3, now=200.0) == (True, 2.0)
+
+    def test_memory_store_evicts_least_recently_used(self):
+
+        store = MemoryRateLimitStore(max_keys=2)
+        store.take("a", 1.0, 1, now=0.0)
+        store.take("b", 1.0, 1, now=0.0)
+        store.take("a", 1.0, 1, now=0.0)
+        store.take("c", 1.0, 1, now=0.0)
+
+        assert len(store) == 2
+        # "b" was evicted and starts again from a full bucket
+        assert store.take("b", 1.0, 1, now=0.0)[0] is True
+        assert store.take("c", 1.0, 1, now=0.0)[0] is False
+
+    def test_sqlite_store_is_shared_and_pruned(self, tmp_path):
+
+        path = str(tmp_path / "shared.db")
+        worker_a = SQLiteRateLimitStore(path, prune_every=2)
+        worker_b = SQLiteRateLimitStore(path, prune_every=2)
+
+        assert worker_a.take("user", 1.0, 1, now=0.0)[0] is True
+        assert worker_b.take("user", 1.0, 1, now=0.0)[0] is False
+
+        # Second take of worker_a prunes buckets that have refilled
+        worker_a.take("other", 1.0, 1, now=5.0)
+        rows = worker_a._conn.execute("SELECT key FROM rate_limit_buckets").fetchall()
+        assert sorted(r[0] for r in rows) == ["other"]
+
+        worker_a.close()
+        worker_b.close()
+
+    def test_take_all_deducts_only_when_every_bucket_allows(self, store):
+
+        store.take("user", 1.0, 2, now=0.0)
+        store.take("user", 1.0, 2, now=0.0)
+
+        assert store.take_all(["ip", "user"], 1.0, 2, now=0.0) == (False, 0.0)
+        # The denied request left the address bucket full
+        assert store.take_all(["ip", "other"], 1.0, 2, now=0.0) == (True, 1.0)
+
+class TestRateLimitMiddleware:
+
+    def test_headers_and_429(self, store):
+
+        client = make_client(store, limit=2)
+
+        first = client.post("/api/upload/")
+        assert first.status_code == 200
+        assert first.headers["RateLimit-Limit"] == "2"
+        assert first.headers["RateLimit-Remaining"] == "1"
+        assert first.headers["RateLimit-Policy"] == "2;w=60"
+
+        client.post("/api/upload/")
+        blocked = client.post("/api/upload/")
+        assert blocked.status_code == 429
+        assert blocked.headers["RateLimit-Remaining"] == "0"
+        assert 1 <= int(blocked.headers["Retry-After"]) <= 30
+
+    def test_unmatched_requests_pass_through(self, store):
+
+        client = make_client(store, limit=1)
+
+        for _ in range(5):
+            response = client.get("/api/sessions/list")
+            assert response.status_code == 200
+            assert "RateLimit-Limit" not in response.headers
+
+    def test_users_behind_one_address_share_its_bucket(self, store):
+
+        client = make_client(store, limit=2)
+
+        assert client.post("/api/upload/", headers={"X-User-ID": "a"}).status_code == 200
+        assert client.post("/api/upload/", headers={"X-User-ID": "b"}).status_code == 200
+        assert client.post("/api/upload/", headers={"X-User-ID": "c"}).status_code == 429
+
+    def test_user_limit_holds_across_addresses(self, store, monkeypatch):
+
+        monkeypatch.setattr(Config, "RATE_LIMIT_TRUST_PROXY", True)
+        client = make_client(store, limit=2)
+        token = {"Authorization": "Bearer some.jwt.token"}
+
+        codes = [
+            client.post("/api/upload/", headers={**token, "X-Forwarded-For": f"10.0.0.{n}"}).status_code
+            for n in range(3)
+        ]
+        other = client.post("/api/upload/", headers={"Authorization": "Bearer other.token", "X-Forwarded-For": "10.0.0.9"})
+
+        assert codes == [200, 200, 429]
+        assert other.status_code == 200
+
+    def test_request_denied_for_its_user_costs_the_address_nothing(self, store, monkeypatch):
+
+        monkeypatch.setattr(Config, "RATE_LIMIT_TRUST_PROXY", True)
+        client = make_client(store, limit=2)
+        token = {"Authorization": "Bearer some.jwt.token"}
+
+        client.post("/api/upload/", headers={**token, "X-Forwarded-For": "10.0.0.1"})
+        client.post("/api/upload/", headers={**token, "X-Forwarded-For": "10.0.0.1"})
+        assert client.post("/api/upload/", headers={**token, "X-Forwarded-For": "10.0.0.2"}).status_code == 429
+
+        codes = [client.post("/api/upload/", headers={"X-Forwarded-For": "10.0.0.2"}).status_code for _ in range(2)]
+        assert codes == [200, 200]
+
+    def test_store_errors_fail_open(self):
+
+        class BrokenStore(MemoryRateLimitStore):
+
+            def take_all(self, *args, **kwargs):
+                raise ConnectionError("store unavailable")
+
+        client = make_client(BrokenStore(), limit=1)
+
+        assert [client.post("/api/upload/").status_code for _ in range(3)] == [200, 200, 200]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
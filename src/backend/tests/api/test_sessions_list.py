@@ -0,0 +1,82 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from src.backend.api import sessions_api
+from src.backend.services.session_service import SessionService
+
+USER = "user-1"
+
+@pytest.fixture
+def api_router():
+
+    return sessions_api.router, "/api/sessions"
+
+@pytest.fixture
+def storage(storage):
+
+    # 25 sessions over 5 timestamps, so pages break inside groups of ties
+    sessions = [
+        {
+            "id": f"s{n:02d}", "user_id": USER, "file_url": "x", "filename": f"lecture-{n}.mp4",
+            "status": "complete" if n % 2 else "processing",
+            "created_at": f"2025-01-0{n // 5 + 1}T10:00:00",
+            "completion_metadata": {"mentor_score": 1.0, "pipeline_stages": {"total_time_sec": 1.0}}
+        }
+        for n in range(25)
+    ]
+    sessions.append({"id": "other", "user_id": "someone-else", "file_url": "x", "filename": "other.mp4", "status": "complete"})
+    storage.insert("sessions", sessions)
+    storage.insert("final_scores", [{"session_id": s["id"], "mentor_score": int(s["id"][1:]) / 4} for s in sessions[:25] if s["status"] == "complete"])
+    return storage
+
+def walk(client, **params):
+
+    ids, cursor, pages = [], None, 0
+    while True:
+        data = client.get("/api/sessions/list", params={**params, **({"cursor": cursor} if cursor else {})}).json()
+        ids += [s["id"] for s in data["sessions"]]
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+class TestSessionList:
+
+    def test_pages_cover_every_session_once_in_order(self, client):
+
+        ids, pages = walk(client, limit=7)
+
+        assert ids == sorted((f"s{n:02d}" for n in range(25)), reverse=True)
+        assert pages == 4
+
+    def test_oldest_first_with_status_filter(self, client):
+
+        ids, _ = walk(client, limit=4, order="asc", status="complete")
+
+        assert ids == [f"s{n:02d}" for n in range(1, 25, 2)]
+
+    def test_summary_shape(self, client):
+
+        session = client.get("/api/sessions/list", params={"limit": 2}).json()["sessions"][0]
+
+        assert session == {
+            "id": "s24", "filename": "lecture-24.mp4", "status": "processing",
+            "created_at": "2025-01-05T10:00:00", "mentor_score": None
+        }
+        assert client.get("/api/sessions/list", params={"limit": 2}).json()["sessions"][1]["mentor_score"] == 5.75
+
+    def test_invalid_cursor(self, client):
+
+        assert client.get("/api/sessions/list", params={"cursor": "not-a-cursor"}).status_code == 400
+        assert client.get("/api/sessions/list", params={"limit": 0}).status_code == 422
+
+    def test_service_clamps_limit(self, storage):
+
+        page = SessionService.list_sessions(USER, limit=10_000)
+
+        assert len(page["sessions"]) == 25
+        assert page["next_cursor"] is None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
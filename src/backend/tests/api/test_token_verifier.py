@@ -0,0 +1,185 @@
+import threading
+import time
+import pytest
+
+jwt = pytest.importorskip("jwt")
+pytest.importorskip("cryptography")
+
+from cryptography.hazmat.primitives.asymmetric import ec
+from starlette.requests import Request
+from src.backend.services.token_verifier import TokenVerifier, set_token_verifier
+from src.backend.services.user_service import UserService
+
+SECRET = "super-secret-jwt-token-with-at-least-32-characters"
+ISSUER = "https://project.supabase.co/auth/v1"
+
+def make_token(key=SECRET, alg="HS256", kid=None, sub="user-1", exp_in=3600, aud="authenticated", iss=ISSUER):
+
+    claims = {"sub": sub, "aud": aud, "iss": iss, "exp": int(time.time()) + exp_in, "role": "authenticated"}
+    return jwt.encode(claims, key, algorithm=alg, headers={"kid": kid} if kid else None)
+
+class RemoteAuth:
+
+    def __init__(self, user_id="remote-user"):
+
+        self.user_id = user_id
+        self.calls = 0
+
+    def __call__(self, token):
+
+        self.calls += 1
+        return self.user_id
+
+class JWKS:
+
+    def __init__(self):
+
+        self.keys = {}
+        self.fetches = 0
+
+    def add(self, kid):
+
+        private = ec.generate_private_key(ec.SECP256R1())
+        jwk = jwt.algorithms.ECAlgorithm.to_jwk(private.public_key(), as_dict=True)
+        self.keys[kid] = {**jwk, "kid": kid, "alg": "ES256", "use": "sig"}
+        return private
+
+    def __call__(self, url):
+
+        self.fetches += 1
+        return {"keys": list(self.keys.values())}
+
+class TestTokenVerifier:
+
+    def test_hs256_is_verified_locally_and_cached(self):
+
+        remote = RemoteAuth()
+        verifier = TokenVerifier(secret=SECRET, issuer=ISSUER, remote_verify=remote)
+        token = make_token()
+
+        assert verifier.verify(token) == "user-1"
+        assert verifier.verify(token) == "user-1"
+        assert remote.calls == 0
+        assert verifier.stats() == {"cached_tokens": 1, "hits": 1, "local": 1, "remote": 0}
+
+    @pytest.mark.parametrize("token", [
+        make_token(exp_in=-10),
+        make_token(key="another-secret-that-is-also-long-enough-1234"),
+        make_token(aud="anon"),
+        make_token(iss="https://other.supabase.co/auth/v1"),
+        "not-a-jwt"
+    ])
+    def test_invalid_tokens_are_rejected_without_remote_call(self, token):
+
+        remote = RemoteAuth()
+        verifier = TokenVerifier(secret=SECRET, issuer=ISSUER, remote_verify=remote)
+
+        with pytest.raises(ValueError):
+            verifier.verify(token)
+        assert remote.calls == 0
+
+    def test_cache_entries_do_not_outlive_the_token(self):
+
+        verifier = TokenVerifier(secret=SECRET, issuer=ISSUER, cache_ttl=600)
+        token = make_token(exp_in=5)
+        verifier.verify(token)
+
+        (_, expires_at), = verifier._tokens.values()
+        assert expires_at <= time.time() + 5
+
+    def test_jwks_is_fetched_once_and_refreshed_for_new_keys(self):
+
+        jwks = JWKS()
+        first = jwks.add("key-1")
+        remote = RemoteAuth()
+        verifier = TokenVerifier(jwks_url="https://jwks", issuer=ISSUER, fetch_jwks=jwks, remote_verify=remote, jwks_min_refresh=0)
+
+        assert verifier.verify(make_token(first, "ES256", "key-1", sub="a")) == "a"
+        assert verifier.verify(make_token(first, "ES256", "key-1", sub="b")) == "b"
+        assert jwks.fetches == 1
+
+        # Key rotation: an unknown kid triggers one refetch
+        second = jwks.add("key-2")
+        assert verifier.verify(make_token(second, "ES256", "key-2", sub="c")) == "c"
+        assert jwks.fetches == 2
+        assert remote.calls == 0
+
+    def test_unknown_kid_is_rejected_once_jwks_has_loaded(self):
+
+        jwks = JWKS()
+        first = jwks.add("key-1")
+        remote = RemoteAuth()
+        verifier = TokenVerifier(jwks_url="https://jwks", issuer=ISSUER, fetch_jwks=jwks, remote_verify=remote)
+        verifier.verify(make_token(first, "ES256", "key-1"))
+
+        # Within jwks_min_refresh of the last fetch: no refetch, no remote call
+        forged = ec.generate_private_key(ec.SECP256R1())
+        with pytest.raises(ValueError, match="Unknown signing key"):
+            verifier.verify(make_token(forged, "ES256", "key-9"))
+        assert jwks.fetches == 1
+        assert remote.calls == 0
+
+    def test_jwks_fetch_does_not_block_known_keys(self):
+
+        jwks = JWKS()
+        first = jwks.add("key-1")
+        gate = threading.Event()
+        fetching = threading.Event()
+
+        def slow_fetch(url):
+            if jwks.fetches:
+                fetching.set()
+                gate.wait(5)
+            return jwks(url)
+
+        verifier = TokenVerifier(jwks_url="https://jwks", issuer=ISSUER, fetch_jwks=slow_fetch, remote_verify=RemoteAuth())
+        verifier.verify(make_token(first, "ES256", "key-1", sub="a"))
+        verifier.jwks_ttl = 0
+
+        refresh = threading.Thread(target=verifier.verify, args=(make_token(first, "ES256", "key-1", sub="b"),))
+        refresh.start()
+        assert fetching.wait(5)
+
+        # Served from the loaded keys while the refresh is in flight
+        assert verifier.verify(make_token(first, "ES256", "key-1", sub="c")) == "c"
+
+        gate.set()
+        refresh.join(5)
+        assert jwks.fetches == 2
+
+    def test_remote_rejections_are_remembered(self):
+
+        remote = RemoteAuth(user_id=None)
+        verifier = TokenVerifier(remote_verify=remote, reject_ttl=30)
+        token = make_token()
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                verifier.verify(token)
+        assert remote.calls == 1
+
+    def test_falls_back_to_remote_without_key_material(self):
+
+        remote = RemoteAuth()
+        verifier = TokenVerifier(remote_verify=remote)
+        token = make_token()
+
+        assert verifier.verify(token) == "remote-user"
+        assert verifier.verify(token) == "remote-user"
+        assert remote.calls == 1
+
+class TestUserServiceAuth:
+
+    def test_bearer_token_resolves_through_verifier(self):
+
+        set_token_verifier(TokenVerifier(secret=SECRET, issuer=ISSUER, remote_verify=RemoteAuth()))
+        token = make_token(sub="teacher-7")
+        request = Request({"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())]})
+
+        try:
+            assert UserService.get_user_id(request) == "teacher-7"
+        finally:
+            set_token_verifier(None)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
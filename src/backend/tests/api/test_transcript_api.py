@@ -0,0 +1,156 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from src.backend.api import results_api
+from src.backend.services.transcript_service import TranscriptService
+
+OWNER = "user-1"
+
+def make_segments(count, length=4.0):
+
+    return [
+        {"start": i * length, "end": (i + 1) * length - 0.5, "text": f"segment {i} has five words"}
+        for i in range(count)
+    ]
+
+@pytest.fixture
+def api_router():
+
+    return results_api.router, "/api/results"
+
+@pytest.fixture
+def api_user():
+
+    return lambda request: request.headers.get("X-User-ID", OWNER)
+
+@pytest.fixture
+def storage(storage):
+
+    for session_id in ("s1", "legacy"):
+        storage.insert("sessions", {
+            "id": session_id, "user_id": OWNER, "file_url": "x", "filename": "talk.mp4", "status": "complete"
+        })
+    return storage
+
+class TestTranscriptStorage:
+
+    def test_segments_stored_as_rows(self, storage):
+
+        TranscriptService.save_transcript("s1", "full text", make_segments(3))
+
+        rows = storage.select("transcript_segments", {"session_id": "s1"}, order_by="seq")
+        transcript = TranscriptService.get_transcript("s1")
+
+        assert [r["seq"] for r in rows] == [0, 1, 2]
+        assert rows[1]["start_time"] == 4.0
+        assert rows[1]["word_count"] == 5
+        assert transcript["raw_text"] == "full text"
+        assert transcript["segments"] == [{"start": s["start"], "end": s["end"], "text": s["text"]} for s in make_segments(3)]
+
+    def test_keyset_pages_cover_every_segment(self, storage):
+
+        TranscriptService.save_transcript("s1", "full text", make_segments(25))
+
+        seqs, cursor = [], None
+        while True:
+            page = TranscriptService.get_segments("s1", cursor=cursor, limit=10)
+            seqs.extend(s["seq"] for s in page["segments"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seqs == list(range(25))
+
+    def test_time_range_returns_overlapping_segments(self, storage):
+
+        TranscriptService.save_transcript("s1", "full text", make_segments(10))
+
+        page = TranscriptService.get_segments("s1", start=9.0, end=16.0)
+
+        # Segment 1 ends at 7.5, segment 4 starts at 16.0
+        assert [s["seq"] for s in page["segments"]] == [2, 3]
+        assert page["next_cursor"] is None
+
+    def test_summary(self, storage):
+
+        TranscriptService.save_transcript("s1", "full text", make_segments(6))
+
+        assert TranscriptService.get_transcript_summary("s1") == {
+            "segment_count": 6, "duration_seconds": 23.5, "word_count": 30
+        }
+        assert TranscriptService.get_transcript_summary("missing") is None
+
+    def test_summary_counts_stored_on_transcript(self, storage):
+
+        TranscriptService.save_transcript("s1", "full text", make_segments(6))
+
+        # Summaries come from the transcripts row, not the segments
+        storage.delete("transcript_segments", {"session_id": "s1"})
+        assert TranscriptService.get_transcript_summary("s1")["word_count"] == 30
+
+    def test_summary_backfilled_for_older_rows(self, storage):
+
+        TranscriptService.save_transcript("s1", "full text", make_segments(6))
+        storage.update("transcripts", {"segment_count": None, "word_count": None, "duration_seconds": None}, {"session_id": "s1"})
+
+        assert TranscriptService.get_transcript_summary("s1") == {
+            "segment_count": 6, "duration_seconds": 23.5, "word_count": 30
+        }
+        assert storage.select_one("transcripts", {"session_id": "s1"})["segment_count"] == 6
+
+    def test_full_transcript_read_in_pages(self, storage, monkeypatch):
+
+        from src.backend.services import transcript_service
+        monkeypatch.setattr(transcript_service, "MAX_SEGMENT_PAGE_SIZE", 4)
+        TranscriptService.save_transcript("s1", "full text", make_segments(10))
+
+        segments = TranscriptService.get_transcript("s1")["segments"]
+
+        assert [s["start"] for s in segments] == [i * 4.0 for i in range(10)]
+
+    def test_legacy_json_segments(self, storage):
+
+        storage.insert("transcripts", {"session_id": "legacy", "raw_text": "old", "segments": make_segments(5), "word_timestamps": []})
+
+        page = TranscriptService.get_segments("legacy", cursor=1, limit=2)
+
+        assert [s["seq"] for s in page["segments"]] == [2, 3]
+        assert page["next_cursor"] == 3
+        assert TranscriptService.get_transcript_summary("legacy")["segment_count"] == 5
+        assert len(TranscriptService.get_transcript("legacy")["segments"]) == 5
+
+class TestTranscriptEndpoint:
+
+    def test_paginated_endpoint(self, client):
+
+        TranscriptService.save_transcript("s1", "full text", make_segments(12))
+
+        first = client.get("/api/results/s1/transcript", params={"limit": 5, "include_text": True}).json()
+        second = client.get("/api/results/s1/transcript", params={"limit": 5, "cursor": first["next_cursor"]}).json()
+
+        assert first["text"] == "full text"
+        assert [s["seq"] for s in first["segments"]] == [0, 1, 2, 3, 4]
+        assert [s["seq"] for s in second["segments"]] == [5, 6, 7, 8, 9]
+        assert "text" not in second
+
+    def test_endpoint_checks_ownership_and_range(self, client):
+
+        assert client.get("/api/results/s1/transcript", headers={"X-User-ID": "someone-else"}).status_code == 403
+        assert client.get("/api/results/nope/transcript").status_code == 404
+        assert client.get("/api/results/s1/transcript", params={"start": 10, "end": 5}).status_code == 400
+        assert client.get("/api/results/s1/transcript", params={"limit": 1000}).status_code == 422
+
+    def test_results_return_transcript_summary(self, client):
+
+        TranscriptService.save_transcript("s1", "full text", make_segments(4))
+
+        summary = client.get("/api/results/s1").json()["transcript"]
+        full = client.get("/api/results/s1", params={"include_transcript": True}).json()["transcript"]
+
+        assert summary == {"segment_count": 4, "duration_seconds": 15.5, "word_count": 20}
+        assert full["text"] == "full text"
+        assert len(full["segments"]) == 4
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+import asyncio
+import subprocess
+import sys
+import pytest
+
+pytest.importorskip("fastapi")
+
+from src.backend.api import upload
+from src.backend.utils import file_manager
+from src.backend.utils.file_manager import FileManager
+
+class TestProbeDuration:
+
+    def test_reads_duration_from_ffprobe(self, monkeypatch):
+
+        calls = []
+
+        def run(command, **kwargs):
+            calls.append(command)
+            return subprocess.CompletedProcess(command, 0, stdout='{"format": {"duration": "1799.456"}}', stderr="")
+
+        monkeypatch.setattr(file_manager.shutil, "which", lambda name: f"/usr/bin/{name}")
+        monkeypatch.setattr(file_manager.subprocess, "run", run)
+
+        assert FileManager.probe_duration(b"video", "talk.mp4") == 1799.46
+        assert calls[0][:2] == ["/usr/bin/ffprobe", "-v"]
+        assert calls[0][-1].endswith(".mp4")
+
+    def test_unreadable_or_missing_ffprobe_gives_none(self, monkeypatch):
+
+        monkeypatch.setattr(file_manager.subprocess, "run", lambda command, **kwargs: subprocess.CompletedProcess(command, 1, stdout="", stderr="bad"))
+        monkeypatch.setattr(file_manager.shutil, "which", lambda name: f"/usr/bin/{name}")
+        assert FileManager.probe_duration(b"video", "talk.mp4") is None
+
+        monkeypatch.setattr(file_manager.shutil, "which", lambda name: None)
+        assert FileManager.probe_duration(b"video", "talk.mp4") is None
+
+    def test_does_not_load_opencv(self, monkeypatch):
+
+        monkeypatch.delitem(sys.modules, "cv2", raising=False)
+        FileManager.probe_duration(b"video", "talk.mp4")
+
+        assert "cv2" not in sys.modules
+
+@pytest.fixture
+def api_router():
+
+    return upload.router, "/api/upload"
+
+class TestUploadEndpoint:
+
+    def test_duration_is_probed_off_the_event_loop(self, client, storage, monkeypatch):
+
+        loops = []
+
+        def probe(content, filename):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return 42.0
+
+        monkeypatch.setattr(FileManager, "probe_duration", staticmethod(probe))
+
+        response = client.post("/api/upload/", files={"file": ("talk.mp4", b"video", "video/mp4")})
+
+        assert response.status_code == 200
+        # Called from a worker thread, where no event loop is running
+        assert loops == [None]
+        session = storage.select_one("sessions", filters={"id": response.json()["session_id"]})
+        assert session["duration_seconds"] == 42.0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
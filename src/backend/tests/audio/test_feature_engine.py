@@ -0,0 +1,134 @@
+import wave
+import pytest
+import numpy as np
+from src.backend.pipelines.audio.feature_engine import (
+    AudioFeatureEngine,
+    analyze_audio_features,
+    extract_audio_features
+)
+from src.backend.pipelines.audio.clarity_analyzer import analyze_audio_clarity
+
+def write_wav(path, audio_data, sample_rate=16000):
+
+    pcm = (np.clip(audio_data, -1, 1) * 32767).astype(np.int16)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return str(path)
+
+def tone(frequency, seconds, amplitude=0.3, sample_rate=16000):
+
+    return amplitude * np.sin(2 * np.pi * frequency * np.arange(int(sample_rate * seconds)) / sample_rate)
+
+def features_of(audio_data, sample_rate=16000, chunk=None):
+
+    engine = AudioFeatureEngine(sample_rate)
+    chunk = chunk or len(audio_data)
+    for start in range(0, len(audio_data), chunk):
+        engine.add(audio_data[start:start + chunk])
+    return engine.result()
+
+def reference_centroid(audio_data, sample_rate=16000, n_fft=1024, hop=None, weight=np.abs):
+
+    # librosa.feature.spectral_centroid: Hann-windowed STFT frames, each
+    # centroid weighted by spectral magnitude, averaged over the frames
+    hop = hop or n_fft // 4
+    window = np.hanning(n_fft)
+    frequencies = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    centroids = []
+    for start in range(0, len(audio_data) - n_fft + 1, hop):
+        spectrum = weight(np.fft.rfft(audio_data[start:start + n_fft] * window))
+        if spectrum.sum() > 1e-6:
+            centroids.append(spectrum @ frequencies / spectrum.sum())
+    return float(np.mean(centroids))
+
+class TestAudioFeatureEngine:
+
+    def test_pitch_and_centroid_of_tone(self):
+
+        features = features_of(tone(220, 2.0))
+
+        assert features["pitch_mean_hz"] == pytest.approx(220, rel=0.02)
+        assert features["avg_centroid"] == pytest.approx(220, rel=0.1)
+        assert features["pitch_variation"] < 0.1
+        assert features["voiced_ratio"] > 0.9
+
+    def test_centroid_is_magnitude_weighted(self):
+
+        rng = np.random.default_rng(1)
+        seconds = 10.0
+        t = np.arange(int(16000 * seconds)) / 16000
+        voice = sum(0.3 / k * np.sin(2 * np.pi * 150 * k * t) for k in range(1, 12))
+        audio = (voice + 0.02 * rng.standard_normal(len(t))).astype(np.float32)
+
+        engine = features_of(audio)["avg_centroid"]
+        magnitude = reference_centroid(audio)
+        power = reference_centroid(audio, weight=lambda spectrum: np.abs(spectrum) ** 2)
+
+        assert engine == pytest.approx(magnitude, rel=0.03)
+        # The two weightings are far apart on this signal
+        assert magnitude > 1.5 * power
+
+    def test_pitch_variation_follows_intonation(self):
+
+        flat = features_of(tone(200, 3.0))
+        varied = features_of(np.concatenate([tone(150, 1.0), tone(200, 1.0), tone(300, 1.0)]))
+
+        assert varied["pitch_variation"] > flat["pitch_variation"] + 3
+
+    def test_rms_matches_amplitude(self):
+
+        features = features_of(tone(440, 2.0, amplitude=0.5))
+
+        assert features["avg_volume"] == pytest.approx(0.5 / np.sqrt(2), rel=0.02)
+
+    def test_snr_drops_with_noise(self):
+
+        rng = np.random.default_rng(0)
+        speech = np.concatenate([tone(200, 2.0), np.zeros(16000)])
+        clean = features_of(speech + 0.0005 * rng.standard_normal(len(speech)))
+        noisy = features_of(speech + 0.005 * rng.standard_normal(len(speech)))
+
+        assert clean["snr_db"] > noisy["snr_db"] + 10
+
+    def test_chunking_does_not_change_results(self):
+
+        audio = np.concatenate([tone(180, 1.5), np.zeros(16000), tone(260, 1.5)]).astype(np.float32)
+
+        whole = features_of(audio)
+        chunked = features_of(audio, chunk=1234)
+
+        for key in ("avg_volume", "volume_variation", "avg_centroid", "pitch_mean_hz", "pitch_variation", "snr_db"):
+            assert chunked[key] == pytest.approx(whole[key], rel=1e-4, abs=1e-6)
+        assert chunked["silence"] == whole["silence"]
+
+class TestAudioStageFeatures:
+
+    def test_single_pass_keeps_silence_and_clarity_contracts(self, tmp_path):
+
+        path = write_wav(tmp_path / "talk.wav", np.concatenate([tone(200, 2.0), np.zeros(24000), tone(250, 2.0)]))
+
+        result = analyze_audio_features(path)
+
+        assert result["silence"]["silence_segments"] == [{"start": 2.0, "end": 3.5}]
+        assert set(result["clarity"]) == {"avg_volume", "volume_variation", "clarity_score", "raw"}
+        assert 0 <= result["clarity"]["clarity_score"] <= 10
+        assert result["clarity"]["raw"]["snr_db"] > 20
+
+    def test_clarity_analyzer_uses_engine(self, tmp_path):
+
+        path = write_wav(tmp_path / "talk.wav", tone(300, 3.0))
+
+        assert analyze_audio_clarity(path) == analyze_audio_features(path)["clarity"]
+
+    def test_short_audio_has_no_silence(self, tmp_path):
+
+        path = write_wav(tmp_path / "short.wav", np.zeros(8000))
+
+        assert analyze_audio_features(path)["silence"]["silence_segments"] == []
+        assert extract_audio_features(path)["duration"] == 0.5
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
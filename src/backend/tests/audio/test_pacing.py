@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+from src.backend.pipelines.audio.pacing import (
+    compact_words,
+    compute_pacing,
+    pacing_from_transcript,
+    segment_word_times,
+    word_times
+)
+from src.backend.pipelines.audio.wpm_calculator import calculate_wpm
+
+def steady_words(count, start=0.0, word_sec=0.3, gap_sec=0.1):
+
+    starts = start + np.arange(count) * (word_sec + gap_sec)
+    return [{"word": f"w{i}", "start": float(s), "end": float(s + word_sec)} for i, s in enumerate(starts)]
+
+class TestPacing:
+
+    def test_steady_speech_rates(self):
+
+        # 150 words at 0.4 s per word: 60 s of speech with no pauses
+        pacing = pacing_from_transcript({"word_timestamps": steady_words(150)})
+
+        assert pacing["source"] == "words"
+        assert pacing["wpm"] == pytest.approx(150, rel=0.01)
+        assert pacing["articulation_rate"] == pytest.approx(150, rel=0.01)
+        assert pacing["pauses"]["count"] == 0
+
+    def test_articulation_rate_excludes_long_pauses(self):
+
+        words = steady_words(50) + steady_words(50, start=50.0)
+        pacing = pacing_from_transcript({"word_timestamps": words})
+
+        # 30 s of pause between two 20 s stretches
+        assert pacing["wpm"] == pytest.approx(100 / 69.9 * 60, rel=0.01)
+        assert pacing["articulation_rate"] == pytest.approx(150, rel=0.01)
+        assert pacing["pauses"]["count"] == 1
+        assert pacing["pauses"]["longest_seconds"] == pytest.approx(30.1, abs=0.01)
+        assert pacing["pauses"]["histogram"] == [0, 0, 0, 0, 1]
+
+    def test_pause_histogram_bins(self):
+
+        starts = np.array([0.0, 1.0, 2.6, 4.8, 8.0, 10.0])
+        ends = np.array([0.7, 2.0, 3.0, 5.0, 9.5, 10.5])
+
+        pacing = compute_pacing(starts, ends)
+
+        # Gaps: 0.3, 0.6, 1.8, 3.0, 0.5
+        assert pacing["pauses"]["bin_edges"] == [0.25, 0.5, 1.0, 2.0, 4.0]
+        assert pacing["pauses"]["histogram"] == [1, 2, 1, 1, 0]
+        assert pacing["pauses"]["total_seconds"] == pytest.approx(6.2)
+
+    def test_rolling_timeline_tracks_a_slowdown(self):
+
+        fast = steady_words(150, word_sec=0.2, gap_sec=0.1)
+        slow = steady_words(60, start=45.0, word_sec=0.6, gap_sec=0.4)
+        pacing = compute_pacing(*word_times(fast + slow), window_sec=20.0, step_sec=5.0)
+        timeline = pacing["timeline"]
+
+        assert len(timeline["t"]) == len(timeline["wpm"]) == len(timeline["articulation_rate"])
+        assert timeline["t"][0] == 5.0
+        assert timeline["wpm"][3] == pytest.approx(200, rel=0.05)
+        assert timeline["wpm"][-2] == pytest.approx(60, rel=0.05)
+        assert timeline["articulation_rate"][-2] < timeline["articulation_rate"][3]
+
+    def test_segments_fallback_matches_segment_wpm(self):
+
+        segments = [
+            {"start": 0.0, "end": 4.0, "text": "one two three four five six seven eight"},
+            {"start": 6.0, "end": 10.0, "text": "nine ten eleven twelve"}
+        ]
+        starts, ends = segment_word_times(segments)
+        pacing = pacing_from_transcript({"segments": segments, "word_timestamps": []})
+
+        assert starts.tolist() == pytest.approx([0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 6.0, 7.0, 8.0, 9.0])
+        assert ends[-1] == pytest.approx(10.0)
+        assert pacing["source"] == "segments"
+        assert pacing["wpm"] == calculate_wpm(segments)
+        assert pacing["pauses"]["count"] == 1
+
+    def test_short_or_empty_input(self):
+
+        assert pacing_from_transcript({"word_timestamps": steady_words(5)}) is None
+        assert pacing_from_transcript({"segments": [], "word_timestamps": None}) is None
+
+    def test_compact_words(self):
+
+        words = [
+            {"word": " Hello", "start": 0.123456, "end": 0.4567, "probability": 0.9},
+            {"word": " there", "start": None, "end": 1.0}
+        ]
+
+        assert compact_words(words) == [{"word": "Hello", "start": 0.12, "end": 0.46}]
+        assert compact_words(None) == []
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,5 +1,29 @@
+import wave
 import pytest
 import numpy as np
+from src.backend.pipelines.audio.silence_detector import (
+    detect_silence_intervals,
+    silence_from_energy,
+    FrameEnergy
+)
+from src.backend.pipelines.audio.pcm_stream import PCMStream
+
+def write_wav(path, audio_data, sample_rate=16000, channels=1):
+    
+    pcm = (np.clip(audio_data, -1, 1) * 32767).astype(np.int16)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return str(path)
+
+def speech_with_pauses(sample_rate=16000):
+    
+    # 2s tone, 1.5s silence, 1s tone, 0.5s silence (too short), 2s tone
+    tone = lambda seconds: 0.5 * np.sin(2 * np.pi * 220 * np.arange(int(sample_rate * seconds)) / sample_rate)
+    quiet = lambda seconds: np.zeros(int(sample_rate * seconds))
+    return np.concatenate([tone(2), quiet(1.5), tone(1), quiet(0.5), tone(2)])
 
 def detect_silence_mock(audio_data, sample_rate, silence_threshold=-40):
     
@@ -143,5 +167,76 @@ class TestSilenceDetector:
         
         assert len(strict_segments) >= len(lenient_segments)
 
+class TestStreamingSilenceDetection:
+    
+    def test_detects_pauses_from_wav(self, tmp_path):
+        
+        path = write_wav(tmp_path / "talk.wav", speech_with_pauses())
+        
+        result = detect_silence_intervals(path)
+        
+        assert result["silence_segments"] == [{"start": 2.0, "end": 3.5}]
+        assert result["total_silence_seconds"] == 1.5
+        assert result["silence_ratio"] == round(1.5 / 7, 2)
+    
+    def test_result_independent_of_chunk_size(self, tmp_path):
+        
+        path = write_wav(tmp_path / "talk.wav", speech_with_pauses())
+        
+        energies = []
+        for chunk_seconds in (0.0137, 1.0, 30.0):
+            energy = FrameEnergy(16000)
+            for chunk in PCMStream(path, chunk_seconds=chunk_seconds):
+                energy.add(chunk)
+            energies.append(energy.energies)
+        
+        np.testing.assert_allclose(energies[0], energies[2])
+        np.testing.assert_allclose(energies[1], energies[2])
+    
+    def test_stereo_is_downmixed(self, tmp_path):
+        
+        mono = speech_with_pauses()
+        path = write_wav(tmp_path / "stereo.wav", np.repeat(mono, 2), channels=2)
+        
+        assert detect_silence_intervals(path)["silence_segments"] == [{"start": 2.0, "end": 3.5}]
+    
+    def test_short_audio_returns_empty_contract(self, tmp_path):
+        
+        path = write_wav(tmp_path / "short.wav", np.zeros(16000))
+        
+        assert detect_silence_intervals(path) == {
+            "silence_ratio": 0.0,
+            "total_silence_seconds": 0.0,
+            "silence_segments": []
+        }
+    
+    def test_missing_file(self):
+        
+        with pytest.raises(FileNotFoundError):
+            detect_silence_intervals("/nonexistent/audio.wav")
+    
+    def test_threshold_applies_to_window_rms(self):
+        
+        # -45 dBFS frames are silent at -40 but not at -50
+        energies = np.full(200, 10 ** (-45 / 10))
+        
+        assert silence_from_energy(energies, 10, 2.0, silence_thresh=-40)["silence_ratio"] == 1.0
+        assert silence_from_energy(energies, 10, 2.0, silence_thresh=-50)["silence_segments"] == []
+    
+    def test_matches_pydub(self, tmp_path):
+        
+        silence = pytest.importorskip("pydub.silence")
+        from pydub import AudioSegment
+        
+        path = write_wav(tmp_path / "talk.wav", speech_with_pauses() + 0.001 * np.random.default_rng(0).standard_normal(112000))
+        expected = silence.detect_silence(AudioSegment.from_file(path), min_silence_len=800, silence_thresh=-40)
+        
+        segments = detect_silence_intervals(path)["silence_segments"]
+        
+        assert len(segments) == len(expected)
+        for segment, (start, end) in zip(segments, expected):
+            assert segment["start"] == pytest.approx(start / 1000, abs=0.011)
+            assert segment["end"] == pytest.approx(end / 1000, abs=0.011)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,111 @@
+import pytest
+from src.backend.pipelines.live import LiveSessionRecorder
+from src.backend.pipelines.visual.engagement_analyzer import compute_engagement_metrics
+from src.backend.services.live_session_service import LiveSessionService
+from src.backend.services.session_service import SessionService
+from src.backend.services.visual_evaluation_service import VisualEvaluationService
+from src.backend.storage import set_storage
+from src.backend.storage.sql_backend import SQLiteBackend
+
+def make_frames(count=30):
+
+    frames = []
+    for i in range(count):
+        frames.append({
+            "timestamp": float(i * 2),
+            "face_detected": i % 3 != 0,
+            "gaze_direction": "forward" if i % 2 == 0 else "away",
+            "hands_detected": i % 4 == 0,
+            "hand_count": 1 if i % 4 == 0 else 0,
+            "body_movement": float(i % 10)
+        })
+    return frames
+
+@pytest.fixture
+def storage(tmp_path):
+
+    backend = SQLiteBackend(str(tmp_path / "test.db"), files_dir=str(tmp_path / "files"))
+    set_storage(backend)
+    yield backend
+    set_storage(None)
+
+class TestLiveSessionRecorder:
+
+    def test_matches_offline_engagement_metrics(self):
+
+        frames = make_frames()
+        recorder = LiveSessionRecorder("session-1")
+        for frame in frames:
+            recorder.add(frame, timestamp=frame["timestamp"])
+
+        expected = compute_engagement_metrics(frames)
+        actual = recorder.engagement_metrics()
+
+        for key in ("face_visibility_ratio", "gaze_forward_ratio", "hand_movement_frequency",
+                    "body_movement_activity", "gesture_activity_ratio"):
+            assert actual[key] == expected[key]
+
+    def test_live_results_without_pose_leave_movement_unset(self):
+
+        recorder = LiveSessionRecorder("session-1")
+        recorder.add({"face_detected": True, "eye_contact": True, "hand_count": 2, "gestures": 1}, timestamp=0.0)
+        recorder.add({"face_detected": True, "eye_contact": False, "hand_count": 0, "gestures": 0}, timestamp=30.0)
+
+        metrics = recorder.engagement_metrics()
+
+        assert metrics["face_visibility_ratio"] == 1.0
+        assert metrics["gaze_forward_ratio"] == 0.5
+        # One hand frame per sampled interval, however far apart they arrive
+        assert metrics["hand_movement_frequency"] == 60.0
+        assert "body_movement_activity" not in metrics
+        assert metrics["raw"]["total_frames"] == 2
+
+class TestLiveSessionService:
+
+    def test_live_evaluation_persisted_and_recording_attached(self, storage):
+
+        session = LiveSessionService.create_live_session("user-1")
+        recorder = LiveSessionRecorder(session["id"])
+        for i in range(10):
+            recorder.add({"face_detected": True, "eye_contact": i % 2 == 0, "hand_count": 1}, timestamp=float(i))
+
+        scores = LiveSessionService.save_live_evaluation(session["id"], recorder)
+        evaluation = VisualEvaluationService.get_visual_evaluation(session["id"])
+
+        assert scores["face_visibility_score"] == 10.0
+        assert evaluation["raw_visual_data"]["source"] == "live"
+        assert "visual" in SessionService.get_session(session["id"])["stages_completed"]
+
+        LiveSessionService.validate_pending_live_session(session["id"], "user-1")
+        LiveSessionService.attach_recording(session["id"], "recording.webm", "file:///recording.webm")
+
+        updated = SessionService.get_session(session["id"])
+        assert updated["status"] == "uploaded"
+        assert updated["filename"] == "recording.webm"
+
+    def test_recording_rejected_for_other_user(self, storage):
+
+        session = LiveSessionService.create_live_session("user-1")
+
+        with pytest.raises(PermissionError):
+            LiveSessionService.validate_pending_live_session(session["id"], "user-2")
+
+    def test_empty_recording_not_saved(self, storage):
+
+        session = LiveSessionService.create_live_session("user-1")
+
+        assert LiveSessionService.save_live_evaluation(session["id"], LiveSessionRecorder(session["id"])) is None
+
+    def test_abandoned_recording_marks_session_failed(self, storage):
+
+        session = LiveSessionService.create_live_session("user-1")
+        recorder = LiveSessionRecorder(session["id"])
+
+        assert LiveSessionService.abandon_live_recording(recorder) is True
+        assert SessionService.get_session(session["id"])["status"] == "failed"
+
+        # Only sessions still waiting in live status are touched
+        assert LiveSessionService.abandon_live_recording(recorder) is False
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
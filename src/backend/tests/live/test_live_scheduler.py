@@ -0,0 +1,206 @@
+import asyncio
+import threading
+import time
+import pytest
+from src.backend.pipelines.live import LiveFrameScheduler, FrameDropped
+
+class FakeTracker:
+
+    instances = []
+
+    def __init__(self):
+
+        self.frames = []
+        self.closed = False
+        FakeTracker.instances.append(self)
+
+    def analyze(self, frame):
+
+        self.frames.append(frame)
+        return {"frame": frame, "thread": threading.current_thread().name}
+
+    def close(self):
+
+        self.closed = True
+
+@pytest.fixture
+def scheduler():
+
+    FakeTracker.instances = []
+    scheduler = LiveFrameScheduler(FakeTracker, max_workers=2, max_clients=2)
+    yield scheduler
+    scheduler.shutdown()
+
+class TestLiveFrameScheduler:
+
+    def test_runs_off_event_loop(self, scheduler):
+
+        async def run():
+            return await scheduler.submit("a", lambda tracker: tracker.analyze(1))
+
+        result = asyncio.run(run())
+
+        assert result["frame"] == 1
+        assert result["thread"].startswith("live-inference")
+
+    def test_tracker_per_client(self, scheduler):
+
+        async def run():
+            await scheduler.submit("a", lambda tracker: tracker.analyze(1))
+            await scheduler.submit("b", lambda tracker: tracker.analyze(2))
+            await scheduler.submit("a", lambda tracker: tracker.analyze(3))
+
+        asyncio.run(run())
+
+        assert [t.frames for t in FakeTracker.instances] == [[1, 3], [2]]
+
+    def test_stale_frames_dropped(self, scheduler):
+
+        release = threading.Event()
+
+        def slow(tracker):
+            release.wait(5)
+            return tracker.analyze("first")
+
+        async def run():
+            first = asyncio.ensure_future(scheduler.submit("a", slow))
+            await asyncio.sleep(0.05)
+            second = asyncio.ensure_future(scheduler.submit("a", lambda t: t.analyze("second")))
+            await asyncio.sleep(0)
+            third = asyncio.ensure_future(scheduler.submit("a", lambda t: t.analyze("third")))
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(first, second, third, return_exceptions=True)
+
+        first, second, third = asyncio.run(run())
+
+        assert first["frame"] == "first"
+        assert isinstance(second, FrameDropped)
+        assert third["frame"] == "third"
+        assert FakeTracker.instances[0].frames == ["first", "third"]
+
+    def test_least_recent_client_evicted(self, scheduler):
+
+        async def run():
+            for client_id in ("a", "b", "c"):
+                await scheduler.submit(client_id, lambda tracker: tracker.analyze(client_id))
+
+        asyncio.run(run())
+        scheduler._executor.submit(lambda: None).result()
+
+        assert scheduler.client_count == 2
+        assert FakeTracker.instances[0].closed is True
+
+    def test_results_recorded_for_recording_client(self, scheduler):
+
+        from src.backend.pipelines.live import LiveSessionRecorder
+
+        recorder = LiveSessionRecorder("session-1")
+        scheduler.start_recording("a", recorder)
+
+        async def run():
+            await scheduler.submit("a", lambda tracker: {"face_detected": True, "hand_count": 1})
+            await scheduler.submit("b", lambda tracker: {"face_detected": True, "hand_count": 1})
+
+        asyncio.run(run())
+
+        assert recorder.total_frames == 1
+        assert scheduler.stop_recording("a") is recorder
+
+    def test_close_client(self, scheduler):
+
+        async def run():
+            await scheduler.submit("a", lambda tracker: tracker.analyze(1))
+
+        asyncio.run(run())
+
+        assert scheduler.close_client("a") is True
+        assert scheduler.close_client("a") is False
+
+class FakeClock:
+
+    def __init__(self):
+
+        self.now = 0.0
+
+    def __call__(self):
+
+        return self.now
+
+class TestLiveSessionStats:
+
+    def test_idle_clients_evicted(self):
+
+        FakeTracker.instances = []
+        clock = FakeClock()
+        scheduler = LiveFrameScheduler(FakeTracker, max_workers=1, idle_timeout=30, clock=clock)
+
+        async def submit(client_id):
+            await scheduler.submit(client_id, lambda tracker: tracker.analyze(client_id))
+
+        asyncio.run(submit("a"))
+        clock.now = 20
+        asyncio.run(submit("b"))
+        clock.now = 45
+
+        assert scheduler.evict_idle() == 1
+        assert scheduler.client_stats("a") is None
+        assert scheduler.client_stats("b") is not None
+        scheduler.shutdown()
+
+    def test_dropping_client_abandons_recording(self):
+
+        clock = FakeClock()
+        abandoned = []
+        scheduler = LiveFrameScheduler(FakeTracker, max_workers=1, idle_timeout=30, clock=clock, on_abandon=abandoned.append)
+
+        async def submit(client_id):
+            await scheduler.submit(client_id, lambda tracker: tracker.analyze(client_id))
+
+        asyncio.run(submit("a"))
+        asyncio.run(submit("b"))
+        scheduler.start_recording("a", "recorder-a")
+        scheduler.start_recording("b", "recorder-b")
+        clock.now = 45
+
+        assert scheduler.evict_idle() == 2
+        assert scheduler.get_recorder("a") is None
+
+        scheduler.start_recording("c", "recorder-c")
+        scheduler.close_client("c")
+        assert scheduler.get_recorder("c") is None
+
+        # Abandoned recordings are handed over on the executor
+        deadline = time.time() + 5
+        while len(abandoned) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        scheduler.shutdown()
+
+        assert sorted(abandoned) == ["recorder-a", "recorder-b", "recorder-c"]
+
+    def test_per_client_stats(self):
+
+        clock = FakeClock()
+        scheduler = LiveFrameScheduler(FakeTracker, max_workers=1, clock=clock)
+
+        def work(tracker):
+            clock.now += 0.05
+            return tracker.analyze(None)
+
+        async def run():
+            for _ in range(5):
+                await scheduler.submit("a", work)
+                clock.now += 0.05
+
+        asyncio.run(run())
+        stats = scheduler.client_stats("a")
+
+        assert stats["frames_processed"] == 5
+        assert stats["fps"] == pytest.approx(10.0)
+        assert stats["latency_ms"]["avg"] == pytest.approx(50.0)
+        assert stats["inference_ms"]["avg"] == pytest.approx(50.0)
+        assert [s["client_id"] for s in scheduler.stats()] == ["a"]
+        scheduler.shutdown()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,173 @@
+import time
+import pytest
+from src.backend.storage import set_storage
+from src.backend.storage.sql_backend import SQLiteBackend
+from src.backend.storage.search_index import (
+    FTS5SearchIndex,
+    TermSearchIndex,
+    create_search_index,
+    parse_query,
+    set_search_index,
+    tokenize
+)
+from src.backend.services.transcript_search_service import TranscriptSearchService
+from src.backend.services.transcript_service import TranscriptService
+
+LECTURES = {
+    "calculus": [
+        {"start": 0.0, "end": 5.0, "text": "Today we look at integration by parts."},
+        {"start": 5.0, "end": 9.0, "text": "Parts of the proof use integration, by the way."},
+        {"start": 9.0, "end": 14.0, "text": "Integration by parts again, with an example."}
+    ],
+    "hindi": [
+        {"start": 0.0, "end": 4.0, "text": "आज हम इंटीग्रेशन बाय पार्ट्स समझेंगे।"},
+        {"start": 4.0, "end": 8.0, "text": "Aaj hum integration by parts ko samjhenge, theek hai?"}
+    ],
+    "physics": [
+        {"start": 0.0, "end": 6.0, "text": "Newton's laws of motion."}
+    ]
+}
+
+@pytest.fixture
+def storage(tmp_path):
+
+    backend = SQLiteBackend(str(tmp_path / "test.db"), files_dir=str(tmp_path / "files"))
+    set_storage(backend)
+    for session_id in LECTURES:
+        backend.insert("sessions", {"id": session_id, "user_id": "teacher", "file_url": "x", "filename": f"{session_id}.mp4"})
+    backend.insert("sessions", {"id": "other", "user_id": "someone-else", "file_url": "x", "filename": "other.mp4"})
+    yield backend
+    set_search_index(None)
+    set_storage(None)
+
+@pytest.fixture(params=["fts5", "terms"])
+def indexed(request, storage):
+
+    index = FTS5SearchIndex(storage) if request.param == "fts5" else TermSearchIndex(storage)
+    set_search_index(index)
+    for session_id, segments in LECTURES.items():
+        TranscriptService.save_transcript(session_id, "text", segments)
+        TranscriptSearchService.index_transcript(session_id, segments)
+    TranscriptService.save_transcript("other", "text", LECTURES["calculus"])
+    TranscriptSearchService.index_transcript("other", LECTURES["calculus"])
+    return index
+
+class TestTokenizer:
+
+    def test_devanagari_words_stay_whole(self):
+
+        assert tokenize("आज हम इंटीग्रेशन समझेंगे।") == ["आज", "हम", "इंटीग्रेशन", "समझेंगे"]
+
+    def test_zero_width_joiners_and_case_are_ignored(self):
+
+        assert tokenize("\u0915\u094d\u200d\u0937 Integration") == tokenize("\u0915\u094d\u0937 INTEGRATION")
+
+    def test_quoted_phrases(self):
+
+        assert parse_query('"integration by parts" example') == [["integration", "by", "parts"], ["example"]]
+        assert parse_query('  "" ') == []
+
+class TestTranscriptSearch:
+
+    def test_phrase_search_finds_segments_and_timestamps(self, indexed):
+
+        results = TranscriptSearchService.search("teacher", '"integration by parts"')["results"]
+        by_session = {r["session_id"]: r for r in results}
+
+        assert set(by_session) == {"calculus", "hindi"}
+        assert [m["start"] for m in by_session["calculus"]["matches"]] == [0.0, 9.0]
+        assert by_session["calculus"]["filename"] == "calculus.mp4"
+        assert by_session["hindi"]["matches"][0]["start"] == 4.0
+
+    def test_unquoted_words_match_in_any_order(self, indexed):
+
+        results = TranscriptSearchService.search("teacher", "parts integration")["results"]
+
+        assert {r["session_id"]: r["match_count"] for r in results}["calculus"] == 3
+
+    def test_hindi_query(self, indexed):
+
+        results = TranscriptSearchService.search("teacher", "इंटीग्रेशन समझेंगे")["results"]
+
+        assert [r["session_id"] for r in results] == ["hindi"]
+        assert results[0]["matches"][0]["end"] == 4.0
+
+    def test_results_are_scoped_to_user(self, indexed):
+
+        results = TranscriptSearchService.search("someone-else", "integration")["results"]
+
+        assert [r["session_id"] for r in results] == ["other"]
+        assert TranscriptSearchService.search("nobody", "integration")["results"] == []
+
+    def test_reindex_and_remove(self, indexed, storage):
+
+        # A re-run replaces the transcript, then re-indexes it
+        segments = [{"start": 0.0, "end": 2.0, "text": "Integration by parts"}]
+        storage.delete("transcript_segments", {"session_id": "physics"})
+        TranscriptService.save_transcript("physics", "text", segments)
+        TranscriptSearchService.index_transcript("physics", segments)
+        assert TranscriptSearchService.search("teacher", "newton")["results"] == []
+
+        TranscriptSearchService.remove_transcript("calculus")
+        sessions = {r["session_id"] for r in TranscriptSearchService.search("teacher", '"integration by parts"')["results"]}
+        assert sessions == {"hindi", "physics"}
+
+class TestTermSearchIndex:
+
+    def test_postings_read_in_pages(self, storage, monkeypatch):
+
+        from src.backend.storage import search_index
+        monkeypatch.setattr(search_index, "POSTINGS_PAGE_SIZE", 2)
+        monkeypatch.setattr(search_index, "SEGMENT_LOOKUP_SIZE", 1)
+        index = TermSearchIndex(storage)
+        TranscriptService.save_transcript("calculus", "text", LECTURES["calculus"])
+        index.add("teacher", [
+            {"session_id": "calculus", "seq": seq, "text": s["text"]} for seq, s in enumerate(LECTURES["calculus"])
+        ])
+
+        matches = index.search("teacher", [["integration", "by", "parts"]])
+
+        assert sorted(m["seq"] for m in matches) == [0, 2]
+
+    def test_database_intersection_used_when_available(self, storage, monkeypatch):
+
+        calls = []
+
+        def rpc(function, params):
+            calls.append((function, params["p_terms"]))
+            return [{"session_id": "calculus", "seq": 2, "start_time": 9.0, "end_time": 14.0, "text": LECTURES["calculus"][2]["text"]}]
+
+        monkeypatch.setattr(storage, "rpc", rpc, raising=False)
+        matches = TermSearchIndex(storage).search("teacher", [["integration", "by", "parts"]])
+
+        assert calls == [("search_transcript_terms", ["by", "integration", "parts"])]
+        assert [m["seq"] for m in matches] == [2]
+
+class TestSearchIndexSelection:
+
+    def test_sqlite_uses_fts5(self, storage):
+
+        assert create_search_index(storage).name == "fts5"
+
+    def test_fts5_latency_over_many_lectures(self, storage):
+
+        index = FTS5SearchIndex(storage)
+        words = "limit derivative matrix vector proof lemma series integral function graph".split()
+        rows = [
+            {"session_id": f"lecture-{n}", "seq": seq, "start_time": seq * 5.0, "end_time": seq * 5.0 + 4.0,
+             "text": " ".join(words[(n + seq + k) % len(words)] for k in range(12))}
+            for n in range(2000)
+            for seq in range(20)
+        ]
+        rows[12345]["text"] += " integration by parts"
+        index.add("teacher", rows)
+
+        start = time.perf_counter()
+        matches = index.search("teacher", [["integration", "by", "parts"]])
+        elapsed = time.perf_counter() - start
+
+        assert [(m["session_id"], m["seq"]) for m in matches] == [("lecture-617", 5)]
+        assert elapsed < 0.1
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
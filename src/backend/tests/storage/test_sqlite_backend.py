@@ -0,0 +1,192 @@
+import pytest
+from src.backend.storage.sql_backend import SQLiteBackend
+from src.backend.storage.base import StorageBackend, StorageError
+
+@pytest.fixture
+def storage(tmp_path):
+
+    return SQLiteBackend(str(tmp_path / "test.db"), files_dir=str(tmp_path / "files"))
+
+@pytest.fixture
+def session(storage):
+
+    return storage.insert("sessions", {
+        "user_id": "user-1",
+        "file_url": "file:///video.mp4",
+        "filename": "video.mp4",
+        "status": "uploaded"
+    })[0]
+
+class TestSQLiteBackend:
+
+    def test_insert_returns_row_with_defaults(self, session):
+
+        assert session["id"]
+        assert session["created_at"]
+        assert session["has_transcript"] is False
+        assert session["stages_completed"] == []
+
+    def test_select_by_filter(self, storage, session):
+
+        row = storage.select_one("sessions", {"id": session["id"]})
+
+        assert row["filename"] == "video.mp4"
+        assert storage.select_one("sessions", {"id": "missing"}) is None
+
+    def test_json_columns_round_trip(self, storage, session):
+
+        segments = [{"start": 0.0, "end": 1.5, "text": "Hello"}]
+        storage.insert("transcripts", {
+            "session_id": session["id"],
+            "raw_text": "Hello",
+            "segments": segments
+        })
+
+        row = storage.select_one("transcripts", {"session_id": session["id"]})
+
+        assert row["segments"] == segments
+
+    def test_update_returns_updated_rows(self, storage, session):
+
+        rows = storage.update(
+            "sessions",
+            {"status": "complete", "completion_metadata": {"mentor_score": 8.1}},
+            {"id": session["id"]}
+        )
+
+        assert len(rows) == 1
+        assert rows[0]["status"] == "complete"
+        assert rows[0]["completion_metadata"]["mentor_score"] == 8.1
+
+    def test_delete_returns_deleted_rows(self, storage, session):
+
+        deleted = storage.delete("sessions", {"id": session["id"]})
+
+        assert len(deleted) == 1
+        assert storage.select("sessions") == []
+
+    def test_in_filter_and_ordering(self, storage):
+
+        storage.insert("analytics_events", [
+            {"event_name": "a", "timestamp": "2024-01-01T00:00:00"},
+            {"event_name": "b", "timestamp": "2024-01-03T00:00:00"},
+            {"event_name": "c", "timestamp": "2024-01-02T00:00:00"}
+        ])
+
+        rows = storage.select(
+            "analytics_events",
+            {"event_name": ["a", "b"]},
+            order_by="timestamp",
+            desc=True
+        )
+
+        assert [r["event_name"] for r in rows] == ["b", "a"]
+
+    def test_comparison_filters_limit_and_offset(self, storage):
+
+        storage.insert("analytics_events", [
+            {"event_name": f"e{i}", "timestamp": f"2024-01-{i + 1:02d}T00:00:00"}
+            for i in range(10)
+        ])
+
+        rows = storage.select(
+            "analytics_events",
+            {"timestamp": ("gte", "2024-01-05T00:00:00")},
+            order_by="timestamp",
+            limit=2,
+            offset=1
+        )
+
+        assert [r["event_name"] for r in rows] == ["e5", "e6"]
+
+    def test_several_conditions_on_one_column(self, storage):
+
+        storage.insert("analytics_events", [
+            {"event_name": f"e{i}", "timestamp": f"2024-01-{i + 1:02d}T00:00:00"}
+            for i in range(10)
+        ])
+
+        rows = storage.select(
+            "analytics_events",
+            {"timestamp": [("gte", "2024-01-03"), ("lt", "2024-01-06")]},
+            order_by=["timestamp", "id"]
+        )
+
+        assert [r["event_name"] for r in rows] == ["e2", "e3", "e4"]
+
+    def test_aggregate_matches_generic_version(self, storage):
+
+        storage.insert("analytics_events", [
+            {"event_name": "view" if i % 3 else "upload", "user_id": f"user-{i % 2}", "timestamp": f"2024-01-0{i % 4 + 1}T0{i % 3}:30:00"}
+            for i in range(24)
+        ])
+
+        for kwargs in (
+            {"group_by": ["event_name"]},
+            {"group_by": ["event_name", "user_id"]},
+            {"time_bucket": ("timestamp", "day")},
+            {"group_by": ["event_name"], "time_bucket": ("timestamp", "hour"), "filters": {"user_id": "user-1"}},
+            {}
+        ):
+            sql = storage.aggregate("analytics_events", **kwargs)
+            generic = StorageBackend.aggregate(storage, "analytics_events", **kwargs)
+            key = lambda r: sorted((k, str(v)) for k, v in r.items())
+            assert sorted(sql, key=key) == sorted(generic, key=key)
+
+        assert storage.aggregate("analytics_events", ["event_name"]) == [
+            {"event_name": "view", "count": 16}, {"event_name": "upload", "count": 8}
+        ]
+        assert storage.aggregate("analytics_events", time_bucket=("timestamp", "day"))[0] == {"bucket": "2024-01-01", "count": 6}
+        assert storage.aggregate("analytics_events", filters={"event_name": "none"}) == [{"count": 0}]
+
+    def test_bulk_insert_with_mixed_columns(self, storage):
+
+        rows = [{"event_name": "x"} for _ in range(1200)]
+        rows.append({"event_name": "y", "user_id": "user-1"})
+
+        inserted = storage.insert("analytics_events", rows)
+
+        assert len(inserted) == 1201
+        assert len(storage.select("analytics_events", {"user_id": "user-1"})) == 1
+
+    def test_transaction_rolls_back_on_error(self, storage, session):
+
+        with pytest.raises(RuntimeError):
+            with storage.transaction():
+                storage.delete("sessions", {"id": session["id"]})
+                raise RuntimeError("boom")
+
+        assert storage.select_one("sessions", {"id": session["id"]}) is not None
+
+    def test_nested_failure_rolls_back_only_its_savepoint(self, storage, session):
+
+        with storage.transaction():
+            storage.update("sessions", {"status": "pending"}, {"id": session["id"]})
+            with pytest.raises(Exception, match="missing_table"):
+                with storage.transaction():
+                    storage.delete("sessions", {"id": session["id"]})
+                    storage.delete("missing_table", {"session_id": session["id"]})
+            storage.update("sessions", {"has_transcript": True}, {"id": session["id"]})
+
+        row = storage.select_one("sessions", {"id": session["id"]})
+        assert (row["status"], row["has_transcript"]) == ("pending", True)
+
+    def test_invalid_identifier_rejected(self, storage):
+
+        with pytest.raises(StorageError):
+            storage.select("sessions; DROP TABLE sessions")
+
+    def test_local_file_round_trip(self, storage):
+
+        storage.upload_file("videos", "clip.mp4", b"data")
+
+        assert storage.download_file("videos", "clip.mp4") == b"data"
+        assert storage.get_public_url("videos", "clip.mp4").startswith("file://")
+
+    def test_file_path_traversal_rejected(self, storage):
+
+        with pytest.raises(StorageError):
+            storage.download_file("videos", "../../etc/passwd")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
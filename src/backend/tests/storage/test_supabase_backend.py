@@ -0,0 +1,100 @@
+import pytest
+from src.backend.storage.supabase_backend import SupabaseBackend
+
+class FakeResponse:
+
+    def __init__(self, data=None, count=None):
+
+        self.data = data
+        self.count = count
+
+class FakeQuery:
+
+    # Records the PostgREST builder calls made on one request
+    def __init__(self, client, table):
+
+        self.client = client
+        self.calls = [("table", table)]
+        client.queries.append(self)
+
+    def __getattr__(self, name):
+
+        def call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return call
+
+    def execute(self):
+
+        if any(c[0] == "select" and c[2].get("head") for c in self.calls[1:]):
+            return FakeResponse(count=self.client.total)
+        rows = self.client.rows
+        offset = next((c[1][0] for c in self.calls[1:] if c[0] == "range"), 0)
+        return FakeResponse(rows[offset:offset + 1000])
+
+class FakeClient:
+
+    def __init__(self, rows=(), total=0, rpc_error=None):
+
+        self.rows = list(rows)
+        self.total = total
+        self.rpc_error = rpc_error
+        self.queries = []
+        self.rpcs = []
+
+    def table(self, table):
+
+        return FakeQuery(self, table)
+
+    def rpc(self, function, params):
+
+        self.rpcs.append((function, params))
+        if self.rpc_error:
+            raise self.rpc_error
+        return FakeQuery(self, function)
+
+class TestSupabaseAggregate:
+
+    def test_total_is_a_head_count(self):
+
+        client = FakeClient(total=123456)
+        backend = SupabaseBackend(client)
+
+        assert backend.aggregate("analytics_events", filters={"event_name": "results_viewed"}) == [{"count": 123456}]
+        calls = client.queries[0].calls
+        assert ("select", ("id",), {"count": "exact", "head": True}) in calls
+        assert ("eq", ("event_name", "results_viewed"), {}) in calls
+
+    def test_groups_run_in_the_database(self):
+
+        client = FakeClient()
+        backend = SupabaseBackend(client)
+
+        backend.aggregate(
+            "analytics_events", group_by=["event_name"],
+            filters={"user_id": "u1", "timestamp": [("gte", "2025-01-01"), ("lt", "2025-02-01")]},
+            time_bucket=("timestamp", "day"), limit=10
+        )
+
+        assert client.rpcs == [("aggregate_rows", {
+            "p_table": "analytics_events",
+            "p_group_by": ["event_name"],
+            "p_bucket_column": "timestamp",
+            "p_bucket": "day",
+            "p_filters": [["user_id", "eq", "u1"], ["timestamp", "gte", "2025-01-01"], ["timestamp", "lt", "2025-02-01"]],
+            "p_limit": 10
+        })]
+
+    def test_missing_function_falls_back_to_paging(self):
+
+        rows = [{"status": "complete"}] * 3 + [{"status": "failed"}]
+        client = FakeClient(rows=rows, rpc_error=RuntimeError("function aggregate_rows does not exist"))
+        backend = SupabaseBackend(client)
+
+        assert backend.aggregate("sessions", group_by=["status"]) == [
+            {"status": "complete", "count": 3},
+            {"status": "failed", "count": 1}
+        ]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
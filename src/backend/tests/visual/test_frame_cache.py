@@ -0,0 +1,133 @@
+import os
+import pytest
+import numpy as np
+from src.backend.pipelines.visual import mediapipe_detector
+from src.backend.pipelines.visual.frame_store import FrameResultStore
+from src.backend.pipelines.visual.frame_cache import (
+    FrameResultCache,
+    analyze_video_cached,
+    media_hash
+)
+
+@pytest.fixture
+def video_path(tmp_path):
+
+    cv2 = pytest.importorskip("cv2")
+    path = str(tmp_path / "lecture.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    if not writer.isOpened():
+        pytest.skip("MJPG writer not available")
+    for i in range(100):
+        writer.write(np.full((48, 64, 3), i * 2, dtype=np.uint8))
+    writer.release()
+    return path
+
+@pytest.fixture
+def analysed(monkeypatch):
+
+    # Records which frames reach the detectors instead of running MediaPipe
+    calls = []
+
+    def fake_batch_analyze_frames(frames, min_face_confidence=0.7, min_hand_confidence=0.6, as_store=False, static_image_mode=False, **kwargs):
+        assert static_image_mode, "cached frames must not depend on tracking state"
+        calls.append([f["frame_number"] for f in frames])
+        return FrameResultStore.from_results([
+            {
+                "timestamp": f["timestamp"],
+                "frame_number": f["frame_number"],
+                "face_detected": True,
+                "gaze_direction": "forward",
+                "hand_count": 0,
+                "raw": {"pose": {"landmarks": np.full((33, 3), 0.5, dtype=np.float32)}}
+            }
+            for f in frames
+        ])
+
+    monkeypatch.setattr(mediapipe_detector, "batch_analyze_frames", fake_batch_analyze_frames)
+    return calls
+
+@pytest.fixture
+def cache(tmp_path):
+
+    return FrameResultCache(str(tmp_path / "frame_cache"))
+
+class TestFrameResultCache:
+
+    def test_second_run_is_fully_cached(self, video_path, cache, analysed):
+
+        first = analyze_video_cached(video_path, cache, fps=2, max_frames=10)
+        second = analyze_video_cached(video_path, cache, fps=2, max_frames=10)
+
+        assert analysed == [list(range(0, 50, 5))]
+        np.testing.assert_array_equal(first.column("frame_number"), second.column("frame_number"))
+        assert second.pose_landmarks.shape == (10, 33, 3)
+
+    def test_changed_sampling_only_analyses_missing_frames(self, video_path, cache, analysed):
+
+        analyze_video_cached(video_path, cache, fps=1, max_frames=10)
+        store = analyze_video_cached(video_path, cache, fps=2, max_frames=20)
+
+        assert analysed[1] == list(range(5, 100, 10))
+        assert store.column("frame_number").tolist() == list(range(0, 100, 5))
+        assert store.column("timestamp").tolist() == [n / 10 for n in range(0, 100, 5)]
+
+    def test_thresholds_are_part_of_the_key(self, video_path, cache, analysed):
+
+        analyze_video_cached(video_path, cache, fps=1, max_frames=5)
+        analyze_video_cached(video_path, cache, fps=1, max_frames=5, min_face_confidence=0.5)
+
+        assert len(analysed) == 2
+
+    def test_adaptive_plan_is_reused(self, video_path, cache, analysed, monkeypatch):
+
+        analyze_video_cached(video_path, cache, fps=1, max_frames=5, adaptive=True)
+
+        from src.backend.pipelines.visual import frame_extractor
+        monkeypatch.setattr(frame_extractor, "plan_adaptive_frames", lambda *a, **k: pytest.fail("plan recomputed"))
+        store = analyze_video_cached(video_path, cache, fps=1, max_frames=5, adaptive=True)
+
+        assert len(analysed) == 1
+        assert len(store) == len(analysed[0])
+
+    def test_least_recently_used_videos_evicted(self, tmp_path):
+
+        store = FrameResultStore.from_results([{"frame_number": n, "timestamp": float(n)} for n in range(50)])
+        size = len(store.to_bytes())
+        cache = FrameResultCache(str(tmp_path / "frame_cache"), max_bytes=int(size * 3.5))
+
+        for media in ["cc33", "bb22", "aa11"]:
+            cache.save(media, "det", store)
+        for age, media in enumerate(["cc33", "bb22", "aa11"]):
+            os.utime(cache._path(media, "det.npz"), (1000 - age, 1000 - age))
+
+        # Reading "aa11" makes it the most recently used
+        assert cache.load("aa11", "det") is not None
+        cache.save("dd44", "det", store)
+
+        assert cache.load("bb22", "det") is None
+        assert cache.load("cc33", "det") is not None
+        assert cache.load("dd44", "det") is not None
+
+    def test_media_hash_follows_content(self, tmp_path):
+
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"one")
+        before = media_hash(str(path))
+        path.write_bytes(b"two!")
+
+        assert media_hash(str(path)) != before
+
+    def test_take_and_concat(self):
+
+        stores = [
+            FrameResultStore.from_results([{"frame_number": n, "timestamp": float(n)} for n in numbers])
+            for numbers in ([4, 2], [3])
+        ]
+        merged = FrameResultStore.concat(stores)
+
+        assert merged.column("frame_number").tolist() == [4, 2, 3]
+        assert merged.take([1, 2, 0]).column("frame_number").tolist() == [2, 3, 4]
+        assert merged.take([1]).pose_landmarks.shape == (1, 33, 3)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,209 @@
+import pickle
+import pytest
+import numpy as np
+from src.backend.pipelines.visual.frame_store import FrameResultStore, GAZE_CODES
+from src.backend.pipelines.visual.engagement_analyzer import (
+    compute_engagement_metrics,
+    compute_detailed_metrics
+)
+from src.backend.pipelines.visual.visual_scoring import compute_visual_scores
+
+def make_result(i, hand_count=1, gaze="forward"):
+
+    return {
+        "timestamp": float(i),
+        "frame_number": i * 30,
+        "face_detected": i % 2 == 0,
+        "face_confidence": 0.9 if i % 2 == 0 else None,
+        "gaze_direction": gaze,
+        "hands_detected": hand_count > 0,
+        "hand_count": hand_count,
+        "body_movement": float(i % 5),
+        "raw": {
+            "face": None,
+            "hands": [{"handedness": "Left", "landmarks": [(0.1, 0.2, 0.0)] * 21}] * hand_count,
+            "pose": {"landmarks": [(0.5, 0.5, 0.0)] * 33}
+        }
+    }
+
+@pytest.fixture
+def results():
+
+    frames = [make_result(i, hand_count=i % 3, gaze=["forward", "away", "down", None][i % 4]) for i in range(40)]
+    frames[7] = None
+    return frames
+
+class TestFrameResultStore:
+
+    def test_columns_from_results(self, results):
+
+        store = FrameResultStore.from_results(results)
+
+        assert len(store) == 40
+        assert store.column("valid").sum() == 39
+        assert store.column("gaze")[0] == GAZE_CODES["forward"]
+        assert np.isnan(store.column("face_confidence")[1])
+        assert store.pose_landmarks.shape == (40, 33, 3)
+        assert store.hand_landmarks.shape == (40, 2, 21, 3)
+        assert np.isnan(store.hand_landmarks[0]).all()
+        assert not np.isnan(store.hand_landmarks[1, 0]).any()
+
+    def test_append_grows_capacity(self):
+
+        store = FrameResultStore(capacity=1, keep_landmarks=False)
+        for i in range(100):
+            store.append(make_result(i))
+
+        assert len(store) == 100
+        assert store.column("frame_number")[-1] == 99 * 30
+        assert store.pose_landmarks is None
+
+    def test_pickle_round_trip_trims_capacity(self, results):
+
+        store = FrameResultStore(capacity=1000)
+        for result in results:
+            store.append(result)
+
+        restored = pickle.loads(pickle.dumps(store))
+
+        assert len(restored) == 40
+        assert len(restored._columns["valid"]) == 40
+        np.testing.assert_array_equal(restored.column("hand_count"), store.column("hand_count"))
+        restored.append(make_result(40))
+        assert len(restored) == 41
+
+    def test_landmarks_stored_as_float16(self, results):
+
+        store = FrameResultStore.from_results(results)
+
+        assert store.pose_landmarks.dtype == np.float16
+        assert store.pose_landmarks[0, 0, 0] == pytest.approx(0.5, abs=1e-3)
+
+    def test_compressed_blob_round_trip(self, results):
+
+        store = FrameResultStore.from_results(results)
+        restored = FrameResultStore.from_bytes(store.to_bytes())
+
+        assert len(restored) == len(store)
+        np.testing.assert_array_equal(restored.column("gaze"), store.column("gaze"))
+        np.testing.assert_array_equal(restored.hand_landmarks, store.hand_landmarks)
+
+    def test_blob_without_landmarks(self, results):
+
+        store = FrameResultStore.from_results(results, keep_landmarks=False)
+        restored = FrameResultStore.from_bytes(store.to_bytes())
+
+        assert restored.pose_landmarks is None
+        assert len(restored) == 40
+
+    def test_to_results_round_trip(self, results):
+
+        converted = FrameResultStore.from_results(results).to_results()
+
+        assert converted[7] is None
+        assert converted[2]["gaze_direction"] == "down"
+        assert converted[3]["gaze_direction"] is None
+        assert converted[1]["face_confidence"] is None
+
+class TestVectorisedEngagementMetrics:
+
+    def test_store_and_list_give_same_metrics(self, results):
+
+        from_list = compute_detailed_metrics(results)
+        from_store = compute_detailed_metrics(FrameResultStore.from_results(results))
+
+        for key in from_list:
+            if key != "raw":
+                assert from_list[key] == from_store[key]
+
+    def test_detailed_metrics(self, results):
+
+        detailed = compute_detailed_metrics(results)["detailed"]
+
+        assert detailed["gaze_distribution"] == {"forward": 10, "away": 10, "down": 10, "unknown": 9}
+        assert detailed["hand_statistics"]["both"] == 13
+        assert detailed["average_face_confidence"] == 0.9
+        assert detailed["valid_frames"] == 39
+
+    def test_engagement_ratios(self, results):
+
+        metrics = compute_engagement_metrics(results)
+
+        assert metrics["face_visibility_ratio"] == 0.5
+        assert metrics["gesture_activity_ratio"] == round(25 / 40, 3)
+
+    def test_raw_frames_only_kept_on_request(self, results):
+
+        assert compute_engagement_metrics(results)["raw"] == {
+            "frames": 40,
+            "valid_frames": 39,
+            "landmarks": False,
+            "nbytes": FrameResultStore.from_results(results, keep_landmarks=False).nbytes
+        }
+        assert compute_engagement_metrics(results, keep_raw=True)["raw"] is results
+
+    def test_empty_input(self):
+
+        assert compute_engagement_metrics([])["face_visibility_ratio"] == 0.0
+        assert compute_engagement_metrics(FrameResultStore())["face_visibility_ratio"] == 0.0
+
+def sampled_clip(times):
+
+    # The same 60 frames of behaviour, sampled at the given times
+    return [
+        {
+            "timestamp": t,
+            "frame_number": i,
+            "face_detected": True,
+            "face_confidence": 0.9,
+            "gaze_direction": "forward" if i % 4 else "down",
+            "hands_detected": True,
+            "hand_count": 2 if i % 3 == 0 else 1,
+            "body_movement": 4.0
+        }
+        for i, t in enumerate(times)
+    ]
+
+class TestSamplingDensity:
+
+    @pytest.mark.parametrize("times", [
+        [float(i) for i in range(60)],
+        [i * 3600 / 59 for i in range(60)],
+        [0.0, 1.0, 2.0, 30.0, 31.0, 300.0] + [301.0 + i for i in range(54)]
+    ], ids=["uniform-1fps", "spread-over-hour", "adaptive-clusters"])
+    def test_scores_do_not_depend_on_spacing(self, times):
+
+        metrics = compute_engagement_metrics(sampled_clip(times))
+        scores = compute_visual_scores(metrics)
+
+        assert metrics["hand_movement_frequency"] == pytest.approx(61.02, abs=0.6)
+        assert scores["gesture_score"] == pytest.approx(8.95, abs=0.15)
+        assert scores["visual_overall"] == pytest.approx(9.16, abs=0.05)
+
+    def test_dense_sampling_keeps_measured_span(self):
+
+        times = [i * 0.5 for i in range(60)]
+
+        assert compute_engagement_metrics(sampled_clip(times))["hand_movement_frequency"] == round(60 / (29.5 / 60), 2)
+
+class TestFrameResultsArtifact:
+
+    def test_artifact_round_trip(self, tmp_path, results):
+
+        from src.backend.storage import set_storage
+        from src.backend.storage.sql_backend import SQLiteBackend
+        from src.backend.services.visual_evaluation_service import VisualEvaluationService
+
+        set_storage(SQLiteBackend(str(tmp_path / "test.db"), files_dir=str(tmp_path / "files")))
+        try:
+            path = VisualEvaluationService.save_frame_results_artifact("session-1", FrameResultStore.from_results(results))
+            restored = VisualEvaluationService.load_frame_results_artifact(path)
+        finally:
+            set_storage(None)
+
+        assert path == "session-1/frame_results.npz"
+        assert len(restored) == 40
+        assert restored.pose_landmarks.shape == (40, 33, 3)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
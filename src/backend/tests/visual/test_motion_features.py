@@ -0,0 +1,111 @@
+import pytest
+import numpy as np
+from src.backend.pipelines.visual.frame_store import FrameResultStore
+from src.backend.pipelines.visual.motion_features import compute_motion_features
+from src.backend.pipelines.visual.engagement_analyzer import compute_engagement_metrics
+from src.backend.pipelines.visual.visual_scoring import compute_visual_scores
+
+def make_pose(wrist_offset=0.0):
+
+    pose = np.full((33, 3), 0.5, dtype=np.float32)
+    pose[11, 0], pose[12, 0] = 0.4, 0.6  # shoulder width 0.2
+    pose[15, 0] += wrist_offset
+    pose[16, 0] -= wrist_offset
+    return pose
+
+def make_frame(i, wrist_offset=0.0, hand_offset=None, pose=True):
+
+    hands = []
+    if hand_offset is not None:
+        hands = [{"handedness": "Left", "landmarks": np.full((21, 3), 0.3 + hand_offset, dtype=np.float32)}]
+    return {
+        "timestamp": float(i),
+        "frame_number": i * 30,
+        "face_detected": True,
+        "gaze_direction": "forward",
+        "hands_detected": bool(hands),
+        "hand_count": len(hands),
+        "body_movement": 2.0,
+        "raw": {
+            "hands": hands,
+            "pose": {"landmarks": make_pose(wrist_offset)} if pose else None
+        }
+    }
+
+def make_store(frames):
+
+    return FrameResultStore.from_results(frames)
+
+class TestMotionFeatures:
+
+    def test_still_speaker(self):
+
+        features = compute_motion_features(make_store([make_frame(i) for i in range(30)]))
+
+        assert features["samples"] == 29
+        assert features["mean_velocity"] == 0.0
+        assert features["gesture_onsets"] == 0
+        assert features["stillness_windows"] == 1
+        assert features["longest_stillness_sec"] == 29.0
+        assert features["stillness_ratio"] == 1.0
+
+    def test_gesture_bursts_counted_as_onsets(self):
+
+        # Three bursts of hand movement separated by still stretches
+        frames = []
+        for i in range(60):
+            moving = (i // 10) % 2 == 1
+            frames.append(make_frame(i, hand_offset=0.1 * (i % 2) if moving else 0.0))
+        features = compute_motion_features(make_store(frames), duration_minutes=1.0)
+
+        assert features["gesture_onsets"] == 3
+        assert features["gesture_onsets_per_minute"] == 3.0
+        assert features["hand_velocity"] > 0
+
+    def test_pose_velocity_scaled_by_shoulder_width(self):
+
+        frames = [make_frame(i, wrist_offset=0.1 * (i % 2)) for i in range(20)]
+        features = compute_motion_features(make_store(frames))
+
+        # Both wrists move 0.1 (half a shoulder width) per second out of 7 landmarks
+        assert features["mean_velocity"] == pytest.approx(2 * 0.5 / 7, abs=1e-2)
+        assert features["stillness_windows"] == 0
+
+    def test_missing_landmarks_and_gaps_are_skipped(self):
+
+        frames = [make_frame(i) for i in range(10)]
+        frames[3] = make_frame(3, pose=False)
+        frames[6] = None
+        frames += [make_frame(20 + i) for i in range(3)]
+
+        features = compute_motion_features(make_store(frames))
+
+        # 0-1, 1-2, 4-5, 7-8, 8-9 and two steps after the gap
+        assert features["samples"] == 7
+
+    def test_no_landmarks(self):
+
+        store = FrameResultStore.from_results([make_frame(i) for i in range(10)], keep_landmarks=False)
+
+        assert compute_motion_features(store)["samples"] == 0
+
+class TestMotionScoring:
+
+    def test_engagement_metrics_include_motion(self):
+
+        metrics = compute_engagement_metrics(make_store([make_frame(i) for i in range(10)]))
+
+        assert metrics["motion"]["samples"] == 9
+        assert "motion" not in compute_engagement_metrics([make_frame(i) for i in range(10)])
+
+    def test_movement_score_uses_motion_activity(self):
+
+        base = {"face_visibility_ratio": 1.0, "gaze_forward_ratio": 1.0, "gesture_activity_ratio": 0.5, "body_movement_activity": 5.0}
+        motion = {"samples": 20, "motion_activity": 0.0, "gesture_onsets_per_minute": 0.0}
+
+        assert compute_visual_scores(base)["movement_score"] == 10.0
+        assert compute_visual_scores({**base, "motion": motion})["movement_score"] == 0.0
+        assert compute_visual_scores({**base, "motion": {**motion, "samples": 1}})["movement_score"] == 10.0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
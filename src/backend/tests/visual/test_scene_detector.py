@@ -0,0 +1,130 @@
+import pytest
+import numpy as np
+from src.backend.pipelines.visual.scene_detector import (
+    segment_scenes,
+    allocate_frame_budget,
+    plan_sample_times,
+    STATIC_SAMPLE_INTERVAL_SEC
+)
+from src.backend.pipelines.visual.frame_extractor import extract_frames
+
+def signatures(levels, noise):
+
+    # One thumbnail per probe: a flat grey level plus optional moving noise
+    rng = np.random.default_rng(0)
+    thumbnails, histograms = [], []
+    for level, moving in zip(levels, noise):
+        thumb = np.full((36, 64), level, dtype=np.float32)
+        if moving:
+            thumb = np.clip(thumb + rng.uniform(-0.1, 0.1, thumb.shape), 0, 1).astype(np.float32)
+        hist = np.bincount((thumb * 255).astype(np.uint8).ravel() >> 3, minlength=32).astype(np.float32)
+        thumbnails.append(thumb)
+        histograms.append(hist / hist.sum())
+    return np.stack(thumbnails), np.stack(histograms)
+
+class TestSceneSegmentation:
+
+    def test_cuts_and_static_segments(self):
+
+        # 20s slide, 10s camera, 20s slide, probed at 1 per second
+        levels = [0.9] * 20 + [0.3] * 10 + [0.6] * 20
+        noise = [False] * 20 + [True] * 10 + [False] * 20
+        thumbnails, histograms = signatures(levels, noise)
+
+        segments = segment_scenes(np.arange(50.0), thumbnails, histograms, duration=50.0)
+
+        assert [(s["start"], s["end"]) for s in segments] == [(0.0, 20.0), (20.0, 30.0), (30.0, 50.0)]
+        assert [s["static"] for s in segments] == [True, False, True]
+
+    def test_single_probe(self):
+
+        thumbnails, histograms = signatures([0.5], [False])
+
+        assert len(segment_scenes(np.array([0.0]), thumbnails, histograms, duration=3.0)) == 1
+
+class TestFrameBudget:
+
+    def test_dense_on_camera_sparse_on_static(self):
+
+        segments = [
+            {"start": 0.0, "end": 100.0, "static": True},
+            {"start": 100.0, "end": 130.0, "static": False}
+        ]
+
+        counts = allocate_frame_budget(segments, fps=1, max_frames=1000)
+
+        assert counts == [int(100 / STATIC_SAMPLE_INTERVAL_SEC), 30]
+
+    def test_budget_keeps_every_segment(self):
+
+        segments = [
+            {"start": 0.0, "end": 600.0, "static": False},
+            {"start": 600.0, "end": 603.0, "static": False},
+            {"start": 603.0, "end": 900.0, "static": True}
+        ]
+
+        counts = allocate_frame_budget(segments, fps=1, max_frames=60)
+
+        assert sum(counts) == 60
+        assert all(count >= 1 for count in counts)
+        assert counts[0] > counts[2]
+
+    def test_more_segments_than_budget_prefers_camera(self):
+
+        segments = [{"start": float(i), "end": i + 1.0, "static": i % 2 == 0} for i in range(10)]
+
+        counts = allocate_frame_budget(segments, fps=1, max_frames=3)
+
+        assert sum(counts) == 3
+        assert all(counts[i] == 0 for i in range(0, 10, 2))
+
+    def test_sample_times_stay_inside_segments(self):
+
+        segments = [{"start": 0.0, "end": 10.0}, {"start": 10.0, "end": 12.0}]
+
+        times = plan_sample_times(segments, [2, 4])
+
+        assert times.tolist() == [2.5, 7.5, 10.25, 10.75, 11.25, 11.75]
+
+class TestAdaptiveExtraction:
+
+    @pytest.fixture
+    def slide_video(self, tmp_path):
+
+        cv2 = pytest.importorskip("cv2")
+        path = str(tmp_path / "lecture.avi")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+        if not writer.isOpened():
+            pytest.skip("MJPG writer not available")
+
+        rng = np.random.default_rng(1)
+        for i in range(300):
+            if 100 <= i < 150:
+                frame = rng.integers(0, 255, (48, 64, 3), dtype=np.uint8)  # camera
+            else:
+                frame = np.full((48, 64, 3), 230, dtype=np.uint8)  # slide
+            writer.write(frame)
+        writer.release()
+        return path
+
+    def test_budget_spread_over_whole_video(self, slide_video):
+
+        frames = extract_frames(slide_video, fps=2, max_frames=20, adaptive=True)
+        timestamps = [f["timestamp"] for f in frames]
+        camera = [t for t in timestamps if 10 <= t < 15]
+
+        assert len(frames) <= 20
+        assert timestamps == sorted(timestamps)
+        assert max(timestamps) > 20
+        assert len(camera) > len(frames) / 3
+        assert {f["scene"] for f in frames} == {0, 1, 2}
+
+    def test_uniform_sampling_unchanged(self, slide_video):
+
+        frames = extract_frames(slide_video, fps=2, max_frames=20)
+
+        assert [f["frame_number"] for f in frames] == list(range(0, 100, 5))
+        assert "scene" not in frames[0]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
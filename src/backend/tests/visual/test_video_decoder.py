@@ -0,0 +1,86 @@
+import pytest
+import numpy as np
+from src.backend.pipelines.visual.video_decoder import (
+    OpenCVDecoder,
+    DecoderUnavailable,
+    available_decoders,
+    open_video
+)
+from src.backend.pipelines.visual.decode_benchmark import benchmark_decoders
+
+@pytest.fixture
+def video_path(tmp_path):
+
+    cv2 = pytest.importorskip("cv2")
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    if not writer.isOpened():
+        pytest.skip("MJPG writer not available")
+
+    # Solid red frames make BGR/RGB mix-ups visible
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    frame[..., 2] = 255
+    for _ in range(40):
+        writer.write(frame)
+    writer.release()
+    return path
+
+class TestVideoDecoders:
+
+    def test_opencv_metadata_and_rgb_output(self, video_path):
+
+        decoder = OpenCVDecoder(video_path)
+        frame_number, frame = next(decoder.iter_frames())
+
+        assert decoder.fps == pytest.approx(10)
+        assert decoder.frame_count == 40
+        assert frame_number == 0
+        assert frame.shape == (48, 64, 3)
+        assert frame[..., 0].mean() > 200 and frame[..., 2].mean() < 50
+
+    def test_step_frame_numbers_and_scaling(self, video_path):
+
+        decoder = OpenCVDecoder(video_path)
+
+        assert [n for n, _ in decoder.iter_frames(step=10)] == [0, 10, 20, 30]
+        assert [n for n, _ in decoder.iter_frames(frame_numbers=[3, 17])] == [3, 17]
+        assert next(decoder.iter_frames(size=(16, 12)))[1].shape == (12, 16, 3)
+
+    @pytest.mark.parametrize("backend", ["ffmpeg", "pyav"])
+    def test_backends_agree_with_opencv(self, video_path, backend):
+
+        if backend not in available_decoders():
+            pytest.skip(f"{backend} decoder not available")
+
+        decoder = open_video(video_path, backend)
+        frames = list(decoder.iter_frames(frame_numbers=[0, 5, 39], size=(32, 24)))
+
+        assert decoder.name == backend
+        assert [n for n, _ in frames] == [0, 5, 39]
+        assert frames[0][1].shape == (24, 32, 3)
+        assert frames[0][1][..., 0].mean() > 200
+
+    def test_unavailable_backend_falls_back_to_opencv(self, video_path, monkeypatch):
+
+        monkeypatch.setattr("shutil.which", lambda name: None)
+
+        assert open_video(video_path, "ffmpeg").name == "opencv"
+
+    def test_unreadable_file(self, tmp_path):
+
+        path = tmp_path / "broken.mp4"
+        path.write_bytes(b"not a video")
+
+        with pytest.raises(DecoderUnavailable):
+            open_video(str(path), "opencv")
+
+    def test_benchmark_reports_each_backend(self, video_path):
+
+        results = benchmark_decoders(video_path, ["opencv"], fps=2)
+
+        assert results[0]["decoder"] == "opencv"
+        assert results[0]["uniform"]["frames"] == 8
+        assert results[0]["probe"]["frames"] == 8
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,84 @@
+import os
+import threading
+import pytest
+from src.backend.workers import InferenceError, InlineModelClient, RemoteModelClient
+from src.backend.workers.model_host import ModelHost
+from src.backend.utils.config import Config
+
+AUTHKEY = "test-authkey"
+
+@pytest.fixture
+def model_host():
+
+    host = ModelHost("127.0.0.1:0", authkey=AUTHKEY)
+    thread = threading.Thread(target=host.serve_forever, daemon=True)
+    thread.start()
+    yield host
+    host.close()
+
+@pytest.fixture
+def remote_client(model_host):
+
+    host, port = model_host.address
+    client = RemoteModelClient(f"{host}:{port}", authkey=AUTHKEY)
+    yield client
+    client.close()
+
+class TestInlineModelClient:
+
+    def test_runs_task_in_process(self):
+
+        result = InlineModelClient().call("ping")
+
+        assert result["status"] == "ok"
+        assert result["pid"] == os.getpid()
+
+    def test_unknown_task_raises(self):
+
+        with pytest.raises(InferenceError):
+            InlineModelClient().call("missing_task")
+
+class TestRemoteModelClient:
+
+    def test_round_trip(self, remote_client):
+
+        assert remote_client.call("ping")["status"] == "ok"
+
+    def test_connection_reused_across_calls(self, remote_client):
+
+        remote_client.call("ping")
+        remote_client.call("ping")
+
+        assert remote_client._pool.qsize() == 1
+
+    def test_task_error_propagates(self, remote_client):
+
+        with pytest.raises(InferenceError, match="Unknown inference task"):
+            remote_client.call("missing_task")
+
+    def test_wrong_authkey_rejected(self, model_host):
+
+        host, port = model_host.address
+        client = RemoteModelClient(f"{host}:{port}", authkey="wrong")
+
+        with pytest.raises(InferenceError):
+            client.call("ping")
+
+    def test_missing_authkey_refused(self, monkeypatch):
+
+        monkeypatch.setattr(Config, "MODEL_HOST_AUTHKEY", None)
+
+        with pytest.raises(ValueError, match="MODEL_HOST_AUTHKEY"):
+            ModelHost("127.0.0.1:0")
+        with pytest.raises(ValueError, match="MODEL_HOST_AUTHKEY"):
+            RemoteModelClient("127.0.0.1:1")
+
+    def test_unavailable_host_raises(self):
+
+        client = RemoteModelClient("127.0.0.1:1", authkey=AUTHKEY)
+
+        with pytest.raises(InferenceError):
+            client.call("ping")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -6,6 +6,7 @@ load_dotenv()
 class Config:
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+    SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
     DATABASE_URL = os.getenv("DATABASE_URL")
     WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
     DATABASE_URL = os.getenv("DATABASE_URL")
@@ -13,6 +14,50 @@ class Config:
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     LLM_MODEL = os.getenv("LLM_MODEL", "gemini-2.0-flash")
     UPLOAD_DIR = os.getenv("UPLOAD_DIR", os.path.join(os.getcwd(), "uploads"))
+    STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "supabase").lower()
+    SQLITE_PATH = os.getenv("SQLITE_PATH", os.path.join(os.getcwd(), "data", "mentormetrics.db"))
+    LOCAL_STORAGE_DIR = os.getenv("LOCAL_STORAGE_DIR", os.path.join(os.getcwd(), "data", "storage"))
+    INFERENCE_MODE = os.getenv("INFERENCE_MODE", "inline").lower()
+    ML_WORKERS = int(os.getenv("ML_WORKERS", "1"))
+    MODEL_HOST_ADDRESS = os.getenv("MODEL_HOST_ADDRESS", "127.0.0.1:8765")
+    MODEL_HOST_AUTHKEY = os.getenv("MODEL_HOST_AUTHKEY")
+    VIDEO_DECODER = os.getenv("VIDEO_DECODER", "opencv")
+    VIDEO_DECODE_THREADS = int(os.getenv("VIDEO_DECODE_THREADS", "0"))
+    VIDEO_HWACCEL = os.getenv("VIDEO_HWACCEL", "false").lower() == "true"
+    ADAPTIVE_FRAME_SAMPLING = os.getenv("ADAPTIVE_FRAME_SAMPLING", "true").lower() == "true"
+    FRAME_CACHE_ENABLED = os.getenv("FRAME_CACHE_ENABLED", "true").lower() == "true"
+    FRAME_CACHE_DIR = os.getenv("FRAME_CACHE_DIR", os.path.join(os.getcwd(), "data", "frame_cache"))
+    FRAME_CACHE_MAX_MB = int(os.getenv("FRAME_CACHE_MAX_MB", "2048"))
+    KEEP_RAW_LANDMARKS = os.getenv("KEEP_RAW_LANDMARKS", "false").lower() == "true"
+    ARTIFACTS_BUCKET = os.getenv("ARTIFACTS_BUCKET", "artifacts")
+    LIVE_INFERENCE_WORKERS = int(os.getenv("LIVE_INFERENCE_WORKERS", "2"))
+    LIVE_MAX_CLIENTS = int(os.getenv("LIVE_MAX_CLIENTS", "64"))
+    LIVE_IDLE_TIMEOUT_SEC = float(os.getenv("LIVE_IDLE_TIMEOUT_SEC", "60"))
+    LIVE_MAX_FRAME_BYTES = int(os.getenv("LIVE_MAX_FRAME_BYTES", str(2 * 1024 * 1024)))
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    UPLOAD_RATE_LIMIT = int(os.getenv("UPLOAD_RATE_LIMIT", "5"))
+    PROCESS_RATE_LIMIT = int(os.getenv("PROCESS_RATE_LIMIT", "10"))
+    RATE_LIMIT_STORE = os.getenv("RATE_LIMIT_STORE", "memory").lower()
+    RATE_LIMIT_SQLITE_PATH = os.getenv("RATE_LIMIT_SQLITE_PATH", os.path.join(os.getcwd(), "data", "rate_limits.db"))
+    RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL")
+    RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "10000"))
+    RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "false").lower() == "true"
+    ANALYTICS_ASYNC = os.getenv("ANALYTICS_ASYNC", "true").lower() == "true"
+    ANALYTICS_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "100"))
+    ANALYTICS_FLUSH_INTERVAL_MS = int(os.getenv("ANALYTICS_FLUSH_INTERVAL_MS", "1000"))
+    ANALYTICS_BUFFER_SIZE = int(os.getenv("ANALYTICS_BUFFER_SIZE", "10000"))
+    PIPELINE_CAPACITY = float(os.getenv("PIPELINE_CAPACITY", "7200"))
+    ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "100"))
+    ADMISSION_SECONDS_PER_UNIT = float(os.getenv("ADMISSION_SECONDS_PER_UNIT", "0.25"))
+    ADMISSION_DEFAULT_DURATION_SEC = float(os.getenv("ADMISSION_DEFAULT_DURATION_SEC", "600"))
+    ADMISSION_HEARTBEAT_SEC = float(os.getenv("ADMISSION_HEARTBEAT_SEC", "30"))
+    ADMISSION_STALE_SEC = float(os.getenv("ADMISSION_STALE_SEC", "120"))
+    ADMIN_USER_IDS = {u.strip() for u in os.getenv("ADMIN_USER_IDS", "").split(",") if u.strip()}
+    AUTH_LOCAL_VERIFY = os.getenv("AUTH_LOCAL_VERIFY", "true").lower() == "true"
+    AUTH_TOKEN_CACHE_TTL_SEC = float(os.getenv("AUTH_TOKEN_CACHE_TTL_SEC", "60"))
+    AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+    AUTH_JWKS_TTL_SEC = float(os.getenv("AUTH_JWKS_TTL_SEC", "600"))
+    AUTH_REJECT_CACHE_TTL_SEC = float(os.getenv("AUTH_REJECT_CACHE_TTL_SEC", "10"))
 
     @staticmethod
     def validate():
@@ -1,8 +1,15 @@
+import json
+import os
 import shutil
+import subprocess
+import tempfile
 from pathlib import Path
+from typing import Optional
 from fastapi import UploadFile
 import uuid
 
+PROBE_TIMEOUT_SEC = 10
+
 class FileManager:
     @staticmethod
     async def validate_video_file(file: UploadFile):
@@ -14,3 +21,27 @@ class FileManager:
     def generate_filename(original_filename: str) -> str:
         ext = Path(original_filename).suffix
         return f"{uuid.uuid4()}{ext}"
+
+    @staticmethod
+    def probe_duration(content: bytes, filename: str) -> Optional[float]:
+        # Reads only the container header with ffprobe, so the API process
+        # never loads a decoder; None without ffprobe or when the video
+        # can't be read. Blocking: call it from a worker thread
+        ffprobe = shutil.which("ffprobe")
+        if not ffprobe:
+            return None
+
+        fd, path = tempfile.mkstemp(suffix=Path(filename).suffix)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            probe = subprocess.run(
+                [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "json", path],
+                capture_output=True, text=True, timeout=PROBE_TIMEOUT_SEC, check=False
+            )
+            duration = float(json.loads(probe.stdout or "{}").get("format", {}).get("duration") or 0)
+            return round(duration, 2) if duration > 0 else None
+        except Exception:
+            return None
+        finally:
+            os.unlink(path)
@@ -1,8 +1,23 @@
-from supabase import create_client, Client
+import threading
 from src.backend.utils.config import Config
 
-def get_supabase_client() -> Client:
-    Config.validate()
-    return create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+_client = None
+_client_lock = threading.Lock()
 
-supabase = get_supabase_client()
+def get_supabase_client():
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from supabase import create_client
+                Config.validate()
+                _client = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+    return _client
+
+def __getattr__(name):
+    # Keeps `from src.backend.utils.supabase_client import supabase` working
+    # while deferring client construction until first access.
+    if name == "supabase":
+        return get_supabase_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,54 @@
+import threading
+from typing import Optional
+from src.backend.workers.tasks import TASKS, InferenceError
+from src.backend.workers.model_client import (
+    ModelClient,
+    InlineModelClient,
+    ProcessModelClient,
+    RemoteModelClient,
+    create_model_client
+)
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_client: Optional[ModelClient] = None
+_client_lock = threading.Lock()
+
+def get_model_client() -> ModelClient:
+
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_model_client()
+                logger.info(f"[Inference] Using {_client.name} model client")
+    return _client
+
+def set_model_client(client: Optional[ModelClient]) -> None:
+
+    global _client
+    _client = client
+
+def shutdown_model_client() -> None:
+
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+__all__ = [
+    'TASKS',
+    'InferenceError',
+    'ModelClient',
+    'InlineModelClient',
+    'ProcessModelClient',
+    'RemoteModelClient',
+    'create_model_client',
+    'get_model_client',
+    'set_model_client',
+    'shutdown_model_client'
+]
@@ -0,0 +1,121 @@
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from typing import Any, Optional
+from src.backend.utils.config import Config
+from src.backend.utils.logger import setup_logger
+from src.backend.workers.tasks import InferenceError, run_task
+
+logger = setup_logger(__name__)
+
+class ModelClient:
+
+    name = "base"
+    in_process = False
+
+    def call(self, task: str, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+class InlineModelClient(ModelClient):
+
+    # Runs tasks in the calling process, matching the original behavior.
+    name = "inline"
+    in_process = True
+
+    def call(self, task: str, *args, **kwargs) -> Any:
+
+        return run_task(task, args, kwargs)
+
+class ProcessModelClient(ModelClient):
+
+    # Runs tasks in a pool of spawned worker processes that keep their
+    # models loaded between calls, so inference never holds the API's GIL.
+    name = "process"
+
+    def __init__(self, max_workers: Optional[int] = None):
+
+        self.max_workers = max_workers or Config.ML_WORKERS
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=get_context("spawn")
+        )
+
+    def call(self, task: str, *args, **kwargs) -> Any:
+
+        return self._executor.submit(run_task, task, args, kwargs).result()
+
+    def close(self) -> None:
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+class RemoteModelClient(ModelClient):
+
+    # Talks to a standalone model host (python -m src.backend.workers.model_host).
+    # Connections are pooled so concurrent pipeline threads do not share one.
+    name = "remote"
+
+    def __init__(self, address: Optional[str] = None, authkey: Optional[str] = None, pool_size: int = 4):
+
+        from src.backend.workers.model_host import parse_address, require_authkey
+
+        self.address = parse_address(address or Config.MODEL_HOST_ADDRESS)
+        self.authkey = require_authkey(authkey)
+        self._pool: "queue.LifoQueue" = queue.LifoQueue(maxsize=pool_size)
+
+    def _acquire(self):
+
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return Client(self.address, authkey=self.authkey)
+
+    def _release(self, conn) -> None:
+
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def call(self, task: str, *args, **kwargs) -> Any:
+
+        conn = None
+        try:
+            conn = self._acquire()
+            conn.send((task, args, kwargs))
+            status, payload = conn.recv()
+        except (EOFError, OSError, AuthenticationError) as e:
+            if conn is not None:
+                conn.close()
+            raise InferenceError(f"Model host unavailable at {self.address[0]}:{self.address[1]}: {str(e)}")
+
+        self._release(conn)
+
+        if status != "ok":
+            raise InferenceError(payload)
+        return payload
+
+    def close(self) -> None:
+
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+def create_model_client(mode: Optional[str] = None) -> ModelClient:
+
+    mode = (mode or Config.INFERENCE_MODE or "inline").lower()
+
+    if mode == "inline":
+        return InlineModelClient()
+    if mode == "process":
+        return ProcessModelClient()
+    if mode == "remote":
+        return RemoteModelClient()
+
+    raise ValueError(f"Unknown INFERENCE_MODE: {mode}")
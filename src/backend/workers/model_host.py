@@ -0,0 +1,111 @@
+import argparse
+import threading
+from collections import defaultdict
+from multiprocessing.connection import Listener
+from typing import Any, Dict, Optional, Tuple
+from src.backend.utils.config import Config
+from src.backend.utils.logger import setup_logger
+from src.backend.workers.tasks import run_task
+
+logger = setup_logger(__name__)
+
+def require_authkey(authkey: Optional[str]) -> bytes:
+
+    # Connections unpickle whatever they receive, so the key is the only
+    # thing between the network and code execution on the host
+    key = authkey or Config.MODEL_HOST_AUTHKEY
+    if not key:
+        raise ValueError("MODEL_HOST_AUTHKEY is not set; set a long random secret shared by the model host and the API")
+    return key.encode()
+
+def parse_address(address: str) -> Tuple[str, int]:
+
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+class ModelHost:
+
+    # Serves inference tasks to API processes over multiprocessing
+    # connections. Models stay loaded for the lifetime of the host; calls
+    # to the same task are serialized since MediaPipe graphs and Whisper
+    # models are not safe to share between threads.
+
+    def __init__(self, address: Optional[str] = None, authkey: Optional[str] = None):
+
+        self.authkey = require_authkey(authkey)
+        self.listener = Listener(parse_address(address or Config.MODEL_HOST_ADDRESS), authkey=self.authkey)
+        self._task_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._locks_guard = threading.Lock()
+        self._closed = threading.Event()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+
+        return self.listener.address
+
+    def _task_lock(self, task: str) -> threading.Lock:
+
+        with self._locks_guard:
+            return self._task_locks[task]
+
+    def _execute(self, task: str, args: tuple, kwargs: Dict[str, Any]):
+
+        with self._task_lock(task):
+            return run_task(task, args, kwargs)
+
+    def _handle_connection(self, conn) -> None:
+
+        try:
+            while not self._closed.is_set():
+                try:
+                    task, args, kwargs = conn.recv()
+                except (EOFError, OSError):
+                    break
+
+                try:
+                    conn.send(("ok", self._execute(task, args, kwargs)))
+                except Exception as e:
+                    logger.error(f"[ModelHost] Task {task} failed: {str(e)}")
+                    conn.send(("error", f"{type(e).__name__}: {str(e)}"))
+        finally:
+            conn.close()
+
+    def serve_forever(self) -> None:
+
+        logger.info(f"[ModelHost] Listening on {self.address[0]}:{self.address[1]}")
+        while not self._closed.is_set():
+            try:
+                conn = self.listener.accept()
+            except OSError:
+                break
+            except Exception as e:
+                logger.warning(f"[ModelHost] Rejected connection: {str(e)}")
+                continue
+            threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+
+    def close(self) -> None:
+
+        self._closed.set()
+        self.listener.close()
+
+def main():
+
+    parser = argparse.ArgumentParser(description="MentorMetrics model host")
+    parser.add_argument("--address", default=Config.MODEL_HOST_ADDRESS, help="host:port to listen on")
+    parser.add_argument("--warmup", action="store_true", help="Load the Whisper model before accepting calls")
+    args = parser.parse_args()
+
+    if args.warmup:
+        from src.backend.pipelines.stt.whisper_engine import load_whisper_model
+        load_whisper_model()
+
+    host = ModelHost(args.address)
+    try:
+        host.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        host.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+from typing import Any, Callable, Dict
+from src.backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Inference entry points executed by the model host. Each task imports its
+# model library lazily so only the process that runs it pays the load cost.
+
+def ping() -> Dict[str, Any]:
+
+    return {"status": "ok", "pid": os.getpid()}
+
+def transcribe(audio_path: str) -> Dict[str, Any]:
+
+    from src.backend.pipelines.stt.whisper_engine import run_whisper
+    return run_whisper(audio_path)
+
+def analyze_video_frames(
+    video_path: str,
+    fps: int = 1,
+    max_frames: int = 60,
+    release_detectors: bool = False,
+    adaptive: bool = False
+):
+
+    from src.backend.pipelines.visual.frame_extractor import extract_frames
+    from src.backend.pipelines.visual.mediapipe_detector import batch_analyze_frames, cleanup_detectors
+    from src.backend.pipelines.visual.frame_cache import get_frame_cache, analyze_video_cached
+
+    try:
+        cache = get_frame_cache()
+        if cache is not None:
+            return analyze_video_cached(video_path, cache, fps=fps, max_frames=max_frames, adaptive=adaptive)
+
+        frames = extract_frames(video_path, fps=fps, max_frames=max_frames, adaptive=adaptive)
+        logger.info(f"Extracted {len(frames)} frames for analysis")
+        return batch_analyze_frames(frames, as_store=True)
+    finally:
+        if release_detectors:
+            cleanup_detectors()
+
+def evaluate_text(transcript: str) -> Dict[str, Any]:
+
+    from src.backend.pipelines.text.text_evaluator import run_text_evaluation
+    return run_text_evaluation(transcript)
+
+def generate_report_json(prompt: str, attempt: int = 1):
+
+    from src.backend.pipelines.report.report_generator import _call_llm_api
+    return _call_llm_api(prompt, attempt)
+
+TASKS: Dict[str, Callable[..., Any]] = {
+    "ping": ping,
+    "transcribe": transcribe,
+    "analyze_video_frames": analyze_video_frames,
+    "evaluate_text": evaluate_text,
+    "generate_report_json": generate_report_json
+}
+
+class InferenceError(Exception):
+    pass
+
+def run_task(task: str, args: tuple = (), kwargs: Dict[str, Any] = None) -> Any:
+
+    func = TASKS.get(task)
+    if func is None:
+        raise InferenceError(f"Unknown inference task: {task}")
+    return func(*args, **(kwargs or {}))
+
+__all__ = ['TASKS', 'InferenceError', 'run_task']
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Clock, TrendingUp, TrendingDown, Zap, Award, ArrowRight, Calendar, Star } from 'lucide-react';
-import { api } from '../../utils/api';
+import { getSessions } from '../../utils/api';
 
 const ScoreComparison = ({ label, firstScore, latestScore }) => {
     const improvement = latestScore - firstScore;
@@ -70,35 +70,26 @@ const TimeMachine = () => {
     const fetchSessions = async () => {
         try {
             setLoading(true);
-            const response = await api.get('/sessions/list');
-            const sessions = response.data || [];
-
-            // Filter completed sessions only
-            const completedSessions = sessions.filter(s =>
-                s.status === 'complete' &&
-                (s.mentor_score || s.completion_metadata?.mentor_score)
-            );
-
-            if (completedSessions.length >= 2) {
-                // Sort by date (oldest first)
-                const sorted = [...completedSessions].sort(
-                    (a, b) => new Date(a.created_at) - new Date(b.created_at)
-                );
-
-                const first = sorted[0];
-                const latest = sorted[sorted.length - 1];
-
+            // Only the oldest and newest completed sessions are needed
+            const [oldest, newest] = await Promise.all([
+                getSessions({ status: 'complete', order: 'asc', limit: 1 }),
+                getSessions({ status: 'complete', order: 'desc', limit: 1 })
+            ]);
+            const first = oldest.sessions[0];
+            const latest = newest.sessions[0];
+
+            if (first && latest && first.id !== latest.id) {
                 setFirstSession(first);
                 setLatestSession(latest);
 
-                const firstScore = first.mentor_score || first.completion_metadata?.mentor_score || 0;
-                const latestScore = latest.mentor_score || latest.completion_metadata?.mentor_score || 0;
+                const firstScore = first.mentor_score || 0;
+                const latestScore = latest.mentor_score || 0;
 
                 if (firstScore > 0) {
                     setImprovement(((latestScore - firstScore) / firstScore) * 100);
                 }
-            } else if (completedSessions.length === 1) {
-                setFirstSession(completedSessions[0]);
+            } else if (first) {
+                setFirstSession(first);
                 setLatestSession(null);
             }
 
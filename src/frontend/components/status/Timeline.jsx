@@ -16,6 +16,7 @@ const STAGES = [
 const STATUS_TO_COMPLETED_STAGES = {
     'pending': [],
     'uploaded': ['upload'],
+    'queued': ['upload'],
     'processing_started': ['upload'],
     'processing': ['upload'],
     'processing_stt': ['upload'],
@@ -38,6 +39,7 @@ const STATUS_TO_COMPLETED_STAGES = {
 const STATUS_TO_CURRENT_STAGE = {
     'pending': null,
     'uploaded': null,
+    'queued': null,
     'processing_started': 'stt',
     'processing': 'stt',
     'processing_stt': 'stt',
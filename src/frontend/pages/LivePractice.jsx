@@ -8,6 +8,8 @@ import ChallengeWheel, { ChallengeOverlay, ChallengeResult } from '../components
 import LiveScorePanel from '../components/live/LiveScorePanel';
 import FeedbackBubble from '../components/live/FeedbackBubble';
 import { api } from '../utils/api';
+import { supabase } from '../utils/supabase';
+import { API_BASE_URL } from '../config/appConfig';
 
 const LivePractice = () => {
     const navigate = useNavigate();
@@ -20,6 +22,14 @@ const LivePractice = () => {
     const [connectionStatus, setConnectionStatus] = useState('idle'); // idle, connecting, connected, error
     const videoRef = useRef(null);
     const canvasRef = useRef(null);
+    // Identifies this tab's tracker on the backend (one MediaPipe state per stream)
+    // Binary WebSocket stream for frames; falls back to HTTP POST when unavailable
+    const wsRef = useRef(null);
+    // Backend session that accumulates this practice run into a visual evaluation
+    const liveSessionIdRef = useRef(null);
+    const clientIdRef = useRef(
+        (window.crypto && window.crypto.randomUUID) ? window.crypto.randomUUID() : `live-${Date.now()}-${Math.random().toString(36).slice(2)}`
+    );
 
     // Audio Analysis State
     const audioContextRef = useRef(null);
@@ -96,8 +106,36 @@ const LivePractice = () => {
     useEffect(() => {
         let analysisInterval;
         let audioInterval;
+        let cancelled = false;
+
+        // Browsers can't send headers on a WebSocket handshake, so the
+        // access token goes in the query string
+        const openStream = async () => {
+            try {
+                const { data: { session } } = await supabase.auth.getSession();
+                const params = new URLSearchParams({ client_id: clientIdRef.current });
+                if (session?.access_token) {
+                    params.set('access_token', session.access_token);
+                }
+                const userId = localStorage.getItem('user_id');
+                if (userId) {
+                    params.set('user_id', userId);
+                }
+                if (cancelled) return;
+
+                const ws = new WebSocket(`${API_BASE_URL.replace(/^http/, 'ws')}/api/live/ws?${params}`);
+                ws.onmessage = (event) => handleAnalysisResult(JSON.parse(event.data));
+                ws.onerror = () => { if (wsRef.current === ws) wsRef.current = null; };
+                ws.onclose = () => { if (wsRef.current === ws) wsRef.current = null; };
+                wsRef.current = ws;
+            } catch (err) {
+                wsRef.current = null;
+            }
+        };
 
         if (isRecording) {
+            openStream();
+
             // Visual Analysis (Every 500ms)
             analysisInterval = setInterval(analyzeFrame, 500);
 
@@ -106,8 +144,13 @@ const LivePractice = () => {
         }
 
         return () => {
+            cancelled = true;
             clearInterval(analysisInterval);
             clearInterval(audioInterval);
+            if (wsRef.current) {
+                wsRef.current.close();
+                wsRef.current = null;
+            }
         };
     }, [isRecording]);
 
@@ -146,54 +189,25 @@ const LivePractice = () => {
         canvas.height = Math.floor(video.videoHeight / 4);
         ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
 
+        const ws = wsRef.current;
+        if (ws && ws.readyState === WebSocket.OPEN) {
+            setConnectionStatus('connected');
+            // Skip this frame if the previous one hasn't left the socket yet
+            if (ws.bufferedAmount === 0) {
+                canvas.toBlob((blob) => {
+                    if (blob && ws.readyState === WebSocket.OPEN) ws.send(blob);
+                }, 'image/jpeg', 0.6);
+            }
+            return;
+        }
+
         // Convert to base64
         const imageData = canvas.toDataURL('image/jpeg', 0.6);
 
         try {
             setConnectionStatus('connected');
-            const response = await api.post('/live/analyze', { image: imageData });
-            const result = response.data;
-
-            // Update tracking stats
-            trackingRef.current.totalFrames++;
-            if (result.eye_contact) trackingRef.current.eyeContactFrames++;
-
-            // Count gestures immediately (no cooldown - gestures are already filtered by backend)
-            if (result.gestures > 0) {
-                trackingRef.current.gestureFrames += result.gestures;
-            }
-
-            // Calculate Metrics
-            const eyeContactRatio = trackingRef.current.eyeContactFrames / Math.max(1, trackingRef.current.totalFrames);
-            const speakingRatio = trackingRef.current.speakingFrames / Math.max(1, trackingRef.current.totalAudioFrames);
-            // Gesture score based on cumulative gestures (more gestures = better, capped at 1.0 ratio)
-            const gestureRatio = Math.min(1, trackingRef.current.gestureFrames / 10); // 10+ gestures = full score
-
-            // Calculate Overall Score (weighted)
-            // 40% Eye Contact, 30% Speaking, 30% Gestures
-            const overall = (eyeContactRatio * 4) + (speakingRatio * 3) + (gestureRatio * 3);
-
-            setLiveStats(prev => ({
-                ...prev,
-                eyeContactPercent: Math.round(eyeContactRatio * 100),
-                gestureCount: trackingRef.current.gestureFrames, // Show TOTAL cumulative gestures
-                eyeContactRatio: eyeContactRatio,
-                overallScore: Math.round(Math.min(10, Math.max(0, overall)) * 10) / 10
-            }));
-
-            // Generate Feedback Bubbles based on REAL data (less frequently)
-            if (Math.random() > 0.85) {
-                if (!result.eye_contact && result.face_detected) {
-                    showFeedback('warning', 'Look at the camera!', '📷');
-                } else if (result.gestures > 0) {
-                    showFeedback('positive', 'Great gestures!', '👋');
-                } else if (result.eye_contact) {
-                    showFeedback('positive', 'Excellent eye contact!', '👀');
-                } else if (!result.face_detected) {
-                    showFeedback('warning', 'Stay in frame!', '🖼️');
-                }
-            }
-
+            const response = await api.post('/live/analyze', { image: imageData, client_id: clientIdRef.current });
+            handleAnalysisResult(response.data);
         } catch (err) {
             trackingRef.current.analysisErrors++;
             if (trackingRef.current.analysisErrors > 5) {
@@ -203,6 +217,51 @@ const LivePractice = () => {
         }
     };
 
+    const handleAnalysisResult = (result) => {
+        // Superseded by a newer frame on the server; don't count it
+        if (!result || result.dropped) return;
+
+        // Update tracking stats
+        trackingRef.current.totalFrames++;
+        if (result.eye_contact) trackingRef.current.eyeContactFrames++;
+
+        // Count gestures immediately (no cooldown - gestures are already filtered by backend)
+        if (result.gestures > 0) {
+            trackingRef.current.gestureFrames += result.gestures;
+        }
+
+        // Calculate Metrics
+        const eyeContactRatio = trackingRef.current.eyeContactFrames / Math.max(1, trackingRef.current.totalFrames);
+        const speakingRatio = trackingRef.current.speakingFrames / Math.max(1, trackingRef.current.totalAudioFrames);
+        // Gesture score based on cumulative gestures (more gestures = better, capped at 1.0 ratio)
+        const gestureRatio = Math.min(1, trackingRef.current.gestureFrames / 10); // 10+ gestures = full score
+
+        // Calculate Overall Score (weighted)
+        // 40% Eye Contact, 30% Speaking, 30% Gestures
+        const overall = (eyeContactRatio * 4) + (speakingRatio * 3) + (gestureRatio * 3);
+
+        setLiveStats(prev => ({
+            ...prev,
+            eyeContactPercent: Math.round(eyeContactRatio * 100),
+            gestureCount: trackingRef.current.gestureFrames, // Show TOTAL cumulative gestures
+            eyeContactRatio: eyeContactRatio,
+            overallScore: Math.round(Math.min(10, Math.max(0, overall)) * 10) / 10
+        }));
+
+        // Generate Feedback Bubbles based on REAL data (less frequently)
+        if (Math.random() > 0.85) {
+            if (!result.eye_contact && result.face_detected) {
+                showFeedback('warning', 'Look at the camera!', '📷');
+            } else if (result.gestures > 0) {
+                showFeedback('positive', 'Great gestures!', '👋');
+            } else if (result.eye_contact) {
+                showFeedback('positive', 'Excellent eye contact!', '👀');
+            } else if (!result.face_detected) {
+                showFeedback('warning', 'Stay in frame!', '🖼️');
+            }
+        }
+    };
+
     const showFeedback = (type, message, icon) => {
         setCurrentFeedback({ type, message, icon });
         setTimeout(() => setCurrentFeedback(null), 2500);
@@ -246,6 +305,14 @@ const LivePractice = () => {
             analyserRef.current = analyser;
             dataArrayRef.current = dataArray;
 
+            try {
+                const { data } = await api.post('/live/sessions', { client_id: clientIdRef.current });
+                liveSessionIdRef.current = data.session_id;
+            } catch (err) {
+                liveSessionIdRef.current = null;
+                console.warn("Live session recording unavailable:", err);
+            }
+
             setIsRecording(true);
             setShowSummary(false);
             setConnectionStatus('connected');
@@ -306,12 +373,30 @@ const LivePractice = () => {
             overallScore: liveStats.overallScore,
             challengesCompleted: completedChallenges,
             totalGestures: trackingRef.current.gestureFrames,
-            grade: getGrade(liveStats.overallScore)
+            grade: getGrade(liveStats.overallScore),
+            sessionId: liveSessionIdRef.current
         };
         setSessionSummary(summary);
         setShowSummary(true);
 
         setIsRecording(false);
+        // Closing the stream or releasing the client abandons a recording in
+        // progress, so both wait until the live session is finished
+        const ws = wsRef.current;
+        wsRef.current = null;
+        const clientId = clientIdRef.current;
+        const releaseClient = () => {
+            if (ws) ws.close();
+            api.delete(`/live/clients/${clientId}`).catch(() => {});
+        };
+        if (liveSessionIdRef.current) {
+            api.post(`/live/sessions/${liveSessionIdRef.current}/finish`, { client_id: clientId })
+                .catch(err => console.warn("Failed to save live session:", err))
+                .finally(releaseClient);
+            liveSessionIdRef.current = null;
+        } else {
+            releaseClient();
+        }
         if (stream) {
             stream.getTracks().forEach(track => track.stop());
             setStream(null);
@@ -3,7 +3,7 @@ import { useSearchParams, useNavigate } from 'react-router-dom';
 import { FileText, Download, ArrowLeft, AlertCircle, CheckCircle, Shield } from 'lucide-react';
 import Button from '../components/Button';
 import LoadingButton from '../components/ui/LoadingButton';
-import { getResults } from '../utils/api';
+import { getResults, getTranscript } from '../utils/api';
 import { useToast } from '../components/ui/ToastProvider';
 import TranscriptViewer from '../components/transcript/TranscriptViewer';
 import ParameterChart from '../components/charts/ParameterChart';
@@ -48,6 +48,7 @@ const Results = () => {
 
     const [data, setData] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [transcript, setTranscript] = useState({ segments: [], text: '' });
 
     useEffect(() => {
         if (!sessionId) {
@@ -82,6 +83,33 @@ const Results = () => {
         fetchData();
     }, [sessionId, navigate, showError]);
 
+    // Results only carry a transcript summary; segments are paged in
+    // separately so the scores render without waiting for them
+    useEffect(() => {
+        if (!data?.transcript?.segment_count) return;
+
+        let cancelled = false;
+        const fetchTranscript = async () => {
+            try {
+                let page = await getTranscript(sessionId, { includeText: true });
+                const text = page.text || '';
+                let segments = page.segments;
+                if (!cancelled) setTranscript({ segments, text });
+
+                while (page.next_cursor !== null && !cancelled) {
+                    page = await getTranscript(sessionId, { cursor: page.next_cursor });
+                    segments = segments.concat(page.segments);
+                    if (!cancelled) setTranscript({ segments, text });
+                }
+            } catch (err) {
+                console.error(err);
+            }
+        };
+
+        fetchTranscript();
+        return () => { cancelled = true; };
+    }, [sessionId, data?.transcript?.segment_count]);
+
     if (loading) {
         return (
             <div className="flex justify-center items-center h-screen">
@@ -109,9 +137,7 @@ const Results = () => {
         fullMark: 10,
     }));
 
-    const durationSeconds = data.transcript?.segments?.length > 0
-        ? data.transcript.segments[data.transcript.segments.length - 1].end
-        : 0;
+    const durationSeconds = data.transcript?.duration_seconds || 0;
     const formatDuration = (seconds) => {
         const mins = Math.floor(seconds / 60);
         const secs = Math.floor(seconds % 60);
@@ -148,7 +174,7 @@ const Results = () => {
                 </div>
                 <div className="md:col-span-3 grid grid-cols-2 md:grid-cols-3 gap-4">
                     <SimpleMetric label="Duration" value={durationSeconds > 0 ? formatDuration(durationSeconds) : "N/A"} />
-                    <SimpleMetric label="Words Spoken" value={data.transcript?.segments?.reduce((sum, seg) => sum + (seg.text?.split(' ').length || 0), 0) || "0"} />
+                    <SimpleMetric label="Words Spoken" value={data.transcript?.word_count || "0"} />
                     <SimpleMetric label="WPM" value={data.audio?.wpm || "0"} subtext="Target: 130-150" />
                     <SimpleMetric label="Silence Ratio" value={`${(data.audio?.silence_ratio * 100 || 0).toFixed(1)}%`} />
                     <SimpleMetric label="Clarity" value={data.audio?.clarity_score?.toFixed(1) || "N/A"} />
@@ -174,7 +200,7 @@ const Results = () => {
                             // Calculate confidence from available data quality
                             const audioQuality = Math.min((data.audio?.clarity_score || 7) / 10, 1);
                             const hasVideo = data.visual?.face_visible_ratio > 0.5 ? 1 : 0.7;
-                            const hasTranscript = data.transcript?.segments?.length > 0 ? 1 : 0.8;
+                            const hasTranscript = data.transcript?.segment_count > 0 ? 1 : 0.8;
                             return ((audioQuality + hasVideo + hasTranscript) / 3).toFixed(2);
                         })()}
                         interval={[
@@ -322,8 +348,8 @@ const Results = () => {
             {/* Transcript Viewer */}
             <div className="mb-8 border-4 border-black shadow-[8px_8px_0px_0px_rgba(0,0,0,1)]">
                 <TranscriptViewer
-                    segments={data.transcript?.segments}
-                    fullText={data.transcript?.text}
+                    segments={transcript.segments}
+                    fullText={transcript.text}
                 />
             </div>
         </div>
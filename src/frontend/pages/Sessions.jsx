@@ -151,14 +151,17 @@ const EmptyState = () => {
 
 const Sessions = () => {
     const [sessions, setSessions] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const { showError, showSuccess } = useToast();
 
     const fetchSessions = async () => {
         try {
             setLoading(true);
             const data = await getSessions();
-            setSessions(data);
+            setSessions(data.sessions);
+            setNextCursor(data.next_cursor);
         } catch (err) {
             console.error(err);
             showError('Failed to load sessions.');
@@ -167,6 +170,20 @@ const Sessions = () => {
         }
     };
 
+    const fetchMoreSessions = async () => {
+        try {
+            setLoadingMore(true);
+            const data = await getSessions({ cursor: nextCursor });
+            setSessions((prev) => [...prev, ...data.sessions]);
+            setNextCursor(data.next_cursor);
+        } catch (err) {
+            console.error(err);
+            showError('Failed to load more sessions.');
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     useEffect(() => {
         fetchSessions();
     }, []);
@@ -221,6 +238,18 @@ const Sessions = () => {
                     ))}
                 </div>
             )}
+
+            {nextCursor && (
+                <div className="flex justify-center mt-8">
+                    <LoadingButton
+                        onClick={fetchMoreSessions}
+                        isLoading={loadingMore}
+                        className="px-6 py-3 bg-white text-black border-2 border-black font-bold uppercase rounded-none hover:bg-black hover:text-white"
+                    >
+                        Load More
+                    </LoadingButton>
+                </div>
+            )}
         </div>
     );
 };
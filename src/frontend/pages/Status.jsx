@@ -14,6 +14,7 @@ const StatusIndicator = ({ status }) => {
     const config = {
         pending: { icon: Clock, color: 'text-black', bg: 'bg-yellow-100', text: 'PENDING' },
         uploaded: { icon: Clock, color: 'text-black', bg: 'bg-yellow-100', text: 'UPLOADED' },
+        queued: { icon: Clock, color: 'text-black', bg: 'bg-yellow-100', text: 'QUEUED' },
         processing: { icon: Loader2, color: 'text-black', bg: 'bg-blue-100', text: 'PROCESSING', animate: true },
         processing_started: { icon: Loader2, color: 'text-black', bg: 'bg-blue-100', text: 'STARTING...', animate: true },
         processing_stt: { icon: Loader2, color: 'text-black', bg: 'bg-blue-100', text: 'TRANSCRIBING...', animate: true },
@@ -35,6 +36,24 @@ const StatusIndicator = ({ status }) => {
     );
 };
 
+const formatEta = (seconds) => {
+    if (seconds < 60) return 'under a minute';
+    const minutes = Math.round(seconds / 60);
+    return minutes < 60 ? `~${minutes} min` : `~${Math.floor(minutes / 60)} h ${minutes % 60} min`;
+};
+
+const AdmissionInfo = ({ admission }) => {
+    if (!admission) return null;
+
+    return (
+        <div className="mt-4 p-4 border-4 border-black bg-white font-bold uppercase text-sm">
+            {admission.state === 'queued'
+                ? <span>Position {admission.position} in queue · starts in {formatEta(admission.start_in_seconds)} · done in {formatEta(admission.eta_seconds)}</span>
+                : <span>Estimated time remaining: {formatEta(admission.eta_seconds)}</span>}
+        </div>
+    );
+};
+
 const Status = () => {
     const [searchParams] = useSearchParams();
     const navigate = useNavigate();
@@ -82,7 +101,12 @@ const Status = () => {
                 throw new Error('Failed to start processing');
             }
 
-            showSuccess('Processing started!');
+            const result = await response.json();
+            if (result.status === 'queued') {
+                showSuccess(`Pipeline is busy. Queued at position ${result.admission.position}.`);
+            } else {
+                showSuccess('Processing started!');
+            }
             await fetchStatus();
         } catch (err) {
             console.error('Failed to start processing:', err);
@@ -158,6 +182,7 @@ const Status = () => {
             <div className="bg-white border-4 border-black shadow-[8px_8px_0px_0px_rgba(0,0,0,1)] overflow-hidden mb-8">
                 <div className="p-8">
                     <StatusIndicator status={statusData.status} />
+                    <AdmissionInfo admission={statusData.admission} />
 
                     <div className="mt-8 pl-4 pr-4">
                         <h3 className="text-lg font-black text-black uppercase tracking-wider mb-6 border-b-4 border-black inline-block">
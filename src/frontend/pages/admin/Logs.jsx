@@ -12,15 +12,20 @@ const Logs = () => {
     const [sessionId, setSessionId] = useState('');
     const [userId, setUserId] = useState('');
 
-    const [offset, setOffset] = useState(0);
+    // Cursors of the pages visited so far; the last one is the current page
+    const [cursors, setCursors] = useState([null]);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [total, setTotal] = useState(null);
     const limit = 50;
+    const cursor = cursors[cursors.length - 1];
 
     const fetchLogs = async () => {
         setLoading(true);
         try {
             const params = {
                 limit,
-                offset,
+                ...(cursor && { cursor }),
+                ...(!cursor && { include_total: true }),
                 ...(eventType && { event_type: eventType }),
                 ...(sessionId && { session_id: sessionId }),
                 ...(userId && { user_id: userId }),
@@ -28,6 +33,8 @@ const Logs = () => {
 
             const response = await api.get('/admin/logs', { params });
             setLogs(response.data.data || []);
+            setNextCursor(response.data.next_cursor);
+            if (response.data.total !== undefined) setTotal(response.data.total);
         } catch (err) {
             console.error(err);
             showError('Failed to fetch logs');
@@ -38,12 +45,11 @@ const Logs = () => {
 
     useEffect(() => {
         fetchLogs();
-    }, [offset]); // Refetch when page changes
+    }, [cursors]); // Refetch when page changes
 
     const handleSearch = (e) => {
         e.preventDefault();
-        setOffset(0); // Reset to first page
-        fetchLogs();
+        setCursors([null]); // Reset to first page
     };
 
     return (
@@ -155,18 +161,21 @@ const Logs = () => {
 
                 {/* Pagination Controls */}
                 <div className="bg-white px-4 py-3 border-t border-gray-200 flex items-center justify-between sm:px-6">
+                    <div className="hidden sm:block text-sm text-gray-500">
+                        {total !== null && `${total.toLocaleString()} matching events`}
+                    </div>
                     <div className="flex-1 flex justify-between sm:justify-end">
                         <button
-                            onClick={() => setOffset(Math.max(0, offset - limit))}
-                            disabled={offset === 0}
-                            className={`relative inline-flex items-center px-4 py-2 border border-gray-300 text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 ${offset === 0 ? 'opacity-50 cursor-not-allowed' : ''}`}
+                            onClick={() => setCursors(cursors.slice(0, -1))}
+                            disabled={cursors.length === 1}
+                            className={`relative inline-flex items-center px-4 py-2 border border-gray-300 text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 ${cursors.length === 1 ? 'opacity-50 cursor-not-allowed' : ''}`}
                         >
                             Previous
                         </button>
                         <button
-                            onClick={() => setOffset(offset + limit)}
-                            disabled={logs.length < limit}
-                            className={`ml-3 relative inline-flex items-center px-4 py-2 border border-gray-300 text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 ${logs.length < limit ? 'opacity-50 cursor-not-allowed' : ''}`}
+                            onClick={() => setCursors([...cursors, nextCursor])}
+                            disabled={!nextCursor}
+                            className={`ml-3 relative inline-flex items-center px-4 py-2 border border-gray-300 text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 ${!nextCursor ? 'opacity-50 cursor-not-allowed' : ''}`}
                         >
                             Next
                         </button>
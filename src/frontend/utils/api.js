@@ -36,9 +36,13 @@ api.interceptors.response.use(
     }
 );
 
-export const uploadVideo = async (file, onProgress) => {
+export const uploadVideo = async (file, onProgress, liveSessionId = null) => {
     const formData = new FormData();
     formData.append('file', file);
+    // Attach the recording to a finished live practice session
+    if (liveSessionId) {
+        formData.append('session_id', liveSessionId);
+    }
 
     const response = await api.post('/upload/', formData, {
         headers: {
@@ -74,7 +78,20 @@ export const getResults = async (sessionId) => {
     return response.data;
 };
 
-export const getSessions = async () => {
-    const response = await api.get(`/sessions/list`);
+export const getTranscript = async (sessionId, { cursor, limit = 200, start, end, includeText = false } = {}) => {
+    const params = { limit, include_text: includeText };
+    if (cursor !== undefined && cursor !== null) params.cursor = cursor;
+    if (start !== undefined) params.start = start;
+    if (end !== undefined) params.end = end;
+    const response = await api.get(`/results/${sessionId}/transcript`, { params });
+    return response.data;
+};
+
+export const getSessions = async ({ cursor, limit = 20, status, order } = {}) => {
+    const params = { limit };
+    if (cursor) params.cursor = cursor;
+    if (status) params.status = status;
+    if (order) params.order = order;
+    const response = await api.get(`/sessions/list`, { params });
     return response.data;
 };